@@ -87,36 +87,46 @@ func (c *Client) GetSkill(ctx context.Context, domain, skill string) (json.RawMe
 }
 
 func (c *Client) getJSON(ctx context.Context, path string) (json.RawMessage, error) {
+	body, _, err := c.getWithHeaders(ctx, path)
+	return body, err
+}
+
+func (c *Client) getWithHeaders(ctx context.Context, path string) (json.RawMessage, http.Header, error) {
 	req, err := http.NewRequestWithContext(ctx, http.MethodGet, c.baseURL+path, nil)
 	if err != nil {
-		return nil, fmt.Errorf("creating request: %w", err)
+		return nil, nil, fmt.Errorf("creating request: %w", err)
 	}
 
 	resp, err := c.httpClient.Do(req)
 	if err != nil {
-		return nil, fmt.Errorf("calling executor: %w", err)
+		return nil, nil, fmt.Errorf("calling executor: %w", err)
 	}
 	defer resp.Body.Close()
 
 	body, err := io.ReadAll(resp.Body)
 	if err != nil {
-		return nil, fmt.Errorf("reading response: %w", err)
+		return nil, nil, fmt.Errorf("reading response: %w", err)
 	}
 
 	if resp.StatusCode >= 400 {
-		return nil, fmt.Errorf("executor returned %d: %s", resp.StatusCode, body)
+		return nil, nil, fmt.Errorf("executor returned %d: %s", resp.StatusCode, body)
 	}
 
-	return json.RawMessage(body), nil
+	return json.RawMessage(body), resp.Header, nil
 }
 
-// ListExecutions returns execution history as raw JSON passthrough.
-func (c *Client) ListExecutions(ctx context.Context, query string) (json.RawMessage, error) {
+// ListExecutions returns one page of execution history as raw JSON passthrough,
+// plus the executor's X-Next-Cursor ("" on the last page).
+func (c *Client) ListExecutions(ctx context.Context, query string) (json.RawMessage, string, error) {
 	path := "/api/v1/executions"
 	if query != "" {
 		path += "?" + query
 	}
-	return c.getJSON(ctx, path)
+	body, header, err := c.getWithHeaders(ctx, path)
+	if err != nil {
+		return nil, "", err
+	}
+	return body, header.Get("X-Next-Cursor"), nil
 }
 
 // GetExecution returns execution detail with linked corrections/reflexions.
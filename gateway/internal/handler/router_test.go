@@ -295,3 +295,33 @@ func TestExecutorError(t *testing.T) {
 		t.Errorf("got status %d, want 502 (body: %s)", w.Code, w.Body.String())
 	}
 }
+
+func TestListExecutionsForwardsCursor(t *testing.T) {
+	var gotQuery string
+	mock := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		gotQuery = r.URL.RawQuery
+		if r.URL.Query().Get("cursor") == "" {
+			w.Header().Set("X-Next-Cursor", "page-2")
+		}
+		w.Header().Set("Content-Type", "application/json")
+		w.Write([]byte(`[]`))
+	}))
+	defer mock.Close()
+
+	router := newTestMux(t, mock)
+
+	w := httptest.NewRecorder()
+	router.ServeHTTP(w, httptest.NewRequest("GET", "/api/v1/executions?limit=2", nil))
+	if got := w.Header().Get("X-Next-Cursor"); got != "page-2" {
+		t.Errorf("got X-Next-Cursor %q, want %q", got, "page-2")
+	}
+	if gotQuery != "limit=2" {
+		t.Errorf("executor got query %q, want %q", gotQuery, "limit=2")
+	}
+
+	w = httptest.NewRecorder()
+	router.ServeHTTP(w, httptest.NewRequest("GET", "/api/v1/executions?limit=2&cursor=page-2", nil))
+	if got := w.Header().Get("X-Next-Cursor"); got != "" {
+		t.Errorf("last page should carry no cursor, got %q", got)
+	}
+}
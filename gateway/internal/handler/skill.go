@@ -60,11 +60,14 @@ func (h *SkillHandler) GetSkill(w http.ResponseWriter, r *http.Request) {
 }
 
 func (h *SkillHandler) ListExecutions(w http.ResponseWriter, r *http.Request) {
-	raw, err := h.executor.ListExecutions(r.Context(), r.URL.RawQuery)
+	raw, nextCursor, err := h.executor.ListExecutions(r.Context(), r.URL.RawQuery)
 	if err != nil {
 		httputil.RespondError(w, http.StatusBadGateway, err.Error())
 		return
 	}
+	if nextCursor != "" {
+		w.Header().Set("X-Next-Cursor", nextCursor)
+	}
 	w.Header().Set("Content-Type", "application/json")
 	w.WriteHeader(http.StatusOK)
 	w.Write(raw)
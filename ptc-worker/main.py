@@ -13,8 +13,9 @@ import asyncio
 import json
 import logging
 import os
+import threading
 import time
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 
 import httpx
 from fastapi import FastAPI
@@ -42,6 +43,8 @@ class PTCRequest(BaseModel):
     approval_tools: list[str] = Field(default_factory=list)
     verify_criteria: list[str] = Field(default_factory=list)
     verify_max_retries: int = 1
+    tool_concurrency: int = 4  # Max tool calls from one turn run concurrently (1 = sequential)
+    sequential_tools: list[str] = Field(default_factory=list)
 
 
 def _sse(event: str, data: dict) -> str:
@@ -58,6 +61,9 @@ _mcp_protocol_servers: set[str] = set()
 _mcp_session_ids: dict[str, str] = {}
 # Auth headers per server URL
 _mcp_server_headers: dict[str, dict[str, str]] = {}
+# Servers whose MCP session has been initialized (eagerly at discovery, or lazily)
+_mcp_initialized: set[str] = set()
+_mcp_init_lock = threading.Lock()
 
 
 def _parse_sse_data(text: str) -> dict:
@@ -105,12 +111,22 @@ def _mcp_initialize(server_url: str) -> bool:
         session_id = resp.headers.get("Mcp-Session-Id", "")
         if session_id:
             _mcp_session_ids[server_url] = session_id
+        _mcp_initialized.add(server_url)
         return True
     except Exception as exc:
         logger.error("MCP initialize failed for %s: %s", server_url, exc)
         return False
 
 
+def _ensure_initialized(server_url: str) -> None:
+    """Initialize an MCP session once per server (tool calls may run in parallel threads)."""
+    if server_url in _mcp_initialized:
+        return
+    with _mcp_init_lock:
+        if server_url not in _mcp_initialized:
+            _mcp_initialize(server_url)
+
+
 def _fetch_tools_rest(server_url: str) -> list[dict] | None:
     """Try REST API: GET {url}/tools → [{name, description, input_schema}]."""
     try:
@@ -173,6 +189,7 @@ def _fetch_mcp_tools(
     _mcp_protocol_servers.clear()
     _mcp_session_ids.clear()
     _mcp_server_headers.clear()
+    _mcp_initialized.clear()
 
     logger.info("MCP discovery: %d servers configured: %s", len(mcp_servers), list(mcp_servers.keys()))
     for server_name, server_cfg in mcp_servers.items():
@@ -187,13 +204,21 @@ def _fetch_mcp_tools(
         if server_cfg.get("headers"):
             _mcp_server_headers[server_url] = server_cfg["headers"]
 
-        # Try REST first (backward compat with k8s-mcp), fall back to MCP protocol
-        remote_tools = _fetch_tools_rest(server_url)
-        if remote_tools is None:
-            remote_tools = _fetch_tools_mcp(server_url)
-            if remote_tools is not None:
+        # Schemas pre-resolved by the executor: no discovery round-trips. MCP protocol
+        # sessions are then initialized lazily on the first tool call.
+        remote_tools = server_cfg.get("tools")
+        if remote_tools is not None:
+            if server_cfg.get("protocol") == "mcp":
                 _mcp_protocol_servers.add(server_url)
-                logger.info("MCP Streamable HTTP: %s (%s) — %d tools", server_name, server_url, len(remote_tools))
+            logger.info("MCP server %s: %d pre-resolved tools", server_name, len(remote_tools))
+        else:
+            # Try REST first (backward compat with k8s-mcp), fall back to MCP protocol
+            remote_tools = _fetch_tools_rest(server_url)
+            if remote_tools is None:
+                remote_tools = _fetch_tools_mcp(server_url)
+                if remote_tools is not None:
+                    _mcp_protocol_servers.add(server_url)
+                    logger.info("MCP Streamable HTTP: %s (%s) — %d tools", server_name, server_url, len(remote_tools))
 
         if remote_tools is None:
             logger.error("Failed to fetch tools from %s (%s) via both REST and MCP", server_name, server_url)
@@ -270,6 +295,7 @@ def _call_mcp_tool_rest(server_url: str, tool_name: str, arguments: dict) -> str
 
 def _call_mcp_tool_protocol(server_url: str, tool_name: str, arguments: dict) -> str:
     """Call tool via MCP Streamable HTTP: POST {url} with JSON-RPC tools/call."""
+    _ensure_initialized(server_url)
     resp = httpx.post(
         server_url,
         json={
@@ -337,6 +363,37 @@ def _call_mcp_tool(
         return f"[error] MCP call failed: {exc}"
 
 
+def _plan_tool_batches(blocks: list, sequential: set[str]) -> list[list]:
+    """Split one turn's tool_use blocks into ordered batches that may run concurrently.
+
+    A sequential-only tool (approval-gated, task_complete, or listed in the request's
+    sequential_tools) gets a batch of its own; a read_file or write_file of a path
+    already touched in the current batch starts a new one, so a read never runs
+    alongside the write before it (same rule as the SDK's agent_executor._path_key).
+    """
+    batches: list[list] = []
+    current: list = []
+    paths: set[str] = set()
+    for block in blocks:
+        if block.name in sequential:
+            if current:
+                batches.append(current)
+            batches.append([block])
+            current, paths = [], set()
+            continue
+        is_file_tool = block.name in ("write_file", "read_file") and isinstance(block.input, dict)
+        path = block.input.get("path", "") if is_file_tool else None
+        if path is not None and path in paths:
+            batches.append(current)
+            current, paths = [], set()
+        current.append(block)
+        if path is not None:
+            paths.add(path)
+    if current:
+        batches.append(current)
+    return batches
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -392,6 +449,7 @@ async def execute_stream(request: PTCRequest):
         final_output: dict = {}
         task_completed = False
         tools_called: set[str] = set()
+        sequential_tools = {"task_complete", *request.approval_tools, *request.sequential_tools}
 
         # Build base kwargs for API calls
         base_kwargs: dict = {
@@ -439,45 +497,57 @@ async def execute_stream(request: PTCRequest):
                     final_output = {"summary": "\n".join(text_parts)}
                     break
 
-                # Process tool calls
+                # Process tool calls — independent calls in one turn run concurrently,
+                # up to request.tool_concurrency at a time; results keep call order
                 tool_results = []
-                for block in resp.content:
-                    if block.type != "tool_use":
-                        continue
-
-                    iteration_count += 1
-                    yield _sse("iteration", {
-                        "iteration": iteration_count,
-                        "tool_name": block.name,
-                        "tool_input": block.input,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    })
-
-                    tool_output = await asyncio.to_thread(
-                        _call_mcp_tool,
-                        block.name, block.input, tool_server_map,
-                        tools_called=tools_called,
-                        approval_tools=request.approval_tools,
-                    )
-
-                    if block.name != "task_complete":
-                        tools_called.add(block.name)
-
-                    yield _sse("tool_result", {
-                        "tool_use_id": block.id,
-                        "output": tool_output[:2000],
-                    })
-
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": tool_output[:4000],
-                    })
-
-                    # Only accept task_complete if it wasn't rejected
-                    if block.name == "task_complete" and not tool_output.startswith("[error]"):
-                        final_output = block.input
-                        task_completed = True
+                slots = asyncio.Semaphore(max(1, request.tool_concurrency))
+
+                async def _dispatch(block, slots=slots) -> str:
+                    async with slots:
+                        return await asyncio.to_thread(
+                            _call_mcp_tool,
+                            block.name, block.input, tool_server_map,
+                            tools_called=tools_called,
+                            approval_tools=request.approval_tools,
+                        )
+
+                tool_blocks = [b for b in resp.content if b.type == "tool_use"]
+                for batch in _plan_tool_batches(tool_blocks, sequential_tools):
+                    batch_iterations = []
+                    for block in batch:
+                        iteration_count += 1
+                        batch_iterations.append(iteration_count)
+                        yield _sse("iteration", {
+                            "iteration": iteration_count,
+                            "tool_name": block.name,
+                            "tool_input": block.input,
+                            "timestamp": datetime.now(UTC).isoformat(),
+                        })
+
+                    outputs = await asyncio.gather(*(_dispatch(block) for block in batch))
+
+                    for block, n, tool_output in zip(batch, batch_iterations, outputs):
+                        if block.name != "task_complete":
+                            tools_called.add(block.name)
+
+                        yield _sse("tool_result", {
+                            "iteration": n,
+                            "tool_use_id": block.id,
+                            "output": tool_output[:2000],
+                        })
+
+                        tool_results.append({
+                            "type": "tool_result",
+                            "tool_use_id": block.id,
+                            "content": tool_output[:4000],
+                        })
+
+                        # Only accept task_complete if it wasn't rejected
+                        if block.name == "task_complete" and not tool_output.startswith("[error]"):
+                            final_output = block.input
+                            task_completed = True
+                            break
+                    if task_completed:
                         break
 
                 messages.append({"role": "user", "content": tool_results})
@@ -4,17 +4,28 @@ Exposes /execute, /code, /files, /health endpoints for the agent executor
 to drive tool calls against. Runs arbitrary user code — must be isolated.
 
 Also supports file-based IPC: if /ipc/ directory exists at startup, a background
-thread watches for request files and writes response files.
+thread watches for request files (inotify on Linux, polling otherwise), runs them
+concurrently on a worker pool, and writes response files.
+
+`python main.py --ipc-stdio` serves the same IPC tools over stdin/stdout instead, as
+length-prefixed JSON frames ("<length>\n<json>"), for one long-lived exec session
+opened by the executor.
 """
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import json
 import logging
+import os
+import select
+import struct
 import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from pathlib import Path
 
@@ -137,7 +148,65 @@ def read_file(path: str = Query(..., description="Absolute file path to read")):
 IPC_ROOT = Path("/ipc")
 IPC_REQUESTS = IPC_ROOT / "requests"
 IPC_RESPONSES = IPC_ROOT / "responses"
-IPC_POLL_INTERVAL = 0.1  # 100ms
+IPC_POLL_INTERVAL = 0.1  # 100ms, only without inotify
+IPC_RESCAN_INTERVAL = 5.0  # safety-net directory scan while idle
+IPC_WORKERS = int(os.environ.get("IPC_WORKERS", "4"))
+
+# inotify(7) event bits
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class _Inotify:
+    """Watch one directory for files finished being written (inotify via libc).
+
+    Same helper as agentura_sdk.sandbox.ipc_protocol — this image can't import the SDK.
+    """
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+
+    @classmethod
+    def watch(cls, directory: Path) -> _Inotify | None:
+        """None where inotify is unavailable (non-Linux, no instances left) — callers poll."""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            if libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+                os.close(fd)
+                return None
+        except (OSError, AttributeError):
+            return None
+        return cls(fd)
+
+    def read(self, timeout: float) -> list[str] | None:
+        """Names of files completed within `timeout`; None if the kernel dropped events."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            if mask & IN_Q_OVERFLOW:
+                return None
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if name:
+                names.append(os.fsdecode(name))
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
 
 
 def _handle_ipc_request(req_path: Path) -> None:
@@ -147,6 +216,8 @@ def _handle_ipc_request(req_path: Path) -> None:
         req_id = data["id"]
         tool = data["tool"]
         args = data.get("args", {})
+    except FileNotFoundError:
+        return  # already handled (duplicate event)
     except Exception as e:
         logger.error("IPC: failed to parse request %s: %s", req_path, e)
         req_path.unlink(missing_ok=True)
@@ -154,6 +225,22 @@ def _handle_ipc_request(req_path: Path) -> None:
 
     req_path.unlink(missing_ok=True)
 
+    result, error = _dispatch_ipc(tool, args)
+
+    IPC_RESPONSES.mkdir(parents=True, exist_ok=True)
+    response = {"id": req_id, "result": result, "error": error}
+    # Rename into place so the reader never sees a half-written response
+    tmp = IPC_RESPONSES / f"{req_id}.tmp"
+    tmp.write_text(json.dumps(response))
+    tmp.rename(IPC_RESPONSES / f"{req_id}.json")
+
+
+# run_code swaps sys.stdout to capture output, so code runs one at a time
+_code_lock = threading.Lock()
+
+
+def _dispatch_ipc(tool: str, args: dict) -> tuple[str | None, str | None]:
+    """Run one IPC tool call. Returns (result, error)."""
     result = None
     error = None
 
@@ -170,7 +257,8 @@ def _handle_ipc_request(req_path: Path) -> None:
             result = "\n".join(parts) or "(no output)"
 
         elif tool == "code":
-            resp = run_code(CodeRequest(code=args.get("code", "")))
+            with _code_lock:
+                resp = run_code(CodeRequest(code=args.get("code", "")))
             parts = []
             if resp.output:
                 parts.append(resp.output)
@@ -192,24 +280,69 @@ def _handle_ipc_request(req_path: Path) -> None:
     except Exception as e:
         error = f"{type(e).__name__}: {e}"
 
-    IPC_RESPONSES.mkdir(parents=True, exist_ok=True)
-    response = {"id": req_id, "result": result, "error": error}
-    (IPC_RESPONSES / f"{req_id}.json").write_text(json.dumps(response))
+    return result, error
 
 
 def _ipc_watcher() -> None:
-    """Background thread that polls /ipc/requests/ for new request files."""
-    logger.info("IPC watcher started, watching %s", IPC_REQUESTS)
+    """Background thread that hands /ipc/requests/ files to a worker pool as they land.
+
+    Woken by inotify when available; otherwise (or when the kernel drops events)
+    falls back to scanning the directory. After an error it backs off for a poll
+    interval and keeps going by polling. Requests run concurrently, so one slow
+    command no longer holds up the rest.
+    """
     IPC_REQUESTS.mkdir(parents=True, exist_ok=True)
     IPC_RESPONSES.mkdir(parents=True, exist_ok=True)
-
+    inotify = _Inotify.watch(IPC_REQUESTS)
+    logger.info("IPC watcher started, watching %s (%s)", IPC_REQUESTS, "inotify" if inotify else "polling")
+
+    pool = ThreadPoolExecutor(max_workers=IPC_WORKERS, thread_name_prefix="ipc")
+    queued: set[str] = set()
+    queued_lock = threading.Lock()
+
+    def submit(name: str) -> None:
+        if not name.endswith(".json"):
+            return
+        with queued_lock:
+            if name in queued:
+                return
+            queued.add(name)
+
+        def run() -> None:
+            try:
+                _handle_ipc_request(IPC_REQUESTS / name)
+            finally:
+                with queued_lock:
+                    queued.discard(name)
+
+        pool.submit(run)
+
+    def scan() -> None:
+        for req_path in sorted(IPC_REQUESTS.glob("*.json")):
+            submit(req_path.name)
+
+    scan()  # requests written before the watch existed
     while True:
         try:
-            for req_path in sorted(IPC_REQUESTS.glob("*.json")):
-                _handle_ipc_request(req_path)
+            if inotify is None:
+                time.sleep(IPC_POLL_INTERVAL)
+                scan()
+                continue
+            names = inotify.read(IPC_RESCAN_INTERVAL)
+            if not names:  # idle (or events dropped) — rescan as a safety net
+                scan()
+            for name in names or []:
+                submit(name)
         except Exception as e:
             logger.error("IPC watcher error: %s", e)
-        time.sleep(IPC_POLL_INTERVAL)
+            if inotify is not None:
+                logger.warning("IPC watcher switching to polling")
+                try:
+                    inotify.close()
+                except OSError:
+                    pass
+                inotify = None
+            time.sleep(IPC_POLL_INTERVAL)
 
 
 @app.on_event("startup")
@@ -221,7 +354,54 @@ def _start_ipc_watcher() -> None:
         logger.info("IPC file watcher thread started")
 
 
+# --- Stdio IPC agent (persistent exec channel) ---
+
+IPC_STDIO_WORKERS = int(os.environ.get("IPC_STDIO_WORKERS", "4"))
+
+
+def _ipc_stdio_agent() -> None:
+    """Serve framed IPC requests over stdin/stdout until the exec session ends.
+
+    Frames are "<length>\n<json>" with ASCII-only JSON. Requests run on a small
+    thread pool, so responses can come back out of order — they carry the request id.
+    The real stdin/stdout are moved to private descriptors first: tool subprocesses
+    and user code get /dev/null and stderr, so they can neither read requests nor
+    corrupt the frame stream.
+    """
+    frames_in = os.fdopen(os.dup(0), "rb")
+    frames_out = os.fdopen(os.dup(1), "wb", buffering=0)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+    out_lock = threading.Lock()
+
+    def send(message: dict) -> None:
+        payload = json.dumps(message)
+        with out_lock:
+            frames_out.write(f"{len(payload)}\n{payload}".encode("ascii"))
+
+    def serve(data: dict) -> None:
+        result, error = _dispatch_ipc(data.get("tool", ""), data.get("args", {}))
+        send({"id": data.get("id", ""), "result": result, "error": error})
+
+    send({"ready": True})
+    with ThreadPoolExecutor(max_workers=IPC_STDIO_WORKERS) as pool:
+        while True:
+            header = frames_in.readline()
+            if not header:
+                break  # executor closed the session
+            try:
+                data = json.loads(frames_in.read(int(header)))
+            except Exception as e:
+                logger.error("IPC stdio: bad frame: %s", e)
+                break
+            pool.submit(serve, data)
+
+
 if __name__ == "__main__":
-    import uvicorn
+    if "--ipc-stdio" in sys.argv:
+        _ipc_stdio_agent()
+    else:
+        import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+        uvicorn.run(app, host="0.0.0.0", port=8080)
@@ -103,6 +103,9 @@ def correct(skill_path: str, execution_id: str, correction: str, skills_dir: str
     if guardrails_updated:
         console.print(f"  [green]GUARDRAILS.md:[/] updated with new anti-pattern")
 
+    _record_feedback_events(skill_path, execution_id, correction, correction_id, reflexion_id,
+                            deepeval_file, promptfoo_file)
+
     # Summary
     _print_summary(console, skill_path, correction_id, reflexion_id, deepeval_file, promptfoo_file)
 
@@ -234,6 +237,58 @@ def _generate_reflexion(
     return reflexion_id
 
 
+def _record_feedback_events(
+    skill_path: str,
+    execution_id: str,
+    correction: str,
+    correction_id: str,
+    reflexion_id: str,
+    deepeval_file: Path | None = None,
+    promptfoo_file: Path | None = None,
+) -> None:
+    """Append correction/reflexion/test events to the platform event log (best-effort)."""
+    from agentura_sdk.memory.events import (
+        correction_event,
+        generated_test_event,
+        generated_test_id,
+        record_events,
+        reflexion_event,
+    )
+
+    events = [
+        correction_event(skill_path, {
+            "correction_id": correction_id, "execution_id": execution_id, "user_correction": correction,
+        }),
+        reflexion_event(skill_path, _load_reflexion(reflexion_id) or {"reflexion_id": reflexion_id}),
+    ]
+    if deepeval_file:
+        events.append(generated_test_event(
+            skill_path, generated_test_id(skill_path, Path(deepeval_file)), "deepeval",
+            f"DeepEval test from {Path(deepeval_file).name}",
+        ))
+    if promptfoo_file:
+        events.append(generated_test_event(
+            skill_path, generated_test_id(skill_path, Path(promptfoo_file), correction_id), "promptfoo",
+            f"Correction {correction_id}: {correction[:80]}",
+        ))
+    record_events(events)
+
+
+def _load_reflexion(reflexion_id: str) -> dict | None:
+    """Load a stored reflexion entry (generated rule, applies_when, confidence) by ID."""
+    import os
+    knowledge_dir = Path(os.environ.get("AGENTURA_KNOWLEDGE_DIR") or str(Path.cwd() / ".agentura"))
+    reflexion_file = knowledge_dir / "reflexion_entries.json"
+
+    if not reflexion_file.exists():
+        return None
+    data = json.loads(reflexion_file.read_text())
+    for entry in data.get("entries", []):
+        if entry.get("reflexion_id") == reflexion_id:
+            return entry
+    return None
+
+
 def _compute_confidence(original_str: str, correction: str) -> float:
     """Derive confidence from string similarity between original and correction.
 
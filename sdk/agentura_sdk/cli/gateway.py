@@ -55,10 +55,21 @@ def get_skill_detail(domain: str, skill: str) -> dict:
         return res.json()
 
 
-def list_executions(skill: str | None = None) -> list[dict]:
-    """GET /api/v1/executions."""
+def list_executions(
+    skill: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+    outcome: str | None = None,
+) -> list[dict]:
+    """GET /api/v1/executions — one page, newest first (the executor caps limit at 1000)."""
+    params: dict[str, Any] = {"limit": limit}
+    if skill:
+        params["skill"] = skill
+    if outcome:
+        params["outcome"] = outcome
+    if cursor:
+        params["cursor"] = cursor
     with _client() as c:
-        params = {"skill": skill} if skill else {}
         res = c.get("/api/v1/executions", params=params)
         res.raise_for_status()
         return res.json()
@@ -96,7 +96,7 @@ def get_domains(fmt: str):
 
     # Try to get execution counts
     try:
-        execs = list_executions()
+        execs = list_executions(limit=1000)
         for e in execs:
             d = e.get("skill", "").split("/")[0]
             if d in domains:
@@ -146,7 +146,7 @@ def get_executions(skill: str | None, limit: int, fmt: str):
     console = Console()
 
     try:
-        execs = list_executions(skill=skill)[:limit]
+        execs = list_executions(skill=skill, limit=limit)
     except Exception as e:
         console.print(f"[yellow]Could not fetch executions: {e}[/]")
         return
@@ -249,7 +249,7 @@ def get_threads(limit: int, fmt: str):
     import json
 
     console = Console()
-    execs = list_executions()
+    execs = list_executions(limit=1000)
 
     threads: dict[str, dict] = {}
     for e in execs:
@@ -306,13 +306,14 @@ def get_approvals(fmt: str):
     console = Console()
 
     try:
-        execs = list_executions()
+        pending = [
+            e for outcome in ("pending_approval", "pending_review")
+            for e in list_executions(outcome=outcome, limit=1000)
+        ]
     except Exception as e:
         console.print(f"[yellow]Could not fetch executions: {e}[/]")
         return
 
-    pending = [e for e in execs if e.get("outcome") in ("pending_approval", "pending_review")]
-
     if fmt == "json":
         console.print_json(json.dumps(pending, indent=2))
         return
@@ -69,7 +69,7 @@ def watch(skill: str | None, limit: int, interval: float):
         with Live(console=console, refresh_per_second=1) as live:
             while True:
                 try:
-                    execs = list_executions(skill=skill)[:limit]
+                    execs = list_executions(skill=skill, limit=limit)
                     title = f"Executions — {skill}" if skill else "Executions (live)"
                     live.update(_build_table(execs, title))
                 except Exception as e:
@@ -0,0 +1,46 @@
+"""Shared async HTTP client for tool traffic — sandbox runtimes and MCP servers.
+
+Sandbox backends and the MCP client send every request through one pooled
+httpx.AsyncClient per event loop, so a long-running run_command only holds a
+connection and never blocks the loop: other executions and health checks on the
+same process keep being served. Callers pass per-request timeouts.
+
+Usage:
+    resp = await get_async_client().post(url, json=payload, timeout=120)
+    await aclose_async_client()  # server shutdown
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+import httpx
+
+_LIMITS = httpx.Limits(
+    max_connections=int(os.environ.get("AGENTURA_TOOL_HTTP_MAX_CONNECTIONS", "200")),
+    max_keepalive_connections=50,
+    keepalive_expiry=60.0,
+)
+_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+_async_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Shared pooled client for the running event loop."""
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(timeout=_TIMEOUT, limits=_LIMITS)
+        _async_client_loop = loop
+    return _async_client
+
+
+async def aclose_async_client() -> None:
+    """Close the shared client (server shutdown)."""
+    global _async_client
+    if _async_client is not None and _async_client_loop is asyncio.get_running_loop():
+        await _async_client.aclose()
+    _async_client = None
@@ -1,6 +1,18 @@
 """Agentura MCP (Model Context Protocol) — tool registry and server management."""
 
-from agentura_sdk.mcp.client import call_tool, fetch_tool_definitions
+from agentura_sdk.mcp.client import (
+    call_tool,
+    call_tool_async,
+    fetch_tool_definitions,
+    fetch_tool_definitions_async,
+)
 from agentura_sdk.mcp.registry import MCPRegistry, get_registry
 
-__all__ = ["MCPRegistry", "get_registry", "fetch_tool_definitions", "call_tool"]
+__all__ = [
+    "MCPRegistry",
+    "get_registry",
+    "fetch_tool_definitions",
+    "fetch_tool_definitions_async",
+    "call_tool",
+    "call_tool_async",
+]
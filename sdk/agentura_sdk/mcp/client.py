@@ -1,25 +1,32 @@
-"""MCP HTTP client — thin wrapper for calling MCP tool servers over HTTP."""
+"""MCP HTTP client — thin wrapper for calling MCP tool servers over HTTP.
+
+The *_async variants share the pooled AsyncClient from agentura_sdk.http_client
+and back off with asyncio.sleep, so the agent loop never blocks on an MCP server.
+Tool definitions are served from the TTL/ETag cache in mcp.tool_cache.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 
 import httpx
 
+from agentura_sdk.http_client import get_async_client
+from agentura_sdk.mcp.tool_cache import fetch_rest, resolve_tools_async
+
 logger = logging.getLogger(__name__)
 
 _MAX_RETRIES = 3
 _RETRY_DELAY = 2  # seconds
 
 
-def fetch_tool_definitions(server_url: str) -> list[dict]:
-    """GET /tools from an MCP server, return list of Anthropic-format tool defs."""
+def fetch_tool_definitions(server_url: str, headers: dict[str, str] | None = None) -> list[dict]:
+    """GET /tools from an MCP server, return list of Anthropic-format tool defs (cached)."""
     for attempt in range(_MAX_RETRIES):
         try:
-            resp = httpx.get(f"{server_url}/tools", timeout=10)
-            resp.raise_for_status()
-            return resp.json()
+            return fetch_rest(server_url, headers)
         except (httpx.ConnectError, OSError) as exc:
             if attempt < _MAX_RETRIES - 1:
                 logger.warning("MCP fetch retry %d/%d for %s: %s", attempt + 1, _MAX_RETRIES, server_url, exc)
@@ -38,13 +45,51 @@ def call_tool(server_url: str, tool_name: str, arguments: dict) -> str:
                 timeout=60,
             )
             resp.raise_for_status()
-            data = resp.json()
-            if data.get("is_error"):
-                return f"[error] {data['content']}"
-            return data["content"]
+            return _tool_content(resp.json())
         except (httpx.ConnectError, OSError) as exc:
             if attempt < _MAX_RETRIES - 1:
                 logger.warning("MCP call retry %d/%d for %s/%s: %s", attempt + 1, _MAX_RETRIES, server_url, tool_name, exc)
                 time.sleep(_RETRY_DELAY)
             else:
                 raise
+
+
+async def fetch_tool_definitions_async(server_url: str, headers: dict[str, str] | None = None) -> list[dict]:
+    """Async fetch_tool_definitions (cached). Raises for servers that only speak MCP Streamable HTTP."""
+    for attempt in range(_MAX_RETRIES):
+        try:
+            resolved = await resolve_tools_async(server_url, headers)
+            if resolved.protocol != "rest":
+                raise ValueError(f"{server_url} has no REST tool API (MCP Streamable HTTP only)")
+            return resolved.tools
+        except (httpx.ConnectError, OSError) as exc:
+            if attempt < _MAX_RETRIES - 1:
+                logger.warning("MCP fetch retry %d/%d for %s: %s", attempt + 1, _MAX_RETRIES, server_url, exc)
+                await asyncio.sleep(_RETRY_DELAY)
+            else:
+                raise
+
+
+async def call_tool_async(server_url: str, tool_name: str, arguments: dict) -> str:
+    """Async call_tool."""
+    for attempt in range(_MAX_RETRIES):
+        try:
+            resp = await get_async_client().post(
+                f"{server_url}/tools/call",
+                json={"name": tool_name, "arguments": arguments},
+                timeout=60,
+            )
+            resp.raise_for_status()
+            return _tool_content(resp.json())
+        except (httpx.ConnectError, OSError) as exc:
+            if attempt < _MAX_RETRIES - 1:
+                logger.warning("MCP call retry %d/%d for %s/%s: %s", attempt + 1, _MAX_RETRIES, server_url, tool_name, exc)
+                await asyncio.sleep(_RETRY_DELAY)
+            else:
+                raise
+
+
+def _tool_content(data: dict) -> str:
+    if data.get("is_error"):
+        return f"[error] {data['content']}"
+    return data["content"]
@@ -0,0 +1,193 @@
+"""MCP Streamable HTTP session pool — one initialized session per (server URL, credential).
+
+Post-approval tool execution used to open a fresh client and run the initialize
+handshake for every approved call, so approving 20 pending actions cost 40 round-trips
+and 20 connection setups. Sessions are now initialized once and reused: requests carry
+the server's Mcp-Session-Id over the shared pooled HTTP client.
+
+A session idle for longer than MCP_SESSION_IDLE_S (default 300s) is re-initialized
+before use; one the server has already expired (HTTP 404 on a known session id) is
+re-initialized and the request retried once. Sessions are keyed like the tool cache —
+a hash of the auth headers — so different credentials never share a session.
+
+Usage:
+    pool = get_session_pool()
+    result = await pool.call_tool(url, "kubectl_get", {"name": "web"}, headers={"Authorization": "Bearer ..."})
+    await aclose_session_pool()  # server shutdown — DELETEs open sessions
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+from agentura_sdk.http_client import get_async_client
+from agentura_sdk.mcp.tool_cache import auth_identity, parse_sse_data
+
+logger = logging.getLogger(__name__)
+
+MCP_SESSION_IDLE_S = float(os.environ.get("MCP_SESSION_IDLE_S", "300"))
+MCP_CALL_TIMEOUT = int(os.environ.get("MCP_CALL_TIMEOUT", "60"))
+_PROTOCOL_VERSION = "2024-11-05"
+
+
+@dataclass
+class _Session:
+    url: str
+    headers: dict[str, str]
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    session_id: str | None = None  # None → not initialized; "" → stateless server
+    next_id: int = 1
+    last_used: float = 0.0
+
+
+class McpSessionPool:
+    """Initialized MCP sessions for the running event loop, reused across tool calls."""
+
+    def __init__(self, client_name: str = "agentura-approval") -> None:
+        self._client_name = client_name
+        self._sessions: dict[tuple[str, str], _Session] = {}
+        self.handshakes = 0
+
+    async def call_tool(
+        self, server_url: str, tool_name: str, arguments: dict, headers: dict[str, str] | None = None,
+    ) -> dict:
+        """tools/call over the pooled session; returns the JSON-RPC result."""
+        return await self.request(server_url, "tools/call", {"name": tool_name, "arguments": arguments}, headers)
+
+    async def request(
+        self, server_url: str, method: str, params: dict, headers: dict[str, str] | None = None,
+    ) -> dict:
+        """Send one JSON-RPC request, initializing (or re-initializing) the session as needed."""
+        session = self._get(server_url, headers)
+        session_id = await self._ensure_session(session)
+        resp = await self._post(session, method, params, session_id)
+        if session_id and _session_expired(resp):
+            logger.info("MCP session expired for %s — re-initializing", server_url)
+            session_id = await self._ensure_session(session, expired=session_id)
+            resp = await self._post(session, method, params, session_id)
+        resp.raise_for_status()
+        session.last_used = time.monotonic()
+
+        data = parse_sse_data(resp.text)
+        if data.get("error"):
+            error = data["error"]
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise RuntimeError(f"MCP {method} failed: {message}")
+        return data.get("result", {})
+
+    async def aclose(self) -> None:
+        """Terminate open sessions (best-effort DELETE) and forget them."""
+        sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            if not session.session_id:
+                continue
+            try:
+                await get_async_client().delete(
+                    session.url, headers=_headers(session, session.session_id), timeout=5,
+                )
+            except httpx.HTTPError:
+                pass
+
+    def _get(self, server_url: str, headers: dict[str, str] | None) -> _Session:
+        key = (server_url, auth_identity(headers))
+        session = self._sessions.get(key)
+        if session is None:
+            session = self._sessions[key] = _Session(url=server_url, headers=dict(headers or {}))
+        return session
+
+    async def _ensure_session(self, session: _Session, expired: str | None = None) -> str:
+        """Session id to use — single-flight initialize when missing, idle or expired."""
+        async with session.lock:
+            if expired is not None and session.session_id == expired:
+                session.session_id = None
+            if session.session_id is not None and time.monotonic() - session.last_used > MCP_SESSION_IDLE_S:
+                session.session_id = None
+            if session.session_id is None:
+                session.session_id = await self._initialize(session)
+                session.last_used = time.monotonic()
+            return session.session_id
+
+    async def _initialize(self, session: _Session) -> str:
+        http = get_async_client()
+        resp = await http.post(
+            session.url,
+            json={
+                "jsonrpc": "2.0", "id": 0, "method": "initialize",
+                "params": {
+                    "protocolVersion": _PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": self._client_name, "version": "1.0"},
+                },
+            },
+            headers=_headers(session, ""),
+            timeout=MCP_CALL_TIMEOUT,
+        )
+        resp.raise_for_status()
+        self.handshakes += 1
+        session_id = resp.headers.get("Mcp-Session-Id", "")
+        try:
+            await http.post(
+                session.url,
+                json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+                headers=_headers(session, session_id),
+                timeout=MCP_CALL_TIMEOUT,
+            )
+        except httpx.HTTPError:
+            logger.debug("notifications/initialized failed for %s", session.url)
+        return session_id
+
+    async def _post(self, session: _Session, method: str, params: dict, session_id: str) -> httpx.Response:
+        request_id = session.next_id
+        session.next_id += 1
+        return await get_async_client().post(
+            session.url,
+            json={"jsonrpc": "2.0", "id": request_id, "method": method, "params": params},
+            headers=_headers(session, session_id),
+            timeout=MCP_CALL_TIMEOUT,
+        )
+
+
+def _headers(session: _Session, session_id: str) -> dict[str, str]:
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json, text/event-stream",
+        **session.headers,
+    }
+    if session_id:
+        headers["Mcp-Session-Id"] = session_id
+    return headers
+
+
+def _session_expired(resp: httpx.Response) -> bool:
+    """404 on a session id means the server dropped it; some servers answer 400 instead."""
+    if resp.status_code == 404:
+        return True
+    return resp.status_code == 400 and "session" in resp.text.lower()
+
+
+_pool: McpSessionPool | None = None
+_pool_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_session_pool() -> McpSessionPool:
+    """Shared session pool for the running event loop."""
+    global _pool, _pool_loop
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool_loop is not loop:
+        _pool = McpSessionPool()
+        _pool_loop = loop
+    return _pool
+
+
+async def aclose_session_pool() -> None:
+    """Close the shared pool (server shutdown)."""
+    global _pool
+    if _pool is not None and _pool_loop is asyncio.get_running_loop():
+        await _pool.aclose()
+    _pool = None
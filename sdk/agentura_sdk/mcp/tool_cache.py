@@ -0,0 +1,199 @@
+"""MCP tool-definition cache — schemas keyed by (server URL, auth identity), TTL + ETag.
+
+Tool discovery used to cost several serial round-trips per execution (and an MCP
+initialize handshake per PTC worker pod). Resolved schemas are now cached per server
+URL and credential — a hash of the auth headers, so users with different OAuth tokens
+never share a cache entry and no secret is kept as a key.
+
+Entries are fresh for MCP_TOOLS_CACHE_TTL_S (default 300s). A stale REST entry is
+revalidated with If-None-Match when the server sent an ETag (304 → keep schemas);
+MCP Streamable HTTP servers have no conditional tools/list, so they are re-listed.
+If revalidation fails the stale schemas are served rather than dropping the server.
+
+The cache is a bounded LRU: at most MCP_TOOLS_CACHE_MAX_ENTRIES entries, and entries
+stale for longer than another TTL (e.g. the identity of a refreshed OAuth token) are
+dropped on every insert.
+
+Usage:
+    resolved = await resolve_tools_async(url, headers={"Authorization": "Bearer ..."})
+    resolved.tools     # [{"name", "description", "input_schema"}, ...]
+    resolved.protocol  # "rest" | "mcp"
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import httpx
+
+from agentura_sdk.http_client import get_async_client
+
+logger = logging.getLogger(__name__)
+
+MCP_TOOLS_CACHE_TTL_S = float(os.environ.get("MCP_TOOLS_CACHE_TTL_S", "300"))
+MCP_TOOLS_CACHE_MAX_ENTRIES = int(os.environ.get("MCP_TOOLS_CACHE_MAX_ENTRIES", "256"))
+MCP_FETCH_TIMEOUT = int(os.environ.get("MCP_FETCH_TIMEOUT", "10"))
+
+
+@dataclass
+class ResolvedTools:
+    tools: list[dict]
+    protocol: str  # "rest" (GET /tools) | "mcp" (Streamable HTTP JSON-RPC)
+    etag: str = ""
+    expires_at: float = 0.0
+
+
+_cache: OrderedDict[tuple[str, str], ResolvedTools] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def auth_identity(headers: dict[str, str] | None) -> str:
+    """Stable, non-reversible identity for the credentials in `headers`."""
+    if not headers:
+        return ""
+    canonical = json.dumps(sorted((k.lower(), v) for k, v in headers.items()))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def invalidate(server_url: str | None = None) -> None:
+    """Drop cached schemas for one server (all identities), or everything."""
+    with _cache_lock:
+        for key in [k for k in _cache if server_url is None or k[0] == server_url]:
+            _cache.pop(key, None)
+
+
+def fetch_rest(server_url: str, headers: dict[str, str] | None = None) -> list[dict]:
+    """Sync GET {url}/tools through the cache (REST servers only)."""
+    key = (server_url, auth_identity(headers))
+    cached = _lookup(key)
+    if cached is not None and time.monotonic() < cached.expires_at:
+        return cached.tools
+    request_headers = dict(headers or {})
+    if cached is not None and cached.etag:
+        request_headers["If-None-Match"] = cached.etag
+    resp = httpx.get(f"{server_url}/tools", headers=request_headers, timeout=MCP_FETCH_TIMEOUT)
+    return _store_rest(key, cached, resp).tools
+
+
+async def resolve_tools_async(server_url: str, headers: dict[str, str] | None = None) -> ResolvedTools:
+    """Cached schemas for `server_url`, discovering the protocol (REST, then MCP) on a miss."""
+    key = (server_url, auth_identity(headers))
+    cached = _lookup(key)
+    if cached is not None and time.monotonic() < cached.expires_at:
+        return cached
+    try:
+        if cached is not None and cached.protocol == "mcp":
+            return _store(key, await _list_tools_mcp(server_url, headers), "mcp")
+        resolved = await _fetch_rest_async(key, server_url, headers, cached)
+        if resolved is not None:
+            return resolved
+        return _store(key, await _list_tools_mcp(server_url, headers), "mcp")
+    except (httpx.HTTPError, OSError, ValueError):
+        if cached is None:
+            raise
+        logger.warning("MCP tool revalidation failed for %s — serving cached schemas", server_url, exc_info=True)
+        cached.expires_at = time.monotonic() + min(MCP_TOOLS_CACHE_TTL_S, 30.0)
+        return cached
+
+
+async def _fetch_rest_async(
+    key: tuple[str, str], server_url: str, headers: dict[str, str] | None, cached: ResolvedTools | None,
+) -> ResolvedTools | None:
+    """GET /tools (conditional if we hold an ETag). None → server speaks MCP protocol instead."""
+    request_headers = dict(headers or {})
+    if cached is not None and cached.etag:
+        request_headers["If-None-Match"] = cached.etag
+    resp = await get_async_client().get(f"{server_url}/tools", headers=request_headers, timeout=MCP_FETCH_TIMEOUT)
+    if resp.status_code in (404, 405, 406):
+        return None
+    return _store_rest(key, cached, resp)
+
+
+def _store_rest(key: tuple[str, str], cached: ResolvedTools | None, resp: httpx.Response) -> ResolvedTools:
+    if resp.status_code == 304 and cached is not None:
+        cached.expires_at = time.monotonic() + MCP_TOOLS_CACHE_TTL_S
+        return cached
+    resp.raise_for_status()
+    data = resp.json()
+    # Some servers return {"tools": [...]}
+    tools = data.get("tools", []) if isinstance(data, dict) else data
+    return _store(key, tools, "rest", etag=resp.headers.get("ETag", ""))
+
+
+def _lookup(key: tuple[str, str]) -> ResolvedTools | None:
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+        return cached
+
+
+def _store(key: tuple[str, str], tools: list[dict], protocol: str, etag: str = "") -> ResolvedTools:
+    now = time.monotonic()
+    resolved = ResolvedTools(tools=tools, protocol=protocol, etag=etag, expires_at=now + MCP_TOOLS_CACHE_TTL_S)
+    with _cache_lock:
+        # Stale entries are kept one more TTL for revalidation/failover, then dropped
+        for old in [k for k, v in _cache.items() if v.expires_at + MCP_TOOLS_CACHE_TTL_S < now]:
+            del _cache[old]
+        _cache[key] = resolved
+        _cache.move_to_end(key)
+        while len(_cache) > MCP_TOOLS_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return resolved
+
+
+async def _list_tools_mcp(server_url: str, headers: dict[str, str] | None) -> list[dict]:
+    """MCP Streamable HTTP: initialize → tools/list, normalized to Anthropic tool format."""
+    http = get_async_client()
+    request_headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json, text/event-stream",
+        **(headers or {}),
+    }
+    init = await http.post(
+        server_url,
+        json={
+            "jsonrpc": "2.0", "id": 0, "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "agentura-executor", "version": "1.0"},
+            },
+        },
+        headers=request_headers,
+        timeout=MCP_FETCH_TIMEOUT,
+    )
+    init.raise_for_status()
+    if init.headers.get("Mcp-Session-Id"):
+        request_headers["Mcp-Session-Id"] = init.headers["Mcp-Session-Id"]
+    resp = await http.post(
+        server_url,
+        json={"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}},
+        headers=request_headers,
+        timeout=MCP_FETCH_TIMEOUT,
+    )
+    resp.raise_for_status()
+    tools = parse_sse_data(resp.text).get("result", {}).get("tools", [])
+    return [
+        {
+            "name": tool["name"],
+            "description": tool.get("description", ""),
+            "input_schema": tool.get("input_schema") or tool.get("inputSchema") or {"type": "object", "properties": {}},
+        }
+        for tool in tools
+    ]
+
+
+def parse_sse_data(text: str) -> dict:
+    """Extract JSON from an SSE 'data:' frame (or a plain JSON body)."""
+    for line in text.strip().split("\n"):
+        if line.startswith("data: "):
+            return json.loads(line[6:])
+    return json.loads(text)
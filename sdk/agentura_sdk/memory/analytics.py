@@ -0,0 +1,223 @@
+"""Execution analytics over a time window — totals, outcomes, per-skill cost and latency.
+
+PgStore computes the per-(skill, outcome) groups in SQL from hourly/daily rollup tables;
+file-backed stores group in-memory entries with group_executions(). Both feed
+summarize_groups(), so every backend returns the same dict (the AnalyticsResponse fields
+minus recent_executions).
+
+The rollups also carry a latency histogram over LATENCY_BUCKET_BOUNDS_MS, so PgStore
+estimates p50/p95 with histogram_percentile() instead of reading raw executions; file-backed
+stores still compute exact percentiles.
+
+Windows are half-open [since, until) and resolve to whole UTC hours — the rollup grain —
+on every backend, so totals agree regardless of where they are computed.
+
+Usage:
+    since, until = resolve_window("2026-01-01T00:00:00Z", None)
+    groups = group_executions(entries, since=since, until=until)
+    summary = summarize_groups(groups, latency_percentiles, total_corrections=3, total_reflexions=1)
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+
+from agentura_sdk.memory.skill_stats import percentile
+
+# Log-scale latency buckets (~10% wide, 1ms .. ~3h). Histogram index i counts latencies in
+# [BOUNDS[i-1], BOUNDS[i]) — Postgres width_bucket() numbering, so index 0 is below 1ms and
+# index len(BOUNDS) is everything past the last bound.
+LATENCY_BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(round(1.1 ** i, 3) for i in range(170))
+
+
+class OutcomeGroup(NamedTuple):
+    """Aggregate of one (skill, outcome) pair within the window."""
+    skill: str
+    outcome: str
+    executions: int
+    cost_total: float
+    latency_total: float
+    tests_generated: int
+
+
+def parse_timestamp(value: object) -> datetime | None:
+    """Parse an ISO-8601 timestamp (naive values are taken as UTC). None if unparseable."""
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    else:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def resolve_window(
+    since: str | datetime | None, until: str | datetime | None
+) -> tuple[datetime | None, datetime | None]:
+    """Align a [since, until) window outward to whole UTC hours.
+
+    Raises ValueError on a bound that is given but not a valid timestamp.
+    """
+    bounds = []
+    for name, value in (("since", since), ("until", until)):
+        if value is None or value == "":
+            bounds.append(None)
+            continue
+        parsed = parse_timestamp(value)
+        if parsed is None:
+            raise ValueError(f"Invalid {name} timestamp: {value!r}")
+        bounds.append(parsed.astimezone(UTC))
+    lo, hi = bounds
+    if lo is not None:
+        lo = lo.replace(minute=0, second=0, microsecond=0)
+    if hi is not None:
+        floored = hi.replace(minute=0, second=0, microsecond=0)
+        hi = floored if floored == hi else floored + timedelta(hours=1)
+    return lo, hi
+
+
+def in_window(value: object, since: datetime | None, until: datetime | None) -> bool:
+    """True when `value` falls in [since, until). Unparseable timestamps only match an open window."""
+    if since is None and until is None:
+        return True
+    ts = parse_timestamp(value)
+    if ts is None:
+        return False
+    return (since is None or ts >= since) and (until is None or ts < until)
+
+
+def group_executions(
+    entries: Iterable[dict],
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> tuple[list[OutcomeGroup], dict[str | None, tuple[float, float]]]:
+    """In-memory equivalent of the rollup GROUP BY, plus exact latency percentiles.
+
+    Returns (groups, percentiles) where percentiles maps skill -> (p50, p95) and the
+    None key holds the overall figures.
+    """
+    totals: dict[tuple[str, str], list] = defaultdict(lambda: [0, 0.0, 0.0, 0])
+    latencies: dict[str, list[float]] = defaultdict(list)
+    for e in entries:
+        if not in_window(e.get("timestamp"), since, until):
+            continue
+        skill = e.get("skill", "unknown")
+        latency = float(e.get("latency_ms") or 0.0)
+        acc = totals[(skill, e.get("outcome") or "pending_review")]
+        acc[0] += 1
+        acc[1] += float(e.get("cost_usd") or 0.0)
+        acc[2] += latency
+        acc[3] += int(bool(e.get("correction_generated_test")))
+        latencies[skill].append(latency)
+
+    groups = [OutcomeGroup(skill, outcome, *acc) for (skill, outcome), acc in totals.items()]
+    everything = [v for values in latencies.values() for v in values]
+    percentiles: dict[str | None, tuple[float, float]] = {
+        skill: (percentile(values, 50), percentile(values, 95)) for skill, values in latencies.items()
+    }
+    percentiles[None] = (percentile(everything, 50), percentile(everything, 95))
+    return groups, percentiles
+
+
+def histogram_percentile(counts: Sequence[int], q: float) -> float:
+    """Estimate a percentile (q in 0..100) from a LATENCY_BUCKET_BOUNDS_MS histogram.
+
+    Interpolates like percentile(), placing each bucket's values evenly across the bucket,
+    so the estimate is within about half a bucket (~5%) of the exact value.
+    Returns 0.0 for an empty histogram.
+    """
+    total = sum(counts)
+    if not total:
+        return 0.0
+    pos = (total - 1) * q / 100
+    lo = int(pos)
+    low = _nth_latency(counts, lo)
+    high = _nth_latency(counts, min(lo + 1, total - 1))
+    return low + (high - low) * (pos - lo)
+
+
+def _nth_latency(counts: Sequence[int], n: int) -> float:
+    """Estimated value of the n-th smallest latency (0-based) in a histogram."""
+    bounds = LATENCY_BUCKET_BOUNDS_MS
+    seen = 0
+    for i, count in enumerate(counts):
+        if n < seen + count:
+            if i >= len(bounds):
+                return bounds[-1]
+            low = bounds[i - 1] if i else 0.0
+            return low + (bounds[i] - low) * (n - seen + 0.5) / count
+        seen += count
+    return bounds[-1]
+
+
+def summarize_groups(
+    groups: Iterable[OutcomeGroup],
+    percentiles: dict[str | None, tuple[float, float]],
+    *,
+    total_corrections: int,
+    total_reflexions: int,
+) -> dict:
+    """Fold (skill, outcome) groups into the analytics response fields."""
+    outcomes: dict[str, int] = defaultdict(int)
+    by_skill: dict[str, int] = defaultdict(int)
+    cost_by_skill: dict[str, float] = defaultdict(float)
+    latency_by_skill: dict[str, float] = defaultdict(float)
+    tests_generated = 0
+    for g in groups:
+        outcomes[g.outcome] += g.executions
+        by_skill[g.skill] += g.executions
+        cost_by_skill[g.skill] += g.cost_total
+        latency_by_skill[g.skill] += g.latency_total
+        tests_generated += g.tests_generated
+
+    total = sum(by_skill.values())
+    total_cost = sum(cost_by_skill.values())
+    total_latency = sum(latency_by_skill.values())
+    accepted = outcomes.get("accepted", 0)
+    p50, p95 = percentiles.get(None, (0.0, 0.0))
+    return {
+        "total_executions": total,
+        "accepted": accepted,
+        "corrected": outcomes.get("corrected", 0),
+        "pending_review": outcomes.get("pending_review", 0),
+        "accept_rate": round(accepted / total, 2) if total else 0,
+        "total_cost_usd": round(total_cost, 4),
+        "avg_cost_usd": round(total_cost / total, 4) if total else 0,
+        "avg_latency_ms": round(total_latency / total, 1) if total else 0,
+        "p50_latency_ms": round(p50, 1),
+        "p95_latency_ms": round(p95, 1),
+        "total_corrections": total_corrections,
+        "total_reflexions": total_reflexions,
+        "correction_to_test_rate": round(tests_generated / total_corrections, 2) if total_corrections else 0,
+        "outcomes": dict(outcomes),
+        "executions_by_skill": dict(by_skill),
+        "cost_by_skill": {k: round(v, 4) for k, v in cost_by_skill.items()},
+        "latency_by_skill": {k: round(latency_by_skill[k] / n, 1) for k, n in by_skill.items() if n},
+        "p50_latency_by_skill": {k: round(v[0], 1) for k, v in percentiles.items() if k is not None},
+        "p95_latency_by_skill": {k: round(v[1], 1) for k, v in percentiles.items() if k is not None},
+    }
+
+
+def summarize_entries(
+    entries: Iterable[dict],
+    corrections: Iterable[dict],
+    reflexions: Iterable[dict],
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> dict:
+    """Analytics for file-backed data. `since`/`until` should come from resolve_window()."""
+    groups, percentiles = group_executions(entries, since=since, until=until)
+    return summarize_groups(
+        groups,
+        percentiles,
+        total_corrections=sum(1 for c in corrections if in_window(c.get("timestamp"), since, until)),
+        total_reflexions=sum(1 for r in reflexions if in_window(r.get("created_at"), since, until)),
+    )
@@ -0,0 +1,193 @@
+"""Platform event log — one append-only record per execution, correction, reflexion or test.
+
+Events are written when the underlying record is written (PgStore inserts them in the
+same transaction) and listed newest first with the same keyset cursors as executions,
+ordered by (timestamp, event_id). Builders here give every writer the same event shape.
+
+Usage:
+    store.record_event(generated_test_event("hr/screener", "TEST-hr-screener-x", "deepeval", "..."))
+    page = store.query_events(domains={"hr"}, event_type="skill_executed", limit=50)
+    cursor = encode_cursor(page[-1], "event_id") if len(page) == 50 else None
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from agentura_sdk.memory.execution_query import decode_cursor
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPES = (
+    "skill_executed",
+    "correction_submitted",
+    "reflexion_generated",
+    "test_generated",
+    "budget_warning",
+)
+
+
+def _domain(skill: str) -> str:
+    return skill.split("/")[0] if "/" in skill else ""
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def execution_event(skill: str, entry: dict) -> dict:
+    outcome = entry.get("outcome") or "pending_review"
+    cost = entry.get("cost_usd") or 0
+    latency = entry.get("latency_ms") or 0
+    return {
+        "event_id": f"evt-exec-{entry.get('execution_id', '')}",
+        "event_type": "skill_executed",
+        "severity": "warning" if outcome == "corrected" else "info",
+        "domain": _domain(skill),
+        "skill": skill,
+        "message": f"Skill {skill} executed → {outcome} (${cost:.2f}, {latency:.0f}ms)",
+        "timestamp": entry.get("timestamp") or _now(),
+        "metadata": {"execution_id": entry.get("execution_id", ""), "outcome": outcome, "cost_usd": cost},
+    }
+
+
+def correction_event(skill: str, entry: dict) -> dict:
+    return {
+        "event_id": f"evt-corr-{entry.get('correction_id', '')}",
+        "event_type": "correction_submitted",
+        "severity": "warning",
+        "domain": _domain(skill),
+        "skill": skill,
+        "message": f"Correction on {skill}: {(entry.get('user_correction') or '')[:80]}",
+        "timestamp": entry.get("timestamp") or _now(),
+        "metadata": {"correction_id": entry.get("correction_id", ""), "execution_id": entry.get("execution_id", "")},
+    }
+
+
+def reflexion_event(skill: str, entry: dict) -> dict:
+    return {
+        "event_id": f"evt-refl-{entry.get('reflexion_id', '')}",
+        "event_type": "reflexion_generated",
+        "severity": "info",
+        "domain": _domain(skill),
+        "skill": skill,
+        "message": f"Reflexion rule learned for {skill}: {(entry.get('rule') or '')[:80]}",
+        "timestamp": entry.get("created_at") or _now(),
+        "metadata": {
+            "reflexion_id": entry.get("reflexion_id", ""),
+            "confidence": entry.get("confidence", 0),
+            "applies_when": entry.get("applies_when", ""),
+        },
+    }
+
+
+def generated_test_id(skill: str, test_file: Path, source_id: str = "") -> str:
+    """Stable test id: the file stem for one-test files, `<source_id>-<stem>` for appended YAML suites."""
+    prefix = f"TEST-{skill.replace('/', '-')}"
+    if test_file.suffix == ".py" or not source_id:
+        return f"{prefix}-{test_file.stem}"
+    return f"{prefix}-{source_id}-{test_file.stem}"
+
+
+def generated_test_event(skill: str, test_id: str, test_type: str, description: str = "") -> dict:
+    return {
+        "event_id": f"evt-test-{test_id}",
+        "event_type": "test_generated",
+        "severity": "info",
+        "domain": _domain(skill),
+        "skill": skill,
+        "message": f"Test generated for {skill}: {description[:80]}",
+        "timestamp": _now(),
+        "metadata": {"test_id": test_id, "test_type": test_type},
+    }
+
+
+# Descriptions written by the correction and failure generators carry the source id.
+_YAML_SOURCE_ID = re.compile(r"^(?:Correction (\S+):|Failure regression \([^)]*\): (\S+))")
+
+
+def scan_generated_test_events(skills_dir: Path) -> list[dict]:
+    """test_generated events for the tests already under <domain>/<skill>/tests/generated.
+
+    Ids match the live writers, so replaying the scan into the log only adds tests
+    generated before the log existed. Timestamps are the test files' mtimes.
+    """
+    import yaml
+
+    events: list[dict] = []
+    if not skills_dir.exists():
+        return events
+    for gen_dir in sorted(skills_dir.glob("*/*/tests/generated")):
+        domain_dir, skill_dir = gen_dir.parents[2], gen_dir.parents[1]
+        if domain_dir.name.startswith(".") or skill_dir.name.startswith("."):
+            continue
+        skill = f"{domain_dir.name}/{skill_dir.name}"
+        for test_file in sorted(gen_dir.glob("test_*.py")):
+            event = generated_test_event(
+                skill, generated_test_id(skill, test_file), "deepeval", f"DeepEval test from {test_file.name}"
+            )
+            events.append({**event, "timestamp": _mtime(test_file)})
+        for test_file in sorted(gen_dir.glob("*.yaml")):
+            try:
+                cases = (yaml.safe_load(test_file.read_text()) or {}).get("tests") or []
+            except Exception:
+                logger.debug("Skipping unreadable test suite %s", test_file, exc_info=True)
+                continue
+            for i, case in enumerate(cases):
+                description = str(case.get("description", ""))
+                match = _YAML_SOURCE_ID.match(description)
+                source_id = next(g for g in match.groups() if g) if match else str(i + 1)
+                event = generated_test_event(
+                    skill, generated_test_id(skill, test_file, source_id), "promptfoo", description
+                )
+                events.append({**event, "timestamp": _mtime(test_file)})
+    return events
+
+
+def _mtime(path: Path) -> str:
+    return datetime.fromtimestamp(path.stat().st_mtime, UTC).isoformat()
+
+
+def record_events(events: Iterable[dict]) -> None:
+    """Best-effort append to the active store's event log. Never raises."""
+    try:
+        from agentura_sdk.memory import get_memory_store
+
+        store = get_memory_store()
+        if not hasattr(store, "record_event"):
+            return
+        for event in events:
+            store.record_event(event)
+    except Exception:
+        logger.debug("Failed to record platform events", exc_info=True)
+
+
+def filter_events(
+    events: Iterable[dict],
+    *,
+    domains: set[str] | None = None,
+    domain: str | None = None,
+    event_type: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> list[dict]:
+    """In-memory equivalent of the SQL keyset query, for file-backed stores."""
+    after = decode_cursor(cursor) if cursor else None
+    rows = [
+        e for e in events
+        if (domains is None or e.get("domain") in domains)
+        and (not domain or e.get("domain") == domain)
+        and (not event_type or e.get("event_type") == event_type)
+    ]
+    rows.sort(key=_sort_key, reverse=True)
+    if after is not None:
+        rows = [e for e in rows if _sort_key(e) < after]
+    return rows[:limit] if limit is not None else rows
+
+
+def _sort_key(event: dict) -> tuple[str, str]:
+    return (str(event.get("timestamp", "")), str(event.get("event_id", "")))
@@ -0,0 +1,82 @@
+"""Keyset pagination + filtering for execution listings.
+
+Executions are listed newest first, ordered by (timestamp, execution_id) DESC. A page
+cursor is the (timestamp, execution_id) of the last row returned, encoded as an opaque
+URL-safe token; the next page starts strictly after it, so pages stay stable while new
+executions are logged.
+
+Usage:
+    rows = store.query_executions(domains={"hr"}, outcome="accepted", limit=50)
+    cursor = encode_cursor(rows[-1]) if len(rows) == 50 else None
+    more = store.query_executions(domains={"hr"}, outcome="accepted", limit=50, cursor=cursor)
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import Iterable
+from datetime import datetime
+
+from agentura_sdk.memory.analytics import in_window, parse_timestamp
+
+# Columns holding request/response payloads — omitted by list views (include_payload=False)
+PAYLOAD_COLUMNS = ("input_summary", "output_summary", "pending_approvals")
+
+
+def encode_cursor(row: dict, id_field: str = "execution_id") -> str:
+    """Opaque page token for the position right after `row` (tie-broken on `id_field`)."""
+    raw = json.dumps([str(row.get("timestamp", "")), row.get(id_field, "")])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Inverse of encode_cursor. Raises ValueError on a malformed token."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, execution_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return str(timestamp), str(execution_id)
+    except Exception as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def filter_executions(
+    entries: Iterable[dict],
+    *,
+    skill: str | None = None,
+    domains: set[str] | None = None,
+    outcome: str | None = None,
+    triggered_by: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_payload: bool = True,
+    since: str | datetime | None = None,
+    until: str | datetime | None = None,
+) -> list[dict]:
+    """In-memory equivalent of the SQL keyset query, for file-backed stores.
+
+    `since`/`until` bound the execution timestamp as [since, until).
+    """
+    after = decode_cursor(cursor) if cursor else None
+    lo = parse_timestamp(since) if since else None
+    hi = parse_timestamp(until) if until else None
+    rows = [
+        e for e in entries
+        if (not skill or e.get("skill") == skill)
+        and (domains is None or e.get("skill", "").split("/")[0] in domains)
+        and (not outcome or e.get("outcome") == outcome)
+        and (not triggered_by or e.get("triggered_by") == triggered_by)
+        and in_window(e.get("timestamp"), lo, hi)
+    ]
+    rows.sort(key=_sort_key, reverse=True)
+    if after is not None:
+        rows = [e for e in rows if _sort_key(e) < after]
+    if limit is not None:
+        rows = rows[:limit]
+    if not include_payload:
+        rows = [{k: v for k, v in e.items() if k not in PAYLOAD_COLUMNS} for e in rows]
+    return rows
+
+
+def _sort_key(entry: dict) -> tuple[str, str]:
+    return (str(entry.get("timestamp", "")), str(entry.get("execution_id", "")))
@@ -1,4 +1,8 @@
-"""Fleet session store — tracks parallel pipeline executions in PostgreSQL."""
+"""Fleet session store — tracks parallel pipeline executions in PostgreSQL.
+
+Agent and session status updates also NOTIFY on FLEET_CHANNEL (delivered on commit),
+so live views can follow a session without polling — see server/fleet_listener.py.
+"""
 
 from __future__ import annotations
 
@@ -9,7 +13,8 @@ from datetime import datetime, timezone
 
 import psycopg2
 import psycopg2.extras
-import psycopg2.pool
+
+from agentura_sdk.memory.pg_pool import get_pool, migrate_once
 
 FLEET_SCHEMA = """
 CREATE TABLE IF NOT EXISTS fleet_sessions (
@@ -55,16 +60,19 @@ CREATE INDEX IF NOT EXISTS idx_fleet_agents_session ON fleet_agents(session_id);
 CREATE INDEX IF NOT EXISTS idx_fleet_agents_status ON fleet_agents(status);
 """
 
+FLEET_CHANNEL = "agentura_fleet"
+
+# NOTIFY payloads are capped at 8000 bytes; agent errors are truncated to stay well under
+_NOTIFY_ERROR_CHARS = 500
+
 
 class FleetStore:
     """PostgreSQL store for fleet session tracking."""
 
     def __init__(self, dsn: str | None = None):
         self._dsn = dsn or os.environ.get("DATABASE_URL", "")
-        self._pool = psycopg2.pool.ThreadedConnectionPool(
-            minconn=2, maxconn=10, dsn=self._dsn,
-        )
-        self._ensure_schema()
+        self._pool = get_pool(self._dsn)
+        migrate_once(self._dsn, "fleet", self._ensure_schema)
 
     def _ensure_schema(self) -> None:
         conn = self._pool.getconn()
@@ -80,6 +88,11 @@ class FleetStore:
             return None
         return json.dumps(value)
 
+    @staticmethod
+    def _notify(cur, payload: dict) -> None:
+        """Queue a FLEET_CHANNEL notification; Postgres delivers it when the transaction commits."""
+        cur.execute("SELECT pg_notify(%s, %s)", (FLEET_CHANNEL, json.dumps(payload)))
+
     def _row_to_dict(self, row: dict) -> dict:
         d = dict(row)
         for field in ("input_data", "output"):
@@ -165,11 +178,24 @@ class FleetStore:
                        success = %s, output = %s, cost_usd = %s,
                        latency_ms = %s, error_message = %s,
                        updated_at = NOW()
-                       WHERE agent_id = %s""",
+                       WHERE agent_id = %s
+                       RETURNING session_id""",
                     (status, execution_id, pod_name, success,
                      self._serialize(output), cost_usd, latency_ms,
                      error_message, agent_id),
                 )
+                row = cur.fetchone()
+                if row:
+                    self._notify(cur, {
+                        "event": "agent_update",
+                        "session_id": row[0],
+                        "agent_id": agent_id,
+                        "status": status,
+                        "success": success,
+                        "cost_usd": cost_usd,
+                        "latency_ms": latency_ms,
+                        "error_message": error_message[:_NOTIFY_ERROR_CHARS],
+                    })
             conn.commit()
         finally:
             self._pool.putconn(conn)
@@ -202,9 +228,20 @@ class FleetStore:
         try:
             with conn.cursor() as cur:
                 cur.execute(
-                    f"UPDATE fleet_sessions SET {', '.join(parts)} WHERE session_id = %s",
+                    f"""UPDATE fleet_sessions SET {', '.join(parts)} WHERE session_id = %s
+                        RETURNING status, completed_agents, failed_agents, total_cost_usd""",
                     values,
                 )
+                row = cur.fetchone()
+                if row:
+                    self._notify(cur, {
+                        "event": "session_update",
+                        "session_id": session_id,
+                        "status": row[0],
+                        "completed_agents": row[1],
+                        "failed_agents": row[2],
+                        "total_cost_usd": row[3],
+                    })
             conn.commit()
         finally:
             self._pool.putconn(conn)
@@ -8,7 +8,8 @@ import uuid
 
 import psycopg2
 import psycopg2.extras
-import psycopg2.pool
+
+from agentura_sdk.memory.pg_pool import get_pool, migrate_once
 
 HEARTBEAT_SCHEMA = """
 CREATE TABLE IF NOT EXISTS heartbeat_runs (
@@ -65,10 +66,8 @@ class HeartbeatStore:
 
     def __init__(self, dsn: str | None = None):
         self._dsn = dsn or os.environ.get("DATABASE_URL", "")
-        self._pool = psycopg2.pool.ThreadedConnectionPool(
-            minconn=2, maxconn=10, dsn=self._dsn,
-        )
-        self._ensure_schema()
+        self._pool = get_pool(self._dsn)
+        migrate_once(self._dsn, "heartbeats", self._ensure_schema)
 
     def _ensure_schema(self) -> None:
         conn = self._pool.getconn()
@@ -7,9 +7,37 @@ from __future__ import annotations
 
 import json
 import os
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
+from agentura_sdk.memory.analytics import resolve_window, summarize_entries
+from agentura_sdk.memory.events import (
+    correction_event,
+    execution_event,
+    filter_events,
+    reflexion_event,
+)
+from agentura_sdk.memory.execution_query import filter_executions
+from agentura_sdk.memory.skill_stats import (
+    SkillStats,
+    build_skill_stats,
+    count_by_skill,
+    memory_stats,
+)
+from agentura_sdk.memory.text_search import KINDS, search_entries
+
+_EXECUTIONS_FILE = "episodic_memory.json"
+_EVENTS_FILE = "platform_events.json"
+
+
+def _file_version(path: Path) -> tuple[int, int]:
+    try:
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (-1, -1)
+
 
 class JSONStore:
     """Knowledge layer backed by .agentura/*.json files."""
@@ -19,6 +47,14 @@ class JSONStore:
             os.environ.get("AGENTURA_KNOWLEDGE_DIR") or str(Path.cwd() / ".agentura")
         )
         self._dir.mkdir(parents=True, exist_ok=True)
+        # Per-skill stats, valid while episodic_memory.json is at _stats_version.
+        # Writes through this store keep it current; outside writers (CLI) force a rebuild.
+        self._stats: dict[str, SkillStats] | None = None
+        self._stats_version: tuple[int, int] = (-1, -1)
+        # Point-lookup indexes: (file, field) → (file version, {value: rows})
+        self._indexes: dict[tuple[str, str], tuple[tuple[int, int], dict[str, list[dict]]]] = {}
+        # stats() counters: file → (file version, rows per skill)
+        self._counts: dict[str, tuple[tuple[int, int], Counter[str]]] = {}
 
     def _load(self, name: str) -> dict:
         f = self._dir / name
@@ -27,7 +63,26 @@ class JSONStore:
         return {}
 
     def _save(self, name: str, data: dict) -> None:
-        (self._dir / name).write_text(json.dumps(data, indent=2))
+        path = self._dir / name
+        track_stats = name == _EXECUTIONS_FILE and self._stats_current()
+        path.write_text(json.dumps(data, indent=2))
+        if track_stats:
+            self._stats_version = _file_version(path)
+
+    def _index(self, name: str, collection: str, field: str) -> dict[str, list[dict]]:
+        """Rows of one JSON file grouped by `field`, rebuilt only when the file changes."""
+        version = _file_version(self._dir / name)
+        cached = self._indexes.get((name, field))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        index: dict[str, list[dict]] = {}
+        for row in self._load(name).get(collection, []):
+            index.setdefault(row.get(field) or "", []).append(row)
+        self._indexes[(name, field)] = (version, index)
+        return index
+
+    def _stats_current(self) -> bool:
+        return self._stats is not None and self._stats_version == _file_version(self._dir / _EXECUTIONS_FILE)
 
     def log_execution(self, skill_path: str, data: dict) -> str:
         execution_id = data.get(
@@ -40,7 +95,10 @@ class JSONStore:
 
         mem = self._load("episodic_memory.json")
         mem.setdefault("entries", []).append(data)
+        if self._stats_current():
+            self._stats.setdefault(skill_path, SkillStats(skill=skill_path)).record(data)
         self._save("episodic_memory.json", mem)
+        self.record_event(execution_event(skill_path, data))
         return execution_id
 
     def add_correction(self, skill_path: str, data: dict) -> str:
@@ -53,6 +111,7 @@ class JSONStore:
         data.setdefault("timestamp", datetime.now(timezone.utc).isoformat())
         corr["corrections"].append(data)
         self._save("corrections.json", corr)
+        self.record_event(correction_event(skill_path, data))
         return correction_id
 
     def add_reflexion(self, skill_path: str, data: dict) -> str:
@@ -65,8 +124,30 @@ class JSONStore:
         data.setdefault("created_at", datetime.now(timezone.utc).isoformat())
         refl["entries"].append(data)
         self._save("reflexion_entries.json", refl)
+        self.record_event(reflexion_event(skill_path, data))
         return reflexion_id
 
+    def _load_events(self) -> dict:
+        """platform_events.json, seeded from the existing records on first use."""
+        if (self._dir / _EVENTS_FILE).exists():
+            return self._load(_EVENTS_FILE)
+        events = [execution_event(e.get("skill", ""), e) for e in self._load(_EXECUTIONS_FILE).get("entries", [])]
+        events += [correction_event(c.get("skill", ""), c) for c in self._load("corrections.json").get("corrections", [])]
+        events += [reflexion_event(r.get("skill", ""), r) for r in self._load("reflexion_entries.json").get("entries", [])]
+        return {"events": events}
+
+    def record_event(self, event: dict) -> str:
+        data = self._load_events()
+        events = data.setdefault("events", [])
+        if not any(e.get("event_id") == event["event_id"] for e in events):
+            events.append(event)
+        self._save(_EVENTS_FILE, data)
+        return event["event_id"]
+
+    def query_events(self, **filters) -> list[dict]:
+        """Filtered, keyset-paginated event listing — see events.filter_events."""
+        return filter_events(self._load_events().get("events", []), **filters)
+
     def get_reflexions(self, skill_path: str) -> list[dict]:
         refl = self._load("reflexion_entries.json")
         return [
@@ -83,6 +164,31 @@ class JSONStore:
         ]
         return matches[:limit]
 
+    def search_text(
+        self,
+        query: str,
+        domains: set[str] | None = None,
+        limit: int = 10,
+        *,
+        skill: str | None = None,
+        kinds: tuple[str, ...] = KINDS,
+    ) -> list[dict]:
+        """Ranked keyword search — see text_search.search_entries."""
+        files = {
+            "execution": (_EXECUTIONS_FILE, "entries"),
+            "correction": ("corrections.json", "corrections"),
+            "reflexion": ("reflexion_entries.json", "entries"),
+        }
+        rows: dict[str, list[dict]] = {}
+        for kind in kinds:
+            name, collection = files[kind]
+            rows[kind + "s"] = [
+                r for r in self._load(name).get(collection, [])
+                if (not skill or r.get("skill") == skill)
+                and (domains is None or r.get("skill", "").split("/")[0] in domains)
+            ]
+        return search_entries(query, limit=limit, **rows)
+
     def get_executions(self, skill_path: str | None = None) -> list[dict]:
         mem = self._load("episodic_memory.json")
         entries = mem.get("entries", [])
@@ -90,6 +196,71 @@ class JSONStore:
             entries = [e for e in entries if e.get("skill") == skill_path]
         return entries
 
+    def query_executions(self, **filters) -> list[dict]:
+        """Filtered, keyset-paginated execution listing — see execution_query.filter_executions."""
+        return filter_executions(self._load(_EXECUTIONS_FILE).get("entries", []), **filters)
+
+    def get_skill_stats(self, skill_path: str | None = None) -> dict[str, dict]:
+        """Per-skill execution stats keyed by skill path (one skill if skill_path is given)."""
+        if not self._stats_current():
+            version = _file_version(self._dir / _EXECUTIONS_FILE)
+            self._stats = build_skill_stats(self._load(_EXECUTIONS_FILE).get("entries", []))
+            self._stats_version = version
+        if skill_path:
+            entry = self._stats.get(skill_path)
+            return {skill_path: entry.to_dict()} if entry else {}
+        return {skill: entry.to_dict() for skill, entry in self._stats.items()}
+
+    def get_analytics(
+        self,
+        *,
+        domains: set[str] | None = None,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+    ) -> dict:
+        """Execution analytics for a [since, until) window — see analytics.summarize_entries."""
+        lo, hi = resolve_window(since, until)
+
+        def scoped(rows: list[dict]) -> list[dict]:
+            if domains is None:
+                return rows
+            return [r for r in rows if r.get("skill", "").split("/")[0] in domains]
+
+        return summarize_entries(
+            scoped(self._load(_EXECUTIONS_FILE).get("entries", [])),
+            scoped(self._load("corrections.json").get("corrections", [])),
+            scoped(self._load("reflexion_entries.json").get("entries", [])),
+            since=lo,
+            until=hi,
+        )
+
+    def stats(self, domains: set[str] | None = None) -> dict:
+        """Memory counts (see skill_stats.memory_stats) from per-file counters cached by file version."""
+        counts = {}
+        for kind, name, collection in (
+            ("executions", _EXECUTIONS_FILE, "entries"),
+            ("corrections", "corrections.json", "corrections"),
+            ("reflexions", "reflexion_entries.json", "entries"),
+        ):
+            version = _file_version(self._dir / name)
+            cached = self._counts.get(name)
+            if cached is None or cached[0] != version:
+                cached = (version, count_by_skill(self._load(name).get(collection, [])))
+                self._counts[name] = cached
+            counts[kind] = cached[1]
+        return memory_stats(counts, domains)
+
+    def get_execution_by_id(self, execution_id: str) -> dict | None:
+        rows = self._index(_EXECUTIONS_FILE, "entries", "execution_id").get(execution_id)
+        return rows[-1] if rows else None
+
+    def get_corrections_for_execution(self, execution_id: str) -> list[dict]:
+        return list(self._index("corrections.json", "corrections", "execution_id").get(execution_id, []))
+
+    def get_reflexions_for_corrections(self, correction_ids: list[str]) -> list[dict]:
+        index = self._index("reflexion_entries.json", "entries", "correction_id")
+        return [r for cid in dict.fromkeys(correction_ids) for r in index.get(cid, [])]
+
     def get_corrections(self, skill_path: str | None = None) -> list[dict]:
         corr = self._load("corrections.json")
         corrections = corr.get("corrections", [])
@@ -126,6 +297,11 @@ class JSONStore:
                 entry["times_injected"] = entry.get("times_injected", 0) + 1
         self._save("reflexion_entries.json", refl)
 
+    def record_reflexion_outcome(self, execution_id: str, reflexion_ids: list[str], helped: bool) -> None:
+        self.record_reflexion_injection(execution_id, reflexion_ids)
+        if helped:
+            self.record_execution_success(execution_id)
+
     def record_execution_success(self, execution_id: str) -> None:
         mem = self._load("episodic_memory.json")
         exec_entry = next(
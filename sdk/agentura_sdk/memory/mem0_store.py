@@ -12,10 +12,13 @@ from __future__ import annotations
 import json
 import os
 import uuid
+from collections import Counter
 from datetime import datetime, timezone
 
 from mem0 import Memory
 
+from agentura_sdk.memory.skill_stats import count_by_skill, memory_stats
+
 
 def _build_config() -> dict:
     """Build mem0 config using available API keys."""
@@ -89,6 +92,8 @@ class Mem0Store:
     def __init__(self):
         config = _build_config()
         self._memory = Memory.from_config(config)
+        # stats() counters per kind, loaded on first use and bumped on every add
+        self._counts: dict[str, Counter[str]] | None = None
 
     def log_execution(self, skill_path: str, data: dict) -> str:
         execution_id = data.get(
@@ -119,6 +124,7 @@ class Mem0Store:
                 **{k: v for k, v in data.items() if isinstance(v, (str, int, float, bool))},
             },
         )
+        self._bump("executions", skill_path)
         return execution_id
 
     def add_correction(self, skill_path: str, data: dict) -> str:
@@ -145,6 +151,7 @@ class Mem0Store:
                 **{k: v for k, v in data.items() if isinstance(v, (str, int, float, bool))},
             },
         )
+        self._bump("corrections", skill_path)
         return correction_id
 
     def add_reflexion(self, skill_path: str, data: dict) -> str:
@@ -177,6 +184,7 @@ class Mem0Store:
                 "validated_by_test": data.get("validated_by_test", False),
             },
         )
+        self._bump("reflexions", skill_path)
         return reflexion_id
 
     def get_reflexions(self, skill_path: str) -> list[dict]:
@@ -222,6 +230,24 @@ class Mem0Store:
         entries = results.get("results", results) if isinstance(results, dict) else results
         return [self._to_reflexion_dict(m) for m in entries]
 
+    def stats(self, domains: set[str] | None = None) -> dict:
+        """Memory counts (see skill_stats.memory_stats) from in-process counters.
+
+        One get_all() per kind seeds the counters; later adds through this store
+        increment them. mem0 may consolidate memories on add, so counts are approximate.
+        """
+        if self._counts is None:
+            self._counts = {
+                "executions": count_by_skill(self.get_executions()),
+                "corrections": count_by_skill(self.get_corrections()),
+                "reflexions": count_by_skill(self.get_all_reflexions()),
+            }
+        return memory_stats(self._counts, domains)
+
+    def _bump(self, kind: str, skill_path: str) -> None:
+        if self._counts is not None:
+            self._counts[kind][skill_path] += 1
+
     def update_reflexion(self, reflexion_id: str, updates: dict) -> None:
         """Update a reflexion entry by ID.
 
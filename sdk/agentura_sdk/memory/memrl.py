@@ -0,0 +1,99 @@
+"""MemRL counter aggregation — batches reflexion injected/helped deltas (DEC-066).
+
+By default PgStore applies MemRL updates with one set-based UPDATE per execution. With
+AGENTURA_MEMRL_FLUSH_MS > 0 it instead adds the deltas here, and a daemon thread
+applies everything accumulated since the last flush in one UPDATE ... FROM unnest().
+
+Utility is recomputed from the flushed totals, (helped + 2) / (injected + 4), for every
+reflexion that gained a success in the window — the same formula, evaluated once per
+flush instead of once per execution. Deltas that fail to apply are kept for the next flush.
+
+Usage:
+    aggregator = get_memrl_aggregator(dsn, store.apply_memrl_deltas)  # None → disabled
+    aggregator.add(["REFL-001", "REFL-002"], injected=1, helped=1)
+    aggregator.flush()
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+MEMRL_FLUSH_MS = int(os.environ.get("AGENTURA_MEMRL_FLUSH_MS", "0"))
+
+
+class MemRLAggregator:
+    """In-memory reflexion_id → (injected, helped) deltas, flushed periodically via `apply`."""
+
+    def __init__(self, apply: Callable[[dict[str, tuple[int, int]]], None], flush_interval_s: float):
+        self._apply = apply
+        self._flush_interval_s = flush_interval_s
+        self._deltas: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="memrl-aggregator", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def add(self, reflexion_ids: Iterable[str], *, injected: int = 0, helped: int = 0) -> None:
+        """Count one execution's injection/success for each (distinct) reflexion id."""
+        self.add_deltas({rid: (injected, helped) for rid in reflexion_ids})
+
+    def add_deltas(self, deltas: dict[str, tuple[int, int]]) -> None:
+        with self._lock:
+            for rid, (injected, helped) in deltas.items():
+                i, h = self._deltas.get(rid, (0, 0))
+                self._deltas[rid] = (i + injected, h + helped)
+
+    @property
+    def pending(self) -> int:
+        return len(self._deltas)
+
+    def flush(self) -> None:
+        """Apply all pending deltas now."""
+        with self._flush_lock:
+            with self._lock:
+                deltas, self._deltas = self._deltas, {}
+            if not deltas:
+                return
+            try:
+                self._apply(deltas)
+            except Exception as e:
+                logger.warning("MemRL flush of %d reflexions failed, retrying next flush: %s", len(deltas), e)
+                self.add_deltas(deltas)
+
+    def close(self) -> None:
+        """Stop the flush thread and apply whatever is still pending."""
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._flush_interval_s):
+            self.flush()
+
+
+_aggregators: dict[str, MemRLAggregator] = {}
+_registry_lock = threading.Lock()
+
+
+def get_memrl_aggregator(
+    dsn: str, apply: Callable[[dict[str, tuple[int, int]]], None]
+) -> MemRLAggregator | None:
+    """Process-wide aggregator for `dsn`, or None unless AGENTURA_MEMRL_FLUSH_MS > 0."""
+    if MEMRL_FLUSH_MS <= 0:
+        return None
+    aggregator = _aggregators.get(dsn)
+    if aggregator is not None:
+        return aggregator
+    with _registry_lock:
+        if dsn not in _aggregators:
+            _aggregators[dsn] = MemRLAggregator(apply, MEMRL_FLUSH_MS / 1000)
+        return _aggregators[dsn]
@@ -0,0 +1,157 @@
+"""Process-wide Postgres connection pools — one bounded pool per DSN, shared by every store.
+
+PgStore, FleetStore, TicketStore, AgentStore and HeartbeatStore all take their pool
+from get_pool(), so constructing a store per request costs no new connections, and
+the process never holds more than PG_POOL_MAX connections per database. When every
+connection is checked out, getconn() waits (up to PG_POOL_TIMEOUT_S) instead of
+failing like a bare ThreadedConnectionPool does.
+
+Schema DDL runs through migrate_once(): the first store of each kind migrates, later
+instances skip it. The server calls migrate_all() at startup.
+
+Usage:
+    self._pool = get_pool(self._dsn)
+    migrate_once(self._dsn, "fleet", self._ensure_schema)
+    pool_metrics()  # {"<dsn host/db>": {"in_use": 3, "max": 20, "wait_ms_avg": 0.4, ...}}
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+
+import psycopg2.extensions
+import psycopg2.pool
+
+PG_POOL_MIN = int(os.environ.get("PG_POOL_MIN", "2"))
+PG_POOL_MAX = int(os.environ.get("PG_POOL_MAX", "20"))
+PG_POOL_TIMEOUT_S = float(os.environ.get("PG_POOL_TIMEOUT_S", "30"))
+
+
+class PoolTimeout(psycopg2.pool.PoolError):
+    """No connection became free within the pool's wait timeout."""
+
+
+class SharedPool:
+    """Bounded, blocking ThreadedConnectionPool with wait-time and utilization counters.
+
+    Drop-in for the getconn()/putconn() calls the stores already make.
+    """
+
+    def __init__(self, dsn: str, minconn: int = PG_POOL_MIN, maxconn: int = PG_POOL_MAX,
+                 timeout_s: float = PG_POOL_TIMEOUT_S):
+        self._pool = psycopg2.pool.ThreadedConnectionPool(minconn=minconn, maxconn=maxconn, dsn=dsn)
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._timeout_s = timeout_s
+        self._lock = threading.Lock()
+        self.maxconn = maxconn
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._acquired = 0
+        self._waited = 0
+        self._timeouts = 0
+        self._wait_total_s = 0.0
+        self._wait_max_s = 0.0
+
+    def getconn(self) -> psycopg2.extensions.connection:
+        start = time.monotonic()
+        if not self._slots.acquire(timeout=self._timeout_s):
+            with self._lock:
+                self._timeouts += 1
+            raise PoolTimeout(f"No Postgres connection free after {self._timeout_s:.0f}s (max {self.maxconn})")
+        try:
+            conn = self._pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+        waited = time.monotonic() - start
+        with self._lock:
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            self._acquired += 1
+            self._wait_total_s += waited
+            self._wait_max_s = max(self._wait_max_s, waited)
+            if waited > 0.001:
+                self._waited += 1
+        return conn
+
+    def putconn(self, conn: psycopg2.extensions.connection, close: bool = False) -> None:
+        try:
+            self._pool.putconn(conn, close=close)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def closeall(self) -> None:
+        self._pool.closeall()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "in_use": self._in_use,
+                "max": self.maxconn,
+                "utilization": round(self._in_use / self.maxconn, 3),
+                "peak_in_use": self._peak_in_use,
+                "acquired_total": self._acquired,
+                "waited_total": self._waited,
+                "timeouts_total": self._timeouts,
+                "wait_ms_avg": round(self._wait_total_s * 1000 / self._acquired, 3) if self._acquired else 0.0,
+                "wait_ms_max": round(self._wait_max_s * 1000, 3),
+            }
+
+
+_pools: dict[str, SharedPool] = {}
+_migrated: set[tuple[str, str]] = set()
+_registry_lock = threading.Lock()
+
+
+def get_pool(dsn: str) -> SharedPool:
+    """The process-wide pool for `dsn`, created on first use."""
+    pool = _pools.get(dsn)
+    if pool is not None:
+        return pool
+    with _registry_lock:
+        if dsn not in _pools:
+            _pools[dsn] = SharedPool(dsn)
+        return _pools[dsn]
+
+
+def migrate_once(dsn: str, name: str, migrate: Callable[[], None]) -> None:
+    """Run `migrate` for schema `name` on `dsn` unless it already ran in this process."""
+    key = (dsn, name)
+    if key in _migrated:
+        return
+    with _registry_lock:
+        if key in _migrated:
+            return
+        migrate()
+        _migrated.add(key)
+
+
+def migrate_all(dsn: str) -> None:
+    """Create every Postgres-backed store once so each schema is migrated up front."""
+    from agentura_sdk.memory.agent_store import AgentStore
+    from agentura_sdk.memory.fleet_store import FleetStore
+    from agentura_sdk.memory.heartbeat_store import HeartbeatStore
+    from agentura_sdk.memory.pg_store import PgStore
+    from agentura_sdk.memory.ticket_store import TicketStore
+
+    # Dependency order: tickets and heartbeat_runs reference agents
+    for store_cls in (PgStore, FleetStore, AgentStore, TicketStore, HeartbeatStore):
+        store_cls(dsn)
+
+
+def pool_metrics() -> dict[str, dict]:
+    """Per-pool metrics keyed by database (credentials stripped from the DSN)."""
+    return {_label(dsn): pool.metrics() for dsn, pool in list(_pools.items())}
+
+
+def _label(dsn: str) -> str:
+    try:
+        params = psycopg2.extensions.parse_dsn(dsn)
+    except psycopg2.Error:
+        return "postgres"
+    return f"{params.get('host', 'localhost')}/{params.get('dbname', '')}"
@@ -7,12 +7,54 @@ All tables are scoped by (domain, workspace_id) for cross-domain isolation.
 from __future__ import annotations
 
 import json
+import logging
 import os
-from datetime import datetime, timezone
+import threading
+from datetime import UTC, datetime, timedelta
 
 import psycopg2
 import psycopg2.extras
-import psycopg2.pool
+
+from agentura_sdk.memory.analytics import (
+    LATENCY_BUCKET_BOUNDS_MS,
+    OutcomeGroup,
+    histogram_percentile,
+    resolve_window,
+    summarize_groups,
+)
+from agentura_sdk.memory.events import (
+    correction_event,
+    execution_event,
+    reflexion_event,
+)
+from agentura_sdk.memory.execution_query import decode_cursor
+from agentura_sdk.memory.memrl import get_memrl_aggregator
+from agentura_sdk.memory.pg_pool import get_pool, migrate_once
+from agentura_sdk.memory.skill_stats import STATS_WINDOW, SkillStats
+from agentura_sdk.memory.text_search import KIND_WEIGHTS, KINDS, to_result
+
+logger = logging.getLogger(__name__)
+
+# executions columns minus the JSONB payloads, for list views
+_EXECUTION_LIST_COLUMNS = (
+    "execution_id, domain, workspace_id, skill, timestamp, outcome, cost_usd, latency_ms, "
+    "model_used, user_feedback, correction_generated_test, reflexion_applied, reviewer_notes, "
+    "created_at, reflexions_injected, triggered_by"
+)
+
+
+def _memrl_set(injected: str, helped: str) -> str:
+    """SET clause adding (injected, helped) to `reflexions AS r` counters.
+
+    Utility (h+2)/(n+4) is rescored, from the updated counts, only when helped > 0.
+    """
+    return f"""times_injected = r.times_injected + {injected},
+               times_helped = r.times_helped + {helped},
+               utility_score = CASE WHEN {helped} > 0
+                   THEN (r.times_helped + {helped} + 2)::REAL / (r.times_injected + {injected} + 4)::REAL
+                   ELSE r.utility_score END,
+               last_scored_at = CASE WHEN {helped} > 0 THEN NOW() ELSE r.last_scored_at END"""
+
 
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS executions (
@@ -71,6 +113,8 @@ CREATE INDEX IF NOT EXISTS idx_corrections_skill ON corrections(skill);
 CREATE INDEX IF NOT EXISTS idx_corrections_domain ON corrections(domain);
 CREATE INDEX IF NOT EXISTS idx_reflexions_skill ON reflexions(skill);
 CREATE INDEX IF NOT EXISTS idx_reflexions_domain ON reflexions(domain);
+CREATE INDEX IF NOT EXISTS idx_corrections_execution ON corrections(execution_id);
+CREATE INDEX IF NOT EXISTS idx_reflexions_correction ON reflexions(correction_id);
 
 CREATE TABLE IF NOT EXISTS fleet_sessions (
     id SERIAL PRIMARY KEY,
@@ -145,8 +189,311 @@ ALTER TABLE executions ADD COLUMN IF NOT EXISTS pending_approvals JSONB DEFAULT
 -- RBAC: track who triggered each execution
 ALTER TABLE executions ADD COLUMN IF NOT EXISTS triggered_by VARCHAR(200) DEFAULT '';
 CREATE INDEX IF NOT EXISTS idx_executions_triggered_by ON executions(triggered_by);
+
+-- Keyset pagination for execution listings: ORDER BY timestamp DESC, execution_id DESC
+CREATE INDEX IF NOT EXISTS idx_executions_keyset ON executions(workspace_id, timestamp DESC, execution_id DESC);
+
+-- Per-skill execution stats, maintained by log_execution and outcome updates
+CREATE TABLE IF NOT EXISTS skill_stats (
+    workspace_id TEXT NOT NULL DEFAULT 'default',
+    skill TEXT NOT NULL,
+    domain TEXT NOT NULL DEFAULT '',
+    executions_total INT NOT NULL DEFAULT 0,
+    accepted_total INT NOT NULL DEFAULT 0,
+    error_total INT NOT NULL DEFAULT 0,
+    cost_total DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+    latency_total DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+    latency_samples REAL[] NOT NULL DEFAULT '{}',
+    cost_samples REAL[] NOT NULL DEFAULT '{}',
+    last_execution_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (workspace_id, skill)
+);
+
+-- Analytics rollups: per (UTC bucket, skill, outcome) aggregates, recomputed per dirty hour
+CREATE TABLE IF NOT EXISTS execution_rollups_hourly (
+    workspace_id TEXT NOT NULL DEFAULT 'default',
+    bucket TIMESTAMPTZ NOT NULL,
+    skill TEXT NOT NULL,
+    domain TEXT NOT NULL DEFAULT '',
+    outcome TEXT NOT NULL,
+    executions INT NOT NULL DEFAULT 0,
+    cost_total DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+    latency_total DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+    tests_generated INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (workspace_id, bucket, skill, outcome)
+);
+
+CREATE TABLE IF NOT EXISTS execution_rollups_daily (
+    workspace_id TEXT NOT NULL DEFAULT 'default',
+    bucket TIMESTAMPTZ NOT NULL,
+    skill TEXT NOT NULL,
+    domain TEXT NOT NULL DEFAULT '',
+    outcome TEXT NOT NULL,
+    executions INT NOT NULL DEFAULT 0,
+    cost_total DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+    latency_total DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+    tests_generated INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (workspace_id, bucket, skill, outcome)
+);
+
+-- Hours whose rollups are stale; appended in the same transaction as the execution write
+CREATE TABLE IF NOT EXISTS execution_rollup_queue (
+    id BIGSERIAL PRIMARY KEY,
+    workspace_id TEXT NOT NULL DEFAULT 'default',
+    bucket TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_execution_rollup_queue_workspace ON execution_rollup_queue(workspace_id);
+
+-- Sparse latency histogram per rollup row: non-empty analytics.LATENCY_BUCKET_BOUNDS_MS bins
+-- (width_bucket indexes) and their counts
+ALTER TABLE execution_rollups_hourly ADD COLUMN IF NOT EXISTS latency_bins INT[];
+ALTER TABLE execution_rollups_hourly ADD COLUMN IF NOT EXISTS latency_counts INT[];
+ALTER TABLE execution_rollups_daily ADD COLUMN IF NOT EXISTS latency_bins INT[];
+ALTER TABLE execution_rollups_daily ADD COLUMN IF NOT EXISTS latency_counts INT[];
+
+-- Append-only platform event log, listed newest first with keyset pagination
+CREATE TABLE IF NOT EXISTS platform_events (
+    id BIGSERIAL PRIMARY KEY,
+    event_id TEXT UNIQUE NOT NULL,
+    workspace_id TEXT NOT NULL DEFAULT 'default',
+    domain TEXT NOT NULL DEFAULT '',
+    event_type TEXT NOT NULL,
+    severity TEXT NOT NULL DEFAULT 'info',
+    skill TEXT NOT NULL DEFAULT '',
+    message TEXT NOT NULL DEFAULT '',
+    timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    metadata JSONB NOT NULL DEFAULT '{}'::jsonb
+);
+CREATE INDEX IF NOT EXISTS idx_platform_events_type
+    ON platform_events(workspace_id, domain, event_type, timestamp DESC, event_id DESC);
+CREATE INDEX IF NOT EXISTS idx_platform_events_keyset
+    ON platform_events(workspace_id, timestamp DESC, event_id DESC);
+
+-- Full-text search over memories (search_text); summaries are capped to bound tsvector size.
+-- search_tsv is a plain nullable column kept current by a trigger: adding it is
+-- metadata-only, where a STORED generated column would rewrite each table under an
+-- ACCESS EXCLUSIVE lock at startup. Older rows are filled in, and the GIN indexes
+-- built CONCURRENTLY, by PgStore.backfill_search_vectors().
+ALTER TABLE reflexions ADD COLUMN IF NOT EXISTS search_tsv tsvector;
+ALTER TABLE corrections ADD COLUMN IF NOT EXISTS search_tsv tsvector;
+ALTER TABLE executions ADD COLUMN IF NOT EXISTS search_tsv tsvector;
+CREATE OR REPLACE FUNCTION memory_search_tsv(r reflexions) RETURNS tsvector LANGUAGE sql AS $$
+    SELECT to_tsvector('english', coalesce(r.rule, '') || ' ' || coalesce(r.applies_when, ''))
+$$;
+CREATE OR REPLACE FUNCTION memory_search_tsv(r corrections) RETURNS tsvector LANGUAGE sql AS $$
+    SELECT to_tsvector('english', coalesce(r.user_correction, '') || ' '
+                                  || left(coalesce(r.original_output::text, ''), 20000))
+$$;
+CREATE OR REPLACE FUNCTION memory_search_tsv(r executions) RETURNS tsvector LANGUAGE sql AS $$
+    SELECT to_tsvector('english', coalesce(r.skill, '') || ' ' || left(coalesce(r.input_summary::text, ''), 20000)
+                                  || ' ' || left(coalesce(r.output_summary::text, ''), 20000))
+$$;
+CREATE OR REPLACE FUNCTION memory_search_tsv_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_tsv := memory_search_tsv(NEW);
+    RETURN NEW;
+END
+$$;
+DO $$
+DECLARE
+    t text;
+    cols text;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['reflexions', 'corrections', 'executions'] LOOP
+        -- Databases migrated with the generated column: keep its values, drop the expression
+        IF EXISTS (SELECT 1 FROM pg_attribute
+                   WHERE attrelid = t::regclass AND attname = 'search_tsv' AND attgenerated = 's') THEN
+            EXECUTE format('ALTER TABLE %I ALTER COLUMN search_tsv DROP EXPRESSION', t);
+        END IF;
+        IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgrelid = t::regclass AND tgname = t || '_search_tsv') THEN
+            cols := CASE t WHEN 'reflexions' THEN 'rule, applies_when'
+                           WHEN 'corrections' THEN 'user_correction, original_output'
+                           ELSE 'skill, input_summary, output_summary' END;
+            EXECUTE format('CREATE TRIGGER %I BEFORE INSERT OR UPDATE OF %s ON %I '
+                           'FOR EACH ROW EXECUTE FUNCTION memory_search_tsv_trigger()', t || '_search_tsv', cols, t);
+        END IF;
+    END LOOP;
+END
+$$;
 """
 
+_SEARCH_TABLES = ("reflexions", "corrections", "executions")
+SEARCH_BACKFILL_BATCH = int(os.environ.get("AGENTURA_SEARCH_BACKFILL_BATCH", "1000"))
+
+# Seconds between background analytics rollup refreshes; <= 0 leaves refreshing to the caller
+ANALYTICS_REFRESH_S = float(os.environ.get("AGENTURA_ANALYTICS_REFRESH_S", "15"))
+# Dirty-hour queue rows rebuilt per refresh transaction
+ROLLUP_REFRESH_BATCH = int(os.environ.get("AGENTURA_ROLLUP_REFRESH_BATCH", "500"))
+
+# One-time backfill of skill_stats from existing executions (no-op once populated)
+_BACKFILL_SKILL_STATS = """
+INSERT INTO skill_stats
+    (workspace_id, skill, domain, executions_total, accepted_total, error_total,
+     cost_total, latency_total, latency_samples, cost_samples, last_execution_at)
+SELECT workspace_id, skill, MAX(domain), COUNT(*),
+       COUNT(*) FILTER (WHERE outcome = 'accepted'),
+       COUNT(*) FILTER (WHERE outcome = 'error'),
+       COALESCE(SUM(cost_usd), 0), COALESCE(SUM(latency_ms), 0),
+       COALESCE(array_agg(latency_ms ORDER BY timestamp) FILTER (WHERE rn <= %(window)s), '{}'),
+       COALESCE(array_agg(cost_usd ORDER BY timestamp) FILTER (WHERE rn <= %(window)s), '{}'),
+       MAX(timestamp)
+FROM (
+    SELECT *, ROW_NUMBER() OVER (PARTITION BY workspace_id, skill ORDER BY timestamp DESC) AS rn
+    FROM executions
+) recent
+GROUP BY workspace_id, skill
+ON CONFLICT (workspace_id, skill) DO NOTHING
+"""
+
+# One-time backfill of the rollup queue: every hour that already has executions
+_BACKFILL_ROLLUP_QUEUE = """
+INSERT INTO execution_rollup_queue (workspace_id, bucket)
+SELECT DISTINCT workspace_id, date_trunc('hour', timestamp, 'UTC')
+FROM executions WHERE timestamp IS NOT NULL
+"""
+
+# One-time backfill of platform_events from the records written before the event log existed
+_BACKFILL_PLATFORM_EVENTS = """
+INSERT INTO platform_events (event_id, workspace_id, domain, event_type, severity, skill, message, timestamp, metadata)
+SELECT 'evt-exec-' || execution_id, workspace_id, domain, 'skill_executed',
+       CASE WHEN outcome = 'corrected' THEN 'warning' ELSE 'info' END, skill,
+       format('Skill %s executed → %s ($%s, %sms)', skill, COALESCE(outcome, 'pending_review'),
+              to_char(COALESCE(cost_usd, 0), 'FM999999990.00'), round(COALESCE(latency_ms, 0))::bigint),
+       COALESCE(timestamp, created_at, NOW()),
+       jsonb_build_object('execution_id', execution_id, 'outcome', COALESCE(outcome, 'pending_review'),
+                          'cost_usd', COALESCE(cost_usd, 0))
+FROM executions
+UNION ALL
+SELECT 'evt-corr-' || correction_id, workspace_id, domain, 'correction_submitted', 'warning', skill,
+       format('Correction on %s: %s', skill, left(COALESCE(user_correction, ''), 80)),
+       COALESCE(timestamp, created_at, NOW()),
+       jsonb_build_object('correction_id', correction_id, 'execution_id', COALESCE(execution_id, ''))
+FROM corrections
+UNION ALL
+SELECT 'evt-refl-' || reflexion_id, workspace_id, domain, 'reflexion_generated', 'info', skill,
+       format('Reflexion rule learned for %s: %s', skill, left(COALESCE(rule, ''), 80)),
+       COALESCE(created_at, NOW()),
+       jsonb_build_object('reflexion_id', reflexion_id, 'confidence', COALESCE(confidence, 0))
+FROM reflexions
+ON CONFLICT (event_id) DO NOTHING
+"""
+
+# Hours whose rollups predate the latency histogram; re-rolled by the next refresh
+_REQUEUE_ROLLUPS_WITHOUT_HISTOGRAM = """
+INSERT INTO execution_rollup_queue (workspace_id, bucket)
+SELECT DISTINCT r.workspace_id, r.bucket FROM execution_rollups_hourly r
+WHERE r.latency_bins IS NULL
+  AND NOT EXISTS (SELECT 1 FROM execution_rollup_queue q WHERE q.workspace_id = r.workspace_id AND q.bucket = r.bucket)
+"""
+
+# Recompute the hourly rollups for a set of dirty hours from the raw executions
+_REBUILD_HOURLY_ROLLUPS = """
+WITH rows AS (
+    SELECT h.bucket, e.skill, e.domain, COALESCE(e.outcome, 'pending_review') AS outcome, e.cost_usd,
+           e.latency_ms, e.correction_generated_test,
+           width_bucket(COALESCE(e.latency_ms, 0), %(bounds)s::float8[]) AS latency_bin
+    FROM unnest(%(hours)s::timestamptz[]) AS h(bucket)
+    JOIN executions e
+      ON e.workspace_id = %(ws)s AND e.timestamp >= h.bucket AND e.timestamp < h.bucket + INTERVAL '1 hour'
+), bins AS (
+    SELECT bucket, skill, outcome, latency_bin, MAX(domain) AS domain, COUNT(*) AS executions,
+           SUM(cost_usd) AS cost_total, SUM(latency_ms) AS latency_total,
+           COUNT(*) FILTER (WHERE correction_generated_test) AS tests_generated
+    FROM rows GROUP BY bucket, skill, outcome, latency_bin
+)
+INSERT INTO execution_rollups_hourly
+    (workspace_id, bucket, skill, domain, outcome, executions, cost_total, latency_total, tests_generated,
+     latency_bins, latency_counts)
+SELECT %(ws)s, bucket, skill, MAX(domain), outcome, SUM(executions),
+       COALESCE(SUM(cost_total), 0), COALESCE(SUM(latency_total), 0), SUM(tests_generated),
+       array_agg(latency_bin ORDER BY latency_bin), array_agg(executions::int ORDER BY latency_bin)
+FROM bins
+GROUP BY bucket, skill, outcome
+"""
+
+# Recompute the daily rollups for a set of dirty days from the hourly rollups
+_REBUILD_DAILY_ROLLUPS = """
+WITH hours AS (
+    SELECT d.bucket AS day, r.*
+    FROM unnest(%(days)s::timestamptz[]) AS d(bucket)
+    JOIN execution_rollups_hourly r
+      ON r.workspace_id = %(ws)s AND r.bucket >= d.bucket AND r.bucket < d.bucket + INTERVAL '1 day'
+), totals AS (
+    SELECT day, skill, MAX(domain) AS domain, outcome, SUM(executions) AS executions,
+           SUM(cost_total) AS cost_total, SUM(latency_total) AS latency_total,
+           SUM(tests_generated) AS tests_generated
+    FROM hours GROUP BY day, skill, outcome
+), bins AS (
+    SELECT h.day, h.skill, h.outcome, u.bin, SUM(u.n)::int AS n
+    FROM hours h CROSS JOIN LATERAL unnest(h.latency_bins, h.latency_counts) AS u(bin, n)
+    GROUP BY h.day, h.skill, h.outcome, u.bin
+), hists AS (
+    SELECT day, skill, outcome, array_agg(bin ORDER BY bin) AS latency_bins, array_agg(n ORDER BY bin) AS latency_counts
+    FROM bins GROUP BY day, skill, outcome
+)
+INSERT INTO execution_rollups_daily
+    (workspace_id, bucket, skill, domain, outcome, executions, cost_total, latency_total, tests_generated,
+     latency_bins, latency_counts)
+SELECT %(ws)s, t.day, t.skill, t.domain, t.outcome, t.executions, t.cost_total, t.latency_total,
+       t.tests_generated, h.latency_bins, h.latency_counts
+FROM totals t LEFT JOIN hists h ON h.day = t.day AND h.skill = t.skill AND h.outcome = t.outcome
+"""
+
+
+def _rollup_ranges(
+    since: datetime | None, until: datetime | None
+) -> list[tuple[str, datetime | None, datetime | None]]:
+    """Split an hour-aligned window into (rollup table, lo, hi) ranges.
+
+    Whole UTC days inside the window read the daily rollups; the partial days at either
+    edge read the hourly rollups.
+    """
+    first_day = None
+    if since is not None:
+        first_day = since.replace(hour=0)
+        if first_day < since:
+            first_day += timedelta(days=1)
+    last_day = until.replace(hour=0) if until is not None else None
+    if first_day is not None and last_day is not None and first_day >= last_day:
+        return [("execution_rollups_hourly", since, until)]
+    ranges = [("execution_rollups_daily", first_day, last_day)]
+    if since is not None and since < first_day:
+        ranges.append(("execution_rollups_hourly", since, first_day))
+    if until is not None and last_day < until:
+        ranges.append(("execution_rollups_hourly", last_day, until))
+    return ranges
+
+
+_rollup_refreshers: dict[tuple[str, str], threading.Thread] = {}
+_rollup_refreshers_lock = threading.Lock()
+
+
+def _start_rollup_refresher(store: PgStore) -> None:
+    """Refresh the store's workspace rollups every ANALYTICS_REFRESH_S, once per (dsn, workspace)."""
+    if ANALYTICS_REFRESH_S <= 0:
+        return
+    key = (store._dsn, store._workspace_id)
+    if key in _rollup_refreshers:
+        return
+    with _rollup_refreshers_lock:
+        if key in _rollup_refreshers:
+            return
+        thread = threading.Thread(
+            target=_refresh_rollups_forever, args=(store,), name="analytics-rollups", daemon=True
+        )
+        _rollup_refreshers[key] = thread
+        thread.start()
+
+
+def _refresh_rollups_forever(store: PgStore) -> None:
+    stopped = threading.Event()
+    while not stopped.wait(ANALYTICS_REFRESH_S):
+        try:
+            store.refresh_analytics_rollups()
+        except Exception as e:
+            logger.warning("Analytics rollup refresh failed, retrying in %ss: %s", ANALYTICS_REFRESH_S, e)
+
 
 class PgStore:
     """PostgreSQL memory store with domain + workspace isolation."""
@@ -156,22 +503,77 @@ class PgStore:
         self._workspace_id = workspace_id or os.environ.get(
             "AGENTURA_WORKSPACE_ID", "default"
         )
-        self._pool = psycopg2.pool.ThreadedConnectionPool(
-            minconn=2,
-            maxconn=10,
-            dsn=self._dsn,
-        )
-        self._ensure_schema()
+        self._pool = get_pool(self._dsn)
+        migrate_once(self._dsn, "memory", self._ensure_schema)
+        # Optional MemRL counter batching (AGENTURA_MEMRL_FLUSH_MS); None → write per execution
+        self._memrl = get_memrl_aggregator(self._dsn, self.apply_memrl_deltas)
+        # Analytics reads the rollups only; a daemon thread drains the dirty-hour queue
+        _start_rollup_refresher(self)
 
     def _ensure_schema(self) -> None:
         conn = self._pool.getconn()
         try:
             with conn.cursor() as cur:
                 cur.execute(_SCHEMA)
+                cur.execute("SELECT EXISTS (SELECT 1 FROM skill_stats)")
+                if not cur.fetchone()[0]:
+                    cur.execute(_BACKFILL_SKILL_STATS, {"window": STATS_WINDOW})
+                cur.execute(
+                    "SELECT EXISTS (SELECT 1 FROM execution_rollups_hourly)"
+                    " OR EXISTS (SELECT 1 FROM execution_rollup_queue)"
+                )
+                if not cur.fetchone()[0]:
+                    cur.execute(_BACKFILL_ROLLUP_QUEUE)
+                cur.execute(_REQUEUE_ROLLUPS_WITHOUT_HISTOGRAM)
+                cur.execute("SELECT EXISTS (SELECT 1 FROM platform_events)")
+                if not cur.fetchone()[0]:
+                    cur.execute(_BACKFILL_PLATFORM_EVENTS)
             conn.commit()
         finally:
             self._pool.putconn(conn)
 
+    def backfill_search_vectors(self, batch_size: int = SEARCH_BACKFILL_BATCH) -> int:
+        """Fill search_tsv for rows written before the trigger existed, then index it.
+
+        Runs in short autocommit batches (row locks only) and builds the GIN indexes
+        with CREATE INDEX CONCURRENTLY, so reads and writes continue throughout. One
+        process at a time (advisory lock); a no-op once done. Returns rows updated.
+        """
+        updated = 0
+        conn = self._pool.getconn()
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_try_advisory_lock(hashtext('memory_search_backfill'))")
+                if not cur.fetchone()[0]:
+                    return 0
+                try:
+                    for table in _SEARCH_TABLES:
+                        while True:
+                            cur.execute(
+                                f"""UPDATE {table} t SET search_tsv = memory_search_tsv(t)
+                                    WHERE ctid = ANY(ARRAY(
+                                        SELECT ctid FROM {table} WHERE search_tsv IS NULL LIMIT %s))""",
+                                (batch_size,),
+                            )
+                            updated += cur.rowcount
+                            if cur.rowcount < batch_size:
+                                break
+                        index = f"idx_{table}_search"
+                        cur.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", (index,))
+                        row = cur.fetchone()
+                        if row is not None and not row[0]:  # left behind by an interrupted build
+                            cur.execute(f"DROP INDEX CONCURRENTLY {index}")
+                            row = None
+                        if row is None:
+                            cur.execute(f"CREATE INDEX CONCURRENTLY {index} ON {table} USING GIN (search_tsv)")
+                finally:
+                    cur.execute("SELECT pg_advisory_unlock(hashtext('memory_search_backfill'))")
+        finally:
+            conn.autocommit = False
+            self._pool.putconn(conn)
+        return updated
+
     def _domain_from_skill(self, skill_path: str) -> str:
         return skill_path.split("/")[0] if "/" in skill_path else ""
 
@@ -193,17 +595,19 @@ class PgStore:
             val = d.get(field)
             if hasattr(val, "isoformat"):
                 d[field] = val.isoformat()
-        # Drop internal serial id
+        # Drop internal serial id and search vector
         d.pop("id", None)
+        d.pop("search_tsv", None)
         return d
 
     def log_execution(self, skill_path: str, data: dict) -> str:
         from uuid import uuid4
         execution_id = data.get(
             "execution_id",
-            f"EXEC-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}-{uuid4().hex[:6]}",
+            f"EXEC-{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}-{uuid4().hex[:6]}",
         )
         domain = self._domain_from_skill(skill_path)
+        timestamp = data.get("timestamp", datetime.now(UTC).isoformat())
         conn = self._pool.getconn()
         try:
             with conn.cursor() as cur:
@@ -219,7 +623,7 @@ class PgStore:
                         domain,
                         self._workspace_id,
                         skill_path,
-                        data.get("timestamp", datetime.now(timezone.utc).isoformat()),
+                        timestamp,
                         self._serialize_json(data.get("input_summary")),
                         self._serialize_json(data.get("output_summary")),
                         data.get("outcome", "pending_review"),
@@ -229,11 +633,452 @@ class PgStore:
                         data.get("triggered_by", ""),
                     ),
                 )
+                if cur.rowcount:
+                    self._record_skill_stats(cur, skill_path, domain, data)
+                    self._mark_rollup_dirty(cur, timestamp)
+                    self._insert_event(
+                        cur, execution_event(skill_path, {**data, "execution_id": execution_id, "timestamp": timestamp})
+                    )
             conn.commit()
         finally:
             self._pool.putconn(conn)
         return execution_id
 
+    def log_executions(self, entries: list[dict]) -> list[str]:
+        """Batch log_execution: one multi-row INSERT and one transaction for the whole batch.
+
+        Each entry carries its skill path under "skill", plus optional "pending_approvals",
+        "reflexions_injected" and "reflexions_helped" (True → MemRL success scoring), so the
+        follow-up writes log_execution callers make separately land in the same transaction.
+        Rows whose execution_id already exists are skipped entirely, which makes replaying a
+        batch idempotent. Returns the execution ids newly inserted.
+        """
+        from uuid import uuid4
+
+        rows: dict[str, dict] = {}
+        for data in entries:
+            execution_id = data.get("execution_id") or (
+                f"EXEC-{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}-{uuid4().hex[:6]}"
+            )
+            rows.setdefault(execution_id, {
+                **data,
+                "execution_id": execution_id,
+                "timestamp": data.get("timestamp", datetime.now(UTC).isoformat()),
+            })
+        if not rows:
+            return []
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                inserted = psycopg2.extras.execute_values(
+                    cur,
+                    """INSERT INTO executions
+                       (execution_id, domain, workspace_id, skill, timestamp,
+                        input_summary, output_summary, outcome, cost_usd,
+                        latency_ms, model_used, triggered_by, pending_approvals, reflexions_injected)
+                       VALUES %s
+                       ON CONFLICT (execution_id) DO NOTHING
+                       RETURNING execution_id""",
+                    [
+                        (
+                            execution_id,
+                            self._domain_from_skill(data.get("skill", "")),
+                            self._workspace_id,
+                            data.get("skill", ""),
+                            data["timestamp"],
+                            self._serialize_json(data.get("input_summary")),
+                            self._serialize_json(data.get("output_summary")),
+                            data.get("outcome", "pending_review"),
+                            data.get("cost_usd", 0.0),
+                            data.get("latency_ms", 0.0),
+                            data.get("model_used", ""),
+                            data.get("triggered_by", ""),
+                            self._serialize_json(data.get("pending_approvals") or []),
+                            list(data.get("reflexions_injected") or []),
+                        )
+                        for execution_id, data in rows.items()
+                    ],
+                    template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::TEXT[])",
+                    page_size=len(rows),
+                    fetch=True,
+                )
+                new_ids = [r[0] for r in inserted]
+                memrl: dict[str, tuple[int, int]] = {}
+                for execution_id in new_ids:
+                    data = rows[execution_id]
+                    skill_path = data.get("skill", "")
+                    self._record_skill_stats(cur, skill_path, self._domain_from_skill(skill_path), data)
+                    self._insert_event(cur, execution_event(skill_path, data))
+                    helped = 1 if data.get("reflexions_helped") else 0
+                    for rid in dict.fromkeys(data.get("reflexions_injected") or []):
+                        i, h = memrl.get(rid, (0, 0))
+                        memrl[rid] = (i + 1, h + helped)
+                if memrl and self._memrl is None:
+                    self._apply_memrl_deltas(cur, memrl)
+                for timestamp in {rows[eid]["timestamp"] for eid in new_ids}:
+                    self._mark_rollup_dirty(cur, timestamp)
+            conn.commit()
+        finally:
+            self._pool.putconn(conn)
+        if memrl and self._memrl is not None:
+            self._memrl.add_deltas(memrl)
+        return new_ids
+
+    # --- Per-skill execution stats ---
+
+    def _record_skill_stats(self, cur, skill_path: str, domain: str, data: dict) -> None:
+        """Fold one new execution into skill_stats (same transaction as the INSERT)."""
+        outcome = data.get("outcome", "pending_review")
+        latency = data.get("latency_ms", 0.0) or 0.0
+        cost = data.get("cost_usd", 0.0) or 0.0
+        cur.execute(
+            """INSERT INTO skill_stats AS s
+               (workspace_id, skill, domain, executions_total, accepted_total, error_total,
+                cost_total, latency_total, latency_samples, cost_samples, last_execution_at)
+               VALUES (%(ws)s, %(skill)s, %(domain)s, 1, %(accepted)s, %(error)s,
+                       %(cost)s, %(latency)s, ARRAY[%(latency)s]::REAL[], ARRAY[%(cost)s]::REAL[], %(ts)s)
+               ON CONFLICT (workspace_id, skill) DO UPDATE SET
+                   executions_total = s.executions_total + 1,
+                   accepted_total = s.accepted_total + EXCLUDED.accepted_total,
+                   error_total = s.error_total + EXCLUDED.error_total,
+                   cost_total = s.cost_total + EXCLUDED.cost_total,
+                   latency_total = s.latency_total + EXCLUDED.latency_total,
+                   latency_samples = (s.latency_samples || EXCLUDED.latency_samples)
+                       [GREATEST(1, cardinality(s.latency_samples) + 2 - %(window)s):],
+                   cost_samples = (s.cost_samples || EXCLUDED.cost_samples)
+                       [GREATEST(1, cardinality(s.cost_samples) + 2 - %(window)s):],
+                   last_execution_at = GREATEST(s.last_execution_at, EXCLUDED.last_execution_at),
+                   updated_at = NOW()""",
+            {
+                "ws": self._workspace_id,
+                "skill": skill_path,
+                "domain": domain,
+                "accepted": int(outcome == "accepted"),
+                "error": int(outcome == "error"),
+                "cost": cost,
+                "latency": latency,
+                "ts": data.get("timestamp", datetime.now(UTC).isoformat()),
+                "window": STATS_WINDOW,
+            },
+        )
+
+    def _record_outcome_change(
+        self, cur, skill_path: str, old: str | None, new: str | None, timestamp: object = None
+    ) -> None:
+        """Keep skill_stats counters and analytics rollups in step with an outcome update."""
+        if old != new and timestamp is not None:
+            self._mark_rollup_dirty(cur, timestamp)
+        accepted = (new == "accepted") - (old == "accepted")
+        error = (new == "error") - (old == "error")
+        if not accepted and not error:
+            return
+        cur.execute(
+            """UPDATE skill_stats
+               SET accepted_total = accepted_total + %s, error_total = error_total + %s, updated_at = NOW()
+               WHERE workspace_id = %s AND skill = %s""",
+            (accepted, error, self._workspace_id, skill_path),
+        )
+
+    def get_skill_stats(self, skill_path: str | None = None) -> dict[str, dict]:
+        """Per-skill execution stats keyed by skill path — one indexed read, no history scan."""
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                if skill_path:
+                    cur.execute(
+                        "SELECT * FROM skill_stats WHERE workspace_id = %s AND skill = %s",
+                        (self._workspace_id, skill_path),
+                    )
+                else:
+                    cur.execute(
+                        "SELECT * FROM skill_stats WHERE workspace_id = %s",
+                        (self._workspace_id,),
+                    )
+                rows = cur.fetchall()
+        finally:
+            self._pool.putconn(conn)
+
+        result: dict[str, dict] = {}
+        for row in rows:
+            last = row.get("last_execution_at")
+            stats = SkillStats(
+                skill=row["skill"],
+                executions_total=row["executions_total"],
+                accepted_total=row["accepted_total"],
+                error_total=row["error_total"],
+                cost_total=row["cost_total"],
+                latency_total=row["latency_total"],
+                latency_samples=list(row.get("latency_samples") or []),
+                cost_samples=list(row.get("cost_samples") or []),
+                last_execution_at=last.isoformat() if hasattr(last, "isoformat") else (last or ""),
+            )
+            result[stats.skill] = stats.to_dict()
+        return result
+
+    # --- Analytics rollups ---
+
+    def _mark_rollup_dirty(self, cur, timestamp: object) -> None:
+        """Queue the execution's UTC hour for rollup recompute (same transaction as the write)."""
+        cur.execute(
+            """INSERT INTO execution_rollup_queue (workspace_id, bucket)
+               VALUES (%s, date_trunc('hour', %s::timestamptz, 'UTC'))""",
+            (self._workspace_id, timestamp),
+        )
+
+    def refresh_analytics_rollups(self, batch_size: int | None = None) -> int:
+        """Bring the hourly/daily rollups up to date. Returns the number of hours recomputed.
+
+        Only hours queued since the last refresh are rebuilt (hourly from executions, then
+        the enclosing days from hourly), so the cost tracks new activity, not history size.
+        The queue is drained oldest hour first in batches of ROLLUP_REFRESH_BATCH queue rows,
+        each its own transaction, so a large backlog (e.g. the first-start backfill) never
+        holds locks for the whole rebuild. Queue rows written by still-open transactions
+        stay queued for the next refresh.
+        Runs on the background refresher; call it directly when ANALYTICS_REFRESH_S <= 0.
+        """
+        batch_size = batch_size or ROLLUP_REFRESH_BATCH
+        total = 0
+        while True:
+            hours = self._refresh_rollup_batch(batch_size)
+            if not hours:
+                return total
+            total += hours
+
+    def _refresh_rollup_batch(self, batch_size: int) -> int:
+        """Rebuild the rollups for the oldest queued hours and commit. Returns the hour count."""
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext('execution_rollups:' || %s))",
+                    (self._workspace_id,),
+                )
+                cur.execute(
+                    """DELETE FROM execution_rollup_queue
+                       WHERE workspace_id = %(ws)s AND bucket IN (
+                           SELECT bucket FROM execution_rollup_queue WHERE workspace_id = %(ws)s
+                           ORDER BY bucket LIMIT %(limit)s FOR UPDATE SKIP LOCKED)
+                       RETURNING bucket""",
+                    {"ws": self._workspace_id, "limit": batch_size},
+                )
+                hours = sorted({row[0] for row in cur.fetchall()})
+                if hours:
+                    days = sorted({h.astimezone(UTC).replace(hour=0) for h in hours})
+                    params = {
+                        "ws": self._workspace_id, "hours": hours, "days": days,
+                        "bounds": list(LATENCY_BUCKET_BOUNDS_MS),
+                    }
+                    cur.execute(
+                        "DELETE FROM execution_rollups_hourly WHERE workspace_id = %(ws)s AND bucket = ANY(%(hours)s)",
+                        params,
+                    )
+                    cur.execute(_REBUILD_HOURLY_ROLLUPS, params)
+                    cur.execute(
+                        "DELETE FROM execution_rollups_daily WHERE workspace_id = %(ws)s AND bucket = ANY(%(days)s)",
+                        params,
+                    )
+                    cur.execute(_REBUILD_DAILY_ROLLUPS, params)
+            conn.commit()
+            return len(hours)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._pool.putconn(conn)
+
+    def get_analytics(
+        self,
+        *,
+        domains: set[str] | None = None,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+    ) -> dict:
+        """Execution analytics for a [since, until) window, aggregated in SQL.
+
+        Everything is read from the rollups (daily buckets for whole days, hourly buckets
+        for the edges): totals, outcome counts and per-skill cost/latency from a GROUP BY,
+        p50/p95 latency estimated from the summed latency histograms, so raw executions are
+        never scanned. The rollups are refreshed in the background every
+        ANALYTICS_REFRESH_S, which bounds how stale the figures can be.
+        Raises ValueError on an unparseable bound.
+        """
+        since, until = resolve_window(since, until)
+
+        parts: list[str] = []
+        params: list[object] = []
+        for table, lo, hi in _rollup_ranges(since, until):
+            conditions, values = self._window_conditions("bucket", lo, hi, domains)
+            parts.append(
+                "SELECT skill, outcome, executions, cost_total, latency_total, tests_generated, latency_bins, "
+                "latency_counts "
+                f"FROM {table} WHERE {' AND '.join(conditions)}"
+            )
+            params.extend(values)
+        rollups = " UNION ALL ".join(parts)
+        corr_conditions, corr_params = self._window_conditions("timestamp", since, until, domains)
+        refl_conditions, refl_params = self._window_conditions("created_at", since, until, domains)
+
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT skill, outcome, SUM(executions)::int, SUM(cost_total), SUM(latency_total), "
+                    f"SUM(tests_generated)::int FROM ({rollups}) r GROUP BY skill, outcome",
+                    params,
+                )
+                groups = [OutcomeGroup(*row) for row in cur.fetchall()]
+                cur.execute(
+                    "SELECT r.skill, u.bin, SUM(u.n)::bigint "
+                    f"FROM ({rollups}) r CROSS JOIN LATERAL unnest(r.latency_bins, r.latency_counts) AS u(bin, n) "
+                    "GROUP BY r.skill, u.bin",
+                    params,
+                )
+                histograms: dict[str | None, list[int]] = {}
+                for skill, bin_, n in cur.fetchall():
+                    for key in (skill, None):
+                        histogram = histograms.setdefault(key, [0] * (len(LATENCY_BUCKET_BOUNDS_MS) + 1))
+                        histogram[bin_] += n
+                percentiles = {
+                    key: (histogram_percentile(h, 50), histogram_percentile(h, 95)) for key, h in histograms.items()
+                }
+                cur.execute(
+                    f"SELECT (SELECT COUNT(*) FROM corrections WHERE {' AND '.join(corr_conditions)}), "
+                    f"(SELECT COUNT(*) FROM reflexions WHERE {' AND '.join(refl_conditions)})",
+                    corr_params + refl_params,
+                )
+                total_corrections, total_reflexions = cur.fetchone()
+        finally:
+            self._pool.putconn(conn)
+
+        return summarize_groups(
+            groups,
+            percentiles,
+            total_corrections=total_corrections,
+            total_reflexions=total_reflexions,
+        )
+
+    def _window_conditions(
+        self, column: str, since: datetime | None, until: datetime | None, domains: set[str] | None
+    ) -> tuple[list[str], list[object]]:
+        conditions = ["workspace_id = %s"]
+        params: list[object] = [self._workspace_id]
+        if since is not None:
+            conditions.append(f"{column} >= %s")
+            params.append(since)
+        if until is not None:
+            conditions.append(f"{column} < %s")
+            params.append(until)
+        if domains is not None:
+            conditions.append("domain = ANY(%s)")
+            params.append(sorted(domains))
+        return conditions, params
+
+    # --- Platform event log ---
+
+    def _insert_event(self, cur, event: dict) -> None:
+        cur.execute(
+            """INSERT INTO platform_events
+               (event_id, workspace_id, domain, event_type, severity, skill, message, timestamp, metadata)
+               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+               ON CONFLICT (event_id) DO NOTHING""",
+            (
+                event["event_id"],
+                self._workspace_id,
+                event.get("domain", ""),
+                event["event_type"],
+                event.get("severity", "info"),
+                event.get("skill", ""),
+                event.get("message", ""),
+                event.get("timestamp") or datetime.now(UTC).isoformat(),
+                self._serialize_json(event.get("metadata") or {}),
+            ),
+        )
+
+    def record_event(self, event: dict) -> str:
+        """Append one event (see events.py builders). Idempotent on event_id."""
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                self._insert_event(cur, event)
+            conn.commit()
+        finally:
+            self._pool.putconn(conn)
+        return event["event_id"]
+
+    def query_events(
+        self,
+        *,
+        domains: set[str] | None = None,
+        domain: str | None = None,
+        event_type: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> list[dict]:
+        """Filtered, keyset-paginated event listing (newest first).
+
+        Seeks through idx_platform_events_type when filtering by domain and type and
+        idx_platform_events_keyset otherwise, so a page costs O(limit).
+        `cursor` comes from execution_query.encode_cursor(last_row, "event_id").
+        """
+        conditions = ["workspace_id = %s"]
+        params: list[object] = [self._workspace_id]
+        if domains is not None:
+            conditions.append("domain = ANY(%s)")
+            params.append(sorted(domains))
+        if domain:
+            conditions.append("domain = %s")
+            params.append(domain)
+        if event_type:
+            conditions.append("event_type = %s")
+            params.append(event_type)
+        if cursor:
+            after_ts, after_id = decode_cursor(cursor)
+            conditions.append("(timestamp, event_id) < (%s::timestamptz, %s)")
+            params.extend([after_ts, after_id])
+        query = (
+            f"SELECT * FROM platform_events WHERE {' AND '.join(conditions)} "
+            "ORDER BY timestamp DESC, event_id DESC"
+        )
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(query, params)
+                return [self._deserialize_row(row) for row in cur.fetchall()]
+        finally:
+            self._pool.putconn(conn)
+
+    def stats(self, domains: set[str] | None = None) -> dict:
+        """Memory counts (see skill_stats.memory_stats) from COUNT(*) queries — no rows fetched."""
+        scope = "workspace_id = %(ws)s"
+        if domains is not None:
+            scope += " AND domain = ANY(%(domains)s)"
+        params = {"ws": self._workspace_id, "domains": sorted(domains) if domains is not None else None}
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""SELECT (SELECT COUNT(*) FROM executions WHERE {scope}),
+                               (SELECT COUNT(*) FROM corrections WHERE {scope}),
+                               (SELECT COUNT(*) FROM reflexions WHERE {scope}),
+                               ARRAY(SELECT skill FROM skill_stats
+                                     WHERE {scope} AND executions_total > 0 ORDER BY skill)""",
+                    params,
+                )
+                executions, corrections, reflexions, skills = cur.fetchone()
+        finally:
+            self._pool.putconn(conn)
+        return {
+            "executions": executions,
+            "corrections": corrections,
+            "reflexions": reflexions,
+            "total": executions + corrections + reflexions,
+            "skills": list(skills),
+        }
+
     def get_execution_by_id(self, execution_id: str) -> dict | None:
         """Single-row SELECT by execution_id. Returns deserialized row or None."""
         conn = self._pool.getconn()
@@ -272,6 +1117,9 @@ class PgStore:
                 )
                 row = cur.fetchone()
                 if row:
+                    self._record_outcome_change(
+                        cur, row["skill"], "pending_approval", new_outcome, row["timestamp"]
+                    )
                     conn.commit()
                     return (new_outcome, self._deserialize_row(row))
 
@@ -299,16 +1147,26 @@ class PgStore:
             with conn.cursor() as cur:
                 if outcome:
                     cur.execute(
-                        "UPDATE executions SET output_summary = %s, outcome = %s WHERE execution_id = %s AND workspace_id = %s",
+                        """UPDATE executions e
+                           SET output_summary = %s, outcome = %s
+                           FROM (SELECT id, outcome FROM executions
+                                 WHERE execution_id = %s AND workspace_id = %s FOR UPDATE) prev
+                           WHERE e.id = prev.id
+                           RETURNING e.skill, prev.outcome, e.timestamp""",
                         (self._serialize_json(output_summary), outcome, execution_id, self._workspace_id),
                     )
+                    changed = cur.fetchall()
+                    for skill, old_outcome, timestamp in changed:
+                        self._record_outcome_change(cur, skill, old_outcome, outcome, timestamp)
+                    updated = len(changed)
                 else:
                     cur.execute(
                         "UPDATE executions SET output_summary = %s WHERE execution_id = %s AND workspace_id = %s",
                         (self._serialize_json(output_summary), execution_id, self._workspace_id),
                     )
+                    updated = cur.rowcount
             conn.commit()
-            return cur.rowcount > 0
+            return updated > 0
         finally:
             self._pool.putconn(conn)
 
@@ -337,6 +1195,7 @@ class PgStore:
                 )
                 count = cur.fetchone()[0]
                 correction_id = data.get("correction_id", f"CORR-{count + 1:03d}")
+                timestamp = data.get("timestamp", datetime.now(UTC).isoformat())
                 cur.execute(
                     """INSERT INTO corrections
                        (correction_id, domain, workspace_id, skill, execution_id,
@@ -349,11 +1208,15 @@ class PgStore:
                         self._workspace_id,
                         skill_path,
                         data.get("execution_id", ""),
-                        data.get("timestamp", datetime.now(timezone.utc).isoformat()),
+                        timestamp,
                         self._serialize_json(data.get("original_output")),
                         data.get("user_correction", ""),
                     ),
                 )
+                if cur.rowcount:
+                    self._insert_event(
+                        cur, correction_event(skill_path, {**data, "correction_id": correction_id, "timestamp": timestamp})
+                    )
             conn.commit()
         finally:
             self._pool.putconn(conn)
@@ -370,6 +1233,7 @@ class PgStore:
                 )
                 count = cur.fetchone()[0]
                 reflexion_id = data.get("reflexion_id", f"REFL-{count + 1:03d}")
+                created_at = data.get("created_at", datetime.now(UTC).isoformat())
                 cur.execute(
                     """INSERT INTO reflexions
                        (reflexion_id, domain, workspace_id, skill, correction_id,
@@ -382,15 +1246,17 @@ class PgStore:
                         self._workspace_id,
                         skill_path,
                         data.get("correction_id", ""),
-                        data.get(
-                            "created_at", datetime.now(timezone.utc).isoformat()
-                        ),
+                        created_at,
                         data.get("rule", ""),
                         data.get("applies_when", ""),
                         data.get("confidence", 0.0),
                         data.get("validated_by_test", False),
                     ),
                 )
+                if cur.rowcount:
+                    self._insert_event(
+                        cur, reflexion_event(skill_path, {**data, "reflexion_id": reflexion_id, "created_at": created_at})
+                    )
             conn.commit()
         finally:
             self._pool.putconn(conn)
@@ -413,29 +1279,72 @@ class PgStore:
     def search_similar(
         self, skill_path: str, query: str, limit: int = 5
     ) -> list[dict]:
-        """Text-based search on reflexion rules (no vector search in PG)."""
+        """Full-text search on one skill's reflexion rules (no vector search in PG)."""
+        return self.search_text(query, limit=limit, skill=skill_path, kinds=("reflexion",))
+
+    def search_text(
+        self,
+        query: str,
+        domains: set[str] | None = None,
+        limit: int = 10,
+        *,
+        skill: str | None = None,
+        kinds: tuple[str, ...] = KINDS,
+    ) -> list[dict]:
+        """Ranked keyword search over executions, corrections and reflexions.
+
+        Rows matching ANY query lexeme are found through the GIN indexes on search_tsv;
+        the top `limit` per kind by ts_rank are then scored like text_search.search_entries
+        (fraction of query lexemes matched x kind weight), so cost tracks hits, not history.
+        """
+        conditions = ["workspace_id = %(ws)s", "search_tsv @@ q.tsq"]
+        if domains is not None:
+            conditions.append("domain = ANY(%(domains)s)")
+        if skill:
+            conditions.append("skill = %(skill)s")
+        where = " AND ".join(conditions)
+        tables = {"execution": "executions", "correction": "corrections", "reflexion": "reflexions"}
+        params = {
+            "ws": self._workspace_id,
+            "query": query,
+            "domains": sorted(domains) if domains is not None else None,
+            "skill": skill,
+            "limit": limit,
+        }
+
         conn = self._pool.getconn()
         try:
-            with conn.cursor(
-                cursor_factory=psycopg2.extras.RealDictCursor
-            ) as cur:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                 cur.execute(
-                    """SELECT * FROM reflexions
-                       WHERE skill = %s AND workspace_id = %s
-                         AND (rule ILIKE %s OR applies_when ILIKE %s)
-                       ORDER BY confidence DESC LIMIT %s""",
-                    (
-                        skill_path,
-                        self._workspace_id,
-                        f"%{query}%",
-                        f"%{query}%",
-                        limit,
-                    ),
+                    "SELECT tsvector_to_array(to_tsvector('english', %(query)s)) AS lexemes", params
                 )
-                return [self._deserialize_row(row) for row in cur.fetchall()]
+                lexemes = set(cur.fetchone()["lexemes"] or [])
+                if not lexemes:
+                    return []
+                candidates: list[tuple[str, dict]] = []
+                for kind in kinds:
+                    cur.execute(
+                        f"""SELECT t.*, tsvector_to_array(t.search_tsv) AS _lexemes
+                            FROM {tables[kind]} t,
+                                 (SELECT replace(plainto_tsquery('english', %(query)s)::text, '&', '|')::tsquery
+                                  AS tsq) q
+                            WHERE {where}
+                            ORDER BY ts_rank(t.search_tsv, q.tsq) DESC
+                            LIMIT %(limit)s""",
+                        params,
+                    )
+                    candidates.extend((kind, row) for row in cur.fetchall())
         finally:
             self._pool.putconn(conn)
 
+        results = []
+        for kind, row in candidates:
+            matched = len(lexemes.intersection(row.pop("_lexemes") or []))
+            score = matched / len(lexemes) * KIND_WEIGHTS[kind]
+            results.append(to_result(kind, self._deserialize_row(row), score))
+        results.sort(key=lambda r: r["score"], reverse=True)
+        return results[:limit]
+
     def get_executions(self, skill_path: str | None = None, triggered_by: str | None = None) -> list[dict]:
         conn = self._pool.getconn()
         try:
@@ -456,6 +1365,67 @@ class PgStore:
         finally:
             self._pool.putconn(conn)
 
+    def query_executions(
+        self,
+        *,
+        skill: str | None = None,
+        domains: set[str] | None = None,
+        outcome: str | None = None,
+        triggered_by: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        include_payload: bool = True,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+    ) -> list[dict]:
+        """Filtered, keyset-paginated execution listing (newest first).
+
+        Filters run in SQL and pages are seeked through idx_executions_keyset, so the
+        cost is proportional to `limit` rather than the table size. `cursor` comes from
+        execution_query.encode_cursor(last_row_of_previous_page).
+        """
+        conditions = ["workspace_id = %s"]
+        params: list[object] = [self._workspace_id]
+        if skill:
+            conditions.append("skill = %s")
+            params.append(skill)
+        if domains is not None:
+            conditions.append("domain = ANY(%s)")
+            params.append(sorted(domains))
+        if outcome:
+            conditions.append("outcome = %s")
+            params.append(outcome)
+        if triggered_by:
+            conditions.append("triggered_by = %s")
+            params.append(triggered_by)
+        if since:
+            conditions.append("timestamp >= %s::timestamptz")
+            params.append(since)
+        if until:
+            conditions.append("timestamp < %s::timestamptz")
+            params.append(until)
+        if cursor:
+            after_ts, after_id = decode_cursor(cursor)
+            conditions.append("(timestamp, execution_id) < (%s::timestamptz, %s)")
+            params.extend([after_ts, after_id])
+
+        columns = "*" if include_payload else _EXECUTION_LIST_COLUMNS
+        query = (
+            f"SELECT {columns} FROM executions WHERE {' AND '.join(conditions)} "
+            "ORDER BY timestamp DESC, execution_id DESC"
+        )
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(query, params)
+                return [self._deserialize_row(row) for row in cur.fetchall()]
+        finally:
+            self._pool.putconn(conn)
+
     def get_corrections(self, skill_path: str | None = None) -> list[dict]:
         conn = self._pool.getconn()
         try:
@@ -476,6 +1446,34 @@ class PgStore:
         finally:
             self._pool.putconn(conn)
 
+    def get_corrections_for_execution(self, execution_id: str) -> list[dict]:
+        """Corrections linked to one execution (idx_corrections_execution)."""
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(
+                    "SELECT * FROM corrections WHERE execution_id = %s AND workspace_id = %s ORDER BY timestamp DESC",
+                    (execution_id, self._workspace_id),
+                )
+                return [self._deserialize_row(row) for row in cur.fetchall()]
+        finally:
+            self._pool.putconn(conn)
+
+    def get_reflexions_for_corrections(self, correction_ids: list[str]) -> list[dict]:
+        """Reflexions generated from any of the given corrections (idx_reflexions_correction)."""
+        if not correction_ids:
+            return []
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(
+                    "SELECT * FROM reflexions WHERE correction_id = ANY(%s) AND workspace_id = %s ORDER BY created_at",
+                    (list(correction_ids), self._workspace_id),
+                )
+                return [self._deserialize_row(row) for row in cur.fetchall()]
+        finally:
+            self._pool.putconn(conn)
+
     def get_all_reflexions(self) -> list[dict]:
         conn = self._pool.getconn()
         try:
@@ -519,52 +1517,94 @@ class PgStore:
 
     def record_reflexion_injection(self, execution_id: str, reflexion_ids: list[str]) -> None:
         """Record which reflexions were injected into an execution and increment times_injected."""
+        self.record_reflexion_outcome(execution_id, reflexion_ids, helped=False)
+
+    def record_reflexion_outcome(self, execution_id: str, reflexion_ids: list[str], helped: bool) -> None:
+        """record_reflexion_injection + record_execution_success in one statement.
+
+        Stores the injected ids on the execution and adds 1 to times_injected (and, if
+        the execution helped, times_helped + utility) for every injected reflexion at once.
+        """
         if not reflexion_ids:
             return
+        params = {
+            "execution_id": execution_id,
+            "injected_ids": reflexion_ids,
+            "ids": list(dict.fromkeys(reflexion_ids)),
+            "helped": 1 if helped else 0,
+        }
         conn = self._pool.getconn()
         try:
             with conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE executions SET reflexions_injected = %s WHERE execution_id = %s",
-                    (reflexion_ids, execution_id),
-                )
-                for rid in reflexion_ids:
+                if self._memrl is None:
+                    cur.execute(
+                        f"""WITH injected AS (
+                                UPDATE executions SET reflexions_injected = %(injected_ids)s
+                                WHERE execution_id = %(execution_id)s
+                            )
+                            UPDATE reflexions AS r SET {_memrl_set("1", "%(helped)s")}
+                            WHERE r.reflexion_id = ANY(%(ids)s)""",
+                        params,
+                    )
+                else:
                     cur.execute(
-                        "UPDATE reflexions SET times_injected = times_injected + 1 WHERE reflexion_id = %s",
-                        (rid,),
+                        "UPDATE executions SET reflexions_injected = %(injected_ids)s"
+                        " WHERE execution_id = %(execution_id)s",
+                        params,
                     )
             conn.commit()
         finally:
             self._pool.putconn(conn)
+        if self._memrl is not None:
+            self._memrl.add(params["ids"], injected=1, helped=params["helped"])
 
     def record_execution_success(self, execution_id: str) -> None:
         """Increment times_helped for reflexions injected into a successful execution, recalc utility."""
         conn = self._pool.getconn()
         try:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                cur.execute(
-                    "SELECT reflexions_injected FROM executions WHERE execution_id = %s",
-                    (execution_id,),
-                )
-                row = cur.fetchone()
-                if not row:
-                    return
-                injected = row.get("reflexions_injected") or []
-                if not injected:
-                    return
-                for rid in injected:
+            with conn.cursor() as cur:
+                if self._memrl is None:
+                    cur.execute(
+                        f"""UPDATE reflexions AS r SET {_memrl_set("0", "1")}
+                            FROM executions e
+                            WHERE e.execution_id = %s AND r.reflexion_id = ANY(e.reflexions_injected)""",
+                        (execution_id,),
+                    )
+                    injected = []
+                else:
                     cur.execute(
-                        """UPDATE reflexions
-                           SET times_helped = times_helped + 1,
-                               utility_score = (times_helped + 1 + 2)::REAL / (times_injected + 4)::REAL,
-                               last_scored_at = NOW()
-                           WHERE reflexion_id = %s""",
-                        (rid,),
+                        "SELECT reflexions_injected FROM executions WHERE execution_id = %s",
+                        (execution_id,),
                     )
+                    row = cur.fetchone()
+                    injected = (row[0] if row else None) or []
+            conn.commit()
+        finally:
+            self._pool.putconn(conn)
+        if injected:
+            self._memrl.add(injected, helped=1)
+
+    def apply_memrl_deltas(self, deltas: dict[str, tuple[int, int]]) -> None:
+        """Apply reflexion_id → (injected, helped) counter deltas in one statement."""
+        if not deltas:
+            return
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                self._apply_memrl_deltas(cur, deltas)
             conn.commit()
         finally:
             self._pool.putconn(conn)
 
+    def _apply_memrl_deltas(self, cur, deltas: dict[str, tuple[int, int]]) -> None:
+        ids = list(deltas)
+        cur.execute(
+            f"""UPDATE reflexions AS r SET {_memrl_set("d.injected", "d.helped")}
+                FROM unnest(%s::TEXT[], %s::INT[], %s::INT[]) AS d(reflexion_id, injected, helped)
+                WHERE r.reflexion_id = d.reflexion_id""",
+            (ids, [deltas[rid][0] for rid in ids], [deltas[rid][1] for rid in ids]),
+        )
+
     def get_top_reflexions(self, skill_path: str, limit: int = 5, min_score: float = 0.3) -> list[dict]:
         """Retrieve reflexions sorted by utility score (Bayesian: (h+2)/(n+4))."""
         conn = self._pool.getconn()
@@ -607,7 +1647,7 @@ class PgStore:
         domain = self._domain_from_skill(skill_path)
         failure_case_id = data.get(
             "failure_case_id",
-            f"FAIL-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}",
+            f"FAIL-{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}",
         )
         conn = self._pool.getconn()
         try:
@@ -60,6 +60,13 @@ class DomainScopedStore:
         self._check_write_access(skill_path)
         return self._store.get_reflexions(skill_path)
 
+    def search_text(self, query: str, domains: set[str] | None = None, limit: int = 10, **filters) -> list[dict]:
+        if filters.get("skill"):
+            self._check_write_access(filters["skill"])
+        if not self.unrestricted:
+            domains = set(self._allowed) if domains is None else domains & self._allowed
+        return self._store.search_text(query, domains, limit, **filters)
+
     def search_similar(self, skill_path: str, query: str, limit: int = 5) -> list[dict]:
         self._check_write_access(skill_path)
         return self._store.search_similar(skill_path, query, limit)
@@ -71,6 +78,14 @@ class DomainScopedStore:
         # No skill_path — return all, but filter by domain
         return self._filter_by_domain(self._store.get_executions(None))
 
+    def query_executions(self, **filters) -> list[dict]:
+        if filters.get("skill"):
+            self._check_write_access(filters["skill"])
+        if not self.unrestricted:
+            requested = filters.get("domains")
+            filters["domains"] = set(self._allowed) if requested is None else requested & self._allowed
+        return self._store.query_executions(**filters)
+
     def get_corrections(self, skill_path: str | None = None) -> list[dict]:
         if skill_path:
             self._check_write_access(skill_path)
@@ -80,6 +95,45 @@ class DomainScopedStore:
     def get_all_reflexions(self) -> list[dict]:
         return self._filter_by_domain(self._store.get_all_reflexions())
 
+    def get_execution_by_id(self, execution_id: str) -> dict | None:
+        entry = self._store.get_execution_by_id(execution_id)
+        return entry if entry and self._filter_by_domain([entry]) else None
+
+    def get_corrections_for_execution(self, execution_id: str) -> list[dict]:
+        return self._filter_by_domain(self._store.get_corrections_for_execution(execution_id))
+
+    def get_reflexions_for_corrections(self, correction_ids: list[str]) -> list[dict]:
+        return self._filter_by_domain(self._store.get_reflexions_for_corrections(correction_ids))
+
+    def get_skill_stats(self, skill_path: str | None = None) -> dict[str, dict]:
+        if skill_path:
+            self._check_write_access(skill_path)
+        stats = self._store.get_skill_stats(skill_path) if hasattr(self._store, "get_skill_stats") else {}
+        if self.unrestricted:
+            return stats
+        return {k: v for k, v in stats.items() if self._domain_from_skill(k) in self._allowed}
+
+    def get_analytics(self, **window) -> dict:
+        if not self.unrestricted:
+            requested = window.get("domains")
+            window["domains"] = set(self._allowed) if requested is None else requested & self._allowed
+        return self._store.get_analytics(**window)
+
+    def stats(self, domains: set[str] | None = None) -> dict:
+        if not self.unrestricted:
+            domains = set(self._allowed) if domains is None else domains & self._allowed
+        return self._store.stats(domains)
+
+    def record_event(self, event: dict) -> str:
+        self._check_write_access(event.get("skill", ""))
+        return self._store.record_event(event)
+
+    def query_events(self, **filters) -> list[dict]:
+        if not self.unrestricted:
+            requested = filters.get("domains")
+            filters["domains"] = set(self._allowed) if requested is None else requested & self._allowed
+        return self._store.query_events(**filters)
+
     def update_reflexion(self, reflexion_id: str, updates: dict) -> None:
         # For updates, we trust the caller verified domain access already
         self._store.update_reflexion(reflexion_id, updates)
@@ -0,0 +1,126 @@
+"""Per-skill execution statistics — maintained incrementally as executions are logged.
+
+Stores keep one SkillStats aggregate per skill so listing and health endpoints read
+precomputed numbers instead of rescanning execution history. Counters cover all
+executions; latency/cost percentiles cover the most recent STATS_WINDOW executions.
+
+Usage:
+    stats = build_skill_stats(entries)        # one pass over existing history
+    stats[skill].record(entry)                # on log_execution
+    stats[skill].to_dict()                    # {"executions_total", "accept_rate", "health", ...}
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+STATS_WINDOW = 200
+
+
+def derive_health(executions_total: int, accept_rate: float) -> str:
+    """Health label from accept rate: healthy ≥ 0.8, degraded ≥ 0.5, failing below."""
+    if executions_total == 0:
+        return "unknown"
+    if accept_rate >= 0.8:
+        return "healthy"
+    if accept_rate >= 0.5:
+        return "degraded"
+    return "failing"
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile (q in 0..100). Returns 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+@dataclass
+class SkillStats:
+    """Running aggregate for one skill."""
+    skill: str
+    executions_total: int = 0
+    accepted_total: int = 0
+    error_total: int = 0
+    cost_total: float = 0.0
+    latency_total: float = 0.0
+    latency_samples: list[float] = field(default_factory=list)
+    cost_samples: list[float] = field(default_factory=list)
+    last_execution_at: str = ""
+
+    def record(self, entry: dict) -> None:
+        """Fold one logged execution into the aggregate."""
+        latency = float(entry.get("latency_ms") or 0.0)
+        cost = float(entry.get("cost_usd") or 0.0)
+        self.executions_total += 1
+        self.record_outcome_change(None, entry.get("outcome", "pending_review"))
+        self.cost_total += cost
+        self.latency_total += latency
+        self.latency_samples = (self.latency_samples + [latency])[-STATS_WINDOW:]
+        self.cost_samples = (self.cost_samples + [cost])[-STATS_WINDOW:]
+        timestamp = str(entry.get("timestamp") or "")
+        self.last_execution_at = max(self.last_execution_at, timestamp)
+
+    def record_outcome_change(self, old: str | None, new: str | None) -> None:
+        """Adjust outcome counters when an execution moves between outcomes."""
+        self.accepted_total += (new == "accepted") - (old == "accepted")
+        self.error_total += (new == "error") - (old == "error")
+
+    def to_dict(self) -> dict:
+        total = self.executions_total
+        rate = round(self.accepted_total / total, 2) if total else 0.0
+        return {
+            "skill": self.skill,
+            "executions_total": total,
+            "accepted_total": self.accepted_total,
+            "error_total": self.error_total,
+            "accept_rate": rate,
+            "health": derive_health(total, rate),
+            "total_cost_usd": round(self.cost_total, 4),
+            "avg_latency_ms": round(self.latency_total / total, 1) if total else 0.0,
+            "p50_latency_ms": round(percentile(self.latency_samples, 50), 1),
+            "p95_latency_ms": round(percentile(self.latency_samples, 95), 1),
+            "p50_cost_usd": round(percentile(self.cost_samples, 50), 4),
+            "p95_cost_usd": round(percentile(self.cost_samples, 95), 4),
+            "last_execution_at": self.last_execution_at,
+        }
+
+
+def build_skill_stats(entries: Iterable[dict]) -> dict[str, SkillStats]:
+    """Aggregate execution entries (oldest first) into per-skill stats in one pass."""
+    stats: dict[str, SkillStats] = {}
+    for entry in entries:
+        skill = entry.get("skill", "")
+        if not skill:
+            continue
+        if skill not in stats:
+            stats[skill] = SkillStats(skill=skill)
+        stats[skill].record(entry)
+    return stats
+
+
+def count_by_skill(rows: Iterable[dict]) -> Counter[str]:
+    """Row counts per skill path — the cached counter behind file/mem0 store stats()."""
+    return Counter(row.get("skill", "") for row in rows)
+
+
+def memory_stats(counts: Mapping[str, Counter[str]], domains: set[str] | None = None) -> dict:
+    """Store-level memory counts from per-kind skill counters, optionally domain-scoped.
+
+    `counts` maps "executions" / "corrections" / "reflexions" to {skill: rows}.
+    """
+    def in_scope(skill: str) -> bool:
+        return domains is None or skill.split("/")[0] in domains
+
+    totals = {
+        kind: sum(n for skill, n in counts.get(kind, Counter()).items() if in_scope(skill))
+        for kind in ("executions", "corrections", "reflexions")
+    }
+    skills = sorted(s for s, n in counts.get("executions", Counter()).items() if s and n and in_scope(s))
+    return {**totals, "total": sum(totals.values()), "skills": skills}
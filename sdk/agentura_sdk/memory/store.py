@@ -26,12 +26,22 @@ class MemoryStore(Protocol):
     def add_reflexion(self, skill_path: str, data: dict) -> str: ...
     def get_reflexions(self, skill_path: str) -> list[dict]: ...
     def search_similar(self, skill_path: str, query: str, limit: int = 5) -> list[dict]: ...
+    def search_text(self, query: str, domains: set[str] | None = None, limit: int = 10, **filters) -> list[dict]: ...
     def get_executions(self, skill_path: str | None = None) -> list[dict]: ...
+    def query_executions(self, **filters) -> list[dict]: ...
     def get_corrections(self, skill_path: str | None = None) -> list[dict]: ...
     def get_all_reflexions(self) -> list[dict]: ...
+    def get_corrections_for_execution(self, execution_id: str) -> list[dict]: ...
+    def get_reflexions_for_corrections(self, correction_ids: list[str]) -> list[dict]: ...
+    def get_skill_stats(self, skill_path: str | None = None) -> dict[str, dict]: ...
+    def get_analytics(self, **window) -> dict: ...
+    def stats(self, domains: set[str] | None = None) -> dict: ...
+    def record_event(self, event: dict) -> str: ...
+    def query_events(self, **filters) -> list[dict]: ...
     def update_reflexion(self, reflexion_id: str, updates: dict) -> None: ...
     # MemRL: utility-scored memory (DEC-066)
     def record_reflexion_injection(self, execution_id: str, reflexion_ids: list[str]) -> None: ...
+    def record_reflexion_outcome(self, execution_id: str, reflexion_ids: list[str], helped: bool) -> None: ...
     def record_execution_success(self, execution_id: str) -> None: ...
     def get_top_reflexions(self, skill_path: str, limit: int = 5, min_score: float = 0.3) -> list[dict]: ...
     # Incident-to-eval (DEC-067)
@@ -75,6 +85,18 @@ class CompositeStore:
             pass
         return exec_id
 
+    def log_executions(self, entries: list[dict]) -> list[str]:
+        new_ids = self._pg.log_executions(entries)
+        inserted = set(new_ids)
+        for data in entries:
+            if data.get("execution_id") not in inserted:
+                continue
+            try:
+                self._mem0.log_execution(data.get("skill", ""), dict(data))
+            except Exception:
+                pass
+        return new_ids
+
     def add_correction(self, skill_path: str, data: dict) -> str:
         corr_id = self._pg.add_correction(skill_path, data)
         try:
@@ -97,12 +119,36 @@ class CompositeStore:
     def get_executions(self, skill_path: str | None = None) -> list[dict]:
         return self._pg.get_executions(skill_path)
 
+    def query_executions(self, **filters) -> list[dict]:
+        return self._pg.query_executions(**filters)
+
     def get_corrections(self, skill_path: str | None = None) -> list[dict]:
         return self._pg.get_corrections(skill_path)
 
     def get_all_reflexions(self) -> list[dict]:
         return self._pg.get_all_reflexions()
 
+    def get_corrections_for_execution(self, execution_id: str) -> list[dict]:
+        return self._pg.get_corrections_for_execution(execution_id)
+
+    def get_reflexions_for_corrections(self, correction_ids: list[str]) -> list[dict]:
+        return self._pg.get_reflexions_for_corrections(correction_ids)
+
+    def get_skill_stats(self, skill_path: str | None = None) -> dict[str, dict]:
+        return self._pg.get_skill_stats(skill_path)
+
+    def get_analytics(self, **window) -> dict:
+        return self._pg.get_analytics(**window)
+
+    def stats(self, domains: set[str] | None = None) -> dict:
+        return self._pg.stats(domains)
+
+    def record_event(self, event: dict) -> str:
+        return self._pg.record_event(event)
+
+    def query_events(self, **filters) -> list[dict]:
+        return self._pg.query_events(**filters)
+
     def update_reflexion(self, reflexion_id: str, updates: dict) -> None:
         self._pg.update_reflexion(reflexion_id, updates)
         try:
@@ -113,10 +159,17 @@ class CompositeStore:
     def search_similar(self, skill_path: str, query: str, limit: int = 5) -> list[dict]:
         return self._mem0.search_similar(skill_path, query, limit)
 
+    def search_text(self, query: str, domains: set[str] | None = None, limit: int = 10, **filters) -> list[dict]:
+        return self._pg.search_text(query, domains, limit, **filters)
+
     def record_reflexion_injection(self, execution_id: str, reflexion_ids: list[str]) -> None:
         if hasattr(self._pg, "record_reflexion_injection"):
             self._pg.record_reflexion_injection(execution_id, reflexion_ids)
 
+    def record_reflexion_outcome(self, execution_id: str, reflexion_ids: list[str], helped: bool) -> None:
+        if hasattr(self._pg, "record_reflexion_outcome"):
+            self._pg.record_reflexion_outcome(execution_id, reflexion_ids, helped)
+
     def record_execution_success(self, execution_id: str) -> None:
         if hasattr(self._pg, "record_execution_success"):
             self._pg.record_execution_success(execution_id)
@@ -0,0 +1,76 @@
+"""Ranked keyword search across executions, corrections and reflexions.
+
+PgStore answers search_text() from tsvector columns with GIN indexes; file-backed stores
+use search_entries() below. Both match ANY query word, weight hits by memory kind
+(reflexions > corrections > executions) and return the same result shape, ready for
+the memory search endpoints.
+
+Usage:
+    hits = store.search_text("route compliance cases", domains={"hr"}, limit=10)
+    hits[0]  # {"type": "reflexion", "skill": "hr/triage", "memory": "Rule: ...", "score": 0.9, ...}
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable
+
+# Score multiplier per memory kind — learned rules outrank raw execution history
+KIND_WEIGHTS = {"execution": 0.5, "correction": 0.85, "reflexion": 0.95}
+KINDS = tuple(KIND_WEIGHTS)
+
+
+def describe(kind: str, row: dict) -> str:
+    """One-line memory text shown for a hit."""
+    if kind == "execution":
+        return f"Execution of {row.get('skill', '')}: {str(row.get('output_summary', ''))[:200]}"
+    if kind == "correction":
+        return f"Correction: {(row.get('user_correction') or '')[:200]}"
+    return f"Rule: {(row.get('rule') or '')[:200]}"
+
+
+def to_result(kind: str, row: dict, score: float) -> dict:
+    return {
+        "type": kind,
+        "skill": row.get("skill", ""),
+        "memory": describe(kind, row),
+        "score": round(score, 2),
+        **{k: v for k, v in row.items() if isinstance(v, (str, int, float, bool))},
+    }
+
+
+def query_words(query: str) -> list[str]:
+    """Distinct words of 3+ characters; punctuation (e.g. from JSON-dumped input) is dropped."""
+    return list(dict.fromkeys(w for w in re.findall(r"\w+", query.lower()) if len(w) > 2))
+
+
+def word_score(words: list[str], text: str) -> float:
+    """Fraction of query words that occur in `text` (substring match)."""
+    if not words:
+        return 0.0
+    text_lower = text.lower()
+    return sum(1 for w in words if w in text_lower) / len(words)
+
+
+def search_entries(
+    query: str,
+    *,
+    executions: Iterable[dict] = (),
+    corrections: Iterable[dict] = (),
+    reflexions: Iterable[dict] = (),
+    limit: int = 10,
+    min_score: float = 0.1,
+) -> list[dict]:
+    """In-memory equivalent of PgStore.search_text over already-scoped rows."""
+    words = query_words(query)
+    if not words:
+        return []
+    results: list[dict] = []
+    for kind, rows in (("execution", executions), ("correction", corrections), ("reflexion", reflexions)):
+        for row in rows:
+            score = word_score(words, json.dumps(row, default=str)) * KIND_WEIGHTS[kind]
+            if score > min_score:
+                results.append(to_result(kind, row, score))
+    results.sort(key=lambda r: r["score"], reverse=True)
+    return results[:limit]
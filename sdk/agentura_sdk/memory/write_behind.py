@@ -0,0 +1,214 @@
+"""Write-behind execution log — executions are queued in memory and written in batches.
+
+log_execution() callers get their execution id back immediately; a background thread
+drains the bounded buffer every AGENTURA_EXEC_FLUSH_MS (or as soon as a batch fills)
+and hands each batch to the store's log_executions() — one multi-row INSERT per batch
+for Postgres.
+
+Nothing is dropped: if the buffer is full, or a batch cannot be written (database
+unreachable), entries are appended to a JSONL spill file and replayed after the next
+successful write. Batch writes skip execution ids that already exist, so replays are
+idempotent. The queue drains on interpreter exit and on server shutdown.
+
+Usage:
+    queue = get_execution_log_queue()   # None → store has no batch writer; write directly
+    queue.submit({"execution_id": "EXEC-...", "skill": "hr/screener", ...})
+    queue.flush()                        # block until everything submitted so far is written
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+EXEC_BUFFER_SIZE = int(os.environ.get("AGENTURA_EXEC_BUFFER_SIZE", "10000"))
+EXEC_BATCH_SIZE = int(os.environ.get("AGENTURA_EXEC_BATCH_SIZE", "200"))
+EXEC_FLUSH_MS = int(os.environ.get("AGENTURA_EXEC_FLUSH_MS", "200"))
+
+
+def _default_spill_path() -> Path:
+    configured = os.environ.get("AGENTURA_EXEC_SPILL_FILE")
+    if configured:
+        return Path(configured)
+    knowledge_dir = Path(os.environ.get("AGENTURA_KNOWLEDGE_DIR") or str(Path.cwd() / ".agentura"))
+    return knowledge_dir / "execution_spill.jsonl"
+
+
+class ExecutionLogQueue:
+    """Bounded in-memory buffer of execution entries, flushed in batches by a daemon thread."""
+
+    def __init__(
+        self,
+        store,
+        *,
+        spill_path: Path | None = None,
+        max_buffer: int = EXEC_BUFFER_SIZE,
+        batch_size: int = EXEC_BATCH_SIZE,
+        flush_interval_s: float = EXEC_FLUSH_MS / 1000,
+    ):
+        self._store = store
+        self._spill_path = spill_path or _default_spill_path()
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        # Entries, then a None sentinel from close()
+        self._buffer: queue.Queue[dict | None] = queue.Queue(maxsize=max_buffer)
+        self._spill_lock = threading.Lock()
+        self._closed = False
+        self.written_total = 0
+        self.spilled_total = 0
+        self.batches_total = 0
+        self._thread = threading.Thread(target=self._run, name="execution-log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, entry: dict) -> None:
+        """Queue one execution entry. Never blocks; spills to disk if the buffer is full or closed."""
+        if not self._closed:
+            try:
+                self._buffer.put_nowait(entry)
+                return
+            except queue.Full:
+                logger.warning("Execution log buffer full — spilling %s to %s", entry.get("execution_id"), self._spill_path)
+        self._spill([entry])
+
+    def flush(self) -> None:
+        """Block until every entry submitted so far has been written or spilled."""
+        self._buffer.join()
+
+    def close(self) -> None:
+        """Stop accepting entries, drain the buffer and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer.put(None)
+        self._thread.join()
+
+    def metrics(self) -> dict:
+        return {
+            "buffered": self._buffer.qsize(),
+            "written_total": self.written_total,
+            "spilled_total": self.spilled_total,
+            "batches_total": self.batches_total,
+            "spill_file": str(self._spill_path),
+        }
+
+    def _run(self) -> None:
+        self._replay_spill()
+        stopping = False
+        while not stopping:
+            try:
+                first = self._buffer.get(timeout=self._flush_interval_s)
+            except queue.Empty:
+                continue
+            batch: list[dict] = []
+            item = first
+            while True:
+                if item is None:  # close() sentinel — everything before it is in this batch
+                    stopping = True
+                    self._buffer.task_done()
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._buffer.get_nowait()
+                except queue.Empty:
+                    break
+            if not batch:
+                continue
+            try:
+                if self._write(batch):
+                    self._replay_spill()
+            finally:
+                for _ in batch:
+                    self._buffer.task_done()
+
+    def _write(self, batch: list[dict]) -> bool:
+        """Write one batch; spill it on failure. True if the store accepted it."""
+        try:
+            self._store.log_executions(batch)
+        except Exception as e:
+            logger.warning("Execution log batch of %d failed (%s) — spilling to %s", len(batch), e, self._spill_path)
+            self._spill(batch)
+            return False
+        self.written_total += len(batch)
+        self.batches_total += 1
+        return True
+
+    def _spill(self, entries: list[dict]) -> None:
+        with self._spill_lock:
+            try:
+                self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+                with self._spill_path.open("a") as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry, default=str) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.spilled_total += len(entries)
+            except OSError:
+                logger.exception("Could not spill %d execution log entries", len(entries))
+
+    def _replay_spill(self) -> None:
+        """Write back spilled entries once the store is reachable again."""
+        with self._spill_lock:
+            replaying = self._spill_path.with_suffix(".replay")
+            # A leftover .replay file means a previous replay was interrupted — finish it first
+            if not replaying.exists():
+                if not self._spill_path.exists() or not self._spill_path.stat().st_size:
+                    return
+                self._spill_path.replace(replaying)
+        entries = []
+        for line in replaying.read_text().splitlines():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning("Skipping corrupt execution spill line: %s", line[:200])
+        logger.info("Replaying %d spilled execution log entries", len(entries))
+        for i in range(0, len(entries), self._batch_size):
+            if not self._write(entries[i:i + self._batch_size]):
+                # Store unreachable again — the rest goes back to the spill file too
+                self._spill(entries[i + self._batch_size:])
+                break
+        replaying.unlink(missing_ok=True)
+
+
+_queue: ExecutionLogQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_execution_log_queue() -> ExecutionLogQueue | None:
+    """Process-wide queue for the active memory store.
+
+    None when write-behind is disabled (AGENTURA_EXEC_WRITE_BEHIND=0) or the store has
+    no batch writer (JSON files, mem0-only) — callers then write synchronously.
+    """
+    global _queue
+    if _queue is not None:
+        return _queue
+    if os.environ.get("AGENTURA_EXEC_WRITE_BEHIND", "1") == "0":
+        return None
+    from agentura_sdk.memory import get_memory_store
+
+    store = get_memory_store()
+    if not hasattr(store, "log_executions"):
+        return None
+    with _queue_lock:
+        if _queue is None:
+            _queue = ExecutionLogQueue(store)
+            atexit.register(_queue.close)
+    return _queue
+
+
+def shutdown_execution_log_queue() -> None:
+    """Drain and stop the process-wide queue (server shutdown)."""
+    global _queue
+    with _queue_lock:
+        q, _queue = _queue, None
+    if q is not None:
+        q.close()
@@ -1,7 +1,8 @@
 """Post-execution notification dispatch.
 
-Reads notification config from agentura.config.yaml and dispatches
-to the appropriate channel (Slack, etc.) after skill execution.
+Reads notification config from agentura.config.yaml (via the cached
+SkillRuntimeConfig) and dispatches to the appropriate channel (Slack, etc.)
+after skill execution.
 """
 
 from __future__ import annotations
@@ -10,9 +11,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
-import yaml
-
-from agentura_sdk.types import SkillResult
+from agentura_sdk.runner.config_loader import load_runtime_config
+from agentura_sdk.types import SkillResult, SkillRuntimeConfig
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +22,13 @@ def dispatch_notifications(
     domain: str,
     skill_name: str,
     result: SkillResult,
+    runtime_config: SkillRuntimeConfig | None = None,
 ) -> None:
-    """Read notification config and dispatch to all configured channels."""
-    config_path = skill_root / "agentura.config.yaml"
-    if not config_path.exists():
-        return
-
-    try:
-        cfg = yaml.safe_load(config_path.read_text()) or {}
-    except Exception:
-        return
+    """Dispatch to all configured channels. Pass runtime_config to skip the config lookup."""
+    if runtime_config is None:
+        runtime_config = load_runtime_config(skill_root)
 
-    notifications = cfg.get("notifications", [])
+    notifications = runtime_config.notifications
     if not notifications:
         return
 
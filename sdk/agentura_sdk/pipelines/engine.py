@@ -16,6 +16,7 @@ from typing import Any
 
 import yaml
 
+from agentura_sdk.runner.config_loader import load_runtime_config
 from agentura_sdk.runner.local_runner import execute_skill, log_execution
 from agentura_sdk.runner.skill_loader import load_skill_md
 from agentura_sdk.types import SandboxConfig, SkillContext, SkillRole
@@ -159,56 +160,48 @@ def _build_skill_context(
     prompt_parts.append(loaded.system_prompt)
     system_prompt = "\n\n---\n\n".join(prompt_parts)
 
+    runtime_config = load_runtime_config(skill_dir)
     sandbox_config = None
     mcp_bindings: list[dict] = []
     if loaded.metadata.role == SkillRole.AGENT:
-        sandbox_config = SandboxConfig()
-        config_path = skill_dir / "agentura.config.yaml"
-        if config_path.exists():
-            try:
-                cfg = yaml.safe_load(config_path.read_text()) or {}
-                sandbox_raw = cfg.get("sandbox", {}) or cfg.get("agent", {})
-                if sandbox_raw:
-                    sandbox_config = SandboxConfig(**sandbox_raw)
-                gateway_api_key = os.environ.get("MCP_GATEWAY_API_KEY", "")
-                for mcp_ref in cfg.get("mcp_tools", []):
-                    server_name = mcp_ref.get("server", "")
-                    tools = mcp_ref.get("tools", [])
-                    binding: dict | None = None
-
-                    # 1. Explicit env var
-                    env_key = f"MCP_{server_name.upper().replace('-', '_')}_URL"
-                    server_url = os.environ.get(env_key, "")
-                    if server_url:
-                        binding = {"server": server_name, "url": server_url, "tools": tools}
-                        auth_key = f"MCP_{server_name.upper().replace('-', '_')}_API_KEY"
-                        api_key = os.environ.get(auth_key, "")
-                        if api_key:
-                            binding["headers"] = {"Authorization": f"Bearer {api_key}"}
-
-                    # 2. MCP registry fallback (Obot auto-discovery)
-                    if binding is None:
-                        try:
-                            from agentura_sdk.mcp.registry import get_registry
-                            reg = get_registry()
-                            srv = reg.get(server_name)
-                            if srv and srv.url:
-                                binding = {"server": server_name, "url": srv.url, "tools": tools}
-                                if gateway_api_key:
-                                    binding["headers"] = {"Authorization": f"Bearer {gateway_api_key}"}
-                                logger.debug("MCP server %s resolved via registry: %s", server_name, srv.url)
-                        except Exception:
-                            pass
-
-                    if binding is None:
-                        logger.warning("MCP server %s: no URL found (env var %s not set, registry empty)", server_name, env_key)
-                        continue
-
-                    if mcp_ref.get("approval_required"):
-                        binding["approval_required"] = mcp_ref["approval_required"]
-                    mcp_bindings.append(binding)
-            except Exception:
-                pass
+        sandbox_config = runtime_config.sandbox or SandboxConfig()
+        gateway_api_key = os.environ.get("MCP_GATEWAY_API_KEY", "")
+        for mcp_ref in runtime_config.mcp_tools:
+            server_name = mcp_ref.get("server", "")
+            tools = mcp_ref.get("tools", [])
+            binding: dict | None = None
+
+            # 1. Explicit env var
+            env_key = f"MCP_{server_name.upper().replace('-', '_')}_URL"
+            server_url = os.environ.get(env_key, "")
+            if server_url:
+                binding = {"server": server_name, "url": server_url, "tools": tools}
+                auth_key = f"MCP_{server_name.upper().replace('-', '_')}_API_KEY"
+                api_key = os.environ.get(auth_key, "")
+                if api_key:
+                    binding["headers"] = {"Authorization": f"Bearer {api_key}"}
+
+            # 2. MCP registry fallback (Obot auto-discovery)
+            if binding is None:
+                try:
+                    from agentura_sdk.mcp.registry import get_registry
+                    reg = get_registry()
+                    srv = reg.get(server_name)
+                    if srv and srv.url:
+                        binding = {"server": server_name, "url": srv.url, "tools": tools}
+                        if gateway_api_key:
+                            binding["headers"] = {"Authorization": f"Bearer {gateway_api_key}"}
+                        logger.debug("MCP server %s resolved via registry: %s", server_name, srv.url)
+                except Exception:
+                    pass
+
+            if binding is None:
+                logger.warning("MCP server %s: no URL found (env var %s not set, registry empty)", server_name, env_key)
+                continue
+
+            if mcp_ref.get("approval_required"):
+                binding["approval_required"] = mcp_ref["approval_required"]
+            mcp_bindings.append(binding)
 
     return SkillContext(
         skill_name=loaded.metadata.name,
@@ -219,6 +212,7 @@ def _build_skill_context(
         input_data=input_data,
         mcp_bindings=mcp_bindings,
         sandbox_config=sandbox_config,
+        runtime_config=runtime_config,
     )
 
 
@@ -13,13 +13,17 @@ import json
 import logging
 import os
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from agentura_sdk.sandbox import get_sandbox_module
 from agentura_sdk.types import AgentIteration, SandboxConfig, SkillContext, SkillResult
 
+if TYPE_CHECKING:
+    from agentura_sdk.runner.openrouter import ToolChatResponse
+
 logger = logging.getLogger(__name__)
 
 sandbox_mod = get_sandbox_module()
@@ -144,29 +148,34 @@ def _to_openai_tools(anthropic_tools: list[dict]) -> list[dict]:
     ]
 
 
-def _build_tool_set(
+async def _build_tool_set(
     mcp_bindings: list[dict],
 ) -> tuple[list[dict], dict[str, str]]:
     """Build the full tool set: sandbox tools + MCP tools from bindings.
 
+    Tool definitions are fetched from all bound MCP servers concurrently.
     Returns (anthropic_tools, tool_name→server_url map for MCP dispatch).
     """
-    from agentura_sdk.mcp.client import fetch_tool_definitions
+    from agentura_sdk.mcp.client import fetch_tool_definitions_async
 
     all_tools = list(SANDBOX_TOOLS)
     tool_server_map: dict[str, str] = {}
 
+    bindings = []
     for binding in mcp_bindings:
-        server_url = binding.get("url", "")
-        requested_tools = binding.get("tools", [])
-        if not server_url:
+        if not binding.get("url", ""):
             logger.warning("MCP binding missing url: %s", binding)
             continue
+        bindings.append(binding)
 
-        try:
-            remote_tools = fetch_tool_definitions(server_url)
-        except Exception as exc:
-            logger.error("failed to fetch tools from %s: %s", server_url, exc)
+    fetched = await asyncio.gather(
+        *(fetch_tool_definitions_async(b["url"]) for b in bindings), return_exceptions=True,
+    )
+    for binding, remote_tools in zip(bindings, fetched):
+        server_url = binding["url"]
+        requested_tools = binding.get("tools", [])
+        if isinstance(remote_tools, BaseException):
+            logger.error("failed to fetch tools from %s: %s", server_url, remote_tools)
             continue
 
         for tool_def in remote_tools:
@@ -203,7 +212,15 @@ class _OpenRouterProvider:
         from agentura_sdk.runner.openrouter import tool_chat_completion
         resp = tool_chat_completion(self._model, self._messages, self._tools,
                                     max_tokens=self._max_tokens, budget_tokens=self._budget_tokens)
+        return self._record(resp)
 
+    async def call_async(self) -> _CallResult:
+        from agentura_sdk.runner.openrouter import tool_chat_completion_async
+        resp = await tool_chat_completion_async(self._model, self._messages, self._tools,
+                                                max_tokens=self._max_tokens, budget_tokens=self._budget_tokens)
+        return self._record(resp)
+
+    def _record(self, resp: ToolChatResponse) -> _CallResult:
         # Build assistant message for history
         assistant_msg: dict = {"role": "assistant"}
         if resp.content:
@@ -278,6 +295,10 @@ class _AnthropicProvider:
 
         return wants_tools, calls, "\n".join(text_parts), tokens_in, tokens_out
 
+    async def call_async(self) -> _CallResult:
+        # The Anthropic client here is synchronous — keep it off the event loop
+        return await asyncio.to_thread(self.call)
+
     def add_tool_results(self, results: list[tuple[str, str]]) -> None:
         tool_results = [
             {"type": "tool_result", "tool_use_id": call_id, "content": output}
@@ -326,7 +347,7 @@ def _get_provider(
 
 # --- Tool execution ---
 
-def _execute_tool(
+async def _execute_tool(
     sandbox: object,
     tool_name: str,
     tool_input: dict,
@@ -336,8 +357,8 @@ def _execute_tool(
     # MCP tool dispatch
     server_url = tool_server_map.get(tool_name)
     if server_url:
-        from agentura_sdk.mcp.client import call_tool
-        return call_tool(server_url, tool_name, tool_input)
+        from agentura_sdk.mcp.client import call_tool_async
+        return await call_tool_async(server_url, tool_name, tool_input)
 
     # Sandbox tools
     if tool_name == "write_file":
@@ -345,49 +366,49 @@ def _execute_tool(
         content = tool_input.get("content", "")
         if not path:
             return "[error] write_file requires 'path' argument"
-        return sandbox_mod.write_file(sandbox, path, content)
+        return await sandbox_mod.write_file(sandbox, path, content)
     if tool_name == "read_file":
         path = tool_input.get("path", "")
         if not path:
             return "[error] read_file requires 'path' argument"
-        return sandbox_mod.read_file(sandbox, path)
+        return await sandbox_mod.read_file(sandbox, path)
     if tool_name == "run_command":
         cmd = tool_input.get("command", "")
         if not cmd:
             return "[error] run_command requires 'command' argument"
-        return sandbox_mod.run_command(sandbox, cmd)
+        return await sandbox_mod.run_command(sandbox, cmd)
     if tool_name == "run_code":
         code = tool_input.get("code", "")
         if not code:
             return "[error] run_code requires 'code' argument"
-        return sandbox_mod.run_code(sandbox, code)
+        return await sandbox_mod.run_code(sandbox, code)
     if tool_name == "clone_repo":
-        return _clone_repo(sandbox, tool_input)
+        return await _clone_repo(sandbox, tool_input)
     if tool_name == "create_branch":
-        return _create_branch(sandbox, tool_input)
+        return await _create_branch(sandbox, tool_input)
     if tool_name == "create_pr":
-        return _create_pr(sandbox, tool_input)
+        return await _create_pr(sandbox, tool_input)
     if tool_name == "task_complete":
         return json.dumps(tool_input)
     return f"Unknown tool: {tool_name}"
 
 
-def _clone_repo(sandbox: object, params: dict) -> str:
+async def _clone_repo(sandbox: object, params: dict) -> str:
     url = params["repo_url"]
     branch = params.get("branch", "main")
     target = params.get("target_dir", "/home/user/repo")
     cmd = f"git clone --depth 1 --branch {branch} {url} {target}"
-    return sandbox_mod.run_command(sandbox, cmd)
+    return await sandbox_mod.run_command(sandbox, cmd)
 
 
-def _create_branch(sandbox: object, params: dict) -> str:
+async def _create_branch(sandbox: object, params: dict) -> str:
     branch = params["branch_name"]
     base_dir = params.get("base_dir", "/home/user/repo")
     cmd = f"cd {base_dir} && git checkout -b {branch}"
-    return sandbox_mod.run_command(sandbox, cmd)
+    return await sandbox_mod.run_command(sandbox, cmd)
 
 
-def _create_pr(sandbox: object, params: dict) -> str:
+async def _create_pr(sandbox: object, params: dict) -> str:
     title = params["title"].replace('"', '\\"')
     body = params["body"].replace('"', '\\"')
     base_dir = params.get("base_dir", "/home/user/repo")
@@ -396,12 +417,104 @@ def _create_pr(sandbox: object, params: dict) -> str:
         f'&& git push -u origin HEAD '
         f'&& gh pr create --title "{title}" --body "{body}"'
     )
-    return sandbox_mod.run_command(sandbox, cmd)
+    return await sandbox_mod.run_command(sandbox, cmd)
+
+
+# --- Per-turn dispatch ---
+
+# Sandbox tools that change shared sandbox state run one at a time, in call order
+_SEQUENTIAL_TOOLS = frozenset({"run_command", "run_code", "clone_repo", "create_branch", "create_pr", "task_complete"})
+
+
+def _sequential_tools(ctx: SkillContext, config: SandboxConfig) -> set[str]:
+    """Tools never dispatched alongside others: sandbox mutations, skill config, approval-gated."""
+    tools = set(_SEQUENTIAL_TOOLS) | set(config.sequential_tools)
+    for binding in ctx.mcp_bindings:
+        tools.update(binding.get("approval_required", []))
+    return tools
+
+
+def _path_key(call: list) -> tuple[str, str] | None:
+    """File tools touching the same path must not share a batch (write-then-read order)."""
+    _, name, args, _ = call
+    if name in ("write_file", "read_file"):
+        return ("path", args.get("path", ""))
+    return None
+
+
+async def _stream_tool_calls(
+    sandbox: object,
+    tool_calls: list[tuple[str, str, dict]],
+    tool_server_map: dict[str, str],
+    write_counts: dict[str, int],
+    *,
+    sequential: set[str],
+    max_concurrency: int,
+) -> AsyncIterator[tuple[int, str, str, dict, str]]:
+    """Execute one turn's tool calls, independent ones concurrently.
+
+    Stops at task_complete. Yields (index, call_id, name, tool_input, output) as each
+    call finishes; index is the call's position in the turn.
+    """
+    from agentura_sdk.runner.tool_dispatch import iter_concurrently, plan_batches
+
+    runs: list[list] = []  # [call_id, name, tool_input, output]
+    for call_id, name, args in tool_calls:
+        run = [call_id, name, args, None]
+        # Detect write_file loops — reject writes after 2 to same path
+        if name == "write_file":
+            fpath = args.get("path", "")
+            write_counts[fpath] = write_counts.get(fpath, 0) + 1
+            if write_counts[fpath] > 2:
+                logger.warning("write_file loop blocked: %s attempt %d", fpath, write_counts[fpath])
+                run[2] = {"path": fpath, "content": "(blocked — duplicate write)"}
+                run[3] = (
+                    f"[error] WRITE REJECTED. {fpath} already written {write_counts[fpath] - 1} times. "
+                    "File content is correct from your earlier write. "
+                    "Do NOT rewrite files. Call task_complete now with your summary and files_created list."
+                )
+        runs.append(run)
+        if name == "task_complete":
+            break
+
+    for index, run in enumerate(runs):
+        if run[3] is not None:
+            yield (index, *run)
+    pending = [index for index, run in enumerate(runs) if run[3] is None]
+    for batch in plan_batches(pending, is_sequential=lambda i: runs[i][1] in sequential,
+                              conflict_key=lambda i: _path_key(runs[i])):
+        calls = [runs[pending[j]] for j in batch]
+        async for k, output in iter_concurrently(
+            calls,
+            lambda run: _execute_tool(sandbox, run[1], run[2], tool_server_map),
+            max_concurrency=max_concurrency,
+        ):
+            calls[k][3] = output
+            yield (pending[batch[k]], *calls[k])
+
+
+async def _run_tool_calls(
+    sandbox: object,
+    tool_calls: list[tuple[str, str, dict]],
+    tool_server_map: dict[str, str],
+    write_counts: dict[str, int],
+    *,
+    sequential: set[str],
+    max_concurrency: int,
+) -> list[tuple[str, str, dict, str]]:
+    """Execute one turn's tool calls (see _stream_tool_calls). Returns (call_id, name, tool_input, output) in call order."""
+    finished = [
+        item async for item in _stream_tool_calls(
+            sandbox, tool_calls, tool_server_map, write_counts,
+            sequential=sequential, max_concurrency=max_concurrency,
+        )
+    ]
+    return [item[1:] for item in sorted(finished, key=lambda item: item[0])]
 
 
 # --- Artifact extraction ---
 
-def _extract_artifacts(sandbox: object, files_created: list[str], skill_name: str) -> tuple[str, dict]:
+async def _extract_artifacts(sandbox: object, files_created: list[str], skill_name: str) -> tuple[str, dict]:
     """Extract files from sandbox to host /artifacts directory for downstream skills."""
     artifacts_dir = os.environ.get("ARTIFACTS_DIR", "/artifacts")
     ts = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
@@ -410,7 +523,7 @@ def _extract_artifacts(sandbox: object, files_created: list[str], skill_name: st
 
     artifacts: dict[str, str] = {}
     for fpath in files_created:
-        content = sandbox_mod.read_file(sandbox, fpath)
+        content = await sandbox_mod.read_file(sandbox, fpath)
         if not content.startswith("[error]"):
             Path(output_dir, os.path.basename(fpath)).write_text(content)
             artifacts[fpath] = content
@@ -423,8 +536,9 @@ def _extract_artifacts(sandbox: object, files_created: list[str], skill_name: st
 def _recall_memories(skill_path: str, input_data: dict) -> str:
     """Search past corrections and reflexions for relevant context.
 
-    Tries semantic search first. Falls back to direct DB lookups if
-    vector search returns empty (common when embeddings fail).
+    Uses the store's indexed keyword search when it has one, otherwise semantic
+    search. Falls back to direct DB lookups if search returns empty (common
+    when embeddings fail).
     """
     try:
         from agentura_sdk.memory import get_memory_store
@@ -432,9 +546,12 @@ def _recall_memories(skill_path: str, input_data: dict) -> str:
         store = get_memory_store()
         lines: list[str] = []
 
-        # Try semantic search first
         query = json.dumps(input_data, default=str)[:500]
-        results = store.search_similar(skill_path, query, limit=3)
+        results: list[dict] = []
+        if hasattr(store, "search_text"):
+            results = store.search_text(query, limit=3, skill=skill_path, kinds=("correction", "reflexion"))
+        if not results:
+            results = store.search_similar(skill_path, query, limit=3)
         for r in results:
             text = r.get("memory", "") or r.get("rule", "") or r.get("user_correction", "")
             if text:
@@ -490,12 +607,12 @@ async def execute_agent(ctx: SkillContext) -> SkillResult:
     iterations: list[AgentIteration] = []
 
     # Build dynamic tool set (sandbox + MCP)
-    all_tools, tool_server_map = _build_tool_set(ctx.mcp_bindings)
+    all_tools, tool_server_map = await _build_tool_set(ctx.mcp_bindings)
     if tool_server_map:
         logger.info("MCP tools loaded: %s", list(tool_server_map.keys()))
 
-    # Compose prompt with memory recall
-    system_prompt = _build_prompt_with_memory(ctx)
+    # Compose prompt with memory recall (store lookups block — keep them off the loop)
+    system_prompt = await asyncio.to_thread(_build_prompt_with_memory, ctx)
 
     try:
         provider = _get_provider(ctx.model, system_prompt, all_tools,
@@ -519,8 +636,9 @@ async def execute_agent(ctx: SkillContext) -> SkillResult:
         task_completed = False
         nudged = False
         write_counts: dict[str, int] = {}  # track write_file calls per path
+        sequential = _sequential_tools(ctx, config)
         for i in range(config.max_iterations):
-            wants_tools, tool_calls, text, tokens_in, tokens_out = await asyncio.to_thread(provider.call)
+            wants_tools, tool_calls, text, tokens_in, tokens_out = await provider.call_async()
             total_in += tokens_in
             total_out += tokens_out
 
@@ -538,30 +656,10 @@ async def execute_agent(ctx: SkillContext) -> SkillResult:
                 break
 
             results: list[tuple[str, str]] = []
-            for call_id, name, args in tool_calls:
-                # Detect write_file loops — reject writes after 2 to same path
-                if name == "write_file":
-                    fpath = args.get("path", "")
-                    write_counts[fpath] = write_counts.get(fpath, 0) + 1
-                    if write_counts[fpath] > 2:
-                        logger.warning("write_file loop blocked: %s attempt %d", fpath, write_counts[fpath])
-                        tool_output = (
-                            f"[error] WRITE REJECTED. {fpath} already written {write_counts[fpath] - 1} times. "
-                            "File content is correct from your earlier write. "
-                            "Do NOT rewrite files. Call task_complete now with your summary and files_created list."
-                        )
-                        iterations.append(AgentIteration(
-                            iteration=i + 1,
-                            tool_name=name,
-                            tool_input={"path": fpath, "content": "(blocked — duplicate write)"},
-                            tool_output=tool_output,
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                        ))
-                        results.append((call_id, tool_output))
-                        continue
-
-                tool_output = _execute_tool(sandbox, name, args, tool_server_map)
-
+            for call_id, name, args, tool_output in await _run_tool_calls(
+                sandbox, tool_calls, tool_server_map, write_counts,
+                sequential=sequential, max_concurrency=config.tool_concurrency,
+            ):
                 iterations.append(AgentIteration(
                     iteration=i + 1,
                     tool_name=name,
@@ -635,7 +733,7 @@ async def execute_agent(ctx: SkillContext) -> SkillResult:
         files_created = final_output.get("files_created", [])
         if files_created:
             try:
-                output_dir, artifacts = _extract_artifacts(sandbox, files_created, ctx.skill_name)
+                output_dir, artifacts = await _extract_artifacts(sandbox, files_created, ctx.skill_name)
                 context_for_next = {"artifacts_dir": output_dir, "artifacts": artifacts}
             except Exception as exc:
                 logger.warning("artifact extraction failed: %s", exc)
@@ -677,7 +775,7 @@ async def execute_agent(ctx: SkillContext) -> SkillResult:
             latency_ms=latency_ms,
         )
     finally:
-        sandbox_mod.close(sandbox)
+        await sandbox_mod.close(sandbox)
 
 
 async def execute_agent_streaming(
@@ -689,12 +787,12 @@ async def execute_agent_streaming(
     iterations: list[AgentIteration] = []
 
     # Build dynamic tool set (sandbox + MCP)
-    all_tools, tool_server_map = _build_tool_set(ctx.mcp_bindings)
+    all_tools, tool_server_map = await _build_tool_set(ctx.mcp_bindings)
     if tool_server_map:
         logger.info("MCP tools loaded: %s", list(tool_server_map.keys()))
 
-    # Compose prompt with memory recall
-    system_prompt = _build_prompt_with_memory(ctx)
+    # Compose prompt with memory recall (store lookups block — keep them off the loop)
+    system_prompt = await asyncio.to_thread(_build_prompt_with_memory, ctx)
 
     try:
         provider = _get_provider(ctx.model, system_prompt, all_tools,
@@ -717,9 +815,10 @@ async def execute_agent_streaming(
         total_out = 0
         task_completed = False
         write_counts: dict[str, int] = {}  # track write_file calls per path
+        sequential = _sequential_tools(ctx, config)
 
         for i in range(config.max_iterations):
-            wants_tools, tool_calls, text, tokens_in, tokens_out = await asyncio.to_thread(provider.call)
+            wants_tools, tool_calls, text, tokens_in, tokens_out = await provider.call_async()
             total_in += tokens_in
             total_out += tokens_out
 
@@ -734,33 +833,12 @@ async def execute_agent_streaming(
                 final_output = {"summary": text}
                 break
 
-            results: list[tuple[str, str]] = []
-            for call_id, name, args in tool_calls:
-                # Detect write_file loops — reject writes after 2 to same path
-                if name == "write_file":
-                    fpath = args.get("path", "")
-                    write_counts[fpath] = write_counts.get(fpath, 0) + 1
-                    if write_counts[fpath] > 2:
-                        logger.warning("write_file loop blocked: %s attempt %d", fpath, write_counts[fpath])
-                        tool_output = (
-                            f"[error] WRITE REJECTED. {fpath} already written {write_counts[fpath] - 1} times. "
-                            "File content is correct from your earlier write. "
-                            "Do NOT rewrite files. Call task_complete now with your summary and files_created list."
-                        )
-                        iteration = AgentIteration(
-                            iteration=i + 1,
-                            tool_name=name,
-                            tool_input={"path": fpath, "content": "(blocked — duplicate write)"},
-                            tool_output=tool_output,
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                        )
-                        iterations.append(iteration)
-                        yield iteration
-                        results.append((call_id, tool_output))
-                        continue
-
-                tool_output = _execute_tool(sandbox, name, args, tool_server_map)
-
+            # Stream each tool's event as it finishes; the transcript keeps call order.
+            results: dict[int, tuple[str, str]] = {}
+            async for index, call_id, name, args, tool_output in _stream_tool_calls(
+                sandbox, tool_calls, tool_server_map, write_counts,
+                sequential=sequential, max_concurrency=config.tool_concurrency,
+            ):
                 iteration = AgentIteration(
                     iteration=i + 1,
                     tool_name=name,
@@ -771,14 +849,13 @@ async def execute_agent_streaming(
                 iterations.append(iteration)
                 yield iteration
 
-                results.append((call_id, tool_output[:4000]))
+                results[index] = (call_id, tool_output[:4000])
 
                 if name == "task_complete":
                     final_output = args
                     task_completed = True
-                    break
 
-            provider.add_tool_results(results)
+            provider.add_tool_results([results[index] for index in sorted(results)])
 
             if final_output:
                 break
@@ -788,7 +865,7 @@ async def execute_agent_streaming(
         files_created = final_output.get("files_created", [])
         if files_created:
             try:
-                output_dir, artifacts = _extract_artifacts(sandbox, files_created, ctx.skill_name)
+                output_dir, artifacts = await _extract_artifacts(sandbox, files_created, ctx.skill_name)
                 context_for_next = {"artifacts_dir": output_dir, "artifacts": artifacts}
             except Exception as exc:
                 logger.warning("artifact extraction failed: %s", exc)
@@ -820,4 +897,4 @@ async def execute_agent_streaming(
             latency_ms=latency_ms,
         )
     finally:
-        sandbox_mod.close(sandbox)
+        await sandbox_mod.close(sandbox)
@@ -1,10 +1,30 @@
-"""Parse agentura.config.yaml → SkillConfig."""
+"""Parse agentura.config.yaml → SkillConfig / SkillRuntimeConfig."""
 
+import logging
+import os
+import threading
 from pathlib import Path
+from typing import Any
 
 import yaml
+from pydantic import ValidationError
 
-from agentura_sdk.types import SkillConfig
+from agentura_sdk.types import (
+    FeedbackConfig,
+    GuardrailsConfig,
+    SandboxConfig,
+    SkillConfig,
+    SkillRuntimeConfig,
+    VerifyConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILENAME = "agentura.config.yaml"
+
+# Runtime configs keyed by resolved config path → ((mtime_ns, size), config)
+_runtime_cache: dict[str, tuple[tuple[int, int], SkillRuntimeConfig]] = {}
+_runtime_lock = threading.Lock()
 
 
 def load_config(config_path: Path) -> SkillConfig:
@@ -74,3 +94,90 @@ def find_config(skill_dir: Path) -> Path:
     raise FileNotFoundError(
         f"No agentura.config.yaml found in or above {skill_dir}"
     )
+
+
+def load_runtime_config(skill_dir: Path) -> SkillRuntimeConfig:
+    """Return the execution-time config for a skill directory.
+
+    Parsed once per file version: cached by (mtime, size) of agentura.config.yaml, so
+    edits are picked up on the next call even without the watcher. A missing or
+    unparseable file yields an all-defaults config.
+    """
+    config_path = (skill_dir / CONFIG_FILENAME).resolve()
+    key = str(config_path)
+    try:
+        st = os.stat(key)
+        version = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        version = (-1, -1)
+
+    cached = _runtime_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    raw: dict[str, Any] = {}
+    if version != (-1, -1):
+        try:
+            loaded = yaml.safe_load(config_path.read_text())
+            if isinstance(loaded, dict):
+                raw = loaded
+        except (OSError, yaml.YAMLError):
+            logger.warning("Invalid YAML in %s — using defaults", config_path)
+
+    config = build_runtime_config(raw)
+    with _runtime_lock:
+        _runtime_cache[key] = (version, config)
+    return config
+
+
+def build_runtime_config(raw: dict[str, Any]) -> SkillRuntimeConfig:
+    """Build a SkillRuntimeConfig from a raw config dict, section by section."""
+    sandbox = None
+    sandbox_raw = raw.get("sandbox", {}) or raw.get("agent", {})
+    if sandbox_raw:
+        sandbox = _section(SandboxConfig, sandbox_raw, "sandbox")
+
+    verify = None
+    verify_raw = raw.get("verify", {})
+    if isinstance(verify_raw, dict) and verify_raw.get("enabled"):
+        verify = _section(VerifyConfig, verify_raw, "verify")
+
+    mcp_tools = raw.get("mcp_tools", []) or []
+    notifications = raw.get("notifications", []) or []
+
+    return SkillRuntimeConfig(
+        sandbox=sandbox,
+        mcp_tools=[m for m in mcp_tools if isinstance(m, dict)],
+        verify=verify,
+        guardrails=_section(GuardrailsConfig, raw.get("guardrails"), "guardrails") or GuardrailsConfig(),
+        feedback=_section(FeedbackConfig, raw.get("feedback"), "feedback") or FeedbackConfig(),
+        notifications=[n for n in notifications if isinstance(n, dict)],
+        raw=raw,
+    )
+
+
+def invalidate_runtime_configs(path: str | Path | None = None) -> int:
+    """Drop cached runtime configs (all if path is None). Called from the skill watcher."""
+    with _runtime_lock:
+        if path is None:
+            count = len(_runtime_cache)
+            _runtime_cache.clear()
+            return count
+        key = str(Path(path).resolve())
+        return 1 if _runtime_cache.pop(key, None) is not None else 0
+
+
+def _section(model, data, name: str):
+    """Validate one config section. Invalid fields fall back to their defaults."""
+    if not isinstance(data, dict):
+        return None
+    try:
+        return model(**data)
+    except ValidationError as e:
+        invalid = {err["loc"][0] for err in e.errors() if err["loc"]}
+        logger.warning("Invalid %s config, using defaults for %s: %s", name, sorted(map(str, invalid)), e)
+    try:
+        return model(**{k: v for k, v in data.items() if k not in invalid})
+    except ValidationError as e:
+        logger.warning("Ignoring invalid %s config: %s", name, e)
+        return None
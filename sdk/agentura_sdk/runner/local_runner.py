@@ -59,29 +59,41 @@ def log_execution(ctx: SkillContext, result: SkillResult) -> str:
         "triggered_by": ctx.input_data.get("_triggered_by", ""),
     }
 
+    pending = result.output.get("pending_approvals") if isinstance(result.output, dict) else None
+
+    # Write-behind: queue the entry (with its approval/MemRL follow-ups) and return at once.
+    # Approval-gated executions are written synchronously — a reviewer may act on them next.
+    if not result.approval_required:
+        try:
+            from agentura_sdk.memory.write_behind import get_execution_log_queue
+            log_queue = get_execution_log_queue()
+        except Exception:
+            log_queue = None
+        if log_queue is not None:
+            log_queue.submit({
+                **entry,
+                "pending_approvals": pending or [],
+                "reflexions_injected": list(ctx.injected_reflexion_ids or []),
+                "reflexions_helped": bool(result.success and ctx.injected_reflexion_ids),
+            })
+            return execution_id
+
     try:
         from agentura_sdk.memory import get_memory_store
         store = get_memory_store()
         store.log_execution(skill_path, entry)
 
         # Approval engine: store pending tool calls for post-approval execution
-        pending = result.output.get("pending_approvals") if isinstance(result.output, dict) else None
         if pending:
             try:
                 store.update_execution_pending_approvals(execution_id, pending)
             except Exception:
                 pass
 
-        # MemRL: track which reflexions were injected (DEC-066)
+        # MemRL: track which reflexions were injected, and score them on success (DEC-066)
         if ctx.injected_reflexion_ids:
             try:
-                store.record_reflexion_injection(execution_id, ctx.injected_reflexion_ids)
-            except Exception:
-                pass
-        # MemRL: record success for utility scoring
-        if result.success and ctx.injected_reflexion_ids:
-            try:
-                store.record_execution_success(execution_id)
+                store.record_reflexion_outcome(execution_id, ctx.injected_reflexion_ids, result.success)
             except Exception:
                 pass
     except Exception:
@@ -156,10 +168,10 @@ async def _execute_via_openrouter(ctx: SkillContext) -> SkillResult:
     """Execute via OpenRouter — supports 200+ models with fallback chains."""
     start = time.monotonic()
     try:
-        from agentura_sdk.runner.openrouter import chat_completion
+        from agentura_sdk.runner.openrouter import chat_completion_async
 
         user_prompt = json.dumps(ctx.input_data, indent=2)
-        response = chat_completion(
+        response = await chat_completion_async(
             model=ctx.model,
             system_prompt=ctx.system_prompt,
             user_message=user_prompt,
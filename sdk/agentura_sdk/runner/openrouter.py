@@ -2,10 +2,15 @@
 
 Provides a unified interface to 200+ models via OpenRouter's API.
 Activated when OPENROUTER_API_KEY is set.
+
+Sync and `*_async` variants share one keep-alive connection pool (HTTP/2 when the
+`h2` package is installed); async callers in the server should use the `*_async`
+functions so a slow completion never blocks the event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -80,20 +85,91 @@ class ToolChatResponse:
     tokens_out: int
 
 
+# One keep-alive connection pool per process (sync) and per event loop (async), so
+# LLM calls reuse TCP+TLS connections instead of paying a handshake each time.
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=120.0)
+_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+
+_client: httpx.Client | None = None
+_async_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+_closing: set[asyncio.Task] = set()  # aclose() tasks for replaced async clients
+
+
+def _headers() -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {os.environ.get('OPENROUTER_API_KEY', '')}",
+        "HTTP-Referer": os.environ.get("OPENROUTER_REFERER", "https://agentura.dev"),
+        "X-Title": "Agentura",
+        "Content-Type": "application/json",
+    }
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 def _get_client() -> httpx.Client:
-    api_key = os.environ.get("OPENROUTER_API_KEY", "")
-    return httpx.Client(
-        base_url=OPENROUTER_BASE,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "HTTP-Referer": os.environ.get(
-                "OPENROUTER_REFERER", "https://agentura.dev"
-            ),
-            "X-Title": "Agentura",
-            "Content-Type": "application/json",
-        },
-        timeout=300.0,
-    )
+    """Shared pooled client; rebuilt if the API key changes."""
+    global _client
+    headers = _headers()
+    if _client is None or _client.is_closed or _client.headers.get("Authorization") != headers["Authorization"]:
+        if _client is not None and not _client.is_closed:
+            _client.close()
+        _client = httpx.Client(
+            base_url=OPENROUTER_BASE, headers=headers, timeout=_TIMEOUT, limits=_LIMITS,
+            http2=_http2_available(),
+        )
+    return _client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Shared pooled HTTP/2 client for the running event loop; rebuilt if the API key changes."""
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    headers = _headers()
+    if (
+        _async_client is None
+        or _async_client.is_closed
+        or _async_client_loop is not loop
+        or _async_client.headers.get("Authorization") != headers["Authorization"]
+    ):
+        if _async_client is not None and not _async_client.is_closed:
+            _retire_async_client(_async_client, _async_client_loop)
+        _async_client = httpx.AsyncClient(
+            base_url=OPENROUTER_BASE, headers=headers, timeout=_TIMEOUT, limits=_LIMITS,
+            http2=_http2_available(),
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+def _retire_async_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Schedule aclose() for a replaced async client on the event loop that owns it."""
+    try:
+        if loop is asyncio.get_running_loop():
+            task = loop.create_task(client.aclose())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+        elif loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    except Exception:
+        logger.debug("Failed to close replaced OpenRouter client", exc_info=True)
+
+
+async def aclose_clients() -> None:
+    """Close the shared clients (server shutdown)."""
+    global _client, _async_client
+    if _async_client is not None and _async_client_loop is asyncio.get_running_loop():
+        await _async_client.aclose()
+    _async_client = None
+    if _client is not None:
+        _client.close()
+        _client = None
 
 
 def resolve_model(model_name: str) -> str:
@@ -101,6 +177,18 @@ def resolve_model(model_name: str) -> str:
     return MODEL_ALIASES.get(model_name, model_name)
 
 
+def _models_to_try(model: str, fallback: bool) -> list[str]:
+    resolved = resolve_model(model)
+    return [resolved, *FALLBACK_CHAINS.get(resolved, [])] if fallback else [resolved]
+
+
+def _system_user_messages(system_prompt: str, user_message: str) -> list[dict]:
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_message},
+    ]
+
+
 def chat_completion(
     model: str,
     system_prompt: str,
@@ -110,17 +198,23 @@ def chat_completion(
     fallback: bool = True,
 ) -> ModelResponse:
     """Chat completion via OpenRouter with optional fallback chain."""
-    resolved = resolve_model(model)
-    models_to_try = [resolved]
-    if fallback:
-        models_to_try.extend(FALLBACK_CHAINS.get(resolved, []))
+    return chat_completion_messages(
+        model, _system_user_messages(system_prompt, user_message), temperature, max_tokens, fallback
+    )
+
 
+def chat_completion_messages(
+    model: str,
+    messages: list[dict],
+    temperature: float = 0.0,
+    max_tokens: int = 4096,
+    fallback: bool = True,
+) -> ModelResponse:
+    """Multi-turn chat completion via OpenRouter."""
     last_error: Exception | None = None
-    for model_id in models_to_try:
+    for model_id in _models_to_try(model, fallback):
         try:
-            return _call_model(
-                model_id, system_prompt, user_message, temperature, max_tokens
-            )
+            return _call_model_messages(model_id, messages, temperature, max_tokens)
         except Exception as e:
             last_error = e
             continue
@@ -128,23 +222,37 @@ def chat_completion(
     raise RuntimeError(f"All models failed. Last error: {last_error}")
 
 
-def chat_completion_messages(
+async def chat_completion_async(
     model: str,
-    messages: list[dict],
+    system_prompt: str,
+    user_message: str,
     temperature: float = 0.0,
     max_tokens: int = 4096,
     fallback: bool = True,
 ) -> ModelResponse:
-    """Multi-turn chat completion via OpenRouter."""
-    resolved = resolve_model(model)
-    models_to_try = [resolved]
-    if fallback:
-        models_to_try.extend(FALLBACK_CHAINS.get(resolved, []))
+    """Async chat_completion on the shared pooled client — does not block the event loop."""
+    return await chat_completion_messages_async(
+        model, _system_user_messages(system_prompt, user_message), temperature, max_tokens, fallback
+    )
+
 
+async def chat_completion_messages_async(
+    model: str,
+    messages: list[dict],
+    temperature: float = 0.0,
+    max_tokens: int = 4096,
+    fallback: bool = True,
+) -> ModelResponse:
+    """Async chat_completion_messages on the shared pooled client."""
     last_error: Exception | None = None
-    for model_id in models_to_try:
+    for model_id in _models_to_try(model, fallback):
         try:
-            return _call_model_messages(model_id, messages, temperature, max_tokens)
+            start = time.monotonic()
+            resp = await _get_async_client().post(
+                "/chat/completions", json=_completion_payload(model_id, messages, temperature, max_tokens),
+            )
+            resp.raise_for_status()
+            return _model_response(resp.json(), model_id, start)
         except Exception as e:
             last_error = e
             continue
@@ -152,29 +260,16 @@ def chat_completion_messages(
     raise RuntimeError(f"All models failed. Last error: {last_error}")
 
 
-def _call_model_messages(
-    model_id: str,
-    messages: list[dict],
-    temperature: float,
-    max_tokens: int,
-) -> ModelResponse:
-    start = time.monotonic()
-    client = _get_client()
-    try:
-        resp = client.post(
-            "/chat/completions",
-            json={
-                "model": model_id,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    finally:
-        client.close()
+def _completion_payload(model_id: str, messages: list[dict], temperature: float, max_tokens: int) -> dict:
+    return {
+        "model": model_id,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
 
+
+def _model_response(data: dict, model_id: str, start: float) -> ModelResponse:
     latency_ms = (time.monotonic() - start) * 1000
     choice = data["choices"][0]
     usage = data.get("usage", {})
@@ -189,18 +284,18 @@ def _call_model_messages(
     )
 
 
-def _call_model(
+def _call_model_messages(
     model_id: str,
-    system_prompt: str,
-    user_message: str,
+    messages: list[dict],
     temperature: float,
     max_tokens: int,
 ) -> ModelResponse:
-    messages = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": user_message},
-    ]
-    return _call_model_messages(model_id, messages, temperature, max_tokens)
+    start = time.monotonic()
+    resp = _get_client().post(
+        "/chat/completions", json=_completion_payload(model_id, messages, temperature, max_tokens),
+    )
+    resp.raise_for_status()
+    return _model_response(resp.json(), model_id, start)
 
 
 def _repair_json(s: str) -> str:
@@ -242,26 +337,55 @@ def tool_chat_completion(
 ) -> ToolChatResponse:
     """Chat completion with tool calling via OpenRouter."""
     resolved = resolve_model(model)
-    client = _get_client()
-    try:
-        payload: dict = {
-            "model": resolved,
-            "messages": messages,
-            "tools": tools,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-        if budget_tokens > 0:
-            payload["reasoning"] = {"effort": "high"}
-            logger.info("Extended thinking enabled (budget_tokens=%d)", budget_tokens)
-        resp = client.post("/chat/completions", json=payload)
-        resp.raise_for_status()
-        body = resp.text.strip()
-        if not body:
-            raise RuntimeError(f"OpenRouter returned empty body (status {resp.status_code})")
-        data = json.loads(body)
-    finally:
-        client.close()
+    resp = _get_client().post(
+        "/chat/completions", json=_tool_payload(resolved, messages, tools, temperature, max_tokens, budget_tokens),
+    )
+    return _tool_chat_response(resp, resolved)
+
+
+async def tool_chat_completion_async(
+    model: str,
+    messages: list[dict],
+    tools: list[dict],
+    temperature: float = 0.0,
+    max_tokens: int = 4096,
+    budget_tokens: int = 0,
+) -> ToolChatResponse:
+    """Async tool_chat_completion on the shared pooled client."""
+    resolved = resolve_model(model)
+    resp = await _get_async_client().post(
+        "/chat/completions", json=_tool_payload(resolved, messages, tools, temperature, max_tokens, budget_tokens),
+    )
+    return _tool_chat_response(resp, resolved)
+
+
+def _tool_payload(
+    model_id: str,
+    messages: list[dict],
+    tools: list[dict],
+    temperature: float,
+    max_tokens: int,
+    budget_tokens: int,
+) -> dict:
+    payload: dict = {
+        "model": model_id,
+        "messages": messages,
+        "tools": tools,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if budget_tokens > 0:
+        payload["reasoning"] = {"effort": "high"}
+        logger.info("Extended thinking enabled (budget_tokens=%d)", budget_tokens)
+    return payload
+
+
+def _tool_chat_response(resp: httpx.Response, resolved: str) -> ToolChatResponse:
+    resp.raise_for_status()
+    body = resp.text.strip()
+    if not body:
+        raise RuntimeError(f"OpenRouter returned empty body (status {resp.status_code})")
+    data = json.loads(body)
 
     choice = data["choices"][0]
     message = choice["message"]
@@ -303,10 +427,6 @@ def tool_chat_completion(
 
 def list_models() -> list[dict]:
     """List available models from OpenRouter."""
-    client = _get_client()
-    try:
-        resp = client.get("/models")
-        resp.raise_for_status()
-        return resp.json().get("data", [])
-    finally:
-        client.close()
+    resp = _get_client().get("/models")
+    resp.raise_for_status()
+    return resp.json().get("data", [])
@@ -13,6 +13,7 @@ Requires: SANDBOX_BACKEND=k8s, ANTHROPIC_API_KEY set.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -51,7 +52,7 @@ def _resolve_model(model: str) -> str:
     }.get(name, name)
 
 
-def _build_worker_env(ctx: SkillContext) -> dict[str, str]:
+def _build_worker_env(ctx: SkillContext | None = None) -> dict[str, str]:
     """Build env vars to pass to the PTC worker pod."""
     env: dict[str, str] = {}
     if os.environ.get("ANTHROPIC_API_KEY"):
@@ -106,6 +107,9 @@ def _build_ptc_request(ctx: SkillContext) -> dict:
         "allowed_mcp_tools": allowed_mcp_tools,
         "approval_tools": approval_tools,
     }
+    if ctx.sandbox_config:
+        req["tool_concurrency"] = ctx.sandbox_config.tool_concurrency
+        req["sequential_tools"] = ctx.sandbox_config.sequential_tools
 
     # Self-critique verification (DEC-069)
     if ctx.verify_config and ctx.verify_config.enabled:
@@ -115,6 +119,25 @@ def _build_ptc_request(ctx: SkillContext) -> dict:
     return req
 
 
+async def _resolve_tool_schemas(mcp_servers: dict[str, dict]) -> None:
+    """Attach cached tool schemas + protocol to each server config so the worker skips discovery.
+
+    Servers that fail to resolve are left as-is; the worker discovers those itself.
+    """
+    from agentura_sdk.mcp.tool_cache import resolve_tools_async
+
+    async def _resolve(server_name: str, server_cfg: dict) -> None:
+        try:
+            resolved = await resolve_tools_async(server_cfg["url"], server_cfg.get("headers"))
+        except Exception as exc:
+            logger.warning("Tool schema pre-resolve failed for %s: %s", server_name, exc)
+            return
+        server_cfg["tools"] = resolved.tools
+        server_cfg["protocol"] = resolved.protocol
+
+    await asyncio.gather(*(_resolve(name, cfg) for name, cfg in mcp_servers.items()))
+
+
 def _parse_sse_events(text: str) -> list[tuple[str, dict]]:
     """Parse SSE text into (event_type, data) tuples."""
     events = []
@@ -149,9 +172,14 @@ async def execute_ptc(ctx: SkillContext) -> SkillResult:
     sandbox_cfg = ctx.sandbox_config or SandboxConfig()
     env_vars = _build_worker_env(ctx)
 
-    worker = await ptc_worker.create(sandbox_cfg, env_vars)
+    request_body = _build_ptc_request(ctx)
+    # Tool schemas resolve (usually from cache) while the worker pod starts
+    worker, _ = await asyncio.gather(
+        ptc_worker.create(sandbox_cfg, env_vars),
+        _resolve_tool_schemas(request_body["mcp_servers"]),
+    )
+    reusable = False
     try:
-        request_body = _build_ptc_request(ctx)
         worker_url = f"http://{worker.pod_ip}:8081/execute-stream"
 
         iterations: list[AgentIteration] = []
@@ -178,6 +206,8 @@ async def execute_ptc(ctx: SkillContext) -> SkillResult:
                                 result_data = data
                             elif event_type == "error":
                                 result_data = {"success": False, "error": data.get("error", "unknown")}
+        # Stream ran to completion — the worker is in a clean state for the warm pool
+        reusable = True
 
         latency_ms = (time.monotonic() - start) * 1000
         cost_usd = result_data.get("cost_usd", 0.0)
@@ -225,7 +255,7 @@ async def execute_ptc(ctx: SkillContext) -> SkillResult:
             latency_ms=latency_ms,
         )
     finally:
-        ptc_worker.close(worker)
+        await ptc_worker.close(worker, reusable=reusable)
 
 
 # ---------------------------------------------------------------------------
@@ -242,9 +272,14 @@ async def execute_ptc_streaming(
     sandbox_cfg = ctx.sandbox_config or SandboxConfig()
     env_vars = _build_worker_env(ctx)
 
-    worker = await ptc_worker.create(sandbox_cfg, env_vars)
+    request_body = _build_ptc_request(ctx)
+    # Tool schemas resolve (usually from cache) while the worker pod starts
+    worker, _ = await asyncio.gather(
+        ptc_worker.create(sandbox_cfg, env_vars),
+        _resolve_tool_schemas(request_body["mcp_servers"]),
+    )
+    reusable = False
     try:
-        request_body = _build_ptc_request(ctx)
         worker_url = f"http://{worker.pod_ip}:8081/execute-stream"
 
         iterations: list[AgentIteration] = []
@@ -270,12 +305,19 @@ async def execute_ptc_streaming(
                                 iterations.append(iteration)
                                 yield iteration
                             elif event_type == "tool_result":
-                                if iterations:
-                                    iterations[-1].tool_output = data.get("output", "")[:2000]
+                                # Calls from one turn may run concurrently — match by iteration number
+                                target = next(
+                                    (it for it in reversed(iterations) if it.iteration == data.get("iteration")),
+                                    iterations[-1] if iterations else None,
+                                )
+                                if target is not None:
+                                    target.tool_output = data.get("output", "")[:2000]
                             elif event_type == "result":
                                 result_data = data
                             elif event_type == "error":
                                 result_data = {"success": False, "error": data.get("error", "unknown")}
+        # Stream ran to completion — the worker is in a clean state for the warm pool
+        reusable = True
 
         latency_ms = (time.monotonic() - start) * 1000
         cost_usd = result_data.get("cost_usd", 0.0)
@@ -322,4 +364,4 @@ async def execute_ptc_streaming(
             latency_ms=latency_ms,
         )
     finally:
-        ptc_worker.close(worker)
+        await ptc_worker.close(worker, reusable=reusable)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -13,6 +14,14 @@ import yaml
 
 from agentura_sdk.types import SkillMetadata
 
+PROMPT_SEPARATOR = "\n\n---\n\n"
+
+_PROJECT_CONFIGS_HEADER = (
+    "## Project Configurations\n\n"
+    "Use these configs for workspace IDs, list IDs, assignee mappings, and channel references. "
+    "Do NOT ask the user for IDs that are listed here.\n"
+)
+
 
 @dataclass
 class LoadedSkill:
@@ -24,6 +33,36 @@ class LoadedSkill:
     reflexion_context: str
     raw_content: str
     injected_reflexion_ids: list[str] = field(default_factory=list)
+    # WORKSPACE + DOMAIN + Reflexion + ProjectConfigs + SKILL, ready for the LLM
+    composed_prompt: str = ""
+
+
+@dataclass(frozen=True)
+class SkillBundle:
+    """Everything in a skill's prompt that only changes when files change.
+
+    Compiled once per skill and reused until a source file's (mtime, size) changes
+    or the skill watcher invalidates it. The per-request reflexion section is spliced
+    in by compose().
+    """
+    metadata: SkillMetadata
+    system_prompt: str
+    workspace_context: str
+    domain_context: str
+    project_configs: str
+    raw_content: str
+    prompt_head: str  # WORKSPACE + DOMAIN
+    prompt_tail: str  # Project configs section + SKILL body
+    fingerprint: tuple[tuple[str, int, int], ...]
+    scope_dirs: frozenset[str]  # dirs whose direct children feed this bundle
+
+    def compose(self, reflexion_context: str = "") -> str:
+        parts = [p for p in (self.prompt_head, reflexion_context, self.prompt_tail) if p]
+        return PROMPT_SEPARATOR.join(parts)
+
+
+_bundle_cache: dict[str, SkillBundle] = {}
+_bundle_lock = threading.Lock()
 
 
 def load_workspace_md(skill_path: Path) -> str:
@@ -104,6 +143,17 @@ def load_project_configs(skill_path: Path) -> str:
     return "\n\n---\n\n".join(config_parts)
 
 
+def format_project_configs_section(project_configs: str) -> str:
+    """Wrap loaded project configs in the prompt section injected for PTC workers.
+
+    PTC workers have no filesystem access, so workspace IDs, ClickUp list mappings,
+    assignee IDs and Slack channels must travel in the system prompt.
+    """
+    if not project_configs:
+        return ""
+    return _PROJECT_CONFIGS_HEADER + project_configs
+
+
 def load_reflexion_entries(skill_path: Path) -> tuple[str, list[str]]:
     """Load reflexion entries relevant to this skill from the knowledge layer.
 
@@ -218,9 +268,69 @@ def load_skill_md(skill_path: Path, include_reflexions: bool = True) -> LoadedSk
     1. Standard YAML frontmatter (--- delimiters) — used by packages/skills/
     2. YAML in code fence under ## Skill Metadata — used by examples/auto-rca/
 
+    File-derived parts come from the compiled bundle cache (see load_skill_bundle);
+    only the reflexion section is loaded per call.
+
     Set include_reflexions=False when only metadata is needed (e.g. listing skills)
     to avoid expensive mem0/reflexion store initialization.
     """
+    bundle = load_skill_bundle(skill_path)
+    if include_reflexions:
+        reflexion_context, injected_ids = load_reflexion_entries(skill_path)
+    else:
+        reflexion_context, injected_ids = "", []
+
+    return LoadedSkill(
+        metadata=bundle.metadata,
+        system_prompt=bundle.system_prompt,
+        workspace_context=bundle.workspace_context,
+        domain_context=bundle.domain_context,
+        project_configs=bundle.project_configs,
+        reflexion_context=reflexion_context,
+        raw_content=bundle.raw_content,
+        injected_reflexion_ids=injected_ids,
+        composed_prompt=bundle.compose(reflexion_context),
+    )
+
+
+def load_skill_bundle(skill_path: Path) -> SkillBundle:
+    """Return the compiled bundle for a SKILL.md, recompiling if any source file changed."""
+    key = str(skill_path.resolve())
+    cached = _bundle_cache.get(key)
+    if cached is not None and _fingerprint_matches(cached.fingerprint):
+        return cached
+
+    bundle = _compile_bundle(skill_path)
+    with _bundle_lock:
+        _bundle_cache[key] = bundle
+    return bundle
+
+
+def invalidate_skill_bundles(path: str | Path | None = None) -> int:
+    """Drop compiled bundles affected by a changed file (all bundles if path is None).
+
+    Called from the skill watcher. A bundle is affected when the file is one of its
+    sources or sits directly in a directory it consults (new DOMAIN.md, new project
+    config, ...). Returns the number of bundles dropped.
+    """
+    with _bundle_lock:
+        if path is None:
+            count = len(_bundle_cache)
+            _bundle_cache.clear()
+            return count
+        changed = Path(path).resolve()
+        changed_str, parent_str = str(changed), str(changed.parent)
+        stale = [
+            key for key, bundle in _bundle_cache.items()
+            if parent_str in bundle.scope_dirs
+            or any(src == changed_str for src, _, _ in bundle.fingerprint)
+        ]
+        for key in stale:
+            del _bundle_cache[key]
+        return len(stale)
+
+
+def _compile_bundle(skill_path: Path) -> SkillBundle:
     if not skill_path.exists():
         raise FileNotFoundError(f"Skill file not found: {skill_path}")
 
@@ -228,51 +338,95 @@ def load_skill_md(skill_path: Path, include_reflexions: bool = True) -> LoadedSk
     workspace_context = load_workspace_md(skill_path)
     domain_context = load_domain_md(skill_path)
     project_configs = load_project_configs(skill_path)
-    if include_reflexions:
-        reflexion_context, injected_ids = load_reflexion_entries(skill_path)
-    else:
-        reflexion_context, injected_ids = "", []
 
     # Try standard frontmatter first (--- delimiters)
     post = frontmatter.loads(raw)
     if post.metadata:
         metadata = _parse_metadata(post.metadata)
-        return LoadedSkill(
-            metadata=metadata,
-            system_prompt=post.content.strip(),
-            workspace_context=workspace_context,
-            domain_context=domain_context,
-            project_configs=project_configs,
-            reflexion_context=reflexion_context,
-            raw_content=raw,
-            injected_reflexion_ids=injected_ids,
-        )
-
-    # Fallback: YAML in ```yaml code fence under ## Skill Metadata
-    metadata_dict = _extract_code_fence_metadata(raw)
-    if metadata_dict:
+        system_prompt = post.content.strip()
+    else:
+        # Fallback: YAML in ```yaml code fence under ## Skill Metadata
+        metadata_dict = _extract_code_fence_metadata(raw)
+        if not metadata_dict:
+            raise ValueError(
+                f"No frontmatter found in {skill_path}. "
+                "Use --- YAML --- or ## Skill Metadata with ```yaml code fence."
+            )
         # Metadata may be nested under 'skill' key
         skill_data = metadata_dict.get("skill", metadata_dict)
         metadata = _parse_metadata(skill_data)
         # Strip the metadata section, keep the rest as prompt
-        prompt = _strip_metadata_section(raw)
-        return LoadedSkill(
-            metadata=metadata,
-            system_prompt=prompt,
-            workspace_context=workspace_context,
-            domain_context=domain_context,
-            project_configs=project_configs,
-            reflexion_context=reflexion_context,
-            raw_content=raw,
-            injected_reflexion_ids=injected_ids,
-        )
-
-    raise ValueError(
-        f"No frontmatter found in {skill_path}. "
-        "Use --- YAML --- or ## Skill Metadata with ```yaml code fence."
+        system_prompt = _strip_metadata_section(raw)
+
+    head = [p for p in (workspace_context, domain_context) if p]
+    tail = [p for p in (format_project_configs_section(project_configs), system_prompt) if p]
+    sources, scope_dirs = _bundle_sources(skill_path)
+
+    return SkillBundle(
+        metadata=metadata,
+        system_prompt=system_prompt,
+        workspace_context=workspace_context,
+        domain_context=domain_context,
+        project_configs=project_configs,
+        raw_content=raw,
+        prompt_head=PROMPT_SEPARATOR.join(head),
+        prompt_tail=PROMPT_SEPARATOR.join(tail),
+        fingerprint=tuple(_stat_fingerprint(p) for p in sources),
+        scope_dirs=frozenset(str(d.resolve()) for d in scope_dirs),
     )
 
 
+def _bundle_sources(skill_path: Path) -> tuple[list[Path], list[Path]]:
+    """Files (and directories, whose mtime tracks added/removed entries) a bundle depends on.
+
+    Mirrors the lookups in load_workspace_md / load_domain_md / load_project_configs.
+    """
+    dirs: list[Path] = []
+    current = skill_path.parent
+    levels_walked = 0
+    while current != current.parent and levels_walked < 5:
+        dirs.append(current)
+        current = current.parent
+        levels_walked += 1
+
+    files = [skill_path]
+    for d in dirs:
+        for name in ("WORKSPACE.md", "DOMAIN.md"):
+            candidate = d / name
+            if candidate.exists():
+                files.append(candidate)
+
+    project_configs_dir = skill_path.parent.parent / "project-configs"
+    if project_configs_dir.is_dir():
+        dirs.append(project_configs_dir)
+        files.extend(sorted(project_configs_dir.glob("*.md")))
+
+    return files + dirs, dirs
+
+
+def _stat_fingerprint(path: Path) -> tuple[str, int, int]:
+    resolved = path.resolve()
+    try:
+        st = resolved.stat()
+        return (str(resolved), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (str(resolved), -1, -1)
+
+
+def _fingerprint_matches(fingerprint: tuple[tuple[str, int, int], ...]) -> bool:
+    # Paths are already resolved — plain os.stat keeps the hot path to one syscall per source
+    for src, mtime, size in fingerprint:
+        try:
+            st = os.stat(src)
+        except OSError:
+            if mtime != -1:
+                return False
+            continue
+        if (st.st_mtime_ns, st.st_size) != (mtime, size):
+            return False
+    return True
+
+
 def _parse_metadata(data: dict) -> SkillMetadata:
     """Parse metadata dict, tolerating missing optional fields."""
     return SkillMetadata(
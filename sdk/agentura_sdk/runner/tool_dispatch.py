@@ -0,0 +1,102 @@
+"""Concurrent dispatch of the tool calls returned in one LLM turn.
+
+Calls are split into ordered batches. Consecutive independent calls share a batch
+and run concurrently, at most `max_concurrency` at a time. A sequential-only call
+(approval-gated, sandbox-mutating, task_complete, or listed in the skill's
+sandbox.sequential_tools) runs in a batch of its own, and a call that conflicts with
+one already in the batch — e.g. write_file to the same path — starts a new batch.
+run_concurrently returns results in the model's call order; iter_concurrently yields
+each result as soon as its call finishes, for streaming.
+
+A multi-lookup turn (several MCP reads) therefore takes as long as its slowest call
+instead of the sum. tool_concurrency: 1 restores strictly sequential execution.
+
+Usage:
+    batches = plan_batches(calls, is_sequential=lambda c: c[1] in sequential, conflict_key=_conflict_key)
+    for batch in batches:
+        outputs = await run_concurrently([calls[i] for i in batch], run_one, max_concurrency=4)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def plan_batches(
+    calls: Sequence[T],
+    *,
+    is_sequential: Callable[[T], bool],
+    conflict_key: Callable[[T], Hashable | None] = lambda _: None,
+) -> list[list[int]]:
+    """Group call indices into ordered batches that are safe to run concurrently."""
+    batches: list[list[int]] = []
+    current: list[int] = []
+    keys: set[Hashable] = set()
+    for i, call in enumerate(calls):
+        if is_sequential(call):
+            if current:
+                batches.append(current)
+            batches.append([i])
+            current, keys = [], set()
+            continue
+        key = conflict_key(call)
+        if key is not None and key in keys:
+            batches.append(current)
+            current, keys = [], set()
+        current.append(i)
+        if key is not None:
+            keys.add(key)
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def iter_concurrently(
+    calls: Sequence[T],
+    run: Callable[[T], Awaitable[R]],
+    *,
+    max_concurrency: int,
+) -> AsyncIterator[tuple[int, R]]:
+    """Run `run(call)` for every call, at most `max_concurrency` at once; yield (index, result) as each finishes.
+
+    Every call finishes before an exception from any of them is re-raised.
+    """
+    if len(calls) == 1 or max_concurrency <= 1:
+        for i, call in enumerate(calls):
+            yield i, await run(call)
+        return
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def _one(i: int, call: T) -> tuple[int, R]:
+        async with slots:
+            return i, await run(call)
+
+    error: BaseException | None = None
+    for finished in asyncio.as_completed([_one(i, call) for i, call in enumerate(calls)]):
+        try:
+            yield await finished
+        except Exception as exc:
+            error = error or exc
+    if error is not None:
+        raise error
+
+
+async def run_concurrently(
+    calls: Sequence[T],
+    run: Callable[[T], Awaitable[R]],
+    *,
+    max_concurrency: int,
+) -> list[R]:
+    """Run `run(call)` for every call, at most `max_concurrency` at once; results in call order.
+
+    Every call finishes before an exception from any of them is re-raised.
+    """
+    results: dict[int, R] = {}
+    async for i, result in iter_concurrently(calls, run, max_concurrency=max_concurrency):
+        results[i] = result
+    return [results[i] for i in range(len(calls))]
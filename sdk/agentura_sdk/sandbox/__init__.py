@@ -5,6 +5,9 @@ Selects sandbox implementation via SANDBOX_BACKEND env var:
 
 When SANDBOX_BACKEND=k8s, SANDBOX_IPC_MODE selects the communication method:
   http (default) | file
+
+Every backend exposes the same async interface:
+  create, run_code, run_command, write_file, read_file, close
 """
 
 from __future__ import annotations
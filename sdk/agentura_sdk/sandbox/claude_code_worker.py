@@ -18,8 +18,8 @@ from agentura_sdk.sandbox.k8s_sandbox import (
     POD_READY_TIMEOUT,
     _load_k8s_config,
     _require_sdk,
-    _wait_for_ready,
 )
+from agentura_sdk.sandbox.pod_informer import wait_for_pod_ready
 from agentura_sdk.types import SandboxConfig
 
 try:
@@ -81,13 +81,12 @@ def _build_worker_manifest(
     )
 
 
-def _create_and_wait(pod_name: str, env_vars: dict[str, str] | None) -> str:
+def _create_pod(pod_name: str, env_vars: dict[str, str] | None) -> None:
     """Blocking helper — runs in thread to avoid freezing the event loop."""
     api = client.CoreV1Api()
     manifest = _build_worker_manifest(pod_name, env_vars)
     api.create_namespaced_pod(namespace=NAMESPACE, body=manifest)
     logger.info("Created worker pod %s", pod_name)
-    return _wait_for_ready(api, pod_name, NAMESPACE)
 
 
 async def create(
@@ -99,7 +98,12 @@ async def create(
     _load_k8s_config()
 
     pod_name = f"cc-worker-{int(time.time() * 1000) % 10_000_000:07d}"
-    pod_ip = await asyncio.to_thread(_create_and_wait, pod_name, env_vars)
+    await asyncio.to_thread(_create_pod, pod_name, env_vars)
+    try:
+        pod_ip = await wait_for_pod_ready(pod_name, NAMESPACE, timeout=POD_READY_TIMEOUT)
+    except Exception:
+        await asyncio.to_thread(close, K8sSandbox(pod_name=pod_name, pod_ip="", namespace=NAMESPACE))
+        raise
     logger.info("Worker pod %s ready at %s", pod_name, pod_ip)
     return K8sSandbox(pod_name=pod_name, pod_ip=pod_ip, namespace=NAMESPACE)
 
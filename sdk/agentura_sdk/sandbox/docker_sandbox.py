@@ -1,19 +1,34 @@
 """Docker sandbox — local dev fallback using Docker containers.
 
-Same 6-function sandbox interface:
+Same 6-function async sandbox interface:
   create, run_code, run_command, write_file, read_file, close
+
+Docker SDK calls run in worker threads; sandbox HTTP goes through the shared
+AsyncClient, so tool calls never block the event loop.
+
+With SANDBOX_WARM_POOL_SIZE > 0, create() leases a pre-started container of the
+same (cpu, memory, env) class and close() resets it for the next execution instead
+of removing it: the container is restarted — a fresh runtime process, since /code
+exec()s in-process and leaks builtins, modules and threads otherwise — and every
+writable location is wiped (docker exec as root). Containers are recycled after
+SANDBOX_WARM_POOL_MAX_USES leases or SANDBOX_WARM_POOL_MAX_AGE_S seconds.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
 import subprocess
 import time
+import uuid
 from dataclasses import dataclass
 
 import httpx
 
+from agentura_sdk.http_client import get_async_client
+from agentura_sdk.sandbox.warm_pool import WarmPool
 from agentura_sdk.types import SandboxConfig
 
 try:
@@ -25,6 +40,15 @@ IMAGE = "agentura/sandbox-runtime:latest"
 CONTAINER_PORT = 8080
 READY_TIMEOUT = 30
 
+WARM_POOL_SIZE = int(os.environ.get("SANDBOX_WARM_POOL_SIZE", "0"))
+WARM_POOL_MAX_USES = int(os.environ.get("SANDBOX_WARM_POOL_MAX_USES", "20"))
+WARM_POOL_MAX_AGE_S = float(os.environ.get("SANDBOX_WARM_POOL_MAX_AGE_S", "3600"))
+
+# Run after the restart (no user processes left to recreate files): wipe every
+# writable location of the slim runtime image.
+_WIPE_SCRIPT = "find /home/sandbox /home/user /tmp /var/tmp /dev/shm -mindepth 1 -delete 2>/dev/null; true"
+RESET_STOP_TIMEOUT = 2
+
 
 def _get_docker_client():
     """Create Docker client, resolving socket from Docker context if needed."""
@@ -70,22 +94,23 @@ def _require_sdk() -> None:
         )
 
 
-def _wait_for_healthy(port: int) -> None:
+async def _wait_for_healthy(port: int) -> None:
     """Poll /health until the container is ready."""
+    http = get_async_client()
     deadline = time.monotonic() + READY_TIMEOUT
     while time.monotonic() < deadline:
         try:
-            resp = httpx.get(f"http://localhost:{port}/health", timeout=2)
+            resp = await http.get(f"http://localhost:{port}/health", timeout=2)
             if resp.status_code == 200:
                 return
         except (httpx.ConnectError, httpx.ReadTimeout, httpx.RemoteProtocolError):
             pass
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
     raise TimeoutError(f"Sandbox container not ready on port {port} within {READY_TIMEOUT}s")
 
 
-async def create(cfg: SandboxConfig, env_vars: dict[str, str] | None = None) -> DockerSandbox:
-    """Run a sandbox-runtime container and wait for it to become healthy."""
+def _run_container(cfg: SandboxConfig, env_vars: dict[str, str] | None) -> DockerSandbox:
+    """Blocking helper — runs in thread to avoid freezing the event loop."""
     client = _get_docker_client()
     environment = env_vars or {}
     container = client.containers.run(
@@ -95,18 +120,33 @@ async def create(cfg: SandboxConfig, env_vars: dict[str, str] | None = None) ->
         environment=environment,
         mem_limit=f"{cfg.memory}m",
         nano_cpus=cfg.cpu * 1_000_000_000,
-        name=f"sandbox-{int(time.time() * 1000) % 10_000_000:07d}",
+        name=f"sandbox-{uuid.uuid4().hex[:10]}",
     )
 
     container.reload()
     host_port = int(
         container.attrs["NetworkSettings"]["Ports"][f"{CONTAINER_PORT}/tcp"][0]["HostPort"]
     )
-
-    _wait_for_healthy(host_port)
     return DockerSandbox(container_id=container.id, host_port=host_port)
 
 
+async def create(cfg: SandboxConfig, env_vars: dict[str, str] | None = None) -> DockerSandbox:
+    """Run a sandbox-runtime container and wait for it to become healthy (or lease a warm one)."""
+    if WARM_POOL_SIZE > 0:
+        return await get_container_pool().lease(_register_class(cfg, env_vars))
+    return await _start_container(cfg, env_vars)
+
+
+async def _start_container(cfg: SandboxConfig, env_vars: dict[str, str] | None) -> DockerSandbox:
+    sandbox = await asyncio.to_thread(_run_container, cfg, env_vars)
+    try:
+        await _wait_for_healthy(sandbox.host_port)
+    except Exception:
+        await close_container(sandbox)
+        raise
+    return sandbox
+
+
 def _url(sandbox: DockerSandbox, path: str) -> str:
     return f"http://localhost:{sandbox.host_port}{path}"
 
@@ -119,8 +159,8 @@ def _safe_json(resp: httpx.Response) -> dict:
         return {"error": f"[sandbox HTTP {resp.status_code}] {resp.text[:500]}"}
 
 
-def run_code(sandbox: DockerSandbox, code: str) -> str:
-    resp = httpx.post(_url(sandbox, "/code"), json={"code": code}, timeout=120)
+async def run_code(sandbox: DockerSandbox, code: str) -> str:
+    resp = await get_async_client().post(_url(sandbox, "/code"), json={"code": code}, timeout=120)
     data = _safe_json(resp)
     parts = []
     if data.get("output"):
@@ -130,8 +170,8 @@ def run_code(sandbox: DockerSandbox, code: str) -> str:
     return "\n".join(parts) or "(no output)"
 
 
-def run_command(sandbox: DockerSandbox, cmd: str) -> str:
-    resp = httpx.post(_url(sandbox, "/execute"), json={"command": cmd}, timeout=120)
+async def run_command(sandbox: DockerSandbox, cmd: str) -> str:
+    resp = await get_async_client().post(_url(sandbox, "/execute"), json={"command": cmd}, timeout=120)
     data = _safe_json(resp)
     parts = []
     if data.get("stdout"):
@@ -143,23 +183,133 @@ def run_command(sandbox: DockerSandbox, cmd: str) -> str:
     return "\n".join(parts) or "(no output)"
 
 
-def write_file(sandbox: DockerSandbox, path: str, content: str) -> str:
-    resp = httpx.post(_url(sandbox, "/files"), json={"path": path, "content": content}, timeout=30)
+async def write_file(sandbox: DockerSandbox, path: str, content: str) -> str:
+    resp = await get_async_client().post(_url(sandbox, "/files"), json={"path": path, "content": content}, timeout=30)
     data = _safe_json(resp)
     return data.get("message", data.get("error", "written"))
 
 
-def read_file(sandbox: DockerSandbox, path: str) -> str:
-    resp = httpx.get(_url(sandbox, "/files"), params={"path": path}, timeout=30)
+async def read_file(sandbox: DockerSandbox, path: str) -> str:
+    resp = await get_async_client().get(_url(sandbox, "/files"), params={"path": path}, timeout=30)
     data = _safe_json(resp)
     return data.get("content", data.get("error", ""))
 
 
-def close(sandbox: DockerSandbox) -> None:
+def _remove_container(container_id: str) -> None:
+    client = _get_docker_client()
+    container = client.containers.get(container_id)
+    container.remove(force=True)
+
+
+async def close(sandbox: DockerSandbox) -> None:
+    """Return the container to the warm pool (reset), or remove it."""
+    if _pool is not None:
+        await _pool.release(sandbox)
+        return
+    await close_container(sandbox)
+
+
+async def close_container(sandbox: DockerSandbox) -> None:
     """Remove the sandbox container."""
     try:
-        client = _get_docker_client()
-        container = client.containers.get(sandbox.container_id)
-        container.remove(force=True)
+        await asyncio.to_thread(_remove_container, sandbox.container_id)
     except Exception:
         pass
+
+
+# ---------------------------------------------------------------------------
+# Warm pool
+# ---------------------------------------------------------------------------
+
+_pool: WarmPool[DockerSandbox] | None = None
+_pool_loop: asyncio.AbstractEventLoop | None = None
+# Pool class key -> (sandbox config, env) the class's containers are started with
+_class_spec: dict[tuple, tuple[SandboxConfig, dict[str, str]]] = {}
+
+
+def _register_class(cfg: SandboxConfig, env_vars: dict[str, str] | None) -> tuple:
+    """Pool class: CPU, memory and a hash of the container env."""
+    env = dict(env_vars or {})
+    env_hash = hashlib.sha256(json.dumps(sorted(env.items())).encode()).hexdigest()[:16]
+    key = (cfg.cpu, cfg.memory, env_hash)
+    _class_spec.setdefault(key, (cfg.model_copy(), env))
+    return key
+
+
+def get_container_pool() -> WarmPool[DockerSandbox]:
+    """Warm container pool for the running event loop."""
+    global _pool, _pool_loop
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool_loop is not loop:
+        _pool = WarmPool(
+            _spawn_pooled,
+            close_container,
+            target_size=WARM_POOL_SIZE,
+            max_age_s=WARM_POOL_MAX_AGE_S,
+            max_uses=WARM_POOL_MAX_USES,
+            check=_is_healthy,
+            reset=_reset,
+            name="docker-sandbox-pool",
+        )
+        _pool_loop = loop
+    return _pool
+
+
+def prewarm(cfg: SandboxConfig | None = None, env_vars: dict[str, str] | None = None) -> None:
+    """Start filling the pool for a resource class (default: SandboxConfig())."""
+    get_container_pool().fill(_register_class(cfg or SandboxConfig(), env_vars))
+
+
+def pool_metrics() -> dict:
+    """Warm pool metrics (empty when pooling is off or unused)."""
+    return _pool.metrics() if _pool is not None else {}
+
+
+async def aclose_container_pool() -> None:
+    """Remove idle warm containers (server shutdown)."""
+    global _pool
+    if _pool is not None and _pool_loop is asyncio.get_running_loop():
+        await _pool.aclose()
+    _pool = None
+
+
+async def _spawn_pooled(key: tuple) -> DockerSandbox:
+    cfg, env = _class_spec[key]
+    return await _start_container(cfg, env)
+
+
+async def _is_healthy(sandbox: DockerSandbox) -> bool:
+    try:
+        resp = await get_async_client().get(_url(sandbox, "/health"), timeout=2)
+        return resp.status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+def _reset_container(container_id: str) -> int | None:
+    """Blocking helper — runs in thread to avoid freezing the event loop.
+
+    Restarts the container and wipes it; returns the (possibly new) host port,
+    or None if the wipe failed.
+    """
+    client = _get_docker_client()
+    container = client.containers.get(container_id)
+    container.restart(timeout=RESET_STOP_TIMEOUT)
+    result = container.exec_run(["sh", "-c", _WIPE_SCRIPT], user="root")
+    if result.exit_code != 0:
+        return None
+    container.reload()
+    return int(container.attrs["NetworkSettings"]["Ports"][f"{CONTAINER_PORT}/tcp"][0]["HostPort"])
+
+
+async def _reset(sandbox: DockerSandbox) -> bool:
+    """Restart and scrub a returned container; only a clean, healthy one goes back to idle."""
+    host_port = await asyncio.to_thread(_reset_container, sandbox.container_id)
+    if host_port is None:
+        return False
+    sandbox.host_port = host_port
+    try:
+        await _wait_for_healthy(host_port)
+    except TimeoutError:
+        return False
+    return True
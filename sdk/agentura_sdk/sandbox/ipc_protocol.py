@@ -4,12 +4,26 @@ Protocol:
 - Agent writes /ipc/requests/{uuid}.json with {"tool": "...", "args": {...}}
 - Sandbox watches /ipc/requests/ and executes tools
 - Sandbox writes /ipc/responses/{uuid}.json with {"result": "...", "error": null}
-- Agent polls /ipc/responses/{uuid}.json with timeout
+- Agent waits for /ipc/responses/{uuid}.json with timeout — woken by inotify on
+  Linux, polling every 100ms where inotify is unavailable
+- Files are written to a temp name and renamed into place, so a reader never sees
+  a half-written request or response
+
+Stream framing (persistent exec channel, `main.py --ipc-stdio`):
+- Each message is "<length>\n<json>" — decimal length of the JSON payload, a newline,
+  then the payload. json.dumps escapes non-ASCII, so characters and bytes line up.
+- Requests and responses are the same JSON objects as the files; responses carry
+  the request id and may arrive out of order. The agent sends {"ready": true} first.
 """
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import json
+import os
+import select
+import struct
 import time
 import uuid
 from dataclasses import dataclass
@@ -23,6 +37,12 @@ RESPONSES_DIR = IPC_ROOT / "responses"
 POLL_INTERVAL = 0.1  # 100ms
 DEFAULT_TIMEOUT = 30.0  # 30s
 
+# inotify(7) event bits
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
 
 @dataclass(frozen=True)
 class IPCRequest:
@@ -46,7 +66,10 @@ class IPCResponse:
 
     @classmethod
     def from_json(cls, data: str) -> IPCResponse:
-        parsed = json.loads(data)
+        return cls.from_dict(json.loads(data))
+
+    @classmethod
+    def from_dict(cls, parsed: dict[str, Any]) -> IPCResponse:
         return cls(
             id=parsed["id"],
             result=parsed.get("result"),
@@ -57,11 +80,91 @@ class IPCResponse:
         return json.dumps({"id": self.id, "result": self.result, "error": self.error})
 
 
+def encode_frame(payload: str) -> str:
+    """Length-prefix one JSON payload for the stream channel."""
+    return f"{len(payload)}\n{payload}"
+
+
+class FrameDecoder:
+    """Incremental decoder for length-prefixed frames read off a stream in chunks."""
+
+    def __init__(self) -> None:
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> list[str]:
+        """Add a chunk; return every payload it completed."""
+        self._buffer += chunk
+        payloads = []
+        while True:
+            header, sep, rest = self._buffer.partition("\n")
+            if not sep:
+                break
+            length = int(header)
+            if len(rest) < length:
+                break
+            payloads.append(rest[:length])
+            self._buffer = rest[length:]
+        return payloads
+
+
+class _Inotify:
+    """Watch one directory for files finished being written (inotify via libc)."""
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+
+    @classmethod
+    def watch(cls, directory: Path) -> _Inotify | None:
+        """None where inotify is unavailable (non-Linux, no instances left) — callers poll."""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            if libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+                os.close(fd)
+                return None
+        except (OSError, AttributeError):
+            return None
+        return cls(fd)
+
+    def read(self, timeout: float) -> list[str] | None:
+        """Names of files completed within `timeout`; None if the kernel dropped events."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            if mask & IN_Q_OVERFLOW:
+                return None
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if name:
+                names.append(os.fsdecode(name))
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(data)
+    tmp.rename(path)
+
+
 def write_request(req: IPCRequest, base: Path = REQUESTS_DIR) -> Path:
     """Write a request JSON file. Returns the file path."""
     base.mkdir(parents=True, exist_ok=True)
     path = base / f"{req.id}.json"
-    path.write_text(req.to_json())
+    _write_atomic(path, req.to_json())
     return path
 
 
@@ -70,15 +173,28 @@ def poll_response(
     base: Path = RESPONSES_DIR,
     timeout: float = DEFAULT_TIMEOUT,
 ) -> IPCResponse:
-    """Poll for a response file, blocking until found or timeout."""
+    """Wait for a response file, blocking until found or timeout.
+
+    Sleeps on inotify events for `base` where available, so the response is picked
+    up as soon as it lands; falls back to polling every POLL_INTERVAL.
+    """
     path = base / f"{request_id}.json"
     deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        if path.exists():
-            data = path.read_text()
-            path.unlink(missing_ok=True)
-            return IPCResponse.from_json(data)
-        time.sleep(POLL_INTERVAL)
+    inotify = _Inotify.watch(base)
+    try:
+        # The watch is in place before the first check, so no write can slip between them
+        while (remaining := deadline - time.monotonic()) > 0:
+            if path.exists():
+                data = path.read_text()
+                path.unlink(missing_ok=True)
+                return IPCResponse.from_json(data)
+            if inotify is None:
+                time.sleep(POLL_INTERVAL)
+            else:
+                inotify.read(remaining)
+    finally:
+        if inotify is not None:
+            inotify.close()
     return IPCResponse(id=request_id, result=None, error=f"IPC timeout after {timeout}s")
 
 
@@ -86,7 +202,7 @@ def write_response(resp: IPCResponse, base: Path = RESPONSES_DIR) -> Path:
     """Write a response JSON file (used by sandbox side)."""
     base.mkdir(parents=True, exist_ok=True)
     path = base / f"{resp.id}.json"
-    path.write_text(resp.to_json())
+    _write_atomic(path, resp.to_json())
     return path
 
 
@@ -1,35 +1,49 @@
-"""K8s sandbox with file-based IPC — uses kubectl exec to write/read files.
+"""K8s sandbox with exec-based IPC — no HTTP round-trips to the sandbox pod.
 
 Same 6-function interface as k8s_sandbox.py but replaces HTTP round-trips
-with file-based IPC via K8s exec API for sandbox tools. MCP tools still
+with IPC over the K8s exec API for sandbox tools. MCP tools still
 use HTTP to their respective servers.
 
-The executor creates the sandbox pod normally, then uses kubectl exec to
-write request files and read response files inside the pod's /ipc/ directory.
+Each sandbox keeps one long-lived exec session running the runtime's stdio agent
+(`main.py --ipc-stdio`). Requests and responses are length-prefixed JSON frames
+multiplexed by request id, so a tool call costs one frame each way instead of
+two execs to write the request, a `cat` exec every 100ms and an `rm`. A single
+reader thread per sandbox demultiplexes responses onto futures the event loop awaits.
+
+Images without the stdio agent fall back to the original file protocol: write
+/ipc/requests/{id}.json via exec and poll /ipc/responses/{id}.json, one worker
+thread per call. Readiness comes from the shared pod informer rather than a
+watch per pod.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 
 from agentura_sdk.sandbox.ipc_protocol import (
     DEFAULT_TIMEOUT,
     POLL_INTERVAL,
+    FrameDecoder,
     IPCRequest,
     IPCResponse,
+    encode_frame,
 )
+from agentura_sdk.sandbox.pod_informer import wait_for_pod_ready
 from agentura_sdk.types import SandboxConfig
 
 try:
-    from kubernetes import client, config, stream, watch
+    from kubernetes import client, config, stream
 except ImportError:
     client = None  # type: ignore[assignment]
     config = None  # type: ignore[assignment]
     stream = None  # type: ignore[assignment]
-    watch = None  # type: ignore[assignment]
 
 NAMESPACE = os.environ.get("SANDBOX_NAMESPACE", "agentura")
 IMAGE = os.environ.get("SANDBOX_IMAGE", "agentura/sandbox-runtime:latest")
@@ -37,12 +51,25 @@ RUNTIME_CLASS = os.environ.get("SANDBOX_RUNTIME_CLASS", "")
 IMAGE_PULL_POLICY = os.environ.get("SANDBOX_IMAGE_PULL_POLICY", "Never")
 POD_READY_TIMEOUT = 120
 
+IPC_AGENT_COMMAND = ["python", "/opt/sandbox-runtime/main.py", "--ipc-stdio"]
+CHANNEL_READY_TIMEOUT = float(os.environ.get("SANDBOX_IPC_CHANNEL_READY_TIMEOUT", "10"))
+# Commands get 120s inside the sandbox, so the channel waits a little longer than that
+CHANNEL_CALL_TIMEOUT = float(os.environ.get("SANDBOX_IPC_TIMEOUT", "130"))
+# A lost channel is reopened up to this many times, waiting backoff × 2^attempt in between
+CHANNEL_REOPEN_ATTEMPTS = max(1, int(os.environ.get("SANDBOX_IPC_CHANNEL_REOPEN_ATTEMPTS", "3")))
+CHANNEL_REOPEN_BACKOFF = float(os.environ.get("SANDBOX_IPC_CHANNEL_REOPEN_BACKOFF", "0.5"))
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class K8sFileSandbox:
     pod_name: str
     namespace: str
     api: object  # CoreV1Api
+    channel: _ExecChannel | None = None
+    file_ipc_only: bool = False  # image has no stdio agent
+    channel_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
 
 
 def _require_sdk() -> None:
@@ -102,23 +129,6 @@ def _build_pod_manifest(name: str, sandbox_cfg: SandboxConfig) -> client.V1Pod:
     )
 
 
-def _wait_for_ready(api: client.CoreV1Api, name: str, namespace: str) -> None:
-    """Watch pod until Ready."""
-    w = watch.Watch()
-    deadline = time.monotonic() + POD_READY_TIMEOUT
-    for event in w.stream(api.list_namespaced_pod, namespace=namespace, field_selector=f"metadata.name={name}"):
-        pod = event["object"]
-        if pod.status.conditions:
-            for cond in pod.status.conditions:
-                if cond.type == "Ready" and cond.status == "True":
-                    w.stop()
-                    return
-        if time.monotonic() > deadline:
-            w.stop()
-            raise TimeoutError(f"Sandbox pod {name} not ready within {POD_READY_TIMEOUT}s")
-    raise TimeoutError(f"Watch stream ended for pod {name}")
-
-
 def _exec_in_pod(sandbox: K8sFileSandbox, command: list[str]) -> str:
     """Execute a command in the sandbox pod and return stdout."""
     resp = stream.stream(
@@ -136,14 +146,13 @@ def _exec_in_pod(sandbox: K8sFileSandbox, command: list[str]) -> str:
 
 
 def _write_file_in_pod(sandbox: K8sFileSandbox, path: str, content: str) -> None:
-    """Write a file inside the sandbox pod via exec."""
-    _exec_in_pod(sandbox, ["sh", "-c", f"mkdir -p $(dirname {path}) && cat > {path}"])
+    """Write a file inside the sandbox pod via exec (renamed into place, so watchers see it whole)."""
     # Use base64 to safely transfer content
     import base64
     encoded = base64.b64encode(content.encode()).decode()
     _exec_in_pod(sandbox, [
         "sh", "-c",
-        f"mkdir -p $(dirname {path}) && echo '{encoded}' | base64 -d > {path}",
+        f"mkdir -p $(dirname {path}) && echo '{encoded}' | base64 -d > {path}.tmp && mv {path}.tmp {path}",
     ])
 
 
@@ -169,59 +178,230 @@ def _send_ipc_request(sandbox: K8sFileSandbox, tool: str, args: dict) -> str:
         if content is not None:
             resp = IPCResponse.from_json(content)
             _exec_in_pod(sandbox, ["rm", "-f", resp_path])
-            if resp.error:
-                return f"[error] {resp.error}"
-            return resp.result or "(no output)"
+            return _format_response(resp)
         time.sleep(POLL_INTERVAL)
     return f"[error] IPC timeout after {DEFAULT_TIMEOUT}s"
 
 
-async def create(cfg: SandboxConfig, env_vars: dict[str, str] | None = None) -> K8sFileSandbox:
-    """Create a sandbox pod with file IPC support."""
-    _require_sdk()
-    _load_k8s_config()
+def _format_response(resp: IPCResponse) -> str:
+    if resp.error:
+        return f"[error] {resp.error}"
+    return resp.result or "(no output)"
+
+
+class _ExecChannel:
+    """One exec session running the stdio agent; multiplexes IPC calls by request id."""
+
+    def __init__(self, ws) -> None:
+        self._ws = ws
+        self._decoder = FrameDecoder()
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self.closed = False
+        self._reader = threading.Thread(target=self._read_loop, name="sandbox-ipc-channel", daemon=True)
+        self._reader.start()
+
+    def wait_ready(self, timeout: float) -> None:
+        if not self._ready.wait(timeout) or self.closed:
+            self.close()
+            raise ConnectionError("sandbox IPC agent did not start")
+
+    def call(self, req: IPCRequest) -> Future:
+        """Send a request frame; the future resolves to its IPCResponse.
+
+        Raises ConnectionError when the channel is already closed (nothing was sent).
+        """
+        future: Future = Future()
+        future.add_done_callback(lambda _: self._pending.pop(req.id, None))
+        with self._lock:
+            if self.closed:
+                raise ConnectionError("sandbox IPC channel closed")
+            self._pending[req.id] = future
+            try:
+                self._ws.write_stdin(encode_frame(req.to_json()))
+            except Exception as exc:
+                self._pending.pop(req.id, None)
+                raise ConnectionError(f"sandbox IPC channel write failed: {exc}") from exc
+        return future
+
+    def close(self) -> None:
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            pending, self._pending = self._pending, {}
+        self._ready.set()
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("sandbox IPC channel closed"))
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+    def _read_loop(self) -> None:
+        try:
+            while not self.closed and self._ws.is_open():
+                self._ws.update(timeout=1)
+                if self._ws.peek_stderr():
+                    logger.debug("sandbox IPC agent: %s", self._ws.read_stderr().rstrip())
+                if self._ws.peek_stdout():
+                    for payload in self._decoder.feed(self._ws.read_stdout()):
+                        self._deliver(json.loads(payload))
+        except Exception as exc:
+            if not self.closed:
+                logger.warning("Sandbox IPC channel failed: %s", exc)
+        finally:
+            self.close()
+
+    def _deliver(self, data: dict) -> None:
+        if data.get("ready"):
+            self._ready.set()
+            return
+        future = self._pending.pop(data.get("id", ""), None)
+        if future is not None and not future.done():
+            future.set_result(IPCResponse.from_dict(data))
+
+
+def _open_channel(sandbox: K8sFileSandbox) -> _ExecChannel:
+    """Blocking helper — runs in thread to avoid freezing the event loop."""
+    ws = stream.stream(
+        sandbox.api.connect_get_namespaced_pod_exec,
+        sandbox.pod_name,
+        sandbox.namespace,
+        command=IPC_AGENT_COMMAND,
+        container="sandbox",
+        stderr=True,
+        stdin=True,
+        stdout=True,
+        tty=False,
+        _preload_content=False,
+    )
+    channel = _ExecChannel(ws)
+    channel.wait_ready(CHANNEL_READY_TIMEOUT)
+    return channel
+
+
+async def _open_initial_channel(sandbox: K8sFileSandbox) -> None:
+    """Open the first exec channel; an image without the stdio agent falls back to file IPC."""
+    async with sandbox.channel_lock:
+        try:
+            sandbox.channel = await asyncio.to_thread(_open_channel, sandbox)
+        except Exception as exc:
+            logger.warning("Sandbox %s: no IPC exec channel (%s) — using file IPC", sandbox.pod_name, exc)
+            sandbox.file_ipc_only = True
 
-    pod_name = f"sandbox-ipc-{int(time.time() * 1000) % 10_000_000:07d}"
-    api = client.CoreV1Api()
 
+async def _get_channel(sandbox: K8sFileSandbox) -> _ExecChannel | None:
+    """The sandbox's open exec channel, reopened with backoff if lost; None means use file IPC.
+
+    Raises ConnectionError when the channel cannot be reopened.
+    """
+    if sandbox.channel is not None and not sandbox.channel.closed:
+        return sandbox.channel
+    if sandbox.file_ipc_only:
+        return None
+    async with sandbox.channel_lock:
+        if sandbox.channel is not None and not sandbox.channel.closed:
+            return sandbox.channel
+        for attempt in range(CHANNEL_REOPEN_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(CHANNEL_REOPEN_BACKOFF * 2 ** (attempt - 1))
+            try:
+                sandbox.channel = await asyncio.to_thread(_open_channel, sandbox)
+                return sandbox.channel
+            except Exception as exc:
+                logger.warning("Sandbox %s: reopening IPC exec channel failed (attempt %d/%d): %s",
+                               sandbox.pod_name, attempt + 1, CHANNEL_REOPEN_ATTEMPTS, exc)
+                error = exc
+        raise ConnectionError(f"sandbox IPC channel unavailable: {error}")
+
+
+async def _call_ipc(sandbox: K8sFileSandbox, tool: str, args: dict) -> str:
+    """Run one sandbox tool over the exec channel, or file IPC if there is none."""
+    req = IPCRequest.create(tool=tool, args=args)
+    for _ in range(2):
+        try:
+            channel = await _get_channel(sandbox)
+        except ConnectionError as exc:
+            return f"[error] {exc}"
+        if channel is None:
+            return await asyncio.to_thread(_send_ipc_request, sandbox, tool, args)
+        try:
+            future = await asyncio.to_thread(channel.call, req)
+            break
+        except ConnectionError:
+            continue  # closed before the request went out — safe to reopen and resend
+    else:
+        return "[error] sandbox IPC channel unavailable"
+    try:
+        resp = await asyncio.wait_for(asyncio.wrap_future(future), CHANNEL_CALL_TIMEOUT)
+    except TimeoutError:
+        return f"[error] IPC timeout after {CHANNEL_CALL_TIMEOUT}s"
+    except ConnectionError as exc:
+        # The request may already have run — report instead of resending it
+        return f"[error] {exc}"
+    return _format_response(resp)
+
+
+def _create_pod(pod_name: str, cfg: SandboxConfig) -> K8sFileSandbox:
+    """Blocking helper — runs in thread to avoid freezing the event loop."""
+    api = client.CoreV1Api()
     manifest = _build_pod_manifest(pod_name, cfg)
     api.create_namespaced_pod(namespace=NAMESPACE, body=manifest)
+    return K8sFileSandbox(pod_name=pod_name, namespace=NAMESPACE, api=api)
 
-    _wait_for_ready(api, pod_name, NAMESPACE)
-
-    sandbox = K8sFileSandbox(pod_name=pod_name, namespace=NAMESPACE, api=api)
 
-    # Initialize IPC directories inside the pod
-    _exec_in_pod(sandbox, ["mkdir", "-p", "/ipc/requests", "/ipc/responses"])
+async def create(cfg: SandboxConfig, env_vars: dict[str, str] | None = None) -> K8sFileSandbox:
+    """Create a sandbox pod with file IPC support."""
+    _require_sdk()
+    _load_k8s_config()
 
+    pod_name = f"sandbox-ipc-{int(time.time() * 1000) % 10_000_000:07d}"
+    sandbox = await asyncio.to_thread(_create_pod, pod_name, cfg)
+    try:
+        await wait_for_pod_ready(pod_name, NAMESPACE, timeout=POD_READY_TIMEOUT)
+        # Initialize IPC directories inside the pod (file IPC fallback)
+        await asyncio.to_thread(_exec_in_pod, sandbox, ["mkdir", "-p", "/ipc/requests", "/ipc/responses"])
+        await _open_initial_channel(sandbox)
+    except Exception:
+        await close(sandbox)
+        raise
     return sandbox
 
 
-def run_code(sandbox: K8sFileSandbox, code: str) -> str:
-    return _send_ipc_request(sandbox, "code", {"code": code})
+async def run_code(sandbox: K8sFileSandbox, code: str) -> str:
+    return await _call_ipc(sandbox, "code", {"code": code})
 
 
-def run_command(sandbox: K8sFileSandbox, cmd: str) -> str:
-    return _send_ipc_request(sandbox, "execute", {"command": cmd})
+async def run_command(sandbox: K8sFileSandbox, cmd: str) -> str:
+    return await _call_ipc(sandbox, "execute", {"command": cmd})
 
 
-def write_file(sandbox: K8sFileSandbox, path: str, content: str) -> str:
-    return _send_ipc_request(sandbox, "files_write", {"path": path, "content": content})
+async def write_file(sandbox: K8sFileSandbox, path: str, content: str) -> str:
+    return await _call_ipc(sandbox, "files_write", {"path": path, "content": content})
 
 
-def read_file(sandbox: K8sFileSandbox, path: str) -> str:
-    return _send_ipc_request(sandbox, "files_read", {"path": path})
+async def read_file(sandbox: K8sFileSandbox, path: str) -> str:
+    return await _call_ipc(sandbox, "files_read", {"path": path})
+
+
+def _delete_pod(sandbox: K8sFileSandbox) -> None:
+    _load_k8s_config()
+    api = client.CoreV1Api()
+    api.delete_namespaced_pod(
+        name=sandbox.pod_name,
+        namespace=sandbox.namespace,
+        grace_period_seconds=0,
+    )
 
 
-def close(sandbox: K8sFileSandbox) -> None:
-    """Delete the sandbox pod."""
+async def close(sandbox: K8sFileSandbox) -> None:
+    """Close the IPC channel and delete the sandbox pod."""
+    if sandbox.channel is not None:
+        sandbox.channel.close()
     try:
-        _load_k8s_config()
-        api = client.CoreV1Api()
-        api.delete_namespaced_pod(
-            name=sandbox.pod_name,
-            namespace=sandbox.namespace,
-            grace_period_seconds=0,
-        )
+        await asyncio.to_thread(_delete_pod, sandbox)
     except Exception:
         pass
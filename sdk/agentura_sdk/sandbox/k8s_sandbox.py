@@ -1,25 +1,31 @@
 """K8s-native sandbox — creates ephemeral pods running sandbox-runtime.
 
-Same 6-function sandbox interface:
+Same 6-function async sandbox interface:
   create, run_code, run_command, write_file, read_file, close
+
+Kubernetes API calls run in worker threads; sandbox HTTP goes through the shared
+AsyncClient, so tool calls never block the event loop. Readiness comes from the
+shared pod informer (pod_informer.py) rather than a watch per pod.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 from dataclasses import dataclass
 
 import httpx
 
+from agentura_sdk.http_client import get_async_client
+from agentura_sdk.sandbox.pod_informer import wait_for_pod_ready
 from agentura_sdk.types import SandboxConfig
 
 try:
-    from kubernetes import client, config, watch
+    from kubernetes import client, config
 except ImportError:
     client = None  # type: ignore[assignment]
     config = None  # type: ignore[assignment]
-    watch = None  # type: ignore[assignment]
 
 NAMESPACE = os.environ.get("SANDBOX_NAMESPACE", "agentura")
 IMAGE = os.environ.get("SANDBOX_IMAGE", "agentura/sandbox-runtime:latest")
@@ -91,21 +97,11 @@ def _build_pod_manifest(name: str, sandbox_cfg: SandboxConfig, env_vars: dict[st
     )
 
 
-def _wait_for_ready(api: client.CoreV1Api, name: str, namespace: str) -> str:
-    """Watch pod until Ready, return pod IP."""
-    w = watch.Watch()
-    deadline = time.monotonic() + POD_READY_TIMEOUT
-    for event in w.stream(api.list_namespaced_pod, namespace=namespace, field_selector=f"metadata.name={name}"):
-        pod = event["object"]
-        if pod.status.pod_ip and pod.status.conditions:
-            for cond in pod.status.conditions:
-                if cond.type == "Ready" and cond.status == "True":
-                    w.stop()
-                    return pod.status.pod_ip
-        if time.monotonic() > deadline:
-            w.stop()
-            raise TimeoutError(f"Sandbox pod {name} not ready within {POD_READY_TIMEOUT}s")
-    raise TimeoutError(f"Watch stream ended for pod {name}")
+def _create_pod(pod_name: str, cfg: SandboxConfig, env_vars: dict[str, str] | None) -> None:
+    """Blocking helper — runs in thread to avoid freezing the event loop."""
+    api = client.CoreV1Api()
+    manifest = _build_pod_manifest(pod_name, cfg, env_vars)
+    api.create_namespaced_pod(namespace=NAMESPACE, body=manifest)
 
 
 async def create(cfg: SandboxConfig, env_vars: dict[str, str] | None = None) -> K8sSandbox:
@@ -114,13 +110,14 @@ async def create(cfg: SandboxConfig, env_vars: dict[str, str] | None = None) ->
     _load_k8s_config()
 
     pod_name = f"sandbox-{int(time.time() * 1000) % 10_000_000:07d}"
-    api = client.CoreV1Api()
-
-    manifest = _build_pod_manifest(pod_name, cfg, env_vars)
-    api.create_namespaced_pod(namespace=NAMESPACE, body=manifest)
-
-    pod_ip = _wait_for_ready(api, pod_name, NAMESPACE)
-    return K8sSandbox(pod_name=pod_name, pod_ip=pod_ip, namespace=NAMESPACE)
+    await asyncio.to_thread(_create_pod, pod_name, cfg, env_vars)
+    sandbox = K8sSandbox(pod_name=pod_name, pod_ip="", namespace=NAMESPACE)
+    try:
+        sandbox.pod_ip = await wait_for_pod_ready(pod_name, NAMESPACE, timeout=POD_READY_TIMEOUT)
+    except Exception:
+        await close(sandbox)
+        raise
+    return sandbox
 
 
 def _url(sandbox: K8sSandbox, path: str) -> str:
@@ -135,8 +132,8 @@ def _safe_json(resp: httpx.Response) -> dict:
         return {"error": f"[sandbox HTTP {resp.status_code}] {resp.text[:500]}"}
 
 
-def run_code(sandbox: K8sSandbox, code: str) -> str:
-    resp = httpx.post(_url(sandbox, "/code"), json={"code": code}, timeout=120)
+async def run_code(sandbox: K8sSandbox, code: str) -> str:
+    resp = await get_async_client().post(_url(sandbox, "/code"), json={"code": code}, timeout=120)
     data = _safe_json(resp)
     parts = []
     if data.get("output"):
@@ -146,8 +143,8 @@ def run_code(sandbox: K8sSandbox, code: str) -> str:
     return "\n".join(parts) or "(no output)"
 
 
-def run_command(sandbox: K8sSandbox, cmd: str) -> str:
-    resp = httpx.post(_url(sandbox, "/execute"), json={"command": cmd}, timeout=120)
+async def run_command(sandbox: K8sSandbox, cmd: str) -> str:
+    resp = await get_async_client().post(_url(sandbox, "/execute"), json={"command": cmd}, timeout=120)
     data = _safe_json(resp)
     parts = []
     if data.get("stdout"):
@@ -159,27 +156,31 @@ def run_command(sandbox: K8sSandbox, cmd: str) -> str:
     return "\n".join(parts) or "(no output)"
 
 
-def write_file(sandbox: K8sSandbox, path: str, content: str) -> str:
-    resp = httpx.post(_url(sandbox, "/files"), json={"path": path, "content": content}, timeout=30)
+async def write_file(sandbox: K8sSandbox, path: str, content: str) -> str:
+    resp = await get_async_client().post(_url(sandbox, "/files"), json={"path": path, "content": content}, timeout=30)
     data = _safe_json(resp)
     return data.get("message", data.get("error", "written"))
 
 
-def read_file(sandbox: K8sSandbox, path: str) -> str:
-    resp = httpx.get(_url(sandbox, "/files"), params={"path": path}, timeout=30)
+async def read_file(sandbox: K8sSandbox, path: str) -> str:
+    resp = await get_async_client().get(_url(sandbox, "/files"), params={"path": path}, timeout=30)
     data = _safe_json(resp)
     return data.get("content", data.get("error", ""))
 
 
-def close(sandbox: K8sSandbox) -> None:
+def _delete_pod(sandbox: K8sSandbox) -> None:
+    _load_k8s_config()
+    api = client.CoreV1Api()
+    api.delete_namespaced_pod(
+        name=sandbox.pod_name,
+        namespace=sandbox.namespace,
+        grace_period_seconds=0,
+    )
+
+
+async def close(sandbox: K8sSandbox) -> None:
     """Delete the sandbox pod."""
     try:
-        _load_k8s_config()
-        api = client.CoreV1Api()
-        api.delete_namespaced_pod(
-            name=sandbox.pod_name,
-            namespace=sandbox.namespace,
-            grace_period_seconds=0,
-        )
+        await asyncio.to_thread(_delete_pod, sandbox)
     except Exception:
         pass
@@ -0,0 +1,201 @@
+"""Shared pod informer — one watch for every pod the executor is waiting on.
+
+Each sandbox/worker create used to block a thread on its own watch stream until
+the pod turned Ready: fifty concurrent fleet agents meant fifty blocked threads and
+fifty API connections. A single informer per namespace now lists and watches pods
+labelled managed-by=agentura-executor on one background thread, caches their
+readiness, and resolves the asyncio futures of everyone waiting on them.
+
+Waits fail fast instead of running into the timeout when a container can never
+start (ErrImagePull, ImagePullBackOff, InvalidImageName, CreateContainerConfigError),
+when the pod terminates, or when it is deleted. The watch resumes from the last seen
+resourceVersion and relists (with backoff) after errors.
+
+Usage:
+    await asyncio.to_thread(api.create_namespaced_pod, namespace=NAMESPACE, body=manifest)
+    pod_ip = await wait_for_pod_ready(pod_name, NAMESPACE, timeout=POD_READY_TIMEOUT)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+try:
+    from kubernetes import client, watch
+except ImportError:
+    client = None  # type: ignore[assignment]
+    watch = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+LABEL_SELECTOR = "managed-by=agentura-executor"
+WATCH_TIMEOUT_S = int(os.environ.get("POD_INFORMER_WATCH_TIMEOUT_S", "300"))
+
+_FATAL_WAITING_REASONS = frozenset({
+    "ErrImagePull",
+    "ImagePullBackOff",
+    "InvalidImageName",
+    "CreateContainerConfigError",
+})
+
+
+class PodStartError(RuntimeError):
+    """The pod can never become ready (image pull failure, terminated, deleted)."""
+
+
+@dataclass
+class _PodState:
+    ip: str = ""
+    ready: bool = False
+    error: str = ""
+
+
+def _pod_state(pod) -> _PodState:
+    status = pod.status
+    ready = any(c.type == "Ready" and c.status == "True" for c in status.conditions or [])
+    error = ""
+    for container in status.container_statuses or []:
+        waiting = container.state.waiting if container.state else None
+        if waiting is not None and waiting.reason in _FATAL_WAITING_REASONS:
+            error = f"{waiting.reason}: {waiting.message or ''}".rstrip(": ")
+    if not error and status.phase in ("Failed", "Succeeded"):
+        error = f"pod {status.phase.lower()}" + (f": {status.reason}" if status.reason else "")
+    return _PodState(ip=status.pod_ip or "", ready=ready and bool(status.pod_ip), error=error)
+
+
+class PodInformer:
+    """List+watch of managed pods in one namespace, shared by every waiter in the process."""
+
+    def __init__(self, api, namespace: str, watch_factory=None) -> None:
+        self.namespace = namespace
+        self._api = api
+        self._watch_factory = watch_factory or watch.Watch
+        self._lock = threading.Lock()
+        self._states: dict[str, _PodState] = {}
+        self._waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._thread: threading.Thread | None = None
+        self._watch = None
+        self._stopped = False
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"pod-informer-{self.namespace}", daemon=True,
+                )
+                self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped = True
+        if self._watch is not None:
+            self._watch.stop()
+
+    async def wait_ready(self, name: str, timeout: float) -> str:
+        """Pod IP once `name` is Ready; PodStartError if it never can be."""
+        self.start()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        waiter = (loop, future)
+        with self._lock:
+            state = self._states.get(name)
+            if state is not None and (state.ready or state.error):
+                _resolve(future, name, state)
+            else:
+                self._waiters.setdefault(name, []).append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            raise TimeoutError(f"Pod {name} not ready within {timeout}s") from None
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(name, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._waiters.pop(name, None)
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._stopped:
+            try:
+                pods = self._api.list_namespaced_pod(namespace=self.namespace, label_selector=LABEL_SELECTOR)
+                for pod in pods.items:
+                    self._apply("ADDED", pod)
+                resource_version = pods.metadata.resource_version
+                while not self._stopped:
+                    self._watch = self._watch_factory()
+                    for event in self._watch.stream(
+                        self._api.list_namespaced_pod,
+                        namespace=self.namespace,
+                        label_selector=LABEL_SELECTOR,
+                        resource_version=resource_version,
+                        timeout_seconds=WATCH_TIMEOUT_S,
+                    ):
+                        if event["type"] == "ERROR":
+                            raise RuntimeError(f"watch error: {event.get('raw_object')}")
+                        self._apply(event["type"], event["object"])
+                        resource_version = getattr(event["object"].metadata, "resource_version", None) or resource_version
+                        backoff = 1.0
+            except Exception as exc:
+                if self._stopped:
+                    return
+                logger.warning("Pod informer for %s failed (%s) — relisting in %.0fs", self.namespace, exc, backoff)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _apply(self, event_type: str, pod) -> None:
+        name = pod.metadata.name
+        if event_type == "DELETED":
+            state = _PodState(error="pod deleted")
+        else:
+            state = _pod_state(pod)
+        with self._lock:
+            if event_type == "DELETED":
+                self._states.pop(name, None)
+            else:
+                self._states[name] = state
+            waiters = self._waiters.pop(name, []) if state.ready or state.error else []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future, name, state)
+            except RuntimeError:
+                pass  # waiter's loop already closed
+
+
+def _resolve(future: asyncio.Future, name: str, state: _PodState) -> None:
+    if future.done():
+        return
+    if state.ready:
+        future.set_result(state.ip)
+    else:
+        future.set_exception(PodStartError(f"Pod {name} failed to start: {state.error}"))
+
+
+_informers: dict[str, PodInformer] = {}
+_informers_lock = threading.Lock()
+
+
+def get_informer(namespace: str) -> PodInformer:
+    """The process-wide informer for `namespace` (Kubernetes config must be loaded)."""
+    with _informers_lock:
+        informer = _informers.get(namespace)
+        if informer is None:
+            informer = _informers[namespace] = PodInformer(client.CoreV1Api(), namespace)
+        return informer
+
+
+async def wait_for_pod_ready(name: str, namespace: str, timeout: float) -> str:
+    """Wait (without a thread or connection of its own) for a managed pod to be Ready; returns its IP."""
+    return await get_informer(namespace).wait_ready(name, timeout)
+
+
+def stop_informers() -> None:
+    with _informers_lock:
+        for informer in _informers.values():
+            informer.stop()
+        _informers.clear()
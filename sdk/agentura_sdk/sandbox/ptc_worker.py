@@ -2,14 +2,33 @@
 
 Same pattern as claude_code_worker.py but uses the ptc-worker image
 with lower resource limits (512Mi RAM, 1 CPU) — no Node.js, no sandbox.
+
+With PTC_WARM_POOL_SIZE > 0, create() leases an idle, ready pod from a warm pool
+(per image/resources/env class) and close() hands it back, skipping pod start and
+the readiness probe delay. Pods are recycled after PTC_WARM_POOL_MAX_AGE_S or
+PTC_WARM_POOL_MAX_USES executions, and failed executions never return their pod.
+The pool's housekeeping reaps leaked pods: untracked ptc-worker pods that this
+executor started. Pods of other executor replicas and other workloads are never touched.
+The worker resets its per-request state, so a reused pod starts clean.
+
+Usage:
+    worker = await create(cfg, env_vars)
+    try:
+        ...
+    finally:
+        await close(worker, reusable=ok)
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
+import socket
 import time
+import uuid
 
 from agentura_sdk.sandbox.k8s_sandbox import (
     IMAGE_PULL_POLICY,
@@ -18,8 +37,9 @@ from agentura_sdk.sandbox.k8s_sandbox import (
     POD_READY_TIMEOUT,
     _load_k8s_config,
     _require_sdk,
-    _wait_for_ready,
 )
+from agentura_sdk.sandbox.pod_informer import wait_for_pod_ready
+from agentura_sdk.sandbox.warm_pool import WarmPool
 from agentura_sdk.types import SandboxConfig
 
 try:
@@ -33,6 +53,14 @@ WORKER_IMAGE = os.environ.get("PTC_WORKER_IMAGE", "agentura/ptc-worker:latest")
 WORKER_CPU = os.environ.get("PTC_WORKER_CPU", "1")
 WORKER_MEMORY = os.environ.get("PTC_WORKER_MEMORY", "512Mi")
 
+WARM_POOL_SIZE = int(os.environ.get("PTC_WARM_POOL_SIZE", "0"))
+WARM_POOL_MAX_AGE_S = float(os.environ.get("PTC_WARM_POOL_MAX_AGE_S", "1800"))
+WARM_POOL_MAX_USES = int(os.environ.get("PTC_WARM_POOL_MAX_USES", "50"))
+WARM_POOL_INTERVAL_S = float(os.environ.get("PTC_WARM_POOL_INTERVAL_S", "30"))
+
+OWNER_LABEL = "agentura.io/owner"
+POOL_OWNER = (os.environ.get("HOSTNAME", "") or socket.gethostname())[:63]
+
 
 def _build_worker_manifest(
     name: str,
@@ -105,39 +133,189 @@ def _build_worker_manifest(
     )
 
 
-def _create_and_wait(pod_name: str, env_vars: dict[str, str] | None) -> str:
-    """Blocking helper — runs in thread to avoid freezing the event loop."""
-    api = client.CoreV1Api()
-    manifest = _build_worker_manifest(pod_name, env_vars)
-    api.create_namespaced_pod(namespace=NAMESPACE, body=manifest)
-    logger.info("Created PTC worker pod %s", pod_name)
-    return _wait_for_ready(api, pod_name, NAMESPACE)
-
-
 async def create(
     cfg: SandboxConfig,
     env_vars: dict[str, str] | None = None,
 ) -> K8sSandbox:
-    """Create a PTC worker pod and wait for ready."""
-    _require_sdk()
-    _load_k8s_config()
+    """Create a PTC worker pod and wait for ready (or lease a warm one)."""
+    if WARM_POOL_SIZE > 0:
+        return await get_worker_pool().lease(_register_class(env_vars))
 
+    api = _PodApi()
     pod_name = f"ptc-worker-{int(time.time() * 1000) % 10_000_000:07d}"
-    pod_ip = await asyncio.to_thread(_create_and_wait, pod_name, env_vars)
-    logger.info("PTC worker pod %s ready at %s", pod_name, pod_ip)
+    pod_ip = await _start_pod(api, pod_name, env_vars, {})
     return K8sSandbox(pod_name=pod_name, pod_ip=pod_ip, namespace=NAMESPACE)
 
 
-def close(sandbox: K8sSandbox) -> None:
-    """Delete the PTC worker pod."""
+async def close(sandbox: K8sSandbox, reusable: bool = True) -> None:
+    """Return the worker to the warm pool, or delete the PTC worker pod."""
+    if _pool is not None:
+        await _pool.release(sandbox, reusable=reusable)
+        return
     try:
-        _load_k8s_config()
-        api = client.CoreV1Api()
-        api.delete_namespaced_pod(
-            name=sandbox.pod_name,
-            namespace=sandbox.namespace,
-            grace_period_seconds=0,
-        )
+        await asyncio.to_thread(_PodApi().delete, sandbox.pod_name)
         logger.info("Deleted PTC worker pod %s", sandbox.pod_name)
     except Exception as exc:
         logger.warning("Failed to delete PTC worker pod %s: %s", sandbox.pod_name, exc)
+
+
+# ---------------------------------------------------------------------------
+# Warm pool
+# ---------------------------------------------------------------------------
+
+class _PodApi:
+    """Kubernetes calls for worker pods — blocking ones run in threads, readiness via the informer."""
+
+    def __init__(self) -> None:
+        _require_sdk()
+        _load_k8s_config()
+        self._api = client.CoreV1Api()
+
+    def create(self, name: str, env_vars: dict[str, str] | None, labels: dict[str, str]) -> None:
+        manifest = _build_worker_manifest(name, env_vars)
+        manifest.metadata.labels.update(labels)
+        self._api.create_namespaced_pod(namespace=NAMESPACE, body=manifest)
+        logger.info("Created PTC worker pod %s", name)
+
+    async def wait_ready(self, name: str) -> str:
+        return await wait_for_pod_ready(name, NAMESPACE, timeout=POD_READY_TIMEOUT)
+
+    def delete(self, name: str) -> None:
+        self._api.delete_namespaced_pod(name=name, namespace=NAMESPACE, grace_period_seconds=0)
+
+    def list(self) -> list[dict]:
+        pods = self._api.list_namespaced_pod(
+            namespace=NAMESPACE, label_selector="managed-by=agentura-executor",
+        )
+        return [
+            {
+                "name": pod.metadata.name,
+                "labels": pod.metadata.labels or {},
+                "created_at": pod.metadata.creation_timestamp.timestamp(),
+            }
+            for pod in pods.items
+        ]
+
+
+_pool: WarmPool[K8sSandbox] | None = None
+_pool_loop: asyncio.AbstractEventLoop | None = None
+# Pool class key -> worker env (the key only carries a hash of it)
+_class_env: dict[tuple[str, ...], dict[str, str]] = {}
+
+
+def _register_class(env_vars: dict[str, str] | None) -> tuple[str, ...]:
+    """Pool class for this worker spec: image, resources and a hash of the env."""
+    env = dict(env_vars or {})
+    env_hash = hashlib.sha256(json.dumps(sorted(env.items())).encode()).hexdigest()[:16]
+    key = (WORKER_IMAGE, WORKER_CPU, WORKER_MEMORY, env_hash)
+    _class_env.setdefault(key, env)
+    return key
+
+
+def get_worker_pool(api: _PodApi | None = None) -> WarmPool[K8sSandbox]:
+    """Warm worker pool for the running event loop (`api` is injectable for tests)."""
+    global _pool, _pool_loop
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool_loop is not loop:
+        _pool = _build_pool(api or _PodApi())
+        _pool_loop = loop
+    return _pool
+
+
+def prewarm(env_vars: dict[str, str] | None = None) -> None:
+    """Start filling the pool for the default worker class (server startup)."""
+    get_worker_pool().fill(_register_class(env_vars))
+
+
+def pool_metrics() -> dict:
+    """Warm pool metrics (empty when pooling is off or unused)."""
+    return _pool.metrics() if _pool is not None else {}
+
+
+async def aclose_worker_pool() -> None:
+    """Delete idle warm workers (server shutdown)."""
+    global _pool
+    if _pool is not None and _pool_loop is asyncio.get_running_loop():
+        await _pool.aclose()
+    _pool = None
+
+
+def _build_pool(api: _PodApi) -> WarmPool[K8sSandbox]:
+    async def spawn(key: tuple[str, ...]) -> K8sSandbox:
+        pod_name = f"ptc-worker-{uuid.uuid4().hex[:10]}"
+        pod_ip = await _start_pod(api, pod_name, _class_env.get(key), {OWNER_LABEL: POOL_OWNER})
+        return K8sSandbox(pod_name=pod_name, pod_ip=pod_ip, namespace=NAMESPACE)
+
+    async def destroy(sandbox: K8sSandbox) -> None:
+        await asyncio.to_thread(api.delete, sandbox.pod_name)
+        logger.info("Deleted PTC worker pod %s", sandbox.pod_name)
+
+    async def reap() -> None:
+        await _reap_leaked_pods(api, {s.pod_name for s in pool.handles()})
+
+    pool: WarmPool[K8sSandbox] = WarmPool(
+        spawn,
+        destroy,
+        target_size=WARM_POOL_SIZE,
+        max_age_s=WARM_POOL_MAX_AGE_S,
+        max_uses=WARM_POOL_MAX_USES,
+        check=_worker_healthy,
+        housekeeping=reap,
+        interval_s=WARM_POOL_INTERVAL_S,
+        name="ptc-worker-pool",
+    )
+    return pool
+
+
+async def _start_pod(
+    api: _PodApi, pod_name: str, env_vars: dict[str, str] | None, labels: dict[str, str],
+) -> str:
+    """Create a worker pod and wait (via the shared informer) until it is ready; returns its IP."""
+    await asyncio.to_thread(api.create, pod_name, env_vars, labels)
+    try:
+        pod_ip = await api.wait_ready(pod_name)
+    except Exception:
+        try:
+            await asyncio.to_thread(api.delete, pod_name)
+        except Exception:
+            pass
+        raise
+    logger.info("PTC worker pod %s ready at %s", pod_name, pod_ip)
+    return pod_ip
+
+
+async def _worker_healthy(sandbox: K8sSandbox) -> bool:
+    import httpx
+
+    from agentura_sdk.http_client import get_async_client
+
+    try:
+        resp = await get_async_client().get(f"http://{sandbox.pod_ip}:8081/health", timeout=2)
+        return resp.status_code == 200
+    except (httpx.HTTPError, httpx.InvalidURL):
+        return False
+
+
+async def _reap_leaked_pods(api: _PodApi, tracked: set[str]) -> int:
+    """Delete worker pods this executor started but no longer tracks; returns how many.
+
+    Only ptc-worker pods labelled with this executor as owner are considered. They are
+    leaks (a crash between create and close, or a previous pool instance) once they are
+    older than the readiness timeout.
+    """
+    now = time.time()
+    reaped = 0
+    for pod in await asyncio.to_thread(api.list):
+        if pod["name"] in tracked:
+            continue
+        age = now - pod["created_at"]
+        labels = pod["labels"]
+        own = labels.get(OWNER_LABEL) == POOL_OWNER and labels.get("app") == "ptc-worker"
+        if own and age > POD_READY_TIMEOUT + 60:
+            try:
+                await asyncio.to_thread(api.delete, pod["name"])
+                reaped += 1
+                logger.info("Reaped leaked pod %s (age %.0fs)", pod["name"], age)
+            except Exception as exc:
+                logger.warning("Failed to reap pod %s: %s", pod["name"], exc)
+    return reaped
@@ -0,0 +1,259 @@
+"""Warm pools of pre-started sandboxes — lease a ready one instead of cold-starting.
+
+Each resource class (e.g. image + CPU + memory) keeps up to `target_size` idle,
+ready handles. lease() hands out an idle one (health-checked first) or, when the
+class is empty, starts one inline; either way the class is topped back up in the
+background. release() returns the handle for reuse unless the execution failed, the
+handle reached `max_uses` or `max_age_s`, or the class already holds `max_idle`
+handles (default twice the target) — then it is destroyed. The headroom above target
+lets steady traffic cycle the same handles instead of destroying one per release.
+An optional `reset` hook scrubs a returned handle in the background before it goes
+back to idle (a failed reset destroys it). A maintenance task recycles idle handles
+past max age (only the target is refilled) and runs the backend's own housekeeping
+(e.g. reaping leaked pods). metrics() reports acquisition latency and reuse counters.
+
+target_size 0 degrades to plain create-per-lease / destroy-on-release.
+
+Usage:
+    pool = WarmPool(spawn, destroy, target_size=2, max_age_s=1800, check=is_healthy)
+    handle = await pool.lease(key)
+    try:
+        ...
+    finally:
+        await pool.release(handle, reusable=ok)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry(Generic[T]):
+    handle: T
+    key: Hashable
+    created_at: float
+    uses: int = 0
+
+
+class WarmPool(Generic[T]):
+    """Per-class pool of idle, ready handles for the running event loop."""
+
+    def __init__(
+        self,
+        spawn: Callable[[Hashable], Awaitable[T]],
+        destroy: Callable[[T], Awaitable[None]],
+        *,
+        target_size: int,
+        max_age_s: float,
+        max_uses: int = 0,
+        max_idle: int | None = None,
+        check: Callable[[T], Awaitable[bool]] | None = None,
+        reset: Callable[[T], Awaitable[bool]] | None = None,
+        housekeeping: Callable[[], Awaitable[None]] | None = None,
+        interval_s: float = 30.0,
+        name: str = "warm-pool",
+    ) -> None:
+        self.target_size = target_size
+        self.max_age_s = max_age_s
+        self.max_uses = max_uses
+        self.max_idle = 2 * target_size if max_idle is None else max_idle
+        self.name = name
+        self._spawn = spawn
+        self._destroy = destroy
+        self._check = check
+        self._reset = reset
+        self._housekeeping = housekeeping
+        self._interval_s = interval_s
+        self._idle: dict[Hashable, list[_Entry[T]]] = {}
+        self._leased: dict[int, _Entry[T]] = {}
+        self._spawning: dict[Hashable, int] = {}
+        self._resetting: dict[int, _Entry[T]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._maintenance: asyncio.Task | None = None
+        self._closed = False
+        self._counters = dict.fromkeys(
+            ("leases", "warm_leases", "cold_starts", "spawn_failures", "reused", "recycled", "reset_failures"), 0,
+        )
+        self._lease_s_total = 0.0
+        self._lease_s_max = 0.0
+
+    def handles(self) -> list[T]:
+        """Every handle the pool currently owns (idle and leased)."""
+        idle = [e.handle for entries in self._idle.values() for e in entries]
+        return idle + [e.handle for e in (*self._leased.values(), *self._resetting.values())]
+
+    def idle_count(self, key: Hashable) -> int:
+        return len(self._idle.get(key, []))
+
+    async def lease(self, key: Hashable) -> T:
+        """A ready handle of class `key` — warm if one is idle, cold-started otherwise."""
+        self._start()
+        started = time.monotonic()
+        warm = True
+        while idle := self._idle.get(key):
+            entry = idle.pop()  # most recently returned first
+            if self._worn_out(entry) or (self._check is not None and not await self._check(entry.handle)):
+                self._background(self._discard(entry))
+                continue
+            break
+        else:
+            warm = False
+            self._counters["cold_starts"] += 1
+            entry = _Entry(await self._spawn(key), key, time.monotonic())
+        entry.uses += 1
+        self._leased[id(entry.handle)] = entry
+        self._counters["leases"] += 1
+        self._counters["warm_leases"] += warm
+        elapsed = time.monotonic() - started
+        self._lease_s_total += elapsed
+        self._lease_s_max = max(self._lease_s_max, elapsed)
+        self.fill(key)
+        return entry.handle
+
+    async def release(self, handle: T, *, reusable: bool = True) -> None:
+        """Return a leased handle; it is destroyed instead when it can't be reused."""
+        entry = self._leased.pop(id(handle), None)
+        if entry is None:
+            self._background(self._destroy_quietly(handle))
+            return
+        idle = self._idle.setdefault(entry.key, [])
+        waiting = len(idle) + self._resetting_count(entry.key)
+        if reusable and not self._closed and not self._worn_out(entry) and waiting < self.max_idle:
+            if self._reset is None:
+                self._return_idle(entry)
+            else:
+                self._resetting[id(entry.handle)] = entry
+                self._background(self._reset_and_return(entry))
+            return
+        self._background(self._discard(entry))
+        self.fill(entry.key)
+
+    def fill(self, key: Hashable) -> None:
+        """Start enough handles in the background to bring class `key` up to target."""
+        if self._closed:
+            return
+        self._start()
+        pending = self._spawning.get(key, 0) + self._resetting_count(key)
+        missing = self.target_size - self.idle_count(key) - pending
+        for _ in range(max(0, missing)):
+            self._spawning[key] = self._spawning.get(key, 0) + 1
+            self._background(self._spawn_idle(key))
+
+    async def maintain(self) -> None:
+        """Recycle idle handles past max age, top classes back up, run housekeeping."""
+        for key, idle in list(self._idle.items()):
+            fresh: list[_Entry[T]] = []
+            for entry in idle:
+                if self._worn_out(entry):
+                    self._background(self._discard(entry))
+                else:
+                    fresh.append(entry)
+            self._idle[key] = fresh
+            self.fill(key)
+        if self._housekeeping is not None:
+            await self._housekeeping()
+
+    def metrics(self) -> dict:
+        leases = self._counters["leases"]
+        return {
+            "target": self.target_size,
+            "idle": sum(len(entries) for entries in self._idle.values()),
+            "leased": len(self._leased),
+            "starting": sum(self._spawning.values()),
+            "resetting": len(self._resetting),
+            **{f"{name}_total": value for name, value in self._counters.items()},
+            "warm_hit_ratio": round(self._counters["warm_leases"] / leases, 3) if leases else 0.0,
+            "lease_ms_avg": round(self._lease_s_total * 1000 / leases, 3) if leases else 0.0,
+            "lease_ms_max": round(self._lease_s_max * 1000, 3),
+        }
+
+    async def aclose(self) -> None:
+        """Destroy idle handles and wait for in-flight spawns/destroys (server shutdown)."""
+        self._closed = True
+        if self._maintenance is not None:
+            self._maintenance.cancel()
+        for idle in self._idle.values():
+            for entry in idle:
+                self._background(self._discard(entry))
+        self._idle.clear()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _resetting_count(self, key: Hashable) -> int:
+        return sum(1 for e in self._resetting.values() if e.key == key)
+
+    def _worn_out(self, entry: _Entry[T]) -> bool:
+        if time.monotonic() - entry.created_at > self.max_age_s:
+            return True
+        return bool(self.max_uses) and entry.uses >= self.max_uses
+
+    async def _spawn_idle(self, key: Hashable) -> None:
+        try:
+            handle = await self._spawn(key)
+        except Exception as exc:
+            self._counters["spawn_failures"] += 1
+            logger.warning("%s: failed to pre-start handle for %s: %s", self.name, key, exc)
+            return
+        finally:
+            self._spawning[key] -= 1
+        if self._closed:
+            await self._destroy_quietly(handle)
+            return
+        self._idle.setdefault(key, []).append(_Entry(handle, key, time.monotonic()))
+
+    async def _reset_and_return(self, entry: _Entry[T]) -> None:
+        try:
+            ok = await self._reset(entry.handle)
+        except Exception as exc:
+            logger.warning("%s: reset failed: %s", self.name, exc)
+            ok = False
+        finally:
+            self._resetting.pop(id(entry.handle), None)
+        if ok and not self._closed:
+            self._return_idle(entry)
+            return
+        if not ok:
+            self._counters["reset_failures"] += 1
+        await self._discard(entry)
+        self.fill(entry.key)
+
+    def _return_idle(self, entry: _Entry[T]) -> None:
+        self._counters["reused"] += 1
+        self._idle.setdefault(entry.key, []).append(entry)
+
+    async def _discard(self, entry: _Entry[T]) -> None:
+        self._counters["recycled"] += 1
+        await self._destroy_quietly(entry.handle)
+
+    async def _destroy_quietly(self, handle: T) -> None:
+        try:
+            await self._destroy(handle)
+        except Exception as exc:
+            logger.warning("%s: failed to destroy handle: %s", self.name, exc)
+
+    def _background(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _start(self) -> None:
+        if self._maintenance is None and not self._closed:
+            self._maintenance = asyncio.get_running_loop().create_task(self._maintain_loop())
+
+    async def _maintain_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_s)
+            try:
+                await self.maintain()
+            except Exception as exc:
+                logger.warning("%s: maintenance failed: %s", self.name, exc)
@@ -1,10 +1,11 @@
 """Agentura Skill Executor — FastAPI server wrapping SDK functions."""
 
+import functools
 import json as _json
 import os
 import re
+import threading
 import time
-from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -14,11 +15,13 @@ from dotenv import load_dotenv
 load_dotenv(Path.cwd() / ".env")
 
 import yaml
-from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
-from agentura_sdk.runner.skill_loader import load_skill_md
-from agentura_sdk.types import SandboxConfig, SkillContext, SkillResult, SkillRole, VerifyConfig
+from agentura_sdk.runner.config_loader import invalidate_runtime_configs, load_runtime_config
+from agentura_sdk.runner.skill_loader import invalidate_skill_bundles, load_skill_md
+from agentura_sdk.server.skill_catalog import CatalogDomain, CatalogSkill, SkillCatalog
+from agentura_sdk.types import SandboxConfig, SkillContext, SkillResult, SkillRole
 
 SKILLS_DIR = Path(os.environ.get("SKILLS_DIR", "/skills"))
 KNOWLEDGE_DIR = Path(os.environ.get("AGENTURA_KNOWLEDGE_DIR") or str(".agentura"))
@@ -26,10 +29,16 @@ KNOWLEDGE_DIR = Path(os.environ.get("AGENTURA_KNOWLEDGE_DIR") or str(".agentura"
 # Directories to skip when scanning for skills
 SKIP_DIRS = {"shared", "__pycache__", "node_modules", ".git"}
 
+# Upper bounds for one page of GET /api/v1/executions and GET /api/v1/events
+_MAX_EXECUTIONS_PAGE = 1000
+_MAX_EVENTS_PAGE = 500
+
 # TTL caches to avoid repeated file reads within the same request cycle
 _CACHE_TTL = 5.0  # seconds
 _knowledge_cache: dict[str, tuple[float, dict]] = {}
-_domain_config_cache: dict[str, tuple[float, dict]] = {}
+
+# Parsed skills/domains — built once at startup, refreshed per directory by the skill watcher
+_catalog = SkillCatalog(SKILLS_DIR, SKIP_DIRS)
 
 import logging
 
@@ -240,114 +249,63 @@ def _extract_guardrail_bullets(content: str) -> list[str]:
     return [line.lstrip("- ").strip() for line in section.splitlines() if line.strip().startswith("-")]
 
 
-def _count_guardrails(domain_dir: Path) -> int:
-    """Count GRD-NNN entries in domain-level GUARDRAILS.md."""
-    grd_file = domain_dir / "GUARDRAILS.md"
-    if not grd_file.exists():
-        return 0
-    return len(re.findall(r"##\s+GRD-\d+", grd_file.read_text()))
-
-
-def _count_corrections(skill_dir: Path) -> int:
-    """Count test entries in tests/generated/corrections.yaml."""
-    corr_file = skill_dir / "tests" / "generated" / "corrections.yaml"
-    if not corr_file.exists():
-        return 0
+def _load_skill_stats(skill_path: str | None = None) -> dict[str, dict]:
+    """Per-skill execution stats keyed by skill path, precomputed by the memory store."""
     try:
-        data = yaml.safe_load(corr_file.read_text())
-        return len(data.get("tests", [])) if data else 0
+        from agentura_sdk.memory import get_memory_store
+        store = get_memory_store()
+        if hasattr(store, "get_skill_stats"):
+            return store.get_skill_stats(skill_path)
     except Exception:
-        return 0
-
-
-def _load_domain_config(domain_dir: Path) -> dict[str, Any]:
-    """Load and cache domain agentura.config.yaml data (cached with TTL). Returns empty dict on failure."""
-    key = str(domain_dir)
-    now = time.time()
-    if key in _domain_config_cache:
-        ts, data = _domain_config_cache[key]
-        if now - ts < _CACHE_TTL:
-            return data
+        pass
 
-    # Check all skill subdirs for agentura.config.yaml (it's at skill level)
-    for child in domain_dir.iterdir():
-        cfg_path = child / "agentura.config.yaml"
-        if cfg_path.exists():
-            try:
-                result = yaml.safe_load(cfg_path.read_text()) or {}
-                _domain_config_cache[key] = (now, result)
-                return result
-            except Exception:
-                pass
-    _domain_config_cache[key] = (now, {})
-    return {}
+    # Stores without a stats aggregate: one grouped pass over the knowledge file
+    from agentura_sdk.memory.skill_stats import build_skill_stats
 
+    entries = _load_knowledge_file("episodic_memory.json").get("entries", [])
+    if skill_path:
+        entries = [e for e in entries if e.get("skill") == skill_path]
+    return {skill: stats.to_dict() for skill, stats in build_skill_stats(entries).items()}
 
-def _compute_skill_lifecycle(skill_path: str) -> dict:
-    """Compute deploy_status, health, accept_rate, executions_total from execution history."""
-    exec_data = _load_knowledge_file("episodic_memory.json")
-    entries = [e for e in exec_data.get("entries", []) if e.get("skill") == skill_path]
-    total = len(entries)
-    accepted = sum(1 for e in entries if e.get("outcome") == "accepted")
-    rate = round(accepted / total, 2) if total else 0.0
-
-    # Derive health from recent accept rate
-    if total == 0:
-        health = "unknown"
-    elif rate >= 0.8:
-        health = "healthy"
-    elif rate >= 0.5:
-        health = "degraded"
-    else:
-        health = "failing"
 
+def _compute_skill_lifecycle(skill_path: str, stats: dict[str, dict] | None = None) -> dict:
+    """Health, accept_rate, executions_total for a skill from the precomputed stats."""
+    if stats is None:
+        stats = _load_skill_stats(skill_path)
+    entry = stats.get(skill_path)
+    if not entry:
+        return {"executions_total": 0, "accept_rate": 0.0, "health": "unknown"}
     return {
-        "executions_total": total,
-        "accept_rate": rate,
-        "health": health,
+        "executions_total": entry["executions_total"],
+        "accept_rate": entry["accept_rate"],
+        "health": entry["health"],
     }
 
 
-def _build_skill_info(skill_dir: Path, domain_dir: Path) -> SkillInfo | None:
-    """Build an enriched SkillInfo from skill files."""
-    skill_md_path = skill_dir / "SKILL.md"
-    if not skill_md_path.exists():
-        return None
-    try:
-        loaded = load_skill_md(skill_md_path, include_reflexions=False)
-    except Exception:
+def _build_skill_info(
+    entry: CatalogSkill,
+    domain: CatalogDomain,
+    stats: dict[str, dict] | None = None,
+) -> SkillInfo | None:
+    """Build an enriched SkillInfo from a catalog entry (stats: from _load_skill_stats())."""
+    loaded = entry.loaded
+    if loaded is None:
         return None
 
     body = loaded.raw_content
-    config = _load_domain_config(domain_dir)
+    config = domain.config
     domain_cfg = config.get("domain", {})
-
-    # Skill-level config file (may not exist for single-file skills)
-    skill_cfg_path = skill_dir / "agentura.config.yaml"
-    has_config_file = skill_cfg_path.exists()
-
-    # Load skill-level config once (reused for mcp_tools, deploy_status, display)
-    skill_cfg: dict = {}
-    if has_config_file:
-        try:
-            skill_cfg = yaml.safe_load(skill_cfg_path.read_text()) or {}
-        except Exception:
-            pass
+    skill_cfg = entry.config
 
     # MCP tools: prefer skill config file, fall back to frontmatter
-    if has_config_file:
+    if entry.has_config_file:
         mcp_tools = [t.get("server", "") for t in skill_cfg.get("mcp_tools", [])]
     else:
         mcp_tools = loaded.metadata.mcp_tools
 
     # Lifecycle: derive from execution history + file metadata
     skill_path = f"{loaded.metadata.domain}/{loaded.metadata.name}"
-    lifecycle = _compute_skill_lifecycle(skill_path)
-
-    # Version from file mtime
-    from datetime import datetime, timezone
-    mtime = skill_md_path.stat().st_mtime
-    last_deployed = datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
+    lifecycle = _compute_skill_lifecycle(skill_path, stats)
 
     # Deploy status from config (look for canary/shadow markers)
     deploy_status = "active"
@@ -357,7 +315,7 @@ def _build_skill_info(skill_dir: Path, domain_dir: Path) -> SkillInfo | None:
             break
 
     # Display metadata: prefer skill config file, fall back to frontmatter
-    display = skill_cfg.get("display", {}) if has_config_file else {}
+    display = skill_cfg.get("display", {}) if entry.has_config_file else {}
     if not display and loaded.metadata.display:
         display = loaded.metadata.display
 
@@ -378,12 +336,12 @@ def _build_skill_info(skill_dir: Path, domain_dir: Path) -> SkillInfo | None:
         mcp_tools=mcp_tools,
         domain_description=domain_cfg.get("description", ""),
         domain_owner=domain_cfg.get("owner", ""),
-        guardrails_count=_count_guardrails(domain_dir),
-        corrections_count=_count_corrections(skill_dir),
+        guardrails_count=domain.guardrails_count,
+        corrections_count=entry.corrections_count,
         deploy_status=deploy_status,
         health=lifecycle["health"],
         version="v1",
-        last_deployed=last_deployed,
+        last_deployed=entry.last_deployed,
         executions_total=lifecycle["executions_total"],
         accept_rate=lifecycle["accept_rate"],
         display_title=display_title,
@@ -405,60 +363,37 @@ def healthz():
     return {"status": "ok"}
 
 
+@app.get("/api/v1/metrics/db-pools")
+def db_pool_metrics():
+    """Shared Postgres pool utilization and connection wait times, per database."""
+    try:
+        from agentura_sdk.memory.pg_pool import pool_metrics
+    except ImportError:
+        return {}
+    return pool_metrics()
+
+
+@app.get("/api/v1/metrics/sandbox-pools")
+def sandbox_pool_metrics():
+    """Warm sandbox pool occupancy, hit ratio and acquisition latency, per backend."""
+    from agentura_sdk.sandbox import docker_sandbox, ptc_worker
+    return {"docker": docker_sandbox.pool_metrics(), "ptc-worker": ptc_worker.pool_metrics()}
+
+
 @app.get("/api/v1/triggers")
 def list_triggers():
     """Return all skill trigger definitions for the gateway cron scheduler."""
-    results: list[dict[str, Any]] = []
-    if not SKILLS_DIR.exists():
-        return results
-
-    for domain_dir in sorted(SKILLS_DIR.iterdir()):
-        if not domain_dir.is_dir() or domain_dir.name.startswith("."):
-            continue
-        for skill_dir in sorted(domain_dir.iterdir()):
-            if not skill_dir.is_dir() or skill_dir.name.startswith(".") or skill_dir.name in SKIP_DIRS:
-                continue
-            cfg_path = skill_dir / "agentura.config.yaml"
-            if not cfg_path.exists():
-                continue
-            try:
-                cfg = yaml.safe_load(cfg_path.read_text()) or {}
-            except Exception:
-                continue
-            # Check top-level triggers (per-skill config format)
-            top_triggers = cfg.get("triggers", [])
-            if top_triggers:
-                results.append({
-                    "domain": domain_dir.name,
-                    "skill": skill_dir.name,
-                    "triggers": top_triggers,
-                })
-            # Check nested skills[].triggers (domain config format)
-            for s in cfg.get("skills", []):
-                triggers = s.get("triggers", [])
-                if triggers:
-                    results.append({
-                        "domain": domain_dir.name,
-                        "skill": s.get("name", skill_dir.name),
-                        "triggers": triggers,
-                    })
-    return results
+    return _catalog.triggers()
 
 
 @app.get("/api/v1/skills", response_model=list[SkillInfo])
 def list_skills():
-    """List all available skills by scanning SKILLS_DIR."""
+    """List all available skills from the in-memory catalog."""
+    stats = _load_skill_stats()
     skills: list[SkillInfo] = []
-    if not SKILLS_DIR.exists():
-        return skills
-
-    for domain_dir in sorted(SKILLS_DIR.iterdir()):
-        if not domain_dir.is_dir() or domain_dir.name.startswith("."):
-            continue
-        for skill_dir in sorted(domain_dir.iterdir()):
-            if not skill_dir.is_dir() or skill_dir.name.startswith(".") or skill_dir.name in SKIP_DIRS:
-                continue
-            info = _build_skill_info(skill_dir, domain_dir)
+    for domain in _catalog.domains():
+        for entry in domain.skills.values():
+            info = _build_skill_info(entry, domain, stats)
             if info:
                 skills.append(info)
     return skills
@@ -467,31 +402,25 @@ def list_skills():
 @app.get("/api/v1/skills/{domain}/{skill_name}", response_model=SkillDetail)
 def get_skill(domain: str, skill_name: str):
     """Return full detail for a single skill."""
-    skill_dir = SKILLS_DIR / domain / skill_name
-    domain_dir = SKILLS_DIR / domain
-    skill_md_path = skill_dir / "SKILL.md"
-
-    if not skill_dir.exists() or not skill_md_path.exists():
+    entry = _catalog.get_skill(domain, skill_name)
+    if entry is None and (SKILLS_DIR / domain / skill_name / "SKILL.md").exists():
+        # Created since the last watcher event (or watchdog not installed)
+        _catalog.refresh_skill(domain, skill_name)
+        entry = _catalog.get_skill(domain, skill_name)
+    if entry is None or not (entry.skill_dir / "SKILL.md").exists():
         raise HTTPException(status_code=404, detail=f"Skill not found: {domain}/{skill_name}")
+    if entry.loaded is None:
+        raise HTTPException(status_code=500, detail=f"Failed to load SKILL.md for {domain}/{skill_name}")
 
-    try:
-        loaded = load_skill_md(skill_md_path)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
-
+    catalog_domain = _catalog.get_domain(domain)
+    loaded = entry.loaded
     body = loaded.raw_content
-    config = _load_domain_config(domain_dir)
+    config = catalog_domain.config
     domain_cfg = config.get("domain", {})
     feedback_cfg = config.get("feedback", {})
 
-    # Load skill-level config (reused for mcp_tools, display, deploy_status)
-    skill_config_path = skill_dir / "agentura.config.yaml"
-    skill_cfg: dict = {}
-    if skill_config_path.exists():
-        try:
-            skill_cfg = yaml.safe_load(skill_config_path.read_text()) or {}
-        except Exception:
-            pass
+    # Skill-level config (reused for mcp_tools, display, deploy_status)
+    skill_cfg = entry.config
 
     # MCP tools from skill-level config
     mcp_tools = [t.get("server", "") for t in skill_cfg.get("mcp_tools", [])]
@@ -506,9 +435,6 @@ def get_skill(domain: str, skill_name: str):
     # Lifecycle
     skill_path = f"{domain}/{skill_name}"
     lifecycle = _compute_skill_lifecycle(skill_path)
-    from datetime import datetime, timezone
-    mtime = skill_md_path.stat().st_mtime
-    last_deployed = datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
 
     deploy_status = "active"
     for s in config.get("skills", []):
@@ -534,12 +460,12 @@ def get_skill(domain: str, skill_name: str):
         mcp_tools=mcp_tools,
         domain_description=domain_cfg.get("description", ""),
         domain_owner=domain_cfg.get("owner", ""),
-        guardrails_count=_count_guardrails(domain_dir),
-        corrections_count=_count_corrections(skill_dir),
+        guardrails_count=catalog_domain.guardrails_count,
+        corrections_count=entry.corrections_count,
         deploy_status=deploy_status,
         health=lifecycle["health"],
         version="v1",
-        last_deployed=last_deployed,
+        last_deployed=entry.last_deployed,
         executions_total=lifecycle["executions_total"],
         accept_rate=lifecycle["accept_rate"],
         display_title=display_title,
@@ -558,38 +484,8 @@ def get_skill(domain: str, skill_name: str):
     )
 
 
-def _load_project_configs(domain_path: Path) -> str:
-    """Load project config files from {domain}/project-configs/ and return as a prompt section.
-
-    Config files are .md files that contain workspace IDs, ClickUp list mappings,
-    assignee IDs, Slack channels, etc. These are injected into the system prompt so
-    PTC workers (which have no filesystem access) can use them.
-    """
-    configs_dir = domain_path / "project-configs"
-    if not configs_dir.is_dir():
-        return ""
-
-    parts: list[str] = []
-    # Load workspace config first (prefixed with _)
-    workspace_file = configs_dir / "_workspace.md"
-    if workspace_file.exists():
-        parts.append(workspace_file.read_text().strip())
-
-    # Load individual project configs
-    for cfg_file in sorted(configs_dir.glob("*.md")):
-        if cfg_file.name.startswith("_"):
-            continue
-        parts.append(cfg_file.read_text().strip())
-
-    if not parts:
-        return ""
-
-    header = "## Project Configurations\n\nUse these configs for workspace IDs, list IDs, assignee mappings, and channel references. Do NOT ask the user for IDs that are listed here.\n"
-    return header + "\n\n---\n\n".join(parts)
-
-
-def _build_mcp_bindings(skill_cfg_raw: dict, user_id: str | None = None) -> list[dict]:
-    """Build MCP server bindings from skill config.
+def _build_mcp_bindings(mcp_refs: list[dict], user_id: str | None = None) -> list[dict]:
+    """Build MCP server bindings from a skill's `mcp_tools` config entries.
 
     Resolution order per server:
     1. Per-user OAuth token (if user_id provided and provider configured)
@@ -601,7 +497,7 @@ def _build_mcp_bindings(skill_cfg_raw: dict, user_id: str | None = None) -> list
     gateway_api_key = os.environ.get("MCP_GATEWAY_API_KEY", "")
 
     bindings: list[dict] = []
-    for mcp_ref in skill_cfg_raw.get("mcp_tools", []):
+    for mcp_ref in mcp_refs:
         server_name = mcp_ref.get("server", "")
         tools = mcp_ref.get("tools", [])
 
@@ -707,44 +603,19 @@ async def execute(domain: str, skill_name: str, req: ExecuteRequest, request: Re
     model = req.model_override or skill_md.metadata.model
 
     # Compose system prompt: WORKSPACE + DOMAIN + Reflexion + ProjectConfigs + SKILL
-    prompt_parts = []
-    if skill_md.workspace_context:
-        prompt_parts.append(skill_md.workspace_context)
-    if skill_md.domain_context:
-        prompt_parts.append(skill_md.domain_context)
-    if skill_md.reflexion_context:
-        prompt_parts.append(skill_md.reflexion_context)
-    project_configs = _load_project_configs(SKILLS_DIR / domain)
-    if project_configs:
-        prompt_parts.append(project_configs)
-    prompt_parts.append(skill_md.system_prompt)
-    composed_prompt = "\n\n---\n\n".join(prompt_parts)
-
-    # Parse sandbox config + MCP bindings for agent-role skills
+    # (compiled bundle, reflexions spliced in per request)
+    composed_prompt = skill_md.composed_prompt
+
+    # Skill-level agentura.config.yaml — parsed once, shared by runners and post-hooks
+    runtime_config = load_runtime_config(root)
+
+    # Sandbox config + MCP bindings for agent-role skills
     sandbox_config = None
     mcp_bindings: list[dict] = []
     if skill_md.metadata.role == SkillRole.AGENT:
-        sandbox_config = SandboxConfig()
-        skill_config_path = root / "agentura.config.yaml"
-        if skill_config_path.exists():
-            try:
-                skill_cfg_raw = yaml.safe_load(skill_config_path.read_text()) or {}
-                sandbox_raw = skill_cfg_raw.get("sandbox", {}) or skill_cfg_raw.get("agent", {})
-                if sandbox_raw:
-                    sandbox_config = SandboxConfig(**sandbox_raw)
-                mcp_bindings = _build_mcp_bindings(skill_cfg_raw, user_id=req.user_id)
-            except Exception:
-                pass
-
-    # Load verify config (DEC-069)
-    verify_config = None
-    skill_config_check = root / "agentura.config.yaml"
-    if skill_config_check.exists():
+        sandbox_config = runtime_config.sandbox or SandboxConfig()
         try:
-            cfg_raw = yaml.safe_load(skill_config_check.read_text()) or {}
-            verify_raw = cfg_raw.get("verify", {})
-            if verify_raw and verify_raw.get("enabled"):
-                verify_config = VerifyConfig(**verify_raw)
+            mcp_bindings = _build_mcp_bindings(runtime_config.mcp_tools, user_id=req.user_id)
         except Exception:
             pass
 
@@ -758,7 +629,8 @@ async def execute(domain: str, skill_name: str, req: ExecuteRequest, request: Re
         mcp_bindings=mcp_bindings,
         sandbox_config=sandbox_config,
         injected_reflexion_ids=skill_md.injected_reflexion_ids,
-        verify_config=verify_config,
+        verify_config=runtime_config.verify,
+        runtime_config=runtime_config,
     )
 
     if req.dry_run:
@@ -787,22 +659,14 @@ async def execute(domain: str, skill_name: str, req: ExecuteRequest, request: Re
         pass
 
     # Check human-in-the-loop approval requirement
-    skill_config_path = root / "agentura.config.yaml"
-    if skill_config_path.exists():
-        try:
-            skill_cfg = yaml.safe_load(skill_config_path.read_text()) or {}
-            guardrails = skill_cfg.get("guardrails", {})
-            hitl = guardrails.get("human_in_loop", {}) if isinstance(guardrails, dict) else {}
-            if hitl.get("require_approval", False):
-                result.approval_required = True
-                result.pending_action = hitl.get("approval_prompt", "Review and approve this output")
-        except Exception:
-            pass
+    if runtime_config.requires_approval:
+        result.approval_required = True
+        result.pending_action = runtime_config.approval_prompt
 
     # Dispatch post-execution notifications (Slack, etc.)
     try:
         from agentura_sdk.notifications import dispatch_notifications
-        dispatch_notifications(root, domain, skill_name, result)
+        dispatch_notifications(root, domain, skill_name, result, runtime_config=runtime_config)
     except Exception:
         pass
 
@@ -841,32 +705,16 @@ async def execute_stream(domain: str, skill_name: str, req: ExecuteRequest):
 
     model = req.model_override or skill_md.metadata.model
 
-    # Parse sandbox config from skill-level agentura.config.yaml
-    sandbox_config = SandboxConfig()
+    # Sandbox config from skill-level agentura.config.yaml
+    runtime_config = load_runtime_config(root)
+    sandbox_config = runtime_config.sandbox or SandboxConfig()
     mcp_bindings: list[dict] = []
-    skill_config_path = root / "agentura.config.yaml"
-    if skill_config_path.exists():
-        try:
-            skill_cfg = yaml.safe_load(skill_config_path.read_text()) or {}
-            sandbox_raw = skill_cfg.get("sandbox", {}) or skill_cfg.get("agent", {})
-            if sandbox_raw:
-                sandbox_config = SandboxConfig(**sandbox_raw)
-            mcp_bindings = _build_mcp_bindings(skill_cfg, user_id=req.user_id)
-        except Exception:
-            pass
+    try:
+        mcp_bindings = _build_mcp_bindings(runtime_config.mcp_tools, user_id=req.user_id)
+    except Exception:
+        pass
 
-    prompt_parts = []
-    if skill_md.workspace_context:
-        prompt_parts.append(skill_md.workspace_context)
-    if skill_md.domain_context:
-        prompt_parts.append(skill_md.domain_context)
-    if skill_md.reflexion_context:
-        prompt_parts.append(skill_md.reflexion_context)
-    project_configs = _load_project_configs(SKILLS_DIR / domain)
-    if project_configs:
-        prompt_parts.append(project_configs)
-    prompt_parts.append(skill_md.system_prompt)
-    composed_prompt = "\n\n---\n\n".join(prompt_parts)
+    composed_prompt = skill_md.composed_prompt
 
     ctx = SkillContext(
         skill_name=skill_md.metadata.name,
@@ -878,6 +726,7 @@ async def execute_stream(domain: str, skill_name: str, req: ExecuteRequest):
         mcp_bindings=mcp_bindings,
         sandbox_config=sandbox_config,
         injected_reflexion_ids=skill_md.injected_reflexion_ids,
+        runtime_config=runtime_config,
     )
 
     # Route to PTC, Claude Code, or legacy agent executor
@@ -920,6 +769,7 @@ def correct(domain: str, skill_name: str, req: CorrectRequest):
     from agentura_sdk.cli.correct import (
         _generate_reflexion,
         _load_execution,
+        _record_feedback_events,
         _store_correction,
         _update_guardrails,
     )
@@ -971,6 +821,9 @@ def correct(domain: str, skill_name: str, req: CorrectRequest):
     except Exception:
         pass
 
+    _record_feedback_events(skill_path, req.execution_id, req.correction, correction_id, reflexion_id,
+                            deepeval_file, promptfoo_file)
+
     # Guardrail updates (parity with CLI — was missing from server endpoint)
     guardrails_updated = False
     try:
@@ -993,20 +846,22 @@ class ApprovalRequest(BaseModel):
 
 
 @app.post("/api/v1/executions/{execution_id}/approve")
-def approve_execution(execution_id: str, req: ApprovalRequest):
+async def approve_execution(execution_id: str, req: ApprovalRequest):
     """Approve or reject a pending execution (atomic, idempotent)."""
     import asyncio
 
     new_outcome = "approved" if req.approved else "rejected"
 
     from agentura_sdk.memory import get_memory_store
-    store = get_memory_store()
+    store = await asyncio.to_thread(get_memory_store)
     pg = getattr(store, "pg", store)
 
     if not hasattr(pg, "approve_execution_atomic"):
         raise HTTPException(status_code=501, detail="Approval requires PostgreSQL store")
 
-    status, row = pg.approve_execution_atomic(execution_id, new_outcome, req.reviewer_notes)
+    status, row = await asyncio.to_thread(
+        pg.approve_execution_atomic, execution_id, new_outcome, req.reviewer_notes,
+    )
 
     if status == "not_found":
         raise HTTPException(status_code=404, detail=f"Execution not found: {execution_id}")
@@ -1033,20 +888,13 @@ def approve_execution(execution_id: str, req: ApprovalRequest):
         "execution_status": "processed",
     }
 
-    # Post-approval: fire tool execution for approved actions
+    # Post-approval: run the approved tool calls before responding. Running them on the
+    # server loop lets consecutive approvals reuse the same pooled MCP sessions.
     if new_outcome == "approved":
         pending = row.get("pending_approvals") or []
         if pending:
             skill_path = row.get("skill", "")
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(_execute_pending_tools(execution_id, skill_path, pending, pg))
-                else:
-                    asyncio.run(_execute_pending_tools(execution_id, skill_path, pending, pg))
-            except RuntimeError:
-                # No event loop — run synchronously in a new one
-                asyncio.run(_execute_pending_tools(execution_id, skill_path, pending, pg))
+            await _execute_pending_tools(execution_id, skill_path, pending, pg)
             response["pending_tools_count"] = len(pending)
 
     return response
@@ -1058,8 +906,12 @@ async def _execute_pending_tools(
     pending_approvals: list[dict],
     pg_store,
 ) -> None:
-    """Execute approved pending tool calls via MCP and update execution output."""
-    import httpx
+    """Execute approved pending tool calls via MCP and update execution output.
+
+    Calls run one at a time in approval order; each server's pooled MCP session is
+    initialized once and reused for every call to it.
+    """
+    import asyncio
     import logging
 
     logger = logging.getLogger(__name__)
@@ -1093,32 +945,28 @@ async def _execute_pending_tools(
 
     # Merge tool results into the execution's output_summary
     try:
-        existing = pg_store.get_execution_by_id(execution_id)
+        existing = await asyncio.to_thread(pg_store.get_execution_by_id, execution_id)
         output = existing.get("output_summary") or {} if existing else {}
         if not isinstance(output, dict):
             output = {"raw_output": output}
         output["approval_tool_results"] = tool_results
-        pg_store.update_execution_output(execution_id, output, outcome=final_outcome)
+        await asyncio.to_thread(pg_store.update_execution_output, execution_id, output, outcome=final_outcome)
     except Exception as exc:
         logger.error("Failed to update execution output after tool execution: %s", exc)
 
 
 def _resolve_mcp_servers_for_skill(skill_path: str) -> dict[str, str]:
-    """Read agentura.config.yaml for a skill and resolve MCP server URLs."""
+    """Resolve MCP server URLs for a skill's configured tools (cached runtime config)."""
     if not skill_path or "/" not in skill_path:
         return {}
-    parts = skill_path.split("/")
     skill_dir = SKILLS_DIR
-    for p in parts:
+    for p in skill_path.split("/"):
         skill_dir = skill_dir / p
-    config_path = skill_dir / "agentura.config.yaml"
-    if not config_path.exists():
-        return {}
+    runtime_config = load_runtime_config(skill_dir)
 
     result: dict[str, str] = {}
     try:
-        cfg = yaml.safe_load(config_path.read_text()) or {}
-        for mcp_ref in cfg.get("mcp_tools", []):
+        for mcp_ref in runtime_config.mcp_tools:
             server_name = mcp_ref.get("server", "")
             env_key = f"MCP_{server_name.upper().replace('-', '_')}_URL"
             server_url = os.environ.get(env_key, "")
@@ -1131,72 +979,33 @@ def _resolve_mcp_servers_for_skill(skill_path: str) -> dict[str, str]:
     return result
 
 
-async def _call_mcp_tool_async(server_url: str, tool_name: str, arguments: dict) -> str:
-    """Call an MCP tool via Streamable HTTP protocol (async)."""
-    import httpx
-
-    # Resolve auth header from env vars
-    headers: dict[str, str] = {
-        "Content-Type": "application/json",
-        "Accept": "application/json, text/event-stream",
-    }
-    # Check for API key matching server URL pattern
+@functools.lru_cache(maxsize=1)
+def _mcp_api_keys_by_url() -> dict[str, str]:
+    """MCP_{SERVER}_URL → MCP_{SERVER}_API_KEY, read from the environment once per process."""
+    keys: dict[str, str] = {}
     for key, val in os.environ.items():
         if key.startswith("MCP_") and key.endswith("_API_KEY") and val:
-            url_key = key.replace("_API_KEY", "_URL")
-            if os.environ.get(url_key) == server_url:
-                headers["Authorization"] = f"Bearer {val}"
-                break
-
-    timeout = int(os.environ.get("MCP_CALL_TIMEOUT", "60"))
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        # Initialize to get session
-        init_resp = await client.post(
-            server_url,
-            json={
-                "jsonrpc": "2.0", "id": 0, "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {"name": "agentura-approval", "version": "1.0"},
-                },
-            },
-            headers=headers,
-        )
-        init_resp.raise_for_status()
-        session_id = init_resp.headers.get("Mcp-Session-Id", "")
-        if session_id:
-            headers["Mcp-Session-Id"] = session_id
-
-        # Call tool
-        resp = await client.post(
-            server_url,
-            json={
-                "jsonrpc": "2.0", "id": 1,
-                "method": "tools/call",
-                "params": {"name": tool_name, "arguments": arguments},
-            },
-            headers=headers,
-        )
-        resp.raise_for_status()
-
-        # Parse SSE or JSON response
-        text = resp.text
-        data: dict = {}
-        for line in text.strip().split("\n"):
-            if line.startswith("data: "):
-                data = _json.loads(line[6:])
-                break
-        if not data:
-            data = _json.loads(text)
-
-        result = data.get("result", {})
-        if result.get("isError"):
-            texts = [c.get("text", "") for c in result.get("content", [])]
-            raise RuntimeError(f"MCP tool error: {' '.join(texts)}")
-        texts = [c.get("text", "") for c in result.get("content", []) if c.get("type") == "text"]
-        return "\n".join(texts)
+            server_url = os.environ.get(key[: -len("_API_KEY")] + "_URL", "")
+            if server_url:
+                keys.setdefault(server_url, val)
+    return keys
+
+
+async def _call_mcp_tool_async(server_url: str, tool_name: str, arguments: dict) -> str:
+    """Call an MCP tool via Streamable HTTP over a pooled, already-initialized session."""
+    from agentura_sdk.mcp.session_pool import get_session_pool
+
+    headers: dict[str, str] = {}
+    api_key = _mcp_api_keys_by_url().get(server_url)
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    result = await get_session_pool().call_tool(server_url, tool_name, arguments, headers)
+    if result.get("isError"):
+        texts = [c.get("text", "") for c in result.get("content", [])]
+        raise RuntimeError(f"MCP tool error: {' '.join(texts)}")
+    texts = [c.get("text", "") for c in result.get("content", []) if c.get("type") == "text"]
+    return "\n".join(texts)
 
 
 # ---------------------------------------------------------------------------
@@ -1261,6 +1070,11 @@ class AnalyticsResponse(BaseModel):
     executions_by_skill: dict[str, int] = Field(default_factory=dict)
     cost_by_skill: dict[str, float] = Field(default_factory=dict)
     latency_by_skill: dict[str, float] = Field(default_factory=dict)
+    p50_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+    p50_latency_by_skill: dict[str, float] = Field(default_factory=dict)
+    p95_latency_by_skill: dict[str, float] = Field(default_factory=dict)
+    outcomes: dict[str, int] = Field(default_factory=dict)
     recent_executions: list[ExecutionEntry] = Field(default_factory=list)
 
 
@@ -1293,53 +1107,69 @@ def _load_knowledge_file(name: str) -> dict:
 @app.get("/api/v1/executions", response_model=list[ExecutionEntry])
 def list_executions(
     request: Request,
+    response: Response,
     skill: str | None = None,
     outcome: str | None = None,
     triggered_by: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+    include_payload: bool = True,
     domains: set[str] | None = Depends(_get_domain_scope),
 ):
     """List execution history from store (PostgreSQL) with JSON fallback (domain-scoped).
 
+    Newest first, keyset-paginated: pass the X-Next-Cursor header of one page as
+    `cursor` to get the next (header absent on the last page; the gateway forwards it).
+    include_payload=false omits input/output summaries for list views.
+
     RBAC: when triggered_by is provided, only returns executions for that user.
     Admin users (listed in ADMIN_USER_IDS env var) bypass this filter.
     """
+    from agentura_sdk.memory.execution_query import decode_cursor, encode_cursor, filter_executions
+
     # RBAC: auto-filter by user_id unless admin
     admin_ids = {uid.strip() for uid in os.environ.get("ADMIN_USER_IDS", "").split(",") if uid.strip()}
     user_id = getattr(getattr(request, "state", None), "user_id", "") or ""
     if triggered_by is None and user_id and user_id not in admin_ids:
         triggered_by = user_id
 
+    limit = max(1, min(limit, _MAX_EXECUTIONS_PAGE))
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    filters = {
+        "skill": skill,
+        "domains": domains,
+        "outcome": outcome,
+        "triggered_by": triggered_by,
+        "limit": limit,
+        "cursor": cursor,
+        "include_payload": include_payload,
+    }
     entries: list[dict] = []
 
-    # Try the store first (PostgreSQL/Composite)
+    # Try the store first (PostgreSQL/Composite) — filters and paging run in SQL
     try:
         from agentura_sdk.memory import get_memory_store
 
         store = get_memory_store()
-        pg = getattr(store, "_pg", store)
-        if hasattr(pg, "get_executions") and triggered_by:
-            entries = pg.get_executions(skill, triggered_by=triggered_by)
-        elif skill:
-            entries = store.get_executions(skill)
+        if hasattr(store, "query_executions"):
+            entries = store.query_executions(**filters)
         else:
-            entries = store.get_executions()
-        entries = _filter_by_domain(entries, domains)
+            entries = filter_executions(store.get_executions(skill), **filters)
     except Exception:
         pass
 
-    # Fallback to JSON
-    if not entries:
+    # Fallback to JSON (first page only — an empty later page is just the end)
+    if not entries and not cursor:
         data = _load_knowledge_file("episodic_memory.json")
-        entries = _filter_by_domain(data.get("entries", []), domains)
-        if skill:
-            entries = [e for e in entries if e.get("skill") == skill]
-        if triggered_by:
-            entries = [e for e in entries if e.get("triggered_by") == triggered_by]
-
-    if outcome:
-        entries = [e for e in entries if e.get("outcome") == outcome]
+        entries = filter_executions(data.get("entries", []), **filters)
 
-    entries.sort(key=lambda e: str(e.get("timestamp", "")), reverse=True)
+    if len(entries) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(entries[-1])
 
     return [ExecutionEntry(**{k: v for k, v in e.items() if k in ExecutionEntry.model_fields}) for e in entries]
 
@@ -1356,14 +1186,23 @@ def get_execution(execution_id: str, domains: set[str] | None = Depends(_get_dom
         from agentura_sdk.memory import get_memory_store
 
         store = get_memory_store()
-        all_execs = store.get_executions()
-        all_execs = _filter_by_domain(all_execs, domains)
-        entry = next((e for e in all_execs if e.get("execution_id") == execution_id), None)
-        if entry:
-            store_corrections = _filter_by_domain(store.get_corrections(), domains)
-            store_corrections = [c for c in store_corrections if c.get("execution_id") == execution_id]
-            corr_ids = {c.get("correction_id") for c in store_corrections}
-            store_reflexions = [r for r in store.get_all_reflexions() if r.get("correction_id") in corr_ids]
+        if hasattr(store, "get_corrections_for_execution"):
+            # Three indexed point lookups: execution → its corrections → their reflexions
+            entry = store.get_execution_by_id(execution_id)
+            if entry and _filter_by_domain([entry], domains):
+                store_corrections = _filter_by_domain(store.get_corrections_for_execution(execution_id), domains)
+                corr_ids = [c.get("correction_id") for c in store_corrections if c.get("correction_id")]
+                store_reflexions = store.get_reflexions_for_corrections(corr_ids)
+            else:
+                entry = None
+        else:
+            all_execs = _filter_by_domain(store.get_executions(), domains)
+            entry = next((e for e in all_execs if e.get("execution_id") == execution_id), None)
+            if entry:
+                store_corrections = _filter_by_domain(store.get_corrections(), domains)
+                store_corrections = [c for c in store_corrections if c.get("execution_id") == execution_id]
+                corr_ids = {c.get("correction_id") for c in store_corrections}
+                store_reflexions = [r for r in store.get_all_reflexions() if r.get("correction_id") in corr_ids]
     except Exception:
         pass
 
@@ -1402,59 +1241,59 @@ def get_execution(execution_id: str, domains: set[str] | None = Depends(_get_dom
 
 
 @app.get("/api/v1/analytics", response_model=AnalyticsResponse)
-def get_analytics(domains: set[str] | None = Depends(_get_domain_scope)):
-    """Aggregate metrics across all executions, corrections, and reflexions (domain-scoped)."""
-    exec_data = _load_knowledge_file("episodic_memory.json")
-    entries = _filter_by_domain(exec_data.get("entries", []), domains)
+def get_analytics(
+    since: str | None = None,
+    until: str | None = None,
+    domains: set[str] | None = Depends(_get_domain_scope),
+):
+    """Aggregate metrics across executions, corrections, and reflexions (domain-scoped).
 
-    corr_data = _load_knowledge_file("corrections.json")
-    corrections = _filter_by_domain(corr_data.get("corrections", []), domains)
+    `since`/`until` (ISO-8601) bound a [since, until) window, widened to whole UTC hours.
+    With PostgreSQL the aggregation runs in SQL over hourly/daily rollups; otherwise (or
+    when the store has no executions) the JSON knowledge files are aggregated.
+    """
+    from agentura_sdk.memory.analytics import resolve_window, summarize_entries
+    from agentura_sdk.memory.execution_query import filter_executions
 
-    refl_data = _load_knowledge_file("reflexion_entries.json")
-    reflexions = _filter_by_domain(refl_data.get("entries", []), domains)
+    try:
+        window_since, window_until = resolve_window(since, until)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    total = len(entries)
-    outcomes = Counter(e.get("outcome", "pending_review") for e in entries)
-    accepted = outcomes.get("accepted", 0)
-    corrected = outcomes.get("corrected", 0)
+    summary: dict = {}
+    recent: list[dict] = []
 
-    total_cost = sum(e.get("cost_usd", 0) for e in entries)
-    total_latency = sum(e.get("latency_ms", 0) for e in entries)
+    # Try the store first (PostgreSQL/Composite) — aggregation runs in SQL
+    try:
+        from agentura_sdk.memory import get_memory_store
 
-    # Per-skill aggregations
-    skill_counter: Counter[str] = Counter()
-    skill_cost: dict[str, float] = {}
-    skill_latency: dict[str, list[float]] = {}
-    for e in entries:
-        s = e.get("skill", "unknown")
-        skill_counter[s] += 1
-        skill_cost[s] = skill_cost.get(s, 0) + e.get("cost_usd", 0)
-        skill_latency.setdefault(s, []).append(e.get("latency_ms", 0))
+        store = get_memory_store()
+        if hasattr(store, "get_analytics"):
+            summary = store.get_analytics(domains=domains, since=window_since, until=window_until)
+            if summary.get("total_executions") and hasattr(store, "query_executions"):
+                recent = store.query_executions(
+                    domains=domains, since=window_since, until=window_until, limit=10
+                )
+    except Exception:
+        summary = {}
 
-    # Correction-to-test rate
-    tests_generated = sum(1 for e in entries if e.get("correction_generated_test"))
+    # Fallback to JSON
+    if not summary.get("total_executions"):
+        exec_data = _load_knowledge_file("episodic_memory.json")
+        entries = _filter_by_domain(exec_data.get("entries", []), domains)
+        corr_data = _load_knowledge_file("corrections.json")
+        corrections = _filter_by_domain(corr_data.get("corrections", []), domains)
+        refl_data = _load_knowledge_file("reflexion_entries.json")
+        reflexions = _filter_by_domain(refl_data.get("entries", []), domains)
 
-    # Recent entries (last 10)
-    sorted_entries = sorted(entries, key=lambda e: e.get("timestamp", ""), reverse=True)[:10]
+        summary = summarize_entries(entries, corrections, reflexions, since=window_since, until=window_until)
+        recent = filter_executions(entries, since=window_since, until=window_until, limit=10)
 
     return AnalyticsResponse(
-        total_executions=total,
-        accepted=accepted,
-        corrected=corrected,
-        pending_review=outcomes.get("pending_review", 0),
-        accept_rate=round(accepted / total, 2) if total else 0,
-        total_cost_usd=round(total_cost, 4),
-        avg_cost_usd=round(total_cost / total, 4) if total else 0,
-        avg_latency_ms=round(total_latency / total, 1) if total else 0,
-        total_corrections=len(corrections),
-        total_reflexions=len(reflexions),
-        correction_to_test_rate=round(tests_generated / len(corrections), 2) if corrections else 0,
-        executions_by_skill=dict(skill_counter),
-        cost_by_skill={k: round(v, 4) for k, v in skill_cost.items()},
-        latency_by_skill={k: round(sum(v) / len(v), 1) for k, v in skill_latency.items()},
+        **summary,
         recent_executions=[
             ExecutionEntry(**{k: v for k, v in e.items() if k in ExecutionEntry.model_fields})
-            for e in sorted_entries
+            for e in recent
         ],
     )
 
@@ -1696,7 +1535,7 @@ class SemanticSearchRequest(BaseModel):
 
 class SemanticSearchResult(BaseModel):
     results: list[dict[str, Any]] = Field(default_factory=list)
-    backend: str = "json"  # "mem0" or "json"
+    backend: str = "json"  # "mem0", "text-search" or "json"
 
 
 @app.post("/api/v1/knowledge/search/{domain}/{skill_name}", response_model=SemanticSearchResult)
@@ -1710,6 +1549,11 @@ def semantic_search(domain: str, skill_name: str, req: SemanticSearchRequest, do
         from agentura_sdk.memory.mem0_store import Mem0Store
 
         store = get_memory_store()
+        if not isinstance(store, Mem0Store) and hasattr(store, "search_text"):
+            results = store.search_text(
+                req.query, limit=req.limit, skill=skill_path, kinds=("correction", "reflexion")
+            )
+            return SemanticSearchResult(results=results, backend="text-search")
         results = store.search_similar(skill_path, req.query, limit=req.limit)
         backend = "mem0" if isinstance(store, Mem0Store) else "json"
         return SemanticSearchResult(results=results, backend=backend)
@@ -1773,62 +1617,32 @@ def get_memory_status(domains: set[str] | None = Depends(_get_domain_scope)):
             except ImportError:
                 pass
 
-        # Count entries and extract skills from the actual store
-        store_executions: list[dict] = []
-        try:
-            store_executions = store.get_executions()
-            status.execution_memories = len(store_executions)
-        except Exception:
-            pass
-        try:
-            status.correction_memories = len(store.get_corrections())
-        except Exception:
-            pass
-        try:
-            status.reflexion_memories = len(store.get_all_reflexions())
-        except Exception:
-            pass
-
-        status.total_memories = (
-            status.execution_memories
-            + status.correction_memories
-            + status.reflexion_memories
-        )
-
-        # Extract skills_tracked from store executions
-        skills_set: set[str] = set()
-        for e in store_executions:
-            s = e.get("skill", "")
-            if s:
-                skills_set.add(s)
-        status.skills_tracked = sorted(skills_set)
+        # Counts and tracked skills come from the store's COUNT/counter-backed stats()
+        counts = store.stats(domains)
+        status.execution_memories = counts["executions"]
+        status.correction_memories = counts["corrections"]
+        status.reflexion_memories = counts["reflexions"]
+        status.total_memories = counts["total"]
+        status.skills_tracked = counts["skills"]
     except Exception:
         pass
 
     # Fallback to JSON files if store returned nothing
     if not status.skills_tracked or status.total_memories == 0:
-        exec_data = _load_knowledge_file("episodic_memory.json")
-        if not status.skills_tracked:
-            skills_set_json: set[str] = set()
-            for e in exec_data.get("entries", []):
-                s = e.get("skill", "")
-                if s:
-                    skills_set_json.add(s)
-            if skills_set_json:
-                status.skills_tracked = sorted(skills_set_json)
-
-        if status.total_memories == 0:
-            json_execs = len(exec_data.get("entries", []))
-            corr_data = _load_knowledge_file("corrections.json")
-            json_corrs = len(corr_data.get("corrections", []))
-            refl_data = _load_knowledge_file("reflexion_entries.json")
-            json_refls = len(refl_data.get("entries", []))
-            json_total = json_execs + json_corrs + json_refls
-            if json_total > status.total_memories:
-                status.execution_memories = json_execs
-                status.correction_memories = json_corrs
-                status.reflexion_memories = json_refls
-                status.total_memories = json_total
+        from agentura_sdk.memory.skill_stats import count_by_skill, memory_stats
+
+        counts = memory_stats({
+            "executions": count_by_skill(_load_knowledge_file("episodic_memory.json").get("entries", [])),
+            "corrections": count_by_skill(_load_knowledge_file("corrections.json").get("corrections", [])),
+            "reflexions": count_by_skill(_load_knowledge_file("reflexion_entries.json").get("entries", [])),
+        }, domains)
+        if not status.skills_tracked and counts["skills"]:
+            status.skills_tracked = counts["skills"]
+        if status.total_memories == 0 and counts["total"] > 0:
+            status.execution_memories = counts["executions"]
+            status.correction_memories = counts["corrections"]
+            status.reflexion_memories = counts["reflexions"]
+            status.total_memories = counts["total"]
 
     return status
 
@@ -1847,106 +1661,55 @@ class MemorySearchResult(BaseModel):
 
 @app.post("/api/v1/memory/search", response_model=MemorySearchResult)
 def memory_search(req: CrossDomainSearchRequest, domains: set[str] | None = Depends(_get_domain_scope)):
-    """Cross-domain semantic search across skill memories (domain-scoped)."""
+    """Cross-domain search across skill memories (domain-scoped).
+
+    mem0 answers with semantic search; PostgreSQL and JSON stores use the ranked keyword
+    search_text() (GIN-indexed tsvector columns in PostgreSQL).
+    """
+    from agentura_sdk.memory.text_search import search_entries
+
     all_results: list[dict[str, Any]] = []
     backend = "json"
-    skills_set: set[str] = set()
+    skills_set = {s for s in _load_skill_stats() if domains is None or s.split("/")[0] in domains}
 
-    # Load data from store (PostgreSQL/CompositeStore) first
-    store_executions: list[dict] = []
-    store_corrections: list[dict] = []
-    store_reflexions: list[dict] = []
     try:
         from agentura_sdk.memory import get_memory_store
         from agentura_sdk.memory.mem0_store import Mem0Store
 
         store = get_memory_store()
-        store_executions = _filter_by_domain(store.get_executions(), domains)
-        try:
-            store_corrections = _filter_by_domain(store.get_corrections(), domains)
-        except Exception:
-            pass
-        try:
-            store_reflexions = _filter_by_domain(store.get_all_reflexions(), domains)
-        except Exception:
-            pass
-
-        for e in store_executions:
-            s = e.get("skill", "")
-            if s:
-                skills_set.add(s)
-
-        # Try semantic search via mem0
         if isinstance(store, Mem0Store):
+            # Semantic search per skill, then keyword search over the same memories
             backend = "mem0"
             for skill in skills_set:
                 hits = store.search_similar(skill, req.query, limit=3)
                 for h in hits:
                     h["skill"] = skill
                     all_results.append(h)
+            if not all_results:
+                backend = "text-search"
+                all_results = search_entries(
+                    req.query,
+                    executions=_filter_by_domain(store.get_executions(), domains),
+                    corrections=_filter_by_domain(store.get_corrections(), domains),
+                    reflexions=_filter_by_domain(store.get_all_reflexions(), domains),
+                    limit=req.limit,
+                )
+        elif hasattr(store, "search_text"):
+            backend = "text-search"
+            all_results = store.search_text(req.query, domains=domains, limit=req.limit)
     except Exception:
         pass
 
-    # Fall back to JSON if store returned nothing
-    if not store_executions:
-        exec_data = _load_knowledge_file("episodic_memory.json")
-        store_executions = _filter_by_domain(exec_data.get("entries", []), domains)
-        for e in store_executions:
-            s = e.get("skill", "")
-            if s:
-                skills_set.add(s)
-    if not store_corrections:
-        corr_data = _load_knowledge_file("corrections.json")
-        store_corrections = _filter_by_domain(corr_data.get("corrections", []), domains)
-    if not store_reflexions:
-        refl_data = _load_knowledge_file("reflexion_entries.json")
-        store_reflexions = _filter_by_domain(refl_data.get("entries", []), domains)
-
-    # Word-level text search across all data
+    # Fall back to the JSON knowledge files if the store found nothing
     if not all_results:
         backend = "text-search"
-        query_words = [w for w in req.query.lower().split() if len(w) > 2]
-
-        def _word_score(text: str) -> float:
-            text_lower = text.lower()
-            if not query_words:
-                return 0.0
-            matches = sum(1 for w in query_words if w in text_lower)
-            return matches / len(query_words)
-
-        for e in store_executions:
-            text = _json.dumps(e, default=str)
-            score = _word_score(text) * 0.5
-            if score > 0.1:
-                all_results.append({
-                    "type": "execution",
-                    "skill": e.get("skill", ""),
-                    "memory": f"Execution of {e.get('skill', '')}: {str(e.get('output_summary', ''))[:200]}",
-                    "score": round(score, 2),
-                    **{k: v for k, v in e.items() if isinstance(v, (str, int, float, bool))},
-                })
-        for c in store_corrections:
-            text = _json.dumps(c, default=str)
-            score = _word_score(text) * 0.85
-            if score > 0.1:
-                all_results.append({
-                    "type": "correction",
-                    "skill": c.get("skill", ""),
-                    "memory": f"Correction: {c.get('user_correction', '')[:200]}",
-                    "score": round(score, 2),
-                    **{k: v for k, v in c.items() if isinstance(v, (str, int, float, bool))},
-                })
-        for r in store_reflexions:
-            text = _json.dumps(r, default=str)
-            score = _word_score(text) * 0.95
-            if score > 0.1:
-                all_results.append({
-                    "type": "reflexion",
-                    "skill": r.get("skill", ""),
-                    "memory": f"Rule: {r.get('rule', '')[:200]}",
-                    "score": round(score, 2),
-                    **{k: v for k, v in r.items() if isinstance(v, (str, int, float, bool))},
-                })
+        all_results = search_entries(
+            req.query,
+            executions=_filter_by_domain(_load_knowledge_file("episodic_memory.json").get("entries", []), domains),
+            corrections=_filter_by_domain(_load_knowledge_file("corrections.json").get("corrections", []), domains),
+            reflexions=_filter_by_domain(_load_knowledge_file("reflexion_entries.json").get("entries", []), domains),
+            limit=req.limit,
+        )
 
     all_results.sort(key=lambda x: x.get("score", 0), reverse=True)
     return MemorySearchResult(
@@ -2200,17 +1963,21 @@ class DomainDetail(DomainSummary):
     recent_corrections: list[CorrectionEntry] = Field(default_factory=list)
 
 
-def _build_domain_summary(domain_dir: Path) -> DomainSummary | None:
-    """Build a DomainSummary by scanning a domain directory."""
-    domain_name = domain_dir.name
-    config = _load_domain_config(domain_dir)
+def _build_domain_summary(
+    domain: CatalogDomain,
+    stats: dict[str, dict] | None = None,
+) -> DomainSummary | None:
+    """Build a DomainSummary from a catalog domain entry (stats: from _load_skill_stats())."""
+    if stats is None:
+        stats = _load_skill_stats()
+    domain_name = domain.name
+    config = domain.config
     domain_cfg = config.get("domain", {})
 
-    # Read DOMAIN.md for identity
-    domain_md = domain_dir / "DOMAIN.md"
+    # DOMAIN.md first line as fallback identity
     description = domain_cfg.get("description", "")
-    if not description and domain_md.exists():
-        first_line = domain_md.read_text().strip().split("\n")[0]
+    if not description and domain.domain_md:
+        first_line = domain.domain_md.strip().split("\n")[0]
         description = first_line.lstrip("# ").strip()
 
     # Build skill list and count roles
@@ -2218,10 +1985,8 @@ def _build_domain_summary(domain_dir: Path) -> DomainSummary | None:
     managers = specialists = field_agents = 0
     mcp_tools_set: set[str] = set()
 
-    for skill_dir in sorted(domain_dir.iterdir()):
-        if not skill_dir.is_dir() or skill_dir.name.startswith(".") or skill_dir.name in SKIP_DIRS:
-            continue
-        info = _build_skill_info(skill_dir, domain_dir)
+    for entry in domain.skills.values():
+        info = _build_skill_info(entry, domain, stats)
         if info:
             skill_infos.append(info)
             if info.role == "manager":
@@ -2235,12 +2000,11 @@ def _build_domain_summary(domain_dir: Path) -> DomainSummary | None:
     if not skill_infos:
         return None
 
-    # Execution stats
-    exec_data = _load_knowledge_file("episodic_memory.json")
-    all_execs = exec_data.get("entries", [])
-    domain_execs = [e for e in all_execs if e.get("skill", "").startswith(f"{domain_name}/")]
-    accepted = sum(1 for e in domain_execs if e.get("outcome") == "accepted")
-    accept_rate = round(accepted / len(domain_execs), 2) if domain_execs else 0.0
+    # Execution stats (summed from the per-skill aggregates)
+    domain_stats = [v for k, v in stats.items() if k.startswith(f"{domain_name}/")]
+    total_executions = sum(v["executions_total"] for v in domain_stats)
+    accepted = sum(v["accepted_total"] for v in domain_stats)
+    accept_rate = round(accepted / total_executions, 2) if total_executions else 0.0
 
     # Corrections + reflexions
     corr_data = _load_knowledge_file("corrections.json")
@@ -2250,7 +2014,7 @@ def _build_domain_summary(domain_dir: Path) -> DomainSummary | None:
     domain_refls = [r for r in refl_data.get("entries", []) if r.get("skill", "").startswith(f"{domain_name}/")]
 
     # Cost
-    total_cost = sum(e.get("cost_usd", 0) for e in domain_execs)
+    total_cost = sum(v["total_cost_usd"] for v in domain_stats)
 
     # Resource quota from guardrails config
     guardrails_cfg = config.get("guardrails", {})
@@ -2294,7 +2058,7 @@ def _build_domain_summary(domain_dir: Path) -> DomainSummary | None:
         managers_count=managers,
         specialists_count=specialists,
         field_agents_count=field_agents,
-        total_executions=len(domain_execs),
+        total_executions=total_executions,
         accept_rate=accept_rate,
         total_corrections=len(domain_corrs),
         total_reflexions=len(domain_refls),
@@ -2305,46 +2069,35 @@ def _build_domain_summary(domain_dir: Path) -> DomainSummary | None:
     )
 
 
-def _build_topology(domain_dir: Path) -> list[SkillRoute]:
+def _build_topology(domain: CatalogDomain) -> list[SkillRoute]:
     """Parse routes_to from skill metadata to build DAG edges."""
     routes: list[SkillRoute] = []
-    domain_name = domain_dir.name
+    domain_name = domain.name
 
-    for skill_dir in domain_dir.iterdir():
-        if not skill_dir.is_dir() or skill_dir.name.startswith(".") or skill_dir.name in SKIP_DIRS:
-            continue
-        skill_md_path = skill_dir / "SKILL.md"
-        if not skill_md_path.exists():
-            continue
-        try:
-            loaded = load_skill_md(skill_md_path, include_reflexions=False)
-            for rt in loaded.metadata.routes_to:
-                target_domain = rt.get("domain", domain_name)
-                target_skill = rt.get("skill", "")
-                condition = rt.get("when", "")
-                if target_domain and not target_skill:
-                    target_skill = f"{target_domain}/*"
-                routes.append(SkillRoute(
-                    from_skill=f"{domain_name}/{skill_dir.name}",
-                    to_skill=f"{target_domain}/{target_skill}" if target_skill else target_domain,
-                    route_condition=condition,
-                ))
-        except Exception:
+    for entry in domain.skills.values():
+        if entry.loaded is None:
             continue
+        for rt in entry.loaded.metadata.routes_to:
+            target_domain = rt.get("domain", domain_name)
+            target_skill = rt.get("skill", "")
+            condition = rt.get("when", "")
+            if target_domain and not target_skill:
+                target_skill = f"{target_domain}/*"
+            routes.append(SkillRoute(
+                from_skill=f"{domain_name}/{entry.name}",
+                to_skill=f"{target_domain}/{target_skill}" if target_skill else target_domain,
+                route_condition=condition,
+            ))
     return routes
 
 
 @app.get("/api/v1/domains", response_model=list[DomainSummary])
 def list_domains():
     """List all domains with health metrics."""
+    stats = _load_skill_stats()
     domains: list[DomainSummary] = []
-    if not SKILLS_DIR.exists():
-        return domains
-
-    for domain_dir in sorted(SKILLS_DIR.iterdir()):
-        if not domain_dir.is_dir() or domain_dir.name.startswith("."):
-            continue
-        summary = _build_domain_summary(domain_dir)
+    for catalog_domain in _catalog.domains():
+        summary = _build_domain_summary(catalog_domain, stats)
         if summary:
             domains.append(summary)
     return domains
@@ -2353,38 +2106,30 @@ def list_domains():
 @app.get("/api/v1/domains/{domain}", response_model=DomainDetail)
 def get_domain(domain: str):
     """Domain detail with skill topology."""
-    domain_dir = SKILLS_DIR / domain
-    if not domain_dir.exists() or not domain_dir.is_dir():
+    catalog_domain = _catalog.get_domain(domain)
+    if catalog_domain is None:
         raise HTTPException(status_code=404, detail=f"Domain not found: {domain}")
 
-    summary = _build_domain_summary(domain_dir)
+    stats = _load_skill_stats()
+    summary = _build_domain_summary(catalog_domain, stats)
     if not summary:
         raise HTTPException(status_code=404, detail=f"No skills in domain: {domain}")
 
     # Full identity from DOMAIN.md
-    domain_md = domain_dir / "DOMAIN.md"
-    identity = domain_md.read_text() if domain_md.exists() else ""
+    identity = catalog_domain.domain_md
 
     # Skill list
     skill_infos: list[SkillInfo] = []
-    for skill_dir in sorted(domain_dir.iterdir()):
-        if not skill_dir.is_dir() or skill_dir.name.startswith(".") or skill_dir.name in SKIP_DIRS:
-            continue
-        info = _build_skill_info(skill_dir, domain_dir)
+    for entry in catalog_domain.skills.values():
+        info = _build_skill_info(entry, catalog_domain, stats)
         if info:
             skill_infos.append(info)
 
     # Topology
-    topology = _build_topology(domain_dir)
+    topology = _build_topology(catalog_domain)
 
     # Guardrails
-    guardrails: list[str] = []
-    grd_file = domain_dir / "GUARDRAILS.md"
-    if grd_file.exists():
-        guardrails = [
-            line.strip() for line in grd_file.read_text().splitlines()
-            if line.strip().startswith("## GRD-")
-        ]
+    guardrails = list(catalog_domain.guardrails)
 
     # Recent executions
     exec_data = _load_knowledge_file("episodic_memory.json")
@@ -2436,86 +2181,69 @@ class PlatformEvent(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
-@app.get("/api/v1/events", response_model=list[PlatformEvent])
-def list_events(domain: str | None = None, event_type: str | None = None, limit: int = 50, domains: set[str] | None = Depends(_get_domain_scope)):
-    """Unified event stream across all platform activity (domain-scoped)."""
-    events: list[PlatformEvent] = []
+def _rebuild_platform_events(domains: set[str] | None) -> list[dict]:
+    """Derive events from the knowledge files and generated tests (pre-event-log data)."""
+    from agentura_sdk.memory.events import (
+        correction_event,
+        execution_event,
+        reflexion_event,
+        scan_generated_test_events,
+    )
 
-    # 1. Executions → skill_executed events
     exec_data = _load_knowledge_file("episodic_memory.json")
-    for e in _filter_by_domain(exec_data.get("entries", []), domains):
-        skill = e.get("skill", "")
-        d = skill.split("/")[0] if "/" in skill else ""
-        outcome = e.get("outcome", "pending_review")
-        severity = "info" if outcome == "accepted" else "warning" if outcome == "corrected" else "info"
-        events.append(PlatformEvent(
-            event_id=f"evt-exec-{e.get('execution_id', '')}",
-            event_type="skill_executed",
-            severity=severity,
-            domain=d,
-            skill=skill,
-            message=f"Skill {skill} executed → {outcome} (${e.get('cost_usd', 0):.2f}, {e.get('latency_ms', 0):.0f}ms)",
-            timestamp=e.get("timestamp", ""),
-            metadata={"execution_id": e.get("execution_id", ""), "outcome": outcome, "cost_usd": e.get("cost_usd", 0)},
-        ))
-
-    # 2. Corrections → correction_submitted events
     corr_data = _load_knowledge_file("corrections.json")
-    for c in _filter_by_domain(corr_data.get("corrections", []), domains):
-        skill = c.get("skill", "")
-        d = skill.split("/")[0] if "/" in skill else ""
-        events.append(PlatformEvent(
-            event_id=f"evt-corr-{c.get('correction_id', '')}",
-            event_type="correction_submitted",
-            severity="warning",
-            domain=d,
-            skill=skill,
-            message=f"Correction on {skill}: {c.get('user_correction', '')[:80]}",
-            timestamp=c.get("timestamp", ""),
-            metadata={"correction_id": c.get("correction_id", ""), "execution_id": c.get("execution_id", "")},
-        ))
-
-    # 3. Reflexions → reflexion_generated events
     refl_data = _load_knowledge_file("reflexion_entries.json")
-    for r in _filter_by_domain(refl_data.get("entries", []), domains):
-        skill = r.get("skill", "")
-        d = skill.split("/")[0] if "/" in skill else ""
-        events.append(PlatformEvent(
-            event_id=f"evt-refl-{r.get('reflexion_id', '')}",
-            event_type="reflexion_generated",
-            severity="info",
-            domain=d,
-            skill=skill,
-            message=f"Reflexion rule learned for {skill}: {r.get('rule', '')[:80]}",
-            timestamp=r.get("created_at", ""),
-            metadata={"reflexion_id": r.get("reflexion_id", ""), "confidence": r.get("confidence", 0)},
-        ))
+    events = [execution_event(e.get("skill", ""), e) for e in _filter_by_domain(exec_data.get("entries", []), domains)]
+    events += [correction_event(c.get("skill", ""), c) for c in _filter_by_domain(corr_data.get("corrections", []), domains)]
+    events += [reflexion_event(r.get("skill", ""), r) for r in _filter_by_domain(refl_data.get("entries", []), domains)]
+    events += _filter_by_domain(scan_generated_test_events(SKILLS_DIR), domains)
+    return events
 
-    # 4. Tests → test_generated events
-    tests = _scan_generated_tests()
-    for t in tests:
-        skill = t.get("skill", "")
-        d = skill.split("/")[0] if "/" in skill else ""
-        events.append(PlatformEvent(
-            event_id=f"evt-test-{t.get('test_id', '')}",
-            event_type="test_generated",
-            severity="info",
-            domain=d,
-            skill=skill,
-            message=f"Test generated for {skill}: {t.get('description', '')[:80]}",
-            timestamp="",
-            metadata={"test_id": t.get("test_id", ""), "test_type": t.get("test_type", "")},
-        ))
 
-    # Apply filters
-    if domain:
-        events = [e for e in events if e.domain == domain]
-    if event_type:
-        events = [e for e in events if e.event_type == event_type]
+@app.get("/api/v1/events", response_model=list[PlatformEvent])
+def list_events(
+    response: Response,
+    domain: str | None = None,
+    event_type: str | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+    domains: set[str] | None = Depends(_get_domain_scope),
+):
+    """Unified event stream across all platform activity (domain-scoped).
+
+    Served from the store's append-only event log, newest first and keyset-paginated:
+    pass the X-Next-Cursor header of one page as `cursor` to get the next.
+    """
+    from agentura_sdk.memory.events import filter_events
+    from agentura_sdk.memory.execution_query import decode_cursor, encode_cursor
 
-    # Sort by timestamp descending, limit
-    events.sort(key=lambda e: e.timestamp or "", reverse=True)
-    return events[:limit]
+    limit = max(1, min(limit, _MAX_EVENTS_PAGE))
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    filters = {"domains": domains, "domain": domain, "event_type": event_type, "limit": limit, "cursor": cursor}
+    events: list[dict] = []
+
+    # Try the store first — filters and paging run against the event log index
+    try:
+        from agentura_sdk.memory import get_memory_store
+
+        store = get_memory_store()
+        if hasattr(store, "query_events"):
+            events = store.query_events(**filters)
+    except Exception:
+        pass
+
+    # Fallback: rebuild from the knowledge files (first page only)
+    if not events and not cursor:
+        events = filter_events(_rebuild_platform_events(domains), **filters)
+
+    if len(events) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(events[-1], "event_id")
+    return [PlatformEvent(**{k: v for k, v in e.items() if k in PlatformEvent.model_fields}) for e in events]
 
 
 # ---------------------------------------------------------------------------
@@ -2567,17 +2295,13 @@ def get_platform_health():
         name="knowledge_store", status=db_status, version="json-fs", last_check=now,
     )
 
-    # MCP tools — scan all domain configs
+    # MCP tools — from catalog domain configs
     mcp_map: dict[str, list[str]] = {}
-    if SKILLS_DIR.exists():
-        for domain_dir in SKILLS_DIR.iterdir():
-            if not domain_dir.is_dir() or domain_dir.name.startswith("."):
-                continue
-            config = _load_domain_config(domain_dir)
-            for tool in config.get("mcp_tools", []):
-                server = tool.get("server", "")
-                if server:
-                    mcp_map.setdefault(server, []).append(domain_dir.name)
+    for catalog_domain in _catalog.domains():
+        for tool in catalog_domain.config.get("mcp_tools", []):
+            server = tool.get("server", "")
+            if server:
+                mcp_map.setdefault(server, []).append(catalog_domain.name)
 
     mcp_tools = [
         MCPToolHealth(name=name, status="configured", domains_using=sorted(set(doms)))
@@ -2695,6 +2419,8 @@ def create_skill(req: CreateSkillRequest):
         filepath.write_text(rendered)
         files_created.append(str(filepath.relative_to(SKILLS_DIR)))
 
+    _catalog.refresh_domain(req.domain)
+
     return CreateSkillResponse(
         domain=req.domain,
         name=req.name,
@@ -2788,6 +2514,47 @@ def get_skill_mcp_bindings(domain: str, skill_name: str):
     ]
 
 
+class MCPResolvedServer(BaseModel):
+    url: str
+    protocol: str = ""
+    tools: list[dict] = Field(default_factory=list)
+    allowed_tools: list[str] = Field(default_factory=list)
+    error: str = ""
+
+
+class MCPResolvedToolsResponse(BaseModel):
+    servers: dict[str, MCPResolvedServer] = Field(default_factory=dict)
+
+
+@app.get("/api/v1/mcp/tools/{domain}/{skill_name}", response_model=MCPResolvedToolsResponse)
+async def resolve_skill_mcp_tools(domain: str, skill_name: str, user_id: str | None = None):
+    """Pre-resolve tool schemas for a skill's MCP servers (TTL/ETag cached).
+
+    Workers pass these along instead of re-discovering tools per pod. Credentials
+    are used for discovery only and never returned.
+    """
+    import asyncio
+
+    from agentura_sdk.mcp.tool_cache import resolve_tools_async
+
+    skill_dir = SKILLS_DIR / domain / skill_name
+    if not (skill_dir / "SKILL.md").exists():
+        raise HTTPException(status_code=404, detail=f"Skill not found: {domain}/{skill_name}")
+    runtime_config = load_runtime_config(skill_dir)
+    bindings = await asyncio.to_thread(_build_mcp_bindings, runtime_config.mcp_tools, user_id)
+
+    async def _resolve(binding: dict) -> tuple[str, MCPResolvedServer]:
+        server = MCPResolvedServer(url=binding["url"], allowed_tools=binding.get("tools", []))
+        try:
+            resolved = await resolve_tools_async(binding["url"], binding.get("headers"))
+            server.protocol, server.tools = resolved.protocol, resolved.tools
+        except Exception as exc:
+            server.error = str(exc)
+        return binding["server"], server
+
+    return MCPResolvedToolsResponse(servers=dict(await asyncio.gather(*(_resolve(b) for b in bindings))))
+
+
 # ---------------------------------------------------------------------------
 # OAuth — Per-User MCP Token Management
 # ---------------------------------------------------------------------------
@@ -3043,9 +2810,18 @@ def cancel_fleet_session(session_id: str):
     return {"session_id": session_id, "status": "cancelled"}
 
 
+# Without a live LISTEN connection the stream polls at this interval; with one, it
+# re-reads the session only this often as a safety net against lost notifications.
+_FLEET_POLL_S = 2.0
+_FLEET_RESYNC_S = 30.0
+
+_FLEET_AGENT_FIELDS = ("agent_id", "status", "success", "cost_usd", "latency_ms", "error_message")
+_FLEET_DONE_FIELDS = ("session_id", "status", "completed_agents", "failed_agents", "total_cost_usd")
+
+
 @app.get("/api/v1/fleet/sessions/{session_id}/stream")
 async def stream_fleet_session(session_id: str):
-    """SSE stream for live fleet session progress."""
+    """SSE stream for live fleet session progress, driven by FleetStore NOTIFY events."""
     import asyncio
 
     from starlette.responses import StreamingResponse
@@ -3057,39 +2833,47 @@ async def stream_fleet_session(session_id: str):
         raise HTTPException(status_code=503, detail="DATABASE_URL not configured")
 
     from agentura_sdk.memory.fleet_store import FleetStore
+    from agentura_sdk.server.fleet_listener import get_fleet_listener
 
     async def event_generator():
         store = FleetStore(dsn)
+        listener = get_fleet_listener(dsn)
         last_agents: dict[str, str] = {}
-        while True:
-            session = store.get_session(session_id)
-            if not session:
-                yield _sse("error", {"message": f"Session not found: {session_id}"})
-                return
-            agents = store.get_session_agents(session_id)
-            for agent in agents:
-                aid = agent["agent_id"]
-                current_status = agent["status"]
-                if last_agents.get(aid) != current_status:
-                    last_agents[aid] = current_status
-                    yield _sse("agent_update", {
-                        "agent_id": aid,
-                        "status": current_status,
-                        "success": agent.get("success", False),
-                        "cost_usd": agent.get("cost_usd", 0),
-                        "latency_ms": agent.get("latency_ms", 0),
-                        "error_message": agent.get("error_message", ""),
-                    })
-            if session["status"] in ("completed", "failed", "cancelled"):
-                yield _sse("session_done", {
-                    "session_id": session_id,
-                    "status": session["status"],
-                    "completed_agents": session.get("completed_agents", 0),
-                    "failed_agents": session.get("failed_agents", 0),
-                    "total_cost_usd": session.get("total_cost_usd", 0),
-                })
-                return
-            await asyncio.sleep(2)
+
+        def agent_update(agent: dict):
+            if last_agents.get(agent["agent_id"]) == agent["status"]:
+                return None
+            last_agents[agent["agent_id"]] = agent["status"]
+            return _sse("agent_update", {k: agent.get(k, "" if k == "error_message" else 0) for k in _FLEET_AGENT_FIELDS})
+
+        async with listener.subscribe(session_id) as updates:
+            snapshot = True
+            while True:
+                if snapshot:
+                    session = await asyncio.to_thread(store.get_session, session_id)
+                    if not session:
+                        yield _sse("error", {"message": f"Session not found: {session_id}"})
+                        return
+                    for agent in await asyncio.to_thread(store.get_session_agents, session_id):
+                        if (message := agent_update(agent)) is not None:
+                            yield message
+                    if session["status"] in ("completed", "failed", "cancelled"):
+                        yield _sse("session_done", {k: session.get(k, 0) for k in _FLEET_DONE_FIELDS})
+                        return
+                try:
+                    event = await asyncio.wait_for(
+                        updates.get(), _FLEET_RESYNC_S if listener.connected else _FLEET_POLL_S,
+                    )
+                except asyncio.TimeoutError:
+                    snapshot = True
+                    continue
+                snapshot = event["event"] == "resync"
+                if event["event"] == "agent_update":
+                    if (message := agent_update(event)) is not None:
+                        yield message
+                elif event["event"] == "session_update" and event["status"] in ("completed", "failed", "cancelled"):
+                    yield _sse("session_done", {k: event.get(k, 0) for k in _FLEET_DONE_FIELDS})
+                    return
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -3464,11 +3248,97 @@ def trigger_heartbeat(agent_id: str):
     return result
 
 
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close the shared keep-alive LLM and tool (sandbox/MCP) client pools."""
+    from agentura_sdk.http_client import aclose_async_client
+    from agentura_sdk.mcp.session_pool import aclose_session_pool
+    from agentura_sdk.runner.openrouter import aclose_clients
+    await aclose_clients()
+    await aclose_session_pool()
+    await aclose_async_client()
+
+
+@app.on_event("startup")
+async def prewarm_sandbox_pools():
+    """Start filling the PTC worker / Docker sandbox warm pools (when sized > 0)."""
+    from agentura_sdk.sandbox import docker_sandbox, ptc_worker
+    if ptc_worker.WARM_POOL_SIZE > 0:
+        from agentura_sdk.runner.ptc_executor import _build_worker_env
+        try:
+            ptc_worker.prewarm(_build_worker_env())
+        except Exception as exc:
+            _logger.warning("PTC worker pre-warm failed: %s", exc)
+    if docker_sandbox.WARM_POOL_SIZE > 0 and os.environ.get("SANDBOX_BACKEND", "docker") == "docker":
+        try:
+            docker_sandbox.prewarm()
+        except Exception as exc:
+            _logger.warning("Docker sandbox pre-warm failed: %s", exc)
+
+
+@app.on_event("shutdown")
+async def drain_sandbox_pools():
+    """Remove idle warm PTC worker pods and sandbox containers; stop pod informers."""
+    from agentura_sdk.sandbox.docker_sandbox import aclose_container_pool
+    from agentura_sdk.sandbox.pod_informer import stop_informers
+    from agentura_sdk.sandbox.ptc_worker import aclose_worker_pool
+    await aclose_worker_pool()
+    await aclose_container_pool()
+    stop_informers()
+
+
+@app.on_event("shutdown")
+def flush_execution_log():
+    """Write out queued execution log entries before the process exits."""
+    from agentura_sdk.memory.write_behind import shutdown_execution_log_queue
+    shutdown_execution_log_queue()
+
+
 # ---------------------------------------------------------------------------
 # Agent sync on startup
 # ---------------------------------------------------------------------------
 
 
+@app.on_event("startup")
+def migrate_postgres_on_startup():
+    """Run every Postgres store's schema migration once, before requests share the pool."""
+    dsn = os.environ.get("DATABASE_URL", "")
+    if not dsn:
+        return
+    try:
+        from agentura_sdk.memory.pg_pool import migrate_all
+        migrate_all(dsn)
+    except Exception as e:
+        _logger.warning("Postgres schema migration failed (non-fatal): %s", e)
+        return
+    threading.Thread(target=_backfill_search_vectors, args=(dsn,), name="search-backfill", daemon=True).start()
+
+
+def _backfill_search_vectors(dsn: str) -> None:
+    """Fill and index search_tsv for pre-existing rows without blocking startup."""
+    try:
+        from agentura_sdk.memory.pg_store import PgStore
+        updated = PgStore(dsn).backfill_search_vectors()
+        if updated:
+            _logger.info("Backfilled search vectors for %d rows", updated)
+    except Exception as e:
+        _logger.warning("Search vector backfill failed (non-fatal): %s", e)
+
+
+@app.on_event("startup")
+def backfill_generated_test_events():
+    """Record test_generated events for tests written before the event log existed."""
+    threading.Thread(target=_backfill_generated_test_events, name="test-event-backfill", daemon=True).start()
+
+
+def _backfill_generated_test_events() -> None:
+    from agentura_sdk.memory.events import record_events, scan_generated_test_events
+    try:
+        record_events(scan_generated_test_events(SKILLS_DIR))
+    except Exception as e:
+        _logger.warning("Generated test event backfill failed (non-fatal): %s", e)
+
+
 @app.on_event("startup")
 def sync_agents_on_startup():
     """Sync agent definitions from agency/ directory to DB on server start."""
@@ -3494,11 +3364,13 @@ AGENCY_DIR = Path(os.environ.get("AGENCY_DIR", "/agency"))
 
 
 def _on_skill_change(path: str) -> None:
-    """Invalidate skill caches when a skill file changes."""
+    """Invalidate skill caches and refresh the catalog entry when a skill file changes."""
     import logging
     logging.getLogger(__name__).info("Skill change detected: %s — cache invalidated", path)
     _knowledge_cache.clear()
-    _domain_config_cache.clear()
+    invalidate_skill_bundles(path)
+    invalidate_runtime_configs(path)
+    _catalog.refresh(path)
 
 
 def _on_agency_change(path: str) -> None:
@@ -3516,6 +3388,12 @@ def _on_agency_change(path: str) -> None:
         log.warning("Agency re-sync failed: %s", e)
 
 
+@app.on_event("startup")
+def build_skill_catalog():
+    """Parse every skill once; the skill watcher keeps the catalog current afterwards."""
+    _catalog.build()
+
+
 @app.on_event("startup")
 def start_file_watchers():
     """Start file watchers for skills/ and agency/ directories."""
@@ -3555,11 +3433,13 @@ def upload_skill(req: SkillUploadRequest):
 
     # Invalidate caches so the new skill appears immediately
     _knowledge_cache.clear()
-    _domain_config_cache.clear()
+    invalidate_skill_bundles(skill_dir / "SKILL.md")
+    _catalog.refresh_domain(req.domain)
 
     # Return the skill info
-    domain_dir = SKILLS_DIR / req.domain
-    info = _build_skill_info(skill_dir, domain_dir)
+    catalog_domain = _catalog.get_domain(req.domain)
+    entry = catalog_domain.skills.get(req.name) if catalog_domain else None
+    info = _build_skill_info(entry, catalog_domain) if entry else None
     if info:
         return info.model_dump()
     return {"domain": req.domain, "name": req.name, "status": "created"}
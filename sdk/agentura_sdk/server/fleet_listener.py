@@ -0,0 +1,171 @@
+"""Fleet update fan-out — one LISTEN connection per process feeds every fleet SSE stream.
+
+FleetStore NOTIFYs FLEET_CHANNEL on each agent/session status update. The listener
+holds a single autocommit psycopg2 connection registered with the event loop
+(add_reader), so notifications are dispatched to per-session subscriber queues as
+soon as they are committed, and DB load does not grow with the number of open streams.
+
+If the connection drops, subscribers get a {"event": "resync"} message (updates may
+have been missed) and the listener reconnects with backoff.
+
+Usage:
+    listener = get_fleet_listener(dsn)
+    async with listener.subscribe(session_id) as updates:
+        event = await updates.get()  # {"event": "agent_update", "agent_id": ..., "status": ...}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncIterator
+
+import psycopg2
+import psycopg2.extensions
+
+from agentura_sdk.memory.fleet_store import FLEET_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+# Per-subscriber backlog; a stream that falls this far behind is told to resync instead
+_QUEUE_SIZE = 256
+_RECONNECT_MAX_S = 30.0
+
+_RESYNC = {"event": "resync"}
+
+
+class FleetListener:
+    """Shared LISTEN connection dispatching FLEET_CHANNEL notifications by session_id."""
+
+    def __init__(self, dsn: str):
+        self._dsn = dsn
+        self._conn: psycopg2.extensions.connection | None = None
+        self._fd = -1
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None and not self._conn.closed
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, session_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Queue of update dicts for one session. Subscribe before reading a snapshot
+        so no update committed in between is lost.
+
+        Connection failures are logged, not raised — check `connected` to decide
+        whether to fall back to polling.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        try:
+            await self._ensure_connected()
+        except Exception as e:
+            logger.warning("Fleet LISTEN connection failed: %s", e)
+        self._subscribers.setdefault(session_id, set()).add(queue)
+        if not self.connected:
+            self._schedule_reconnect()
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(session_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[session_id]
+
+    async def _ensure_connected(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or a new event loop (e.g. server restart in-process): start over
+            self._close()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._subscribers.clear()
+        async with self._lock:
+            if self.connected:
+                return
+            conn = await asyncio.to_thread(psycopg2.connect, self._dsn)
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {FLEET_CHANNEL}")
+            self._conn, self._fd = conn, conn.fileno()
+            loop.add_reader(self._fd, self._on_readable)
+
+    def _on_readable(self) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            conn.poll()
+        except Exception as e:
+            logger.warning("Fleet LISTEN connection lost: %s", e)
+            self._close()
+            self._broadcast(_RESYNC)
+            self._schedule_reconnect()
+            return
+        while conn.notifies:
+            self._dispatch(conn.notifies.pop(0).payload)
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except json.JSONDecodeError:
+            return
+        for queue in tuple(self._subscribers.get(event.get("session_id", ""), ())):
+            self._put(queue, event)
+
+    def _broadcast(self, event: dict) -> None:
+        for queues in tuple(self._subscribers.values()):
+            for queue in tuple(queues):
+                self._put(queue, event)
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event: dict) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Consumer is behind — replace its backlog with a single resync marker
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(_RESYNC)
+
+    def _schedule_reconnect(self) -> None:
+        if self._loop is None or (self._reconnect_task and not self._reconnect_task.done()):
+            return
+        self._reconnect_task = self._loop.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = 0.5
+        while self._subscribers and not self.connected:
+            await asyncio.sleep(delay)
+            try:
+                await self._ensure_connected()
+                self._broadcast(_RESYNC)
+            except Exception as e:
+                logger.warning("Fleet LISTEN reconnect failed: %s", e)
+                delay = min(delay * 2, _RECONNECT_MAX_S)
+
+    def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            with contextlib.suppress(Exception):
+                self._loop.remove_reader(self._fd)
+        with contextlib.suppress(Exception):
+            conn.close()
+
+
+_listeners: dict[str, FleetListener] = {}
+
+
+def get_fleet_listener(dsn: str) -> FleetListener:
+    """Process-wide listener for `dsn`."""
+    listener = _listeners.get(dsn)
+    if listener is None:
+        listener = _listeners[dsn] = FleetListener(dsn)
+    return listener
@@ -0,0 +1,282 @@
+"""In-memory skill catalog — parsed once at startup, refreshed per directory by the skill watcher.
+
+Listing endpoints (skills, triggers, domains, platform health) read from the catalog
+instead of walking SKILLS_DIR and re-parsing every SKILL.md / agentura.config.yaml.
+
+Usage:
+    catalog = SkillCatalog(skills_dir)
+    catalog.build()                      # full scan (startup)
+    catalog.refresh(changed_path)        # watcher callback — rescans one skill/domain
+    for domain in catalog.domains(): ...
+    entry = catalog.get_skill("hr", "triage")
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from agentura_sdk.runner.skill_loader import LoadedSkill, load_skill_md
+
+logger = logging.getLogger(__name__)
+
+# Directories never treated as skills
+DEFAULT_SKIP_DIRS = {"shared", "__pycache__", "node_modules", ".git"}
+
+
+@dataclass
+class CatalogSkill:
+    """Parsed files for one skill directory."""
+    domain: str
+    name: str
+    skill_dir: Path
+    loaded: LoadedSkill | None = None  # None when SKILL.md is missing or unparseable
+    config: dict[str, Any] = field(default_factory=dict)
+    has_config_file: bool = False
+    last_deployed: str = ""
+    corrections_count: int = 0
+
+
+@dataclass
+class CatalogDomain:
+    """Parsed files for one domain directory plus its skills (sorted by name)."""
+    name: str
+    domain_dir: Path
+    config: dict[str, Any] = field(default_factory=dict)
+    domain_md: str = ""
+    guardrails: list[str] = field(default_factory=list)
+    guardrails_count: int = 0
+    skills: dict[str, CatalogSkill] = field(default_factory=dict)
+
+
+class SkillCatalog:
+    """Thread-safe index of all skills under a skills directory."""
+
+    def __init__(self, skills_dir: Path, skip_dirs: set[str] | None = None):
+        self._skills_dir = skills_dir
+        self._skip_dirs = skip_dirs if skip_dirs is not None else DEFAULT_SKIP_DIRS
+        self._domains: dict[str, CatalogDomain] = {}
+        self._built = False
+        self._lock = threading.Lock()
+
+    # --- Reads ---
+
+    def domains(self) -> list[CatalogDomain]:
+        self._ensure_built()
+        domains = self._domains
+        return [domains[name] for name in sorted(domains)]
+
+    def get_domain(self, name: str) -> CatalogDomain | None:
+        self._ensure_built()
+        return self._domains.get(name)
+
+    def skills(self) -> list[CatalogSkill]:
+        """All skill directories with a loadable SKILL.md, sorted by (domain, name)."""
+        return [s for d in self.domains() for s in d.skills.values() if s.loaded is not None]
+
+    def get_skill(self, domain: str, name: str) -> CatalogSkill | None:
+        entry = self.get_domain(domain)
+        return entry.skills.get(name) if entry else None
+
+    def triggers(self) -> list[dict[str, Any]]:
+        """Trigger definitions for the gateway cron scheduler (top-level and skills[] formats)."""
+        results: list[dict[str, Any]] = []
+        for domain in self.domains():
+            for skill in domain.skills.values():
+                if not skill.has_config_file:
+                    continue
+                top_triggers = skill.config.get("triggers", [])
+                if top_triggers:
+                    results.append({"domain": domain.name, "skill": skill.name, "triggers": top_triggers})
+                for s in skill.config.get("skills", []):
+                    triggers = s.get("triggers", [])
+                    if triggers:
+                        results.append({
+                            "domain": domain.name,
+                            "skill": s.get("name", skill.name),
+                            "triggers": triggers,
+                        })
+        return results
+
+    # --- Writes ---
+
+    def build(self) -> None:
+        """Full scan of the skills directory."""
+        domains: dict[str, CatalogDomain] = {}
+        if self._skills_dir.exists():
+            for domain_dir in sorted(self._skills_dir.iterdir()):
+                if self._is_domain_dir(domain_dir):
+                    domains[domain_dir.name] = self._load_domain(domain_dir)
+        with self._lock:
+            self._domains = domains
+            self._built = True
+        logger.info(
+            "Skill catalog built: %d domains, %d skills",
+            len(domains), sum(len(d.skills) for d in domains.values()),
+        )
+
+    def refresh(self, path: str | Path) -> None:
+        """Rescan the skill (or domain) directory that contains `path`.
+
+        Root-level files (WORKSPACE.md) trigger a full rebuild, domain-level files
+        (DOMAIN.md, GUARDRAILS.md) rebuild the domain, anything deeper rebuilds one skill.
+        """
+        if not self._built:
+            self.build()
+            return
+        try:
+            rel = Path(path).resolve().relative_to(self._skills_dir.resolve())
+        except ValueError:
+            return
+        parts = rel.parts
+        if len(parts) <= 1:
+            self.build()
+            return
+
+        domain_dir = self._skills_dir / parts[0]
+        if len(parts) == 2:
+            self.refresh_domain(domain_dir.name)
+        else:
+            self.refresh_skill(domain_dir.name, parts[1])
+
+    def refresh_domain(self, domain: str) -> None:
+        with self._lock:
+            self._reload_domain(domain)
+
+    def refresh_skill(self, domain: str, name: str) -> None:
+        domain_dir = self._skills_dir / domain
+        with self._lock:
+            current = self._domains.get(domain)
+            if current is None or not self._is_domain_dir(domain_dir):
+                self._reload_domain(domain)
+                return
+            skills = dict(current.skills)
+            skill_dir = domain_dir / name
+            entry = self._load_skill(domain, skill_dir) if self._is_skill_dir(skill_dir) else None
+            if entry is not None:
+                skills[name] = entry
+            else:
+                skills.pop(name, None)
+            skills = {k: skills[k] for k in sorted(skills)}
+            updated = CatalogDomain(
+                name=current.name,
+                domain_dir=current.domain_dir,
+                config=self._domain_config(skills),
+                domain_md=current.domain_md,
+                guardrails=current.guardrails,
+                guardrails_count=current.guardrails_count,
+                skills=skills,
+            )
+            self._domains = {**self._domains, domain: updated}
+
+    def _reload_domain(self, domain: str) -> None:
+        """Rescan one whole domain. Caller holds the lock."""
+        domain_dir = self._skills_dir / domain
+        domains = dict(self._domains)
+        if self._is_domain_dir(domain_dir):
+            domains[domain] = self._load_domain(domain_dir)
+        else:
+            domains.pop(domain, None)
+        self._domains = domains
+
+    # --- Loading ---
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.build()
+
+    def _is_domain_dir(self, path: Path) -> bool:
+        return path.is_dir() and not path.name.startswith(".")
+
+    def _is_skill_dir(self, path: Path) -> bool:
+        return path.is_dir() and not path.name.startswith(".") and path.name not in self._skip_dirs
+
+    def _load_domain(self, domain_dir: Path) -> CatalogDomain:
+        skills: dict[str, CatalogSkill] = {}
+        for skill_dir in sorted(domain_dir.iterdir()):
+            if not self._is_skill_dir(skill_dir):
+                continue
+            entry = self._load_skill(domain_dir.name, skill_dir)
+            if entry is not None:
+                skills[skill_dir.name] = entry
+
+        domain_md_path = domain_dir / "DOMAIN.md"
+        grd_path = domain_dir / "GUARDRAILS.md"
+        guardrails: list[str] = []
+        guardrails_count = 0
+        if grd_path.exists():
+            grd_text = grd_path.read_text()
+            guardrails = [line.strip() for line in grd_text.splitlines() if line.strip().startswith("## GRD-")]
+            guardrails_count = len(re.findall(r"##\s+GRD-\d+", grd_text))
+
+        return CatalogDomain(
+            name=domain_dir.name,
+            domain_dir=domain_dir,
+            config=self._domain_config(skills),
+            domain_md=domain_md_path.read_text() if domain_md_path.exists() else "",
+            guardrails=guardrails,
+            guardrails_count=guardrails_count,
+            skills=skills,
+        )
+
+    def _load_skill(self, domain: str, skill_dir: Path) -> CatalogSkill | None:
+        """Parse one skill directory. Returns None when it has neither SKILL.md nor config."""
+        skill_md_path = skill_dir / "SKILL.md"
+        config_path = skill_dir / "agentura.config.yaml"
+        if not skill_md_path.exists() and not config_path.exists():
+            return None
+
+        loaded: LoadedSkill | None = None
+        last_deployed = ""
+        if skill_md_path.exists():
+            try:
+                loaded = load_skill_md(skill_md_path, include_reflexions=False)
+            except Exception:
+                logger.debug("Catalog: failed to load %s", skill_md_path)
+            mtime = skill_md_path.stat().st_mtime
+            last_deployed = datetime.fromtimestamp(mtime, tz=UTC).isoformat()
+
+        config: dict[str, Any] = {}
+        if config_path.exists():
+            try:
+                config = yaml.safe_load(config_path.read_text()) or {}
+            except (OSError, yaml.YAMLError):
+                logger.debug("Catalog: invalid config YAML %s", config_path)
+
+        return CatalogSkill(
+            domain=domain,
+            name=skill_dir.name,
+            skill_dir=skill_dir,
+            loaded=loaded,
+            config=config,
+            has_config_file=config_path.exists(),
+            last_deployed=last_deployed,
+            corrections_count=_count_corrections(skill_dir),
+        )
+
+    @staticmethod
+    def _domain_config(skills: dict[str, CatalogSkill]) -> dict[str, Any]:
+        """Domain config lives at skill level — first skill with a parseable config wins."""
+        for skill in skills.values():
+            if skill.config:
+                return skill.config
+        return {}
+
+
+def _count_corrections(skill_dir: Path) -> int:
+    """Count test entries in tests/generated/corrections.yaml."""
+    corr_file = skill_dir / "tests" / "generated" / "corrections.yaml"
+    if not corr_file.exists():
+        return 0
+    try:
+        data = yaml.safe_load(corr_file.read_text())
+        return len(data.get("tests", [])) if data else 0
+    except (OSError, yaml.YAMLError, AttributeError):
+        return 0
@@ -15,14 +15,27 @@ _DEBOUNCE_MS = int(os.environ.get("SKILL_WATCH_DEBOUNCE_MS", "500"))
 
 
 class _DebouncedHandler(FileSystemEventHandler):
-    """Triggers a callback after a debounce window, coalescing rapid changes."""
-
-    def __init__(self, callback: callable, debounce_s: float, watch_extensions: set[str]):
+    """Triggers a callback after a debounce window, coalescing rapid changes.
+
+    With fire_each=True the callback runs once per distinct path changed in the
+    window; otherwise once, with the most recent path.
+    """
+
+    def __init__(
+        self,
+        callback: callable,
+        debounce_s: float,
+        watch_extensions: set[str],
+        fire_each: bool = False,
+    ):
         super().__init__()
         self._callback = callback
         self._debounce_s = debounce_s
         self._extensions = watch_extensions
+        self._fire_each = fire_each
+        self._last_path = ""
         self._timer: threading.Timer | None = None
+        self._pending: set[str] = set()
         self._lock = threading.Lock()
 
     def _matches(self, path: str) -> bool:
@@ -31,26 +44,33 @@ class _DebouncedHandler(FileSystemEventHandler):
     def on_any_event(self, event: FileSystemEvent) -> None:
         if event.is_directory:
             return
-        src = getattr(event, "src_path", "")
-        if not self._matches(src):
+        # Moves (editor atomic saves) may only match on the destination path
+        paths = [p for p in (getattr(event, "src_path", ""), getattr(event, "dest_path", "")) if p and self._matches(p)]
+        if not paths:
             return
         with self._lock:
+            self._last_path = paths[-1]
+            self._pending.update(paths)
             if self._timer is not None:
                 self._timer.cancel()
-            self._timer = threading.Timer(self._debounce_s, self._fire, args=(src,))
+            self._timer = threading.Timer(self._debounce_s, self._fire)
             self._timer.daemon = True
             self._timer.start()
 
-    def _fire(self, path: str) -> None:
-        logger.info("File change detected: %s — running callback", path)
-        try:
-            self._callback(path)
-        except Exception:
-            logger.exception("Watcher callback failed for %s", path)
+    def _fire(self) -> None:
+        with self._lock:
+            pending, self._pending = sorted(self._pending), set()
+        paths = pending if self._fire_each else [self._last_path]
+        for path in paths:
+            logger.info("File change detected: %s — running callback", path)
+            try:
+                self._callback(path)
+            except Exception:
+                logger.exception("Watcher callback failed for %s", path)
 
 
 def start_skill_watcher(skills_dir: Path, on_change: callable) -> Observer | None:
-    """Watch skills_dir for .md/.yaml changes; call on_change(path) with debounce."""
+    """Watch skills_dir for .md/.yaml changes; call on_change(path) for each changed path, debounced."""
     if not skills_dir.exists():
         logger.warning("Skills dir %s does not exist — skipping watcher", skills_dir)
         return None
@@ -59,6 +79,7 @@ def start_skill_watcher(skills_dir: Path, on_change: callable) -> Observer | Non
         callback=on_change,
         debounce_s=_DEBOUNCE_MS / 1000.0,
         watch_extensions={".md", ".yaml", ".yml"},
+        fire_each=True,  # catalog refreshes per skill directory
     )
     observer = Observer()
     observer.schedule(handler, str(skills_dir), recursive=True)
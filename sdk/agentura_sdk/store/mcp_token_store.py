@@ -1,17 +1,37 @@
-"""CRUD store for per-user OAuth tokens used by MCP server connections."""
+"""CRUD store for per-user OAuth tokens used by MCP server connections.
+
+Connections come from the shared per-DSN pool (memory/pg_pool.py) and the DDL runs
+once per process, so constructing a store per execution is cheap. Valid access tokens
+are cached in-process per (user_id, provider) until shortly before they expire, and
+refreshes are single-flight: concurrent callers for the same token wait for one refresh.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
 import os
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import UTC, datetime, timedelta
 
 import psycopg2
 import psycopg2.extras
 
+from agentura_sdk.memory.pg_pool import get_pool, migrate_once
+
 _logger = logging.getLogger("agentura.mcp_token_store")
 
+# Tokens are treated as expired this long before expires_at, so none lapses mid-execution
+_EXPIRY_SKEW = timedelta(seconds=60)
+# Cache lifetime for tokens without expires_at (bounds staleness after revocation elsewhere)
+_NO_EXPIRY_TTL_S = 300.0
+
+# (dsn, user_id, provider) -> (access_token, cached-until monotonic time)
+_token_cache: dict[tuple[str, str, str], tuple[str, float]] = {}
+_refresh_locks: dict[tuple[str, str, str], threading.Lock] = {}
+_locks_guard = threading.Lock()
+
 _SCHEMA = """\
 CREATE TABLE IF NOT EXISTS mcp_user_tokens (
     id SERIAL PRIMARY KEY,
@@ -41,22 +61,20 @@ class McpTokenStore:
         self._dsn = dsn or os.environ.get("DATABASE_URL", "")
         if not self._dsn:
             raise ValueError("DATABASE_URL is required for McpTokenStore")
-        self._ensure_schema()
-
-    def _conn(self):
-        return psycopg2.connect(self._dsn)
+        self._pool = get_pool(self._dsn)
+        migrate_once(self._dsn, "mcp_tokens", self._ensure_schema)
 
     def _ensure_schema(self) -> None:
-        conn = self._conn()
+        conn = self._pool.getconn()
         try:
             with conn.cursor() as cur:
                 cur.execute(_SCHEMA)
             conn.commit()
         finally:
-            conn.close()
+            self._pool.putconn(conn)
 
     def get_token(self, user_id: str, provider: str) -> dict | None:
-        conn = self._conn()
+        conn = self._pool.getconn()
         try:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                 cur.execute(
@@ -66,7 +84,7 @@ class McpTokenStore:
                 row = cur.fetchone()
                 return dict(row) if row else None
         finally:
-            conn.close()
+            self._pool.putconn(conn)
 
     def save_token(
         self,
@@ -81,7 +99,7 @@ class McpTokenStore:
         client_secret: str | None = None,
         metadata: dict | None = None,
     ) -> None:
-        conn = self._conn()
+        conn = self._pool.getconn()
         try:
             with conn.cursor() as cur:
                 cur.execute(
@@ -110,10 +128,11 @@ class McpTokenStore:
                 )
             conn.commit()
         finally:
-            conn.close()
+            self._pool.putconn(conn)
+        self._invalidate(user_id, provider)
 
     def list_connected(self, user_id: str) -> list[str]:
-        conn = self._conn()
+        conn = self._pool.getconn()
         try:
             with conn.cursor() as cur:
                 cur.execute(
@@ -122,10 +141,10 @@ class McpTokenStore:
                 )
                 return [row[0] for row in cur.fetchall()]
         finally:
-            conn.close()
+            self._pool.putconn(conn)
 
     def delete_token(self, user_id: str, provider: str) -> None:
-        conn = self._conn()
+        conn = self._pool.getconn()
         try:
             with conn.cursor() as cur:
                 cur.execute(
@@ -134,16 +153,33 @@ class McpTokenStore:
                 )
             conn.commit()
         finally:
-            conn.close()
+            self._pool.putconn(conn)
+        self._invalidate(user_id, provider)
 
     def refresh_if_expired(self, user_id: str, provider: str) -> str | None:
-        """Return a valid access token, refreshing if expired. Returns None if no token stored."""
+        """Return a valid access token, refreshing if expired. Returns None if no token stored.
+
+        Served from the in-process cache when possible; otherwise one caller per
+        (user_id, provider) reads — and if needed refreshes — the token while the rest wait.
+        """
+        key = (self._dsn, user_id, provider)
+        cached = _cached_token(key)
+        if cached is not None:
+            return cached
+
+        with _refresh_lock(key):
+            cached = _cached_token(key)
+            if cached is not None:
+                return cached
+            return self._load_or_refresh(key, user_id, provider)
+
+    def _load_or_refresh(self, key: tuple[str, str, str], user_id: str, provider: str) -> str | None:
         token_row = self.get_token(user_id, provider)
         if not token_row:
             return None
 
         expires_at = token_row.get("expires_at")
-        if expires_at and expires_at < datetime.now(timezone.utc):
+        if expires_at and expires_at - _EXPIRY_SKEW < datetime.now(UTC):
             refresh_token = token_row.get("refresh_token")
             if not refresh_token:
                 _logger.warning("Token expired for %s/%s but no refresh_token", user_id, provider)
@@ -169,6 +205,35 @@ class McpTokenStore:
                 client_id=token_row.get("client_id"),
                 client_secret=token_row.get("client_secret"),
             )
+            _cache_token(key, new_tokens["access_token"], new_tokens.get("expires_at"))
             return new_tokens["access_token"]
 
+        _cache_token(key, token_row["access_token"], expires_at)
         return token_row["access_token"]
+
+    def _invalidate(self, user_id: str, provider: str) -> None:
+        _token_cache.pop((self._dsn, user_id, provider), None)
+
+
+def _cached_token(key: tuple[str, str, str]) -> str | None:
+    entry = _token_cache.get(key)
+    if entry is None or entry[1] <= time.monotonic():
+        return None
+    return entry[0]
+
+
+def _cache_token(key: tuple[str, str, str], access_token: str, expires_at: datetime | None) -> None:
+    if expires_at is None:
+        ttl = _NO_EXPIRY_TTL_S
+    else:
+        ttl = (expires_at - _EXPIRY_SKEW - datetime.now(UTC)).total_seconds()
+    if ttl > 0:
+        _token_cache[key] = (access_token, time.monotonic() + ttl)
+
+
+def _refresh_lock(key: tuple[str, str, str]) -> threading.Lock:
+    with _locks_guard:
+        lock = _refresh_locks.get(key)
+        if lock is None:
+            lock = _refresh_locks[key] = threading.Lock()
+        return lock
@@ -10,8 +10,7 @@ import logging
 import threading
 from pathlib import Path
 
-import yaml
-
+from agentura_sdk.runner.config_loader import load_runtime_config
 from agentura_sdk.types import SkillContext, SkillResult
 
 logger = logging.getLogger(__name__)
@@ -27,17 +26,8 @@ def maybe_generate_failure_tests(
         return
 
     skill_dir = skills_dir / ctx.domain / ctx.skill_name
-    config_path = skill_dir / "agentura.config.yaml"
-    if not config_path.exists():
-        return
-
-    try:
-        cfg = yaml.safe_load(config_path.read_text()) or {}
-    except Exception:
-        return
-
-    feedback = cfg.get("feedback", {})
-    if not feedback.get("capture_failure_cases", False):
+    runtime_config = ctx.runtime_config or load_runtime_config(skill_dir)
+    if not runtime_config.feedback.capture_failure_cases:
         return
 
     # Fire in daemon thread — never blocks
@@ -62,14 +52,14 @@ def _generate_tests_sync(ctx: SkillContext, result: SkillResult, skill_dir: Path
             generate_failure_promptfoo_test,
         )
 
-        generate_failure_deepeval_test(
+        deepeval_file = generate_failure_deepeval_test(
             skill_dir=skill_dir,
             input_data=ctx.input_data,
             error_output=result.output,
             execution_id=execution_id,
             severity="P0",
         )
-        generate_failure_promptfoo_test(
+        promptfoo_file = generate_failure_promptfoo_test(
             skill_dir=skill_dir,
             input_data=ctx.input_data,
             error_output=result.output,
@@ -77,6 +67,16 @@ def _generate_tests_sync(ctx: SkillContext, result: SkillResult, skill_dir: Path
             severity="P0",
         )
         logger.info("Generated failure regression tests for %s", skill_path)
+
+        from agentura_sdk.memory.events import generated_test_event, generated_test_id, record_events
+
+        description = f"Failure regression (P0): {execution_id}"
+        record_events([
+            generated_test_event(skill_path, generated_test_id(skill_path, deepeval_file), "deepeval", description),
+            generated_test_event(
+                skill_path, generated_test_id(skill_path, promptfoo_file, execution_id), "promptfoo", description
+            ),
+        ])
     except Exception:
         logger.debug("Failed to generate failure tests for %s", skill_path, exc_info=True)
 
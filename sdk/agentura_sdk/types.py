@@ -66,6 +66,8 @@ class SandboxConfig(BaseModel):
     memory: int = 512
     backend: str = ""
     executor: str = ""  # "claude-code" for Claude Agent SDK, "" for legacy sandbox
+    tool_concurrency: int = 4  # Max tool calls from one LLM turn run concurrently (1 = sequential)
+    sequential_tools: list[str] = Field(default_factory=list)  # Never run alongside other calls
 
 
 class AgentIteration(BaseModel):
@@ -145,6 +147,29 @@ class SkillConfig(BaseModel):
     mcp_tools: list[McpToolRef] = Field(default_factory=list)
 
 
+class SkillRuntimeConfig(BaseModel):
+    """Execution-time view of a skill's agentura.config.yaml, parsed once per file version.
+
+    Unlike SkillConfig this never fails: a missing or malformed file yields defaults,
+    and each section falls back independently when it does not validate.
+    """
+    sandbox: SandboxConfig | None = None  # `sandbox:` or legacy `agent:` block
+    mcp_tools: list[dict] = Field(default_factory=list)
+    verify: VerifyConfig | None = None  # only set when verify.enabled
+    guardrails: GuardrailsConfig = Field(default_factory=GuardrailsConfig)
+    feedback: FeedbackConfig = Field(default_factory=FeedbackConfig)
+    notifications: list[dict] = Field(default_factory=list)  # `on:` keys parse as YAML booleans
+    raw: dict[str, Any] = Field(default_factory=dict)
+
+    @property
+    def requires_approval(self) -> bool:
+        return bool(self.guardrails.human_in_loop.get("require_approval", False))
+
+    @property
+    def approval_prompt(self) -> str:
+        return self.guardrails.human_in_loop.get("approval_prompt", "Review and approve this output")
+
+
 # --- Runtime types (SkillContext → SkillResult contract from DEC-005) ---
 
 class SkillContext(BaseModel):
@@ -158,9 +183,10 @@ class SkillContext(BaseModel):
     routed_context: dict[str, Any] = Field(default_factory=dict)
     mcp_tools: list[str] = Field(default_factory=list)
     mcp_bindings: list[dict] = Field(default_factory=list)
-    sandbox_config: Optional[SandboxConfig] = None
+    sandbox_config: SandboxConfig | None = None
     injected_reflexion_ids: list[str] = Field(default_factory=list)
     verify_config: Optional["VerifyConfig"] = None
+    runtime_config: SkillRuntimeConfig | None = None
 
 
 class SkillResult(BaseModel):
@@ -172,11 +198,11 @@ class SkillResult(BaseModel):
     model_used: str = ""
     cost_usd: float = 0.0
     latency_ms: float = 0.0
-    route_to: Optional[str] = None
+    route_to: str | None = None
     context_for_next: dict[str, Any] = Field(default_factory=dict)
     approval_required: bool = False
     pending_action: str = ""
-    verified: Optional[bool] = None
+    verified: bool | None = None
     verify_issues: list[str] = Field(default_factory=list)
 
 
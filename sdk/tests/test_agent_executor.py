@@ -0,0 +1,192 @@
+"""Tests for non-blocking tool dispatch in the legacy agent loop."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from werkzeug import Response
+
+from agentura_sdk.runner import agent_executor
+from agentura_sdk.sandbox.docker_sandbox import DockerSandbox
+
+
+@pytest.fixture
+def sandbox(httpserver, monkeypatch):
+    from agentura_sdk.sandbox import docker_sandbox
+
+    monkeypatch.setattr(agent_executor, "sandbox_mod", docker_sandbox)
+    return DockerSandbox(container_id="test", host_port=httpserver.port)
+
+
+class TestAsyncToolDispatch:
+    @pytest.mark.asyncio
+    async def test_mcp_tools_fetched_and_called(self, httpserver):
+        server = httpserver.url_for("").rstrip("/")
+        httpserver.expect_request("/tools").respond_with_json([
+            {"name": "search", "description": "", "input_schema": {}},
+            {"name": "delete", "description": "", "input_schema": {}},
+        ])
+        httpserver.expect_request(
+            "/tools/call", json={"name": "search", "arguments": {"q": "x"}},
+        ).respond_with_json({"content": "found"})
+
+        tools, tool_map = await agent_executor._build_tool_set([
+            {"url": server, "tools": ["search"]},
+            {"url": ""},
+        ])
+        assert tool_map == {"search": server}
+        assert tools[-1]["name"] == "search"
+        assert await agent_executor._execute_tool(None, "search", {"q": "x"}, tool_map) == "found"
+
+    @pytest.mark.asyncio
+    async def test_failed_mcp_server_is_skipped(self, monkeypatch):
+        from agentura_sdk.mcp import client
+
+        monkeypatch.setattr(client, "_RETRY_DELAY", 0)
+        tools, tool_map = await agent_executor._build_tool_set([{"url": "http://127.0.0.1:9"}])
+        assert tool_map == {}
+        assert len(tools) == len(agent_executor.SANDBOX_TOOLS)
+
+    @pytest.mark.asyncio
+    async def test_long_command_does_not_block_loop(self, httpserver, sandbox):
+        def slow_execute(request):
+            time.sleep(0.5)
+            return Response(json.dumps({"stdout": "done", "exit_code": 0}), content_type="application/json")
+
+        httpserver.expect_request("/execute", method="POST").respond_with_handler(slow_execute)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        output = await agent_executor._execute_tool(sandbox, "run_command", {"command": "sleep 1"}, {})
+        ticking.cancel()
+        assert output == "done"
+        assert ticks >= 5
+
+
+class TestConcurrentToolCalls:
+    def test_plan_batches(self):
+        from agentura_sdk.runner.tool_dispatch import plan_batches
+
+        calls = [
+            ("read", "a"), ("read", "b"), ("write", "a"), ("read", "c"),
+            ("approve", None), ("read", "d"), ("read", "e"),
+        ]
+        batches = plan_batches(
+            calls,
+            is_sequential=lambda c: c[0] == "approve",
+            conflict_key=lambda c: c[1],
+        )
+        assert batches == [[0, 1], [2, 3], [4], [5, 6]]
+
+    @pytest.mark.asyncio
+    async def test_independent_calls_overlap_and_keep_order(self, monkeypatch):
+        running = 0
+        peak = 0
+
+        async def fake_execute(sandbox, name, args, tool_server_map):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.2 if args["n"] == 0 else 0.05)
+            running -= 1
+            return f"{name}-{args['n']}"
+
+        monkeypatch.setattr(agent_executor, "_execute_tool", fake_execute)
+        calls = [(f"c{n}", "lookup", {"n": n}) for n in range(4)]
+        calls.append(("c4", "run_command", {"n": 4, "command": "ls"}))
+        calls.append(("c5", "task_complete", {"n": 5}))
+        calls.append(("c6", "lookup", {"n": 6}))
+
+        start = time.monotonic()
+        runs = await agent_executor._run_tool_calls(
+            None, calls, {}, {}, sequential=set(agent_executor._SEQUENTIAL_TOOLS), max_concurrency=3,
+        )
+        elapsed = time.monotonic() - start
+
+        assert [(cid, out) for cid, _, _, out in runs] == [
+            ("c0", "lookup-0"), ("c1", "lookup-1"), ("c2", "lookup-2"), ("c3", "lookup-3"),
+            ("c4", "run_command-4"), ("c5", "task_complete-5"),
+        ]
+        assert peak == 3
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_of_one_is_sequential(self, monkeypatch):
+        running = 0
+        peak = 0
+
+        async def fake_execute(sandbox, name, args, tool_server_map):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "ok"
+
+        monkeypatch.setattr(agent_executor, "_execute_tool", fake_execute)
+        calls = [(f"c{n}", "lookup", {}) for n in range(3)]
+        await agent_executor._run_tool_calls(None, calls, {}, {}, sequential=set(), max_concurrency=1)
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_streaming_yields_each_tool_as_it_finishes(self, monkeypatch):
+        from agentura_sdk.types import SandboxConfig, SkillContext, SkillRole
+
+        async def fake_execute(sandbox, name, args, tool_server_map):
+            await asyncio.sleep(0.3 if args["n"] == 0 else 0.01)
+            return f"{name}-{args['n']}"
+
+        class FakeProvider:
+            def __init__(self):
+                self.turns = [
+                    (True, [("c0", "lookup", {"n": 0}), ("c1", "lookup", {"n": 1})], "", 0, 0),
+                    (True, [("c2", "task_complete", {"n": 2, "summary": "done"})], "", 0, 0),
+                ]
+                self.transcript = []
+
+            def add_user_message(self, content):
+                pass
+
+            async def call_async(self):
+                return self.turns.pop(0)
+
+            def add_tool_results(self, results):
+                self.transcript.append(results)
+
+        async def fake_tool_set(bindings):
+            return [], {}
+
+        async def fake_create(config):
+            return None
+
+        async def fake_close(sandbox):
+            pass
+
+        provider = FakeProvider()
+        monkeypatch.setattr(agent_executor, "_execute_tool", fake_execute)
+        monkeypatch.setattr(agent_executor, "_build_tool_set", fake_tool_set)
+        monkeypatch.setattr(agent_executor, "_build_prompt_with_memory", lambda ctx: "")
+        monkeypatch.setattr(agent_executor, "_get_provider", lambda *a, **kw: provider)
+        monkeypatch.setattr(agent_executor.sandbox_mod, "create", fake_create)
+        monkeypatch.setattr(agent_executor.sandbox_mod, "close", fake_close)
+
+        ctx = SkillContext(
+            skill_name="worker", domain="hr", role=SkillRole.AGENT, model="anthropic/claude-sonnet-4.5",
+            system_prompt="", input_data={}, sandbox_config=SandboxConfig(tool_concurrency=2),
+        )
+        start = time.monotonic()
+        seen = []
+        async for event in agent_executor.execute_agent_streaming(ctx):
+            seen.append((getattr(event, "tool_output", None), time.monotonic() - start))
+
+        assert [out for out, _ in seen[:3]] == ["lookup-1", "lookup-0", "task_complete-2"]
+        assert seen[0][1] < 0.2
+        assert provider.transcript[0] == [("c0", "lookup-0"), ("c1", "lookup-1")]
+        assert seen[-1][0] is None
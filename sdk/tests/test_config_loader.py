@@ -0,0 +1,112 @@
+"""Tests for the cached per-skill runtime config."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from agentura_sdk.runner.config_loader import (
+    invalidate_runtime_configs,
+    load_runtime_config,
+)
+
+CONFIG_YAML = """domain:
+  name: dev
+sandbox:
+  executor: ptc
+  max_iterations: 12
+mcp_tools:
+  - server: github
+    tools: ["create_pr"]
+    approval_required: true
+verify:
+  enabled: true
+  criteria: ["has tests"]
+guardrails:
+  human_in_loop:
+    require_approval: true
+    approval_prompt: "Check the PR"
+feedback:
+  capture_failure_cases: true
+notifications:
+  - channel: slack
+    on: [error]
+    config:
+      channel_id: C123
+"""
+
+
+@pytest.fixture
+def skill_dir(tmp_path: Path) -> Path:
+    d = tmp_path / "skills" / "dev" / "deployer"
+    d.mkdir(parents=True)
+    (d / "agentura.config.yaml").write_text(CONFIG_YAML)
+    invalidate_runtime_configs()
+    yield d
+    invalidate_runtime_configs()
+
+
+class TestRuntimeConfig:
+    def test_sections_parsed(self, skill_dir: Path):
+        cfg = load_runtime_config(skill_dir)
+        assert cfg.sandbox.executor == "ptc"
+        assert cfg.sandbox.max_iterations == 12
+        assert cfg.mcp_tools[0]["approval_required"] is True
+        assert cfg.verify.criteria == ["has tests"]
+        assert cfg.requires_approval
+        assert cfg.approval_prompt == "Check the PR"
+        assert cfg.feedback.capture_failure_cases
+        assert cfg.notifications[0]["config"]["channel_id"] == "C123"
+
+    def test_missing_file_yields_defaults(self, tmp_path: Path):
+        cfg = load_runtime_config(tmp_path / "nowhere")
+        assert cfg.sandbox is None
+        assert cfg.verify is None
+        assert cfg.mcp_tools == []
+        assert not cfg.requires_approval
+
+    def test_invalid_section_falls_back_alone(self, skill_dir: Path):
+        (skill_dir / "agentura.config.yaml").write_text(
+            "sandbox:\n  timeout: not-a-number\n  max_iterations: 7\nfeedback:\n  capture_failure_cases: true\n"
+        )
+        cfg = load_runtime_config(skill_dir)
+        assert cfg.sandbox.timeout == 300
+        assert cfg.sandbox.max_iterations == 7
+        assert cfg.feedback.capture_failure_cases
+
+    def test_invalid_section_is_not_logged_raw(self, skill_dir: Path, caplog):
+        (skill_dir / "agentura.config.yaml").write_text(
+            "guardrails:\n  budget: lots\n  human_in_loop:\n    webhook_secret: s3cret\n"
+        )
+        with caplog.at_level("WARNING"):
+            cfg = load_runtime_config(skill_dir)
+        assert cfg.guardrails.human_in_loop == {"webhook_secret": "s3cret"}
+        assert "budget" in caplog.text
+        assert "s3cret" not in caplog.text
+
+    def test_verify_disabled_is_none(self, skill_dir: Path):
+        (skill_dir / "agentura.config.yaml").write_text("verify:\n  enabled: false\n")
+        assert load_runtime_config(skill_dir).verify is None
+
+
+class TestRuntimeConfigCache:
+    def test_parsed_once_while_unchanged(self, skill_dir: Path):
+        assert load_runtime_config(skill_dir) is load_runtime_config(skill_dir)
+
+    def test_edit_is_picked_up(self, skill_dir: Path):
+        first = load_runtime_config(skill_dir)
+        path = skill_dir / "agentura.config.yaml"
+        path.write_text("sandbox:\n  executor: claude-code\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        second = load_runtime_config(skill_dir)
+        assert second is not first
+        assert second.sandbox.executor == "claude-code"
+
+    def test_watcher_invalidation(self, skill_dir: Path):
+        first = load_runtime_config(skill_dir)
+        assert invalidate_runtime_configs(skill_dir / "agentura.config.yaml") == 1
+        assert load_runtime_config(skill_dir) is not first
+        assert invalidate_runtime_configs(skill_dir / "SKILL.md") == 0
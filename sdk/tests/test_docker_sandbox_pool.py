@@ -0,0 +1,145 @@
+"""Tests for the Docker sandbox warm container pool (container lifecycle faked)."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from agentura_sdk.sandbox import docker_sandbox
+from agentura_sdk.sandbox.docker_sandbox import DockerSandbox
+from agentura_sdk.types import SandboxConfig
+
+
+class FakeDocker:
+    def __init__(self):
+        self.started: list[tuple[int, int]] = []
+        self.removed: list[str] = []
+        self.resets: list[str] = []
+        self.reset_ok = True
+
+    async def start(self, cfg, env_vars):
+        await asyncio.sleep(0.05)  # container boot
+        self.started.append((cfg.cpu, cfg.memory))
+        return DockerSandbox(container_id=f"c{len(self.started)}", host_port=10_000 + len(self.started))
+
+    async def remove(self, sandbox):
+        self.removed.append(sandbox.container_id)
+
+    async def reset(self, sandbox):
+        self.resets.append(sandbox.container_id)
+        return self.reset_ok
+
+
+async def _settle(pool):
+    while pool._tasks:
+        await asyncio.gather(*list(pool._tasks))
+
+
+@pytest_asyncio.fixture
+async def docker(monkeypatch):
+    async def healthy(sandbox):
+        return True
+
+    fake = FakeDocker()
+    monkeypatch.setattr(docker_sandbox, "WARM_POOL_SIZE", 1)
+    monkeypatch.setattr(docker_sandbox, "WARM_POOL_MAX_USES", 3)
+    monkeypatch.setattr(docker_sandbox, "_start_container", fake.start)
+    monkeypatch.setattr(docker_sandbox, "close_container", fake.remove)
+    monkeypatch.setattr(docker_sandbox, "_reset", fake.reset)
+    monkeypatch.setattr(docker_sandbox, "_is_healthy", healthy)
+    yield fake, docker_sandbox.get_container_pool()
+    await docker_sandbox.aclose_container_pool()
+
+
+class TestDockerWarmPool:
+    @pytest.mark.asyncio
+    async def test_reset_container_is_reused(self, docker):
+        fake, pool = docker
+        cfg = SandboxConfig(cpu=2, memory=1024)
+        docker_sandbox.prewarm(cfg)
+        await _settle(pool)
+
+        first = await docker_sandbox.create(cfg)
+        await _settle(pool)
+        await docker_sandbox.close(first)
+        await _settle(pool)
+        assert fake.resets == [first.container_id]
+        assert await docker_sandbox.create(cfg) is first
+
+        metrics = docker_sandbox.pool_metrics()
+        assert metrics["cold_starts_total"] == 0
+        assert metrics["warm_hit_ratio"] == 1.0
+        assert metrics["lease_ms_avg"] < 50
+        assert fake.removed == []
+
+    @pytest.mark.asyncio
+    async def test_classes_are_per_resources(self, docker):
+        fake, pool = docker
+        small = await docker_sandbox.create(SandboxConfig(cpu=1, memory=512))
+        big = await docker_sandbox.create(SandboxConfig(cpu=2, memory=2048))
+        await _settle(pool)
+        assert small is not big
+        assert sorted(fake.started) == [(1, 512), (1, 512), (2, 2048), (2, 2048)]
+
+    @pytest.mark.asyncio
+    async def test_failed_reset_and_max_uses_recycle(self, docker):
+        fake, pool = docker
+        cfg = SandboxConfig()
+        box = await docker_sandbox.create(cfg)
+        fake.reset_ok = False
+        await docker_sandbox.close(box)
+        await _settle(pool)
+        assert fake.removed == [box.container_id]
+        assert docker_sandbox.pool_metrics()["reset_failures_total"] == 1
+
+        fake.reset_ok = True
+        reused = await docker_sandbox.create(cfg)
+        await _settle(pool)
+        for _ in range(2):
+            await docker_sandbox.close(reused)
+            await _settle(pool)
+            assert await docker_sandbox.create(cfg) is reused
+        await docker_sandbox.close(reused)  # third lease done — max uses reached
+        await _settle(pool)
+        assert reused.container_id in fake.removed
+        assert len(fake.resets) == 3  # 1 failed + 2 successful; the worn-out one isn't reset
+
+
+class FakeContainer:
+    def __init__(self, wipe_exit=0):
+        self.calls: list[str] = []
+        self.wipe_exit = wipe_exit
+        self.attrs = {}
+
+    def restart(self, timeout):
+        self.calls.append("restart")
+
+    def exec_run(self, cmd, user):
+        self.calls.append(f"exec:{user}")
+        assert "/var/tmp" in cmd[-1] and "/dev/shm" in cmd[-1]
+        return type("Result", (), {"exit_code": self.wipe_exit})()
+
+    def reload(self):
+        self.attrs = {"NetworkSettings": {"Ports": {"8080/tcp": [{"HostPort": "32001"}]}}}
+
+
+class TestDockerReset:
+    @pytest.mark.asyncio
+    async def test_reset_restarts_runtime_then_wipes(self, monkeypatch):
+        container = FakeContainer()
+        waited = []
+
+        async def healthy(port):
+            waited.append(port)
+
+        monkeypatch.setattr(docker_sandbox, "_get_docker_client", lambda: type(
+            "Client", (), {"containers": type("Containers", (), {"get": lambda self, cid: container})()},
+        )())
+        monkeypatch.setattr(docker_sandbox, "_wait_for_healthy", healthy)
+        sandbox = DockerSandbox(container_id="c1", host_port=31000)
+        assert await docker_sandbox._reset(sandbox)
+        assert container.calls == ["restart", "exec:root"]
+        assert sandbox.host_port == waited[0] == 32001
+
+        container.wipe_exit = 1
+        assert not await docker_sandbox._reset(sandbox)
@@ -0,0 +1,40 @@
+"""Tests for fleet NOTIFY fan-out — runs against PostgreSQL if DATABASE_URL is set, skips otherwise."""
+
+import asyncio
+import os
+
+import pytest
+
+HAS_PG = bool(os.environ.get("DATABASE_URL"))
+
+
+@pytest.mark.skipif(not HAS_PG, reason="DATABASE_URL not set")
+class TestFleetListener:
+    def setup_method(self):
+        from agentura_sdk.memory.fleet_store import FleetStore
+        self.dsn = os.environ["DATABASE_URL"]
+        self.store = FleetStore(self.dsn)
+
+    @pytest.mark.asyncio
+    async def test_updates_fan_out_by_session(self):
+        from agentura_sdk.server.fleet_listener import FleetListener
+
+        session_id = self.store.create_session("review", total_agents=1)
+        other_id = self.store.create_session("review", total_agents=1)
+        agent_id = f"{session_id}-agent"
+        self.store.create_agent(session_id, agent_id, "dev/reviewer")
+
+        listener = FleetListener(self.dsn)
+        async with listener.subscribe(session_id) as updates, listener.subscribe(other_id) as other:
+            assert listener.connected
+            await asyncio.to_thread(self.store.update_agent_status, agent_id, "completed", success=True, cost_usd=0.2)
+            await asyncio.to_thread(self.store.update_session_status, session_id, "completed", completed_agents=1)
+
+            agent = await asyncio.wait_for(updates.get(), 5)
+            assert (agent["event"], agent["agent_id"], agent["status"], agent["success"]) == (
+                "agent_update", agent_id, "completed", True,
+            )
+            session = await asyncio.wait_for(updates.get(), 5)
+            assert (session["event"], session["status"], session["completed_agents"]) == ("session_update", "completed", 1)
+            assert other.empty()
+        assert not listener._subscribers
@@ -0,0 +1,112 @@
+"""Tests for event-driven file IPC: the sandbox-runtime watcher and ipc_protocol.poll_response."""
+
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from agentura_sdk.sandbox import ipc_protocol
+from agentura_sdk.sandbox.ipc_protocol import (
+    IPCRequest,
+    IPCResponse,
+    poll_response,
+    write_request,
+    write_response,
+)
+
+RUNTIME_MAIN = Path(__file__).resolve().parents[2] / "sandbox-runtime" / "main.py"
+
+needs_inotify = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+
+
+@pytest.fixture(scope="module")
+def runtime():
+    spec = importlib.util.spec_from_file_location("sandbox_runtime_main", RUNTIME_MAIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _respond_later(base, request_id, delay):
+    def write():
+        time.sleep(delay)
+        write_response(IPCResponse(id=request_id, result="done", error=None), base)
+
+    threading.Thread(target=write, daemon=True).start()
+
+
+class TestPollResponse:
+    @needs_inotify
+    def test_wakes_on_write_instead_of_poll_interval(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ipc_protocol, "POLL_INTERVAL", 5.0)  # would dominate if we polled
+        _respond_later(tmp_path, "r1", 0.1)
+        started = time.monotonic()
+        resp = poll_response("r1", tmp_path, timeout=3)
+        assert resp.result == "done"
+        assert time.monotonic() - started < 1.0
+        assert not (tmp_path / "r1.json").exists()
+
+    def test_falls_back_to_polling(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ipc_protocol._Inotify, "watch", classmethod(lambda cls, d: None))
+        monkeypatch.setattr(ipc_protocol, "POLL_INTERVAL", 0.01)
+        _respond_later(tmp_path, "r2", 0.05)
+        assert poll_response("r2", tmp_path, timeout=3).result == "done"
+        assert poll_response("missing", tmp_path, timeout=0.05).error == "IPC timeout after 0.05s"
+
+
+class TestRuntimeWatcher:
+    @needs_inotify
+    def test_requests_run_concurrently_and_respond_promptly(self, runtime, tmp_path, monkeypatch):
+        requests_dir, responses_dir = tmp_path / "requests", tmp_path / "responses"
+        monkeypatch.setattr(runtime, "IPC_REQUESTS", requests_dir)
+        monkeypatch.setattr(runtime, "IPC_RESPONSES", responses_dir)
+        monkeypatch.setattr(runtime, "IPC_POLL_INTERVAL", 5.0)
+
+        def slow_dispatch(tool, args):
+            time.sleep(0.5)
+            return f"{tool}:{args['n']}", None
+
+        monkeypatch.setattr(runtime, "_dispatch_ipc", slow_dispatch)
+        requests_dir.mkdir()
+        early = write_request(IPCRequest.create("echo", {"n": -1}), requests_dir)  # before the watcher
+        threading.Thread(target=runtime._ipc_watcher, daemon=True).start()
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        reqs = [IPCRequest.create("echo", {"n": i}) for i in range(4)]
+        for req in reqs:
+            write_request(req, requests_dir)
+        results = [poll_response(req.id, responses_dir, timeout=5).result for req in reqs]
+        assert results == [f"echo:{i}" for i in range(4)]
+        assert time.monotonic() - started < 1.5  # 4 × 0.5s serially would be 2s+
+        assert poll_response(early.stem, responses_dir, timeout=5).result == "echo:-1"
+        assert list(requests_dir.iterdir()) == []
+
+    def test_inotify_error_falls_back_to_polling(self, runtime, tmp_path, monkeypatch):
+        requests_dir, responses_dir = tmp_path / "requests", tmp_path / "responses"
+        monkeypatch.setattr(runtime, "IPC_REQUESTS", requests_dir)
+        monkeypatch.setattr(runtime, "IPC_RESPONSES", responses_dir)
+        monkeypatch.setattr(runtime, "IPC_POLL_INTERVAL", 0.05)
+        monkeypatch.setattr(runtime, "_dispatch_ipc", lambda tool, args: (f"{tool}:{args['n']}", None))
+
+        class BrokenInotify:
+            reads = 0
+            closed = False
+
+            def read(self, timeout):
+                BrokenInotify.reads += 1
+                raise OSError("inotify fd gone")
+
+            def close(self):
+                BrokenInotify.closed = True
+
+        monkeypatch.setattr(runtime._Inotify, "watch", classmethod(lambda cls, d: BrokenInotify()))
+        threading.Thread(target=runtime._ipc_watcher, daemon=True).start()
+        time.sleep(0.3)
+
+        req = write_request(IPCRequest.create("echo", {"n": 7}), requests_dir)
+        assert poll_response(req.stem, responses_dir, timeout=5).result == "echo:7"
+        assert BrokenInotify.reads == 1 and BrokenInotify.closed
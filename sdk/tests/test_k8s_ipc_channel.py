@@ -0,0 +1,181 @@
+"""Tests for the persistent exec IPC channel, driving the real sandbox-runtime stdio agent."""
+
+import asyncio
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from agentura_sdk.sandbox import k8s_file_sandbox
+from agentura_sdk.sandbox.ipc_protocol import FrameDecoder, encode_frame
+from agentura_sdk.sandbox.k8s_file_sandbox import K8sFileSandbox
+
+RUNTIME_MAIN = Path(__file__).resolve().parents[2] / "sandbox-runtime" / "main.py"
+
+
+class SubprocessExec:
+    """Stands in for the kubernetes WSClient; the exec'd agent runs as a local subprocess."""
+
+    def __init__(self, command):
+        self.proc = subprocess.Popen(
+            [sys.executable, str(RUNTIME_MAIN), *command[2:]],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        self._chunks: queue.Queue = queue.Queue()
+        self._stdout = ""
+        self._open = True
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self):
+        while chunk := os.read(self.proc.stdout.fileno(), 65536):
+            self._chunks.put(chunk.decode("ascii"))
+        self._chunks.put(None)
+
+    def is_open(self):
+        return self._open
+
+    def update(self, timeout):
+        try:
+            chunk = self._chunks.get(timeout=timeout)
+        except queue.Empty:
+            return
+        if chunk is None:
+            self._open = False
+        else:
+            self._stdout += chunk
+
+    def peek_stdout(self):
+        return bool(self._stdout)
+
+    def read_stdout(self):
+        data, self._stdout = self._stdout, ""
+        return data
+
+    def peek_stderr(self):
+        return False
+
+    def write_stdin(self, data):
+        self.proc.stdin.write(data.encode("ascii"))
+        self.proc.stdin.flush()
+
+    def close(self):
+        self._open = False
+        self.proc.stdin.close()
+        self.proc.wait(timeout=5)
+
+
+@pytest.fixture
+def execs(monkeypatch):
+    opened: list[SubprocessExec] = []
+
+    def fake_stream(func, pod_name, namespace, *, command, **kwargs):
+        assert kwargs["stdin"] and not kwargs["_preload_content"]
+        opened.append(SubprocessExec(command))
+        return opened[-1]
+
+    monkeypatch.setattr(k8s_file_sandbox, "stream", SimpleNamespace(stream=fake_stream))
+    yield opened
+    for ws in opened:
+        ws.proc.kill()
+
+
+def _sandbox():
+    return K8sFileSandbox(pod_name="sandbox-ipc-1", namespace="agentura", api=SimpleNamespace(
+        connect_get_namespaced_pod_exec=None,
+    ))
+
+
+class TestFraming:
+    def test_decoder_handles_split_and_coalesced_frames(self):
+        payloads = [json.dumps({"id": "a", "result": "héllo\n12\n"}), json.dumps({"id": "b"})]
+        wire = "".join(encode_frame(p) for p in payloads)
+        decoder = FrameDecoder()
+        got = []
+        for i in range(0, len(wire), 7):
+            got += decoder.feed(wire[i:i + 7])
+        assert got == payloads
+        assert decoder.feed(wire) == payloads
+
+
+class TestExecChannel:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_exec(self, execs, tmp_path):
+        sandbox = _sandbox()
+        results = await asyncio.gather(*(
+            k8s_file_sandbox.write_file(sandbox, f"/tmp/{tmp_path.name}-{i}.txt", f"content {i}")
+            for i in range(20)
+        ))
+        assert all(r.startswith("Written") for r in results)
+        contents = await asyncio.gather(*(
+            k8s_file_sandbox.read_file(sandbox, f"/tmp/{tmp_path.name}-{i}.txt") for i in range(20)
+        ))
+        assert contents == [f"content {i}" for i in range(20)]
+        assert len(execs) == 1
+        await k8s_file_sandbox.close(sandbox)
+        assert sandbox.channel.closed
+
+    @pytest.mark.asyncio
+    async def test_user_code_cannot_corrupt_the_stream(self, execs):
+        sandbox = _sandbox()
+        code = "import os, sys\nos.write(1, b'999\\n')\nprint(sys.stdin.read() or 'no stdin')"
+        assert await k8s_file_sandbox.run_code(sandbox, code) == "no stdin\n"
+        assert await k8s_file_sandbox.run_code(sandbox, "print(6 * 7)") == "42\n"
+        await k8s_file_sandbox.close(sandbox)
+
+    @pytest.mark.asyncio
+    async def test_lost_channel_fails_in_flight_call_and_reopens(self, execs):
+        sandbox = _sandbox()
+        call = asyncio.create_task(k8s_file_sandbox.run_code(sandbox, "import time; time.sleep(30)"))
+        while not execs or not sandbox.channel:
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.2)
+        execs[0].proc.kill()
+        assert "channel closed" in await asyncio.wait_for(call, 5)
+        assert await k8s_file_sandbox.run_code(sandbox, "print('back')") == "back\n"
+        assert len(execs) == 2
+        await k8s_file_sandbox.close(sandbox)
+
+    @pytest.mark.asyncio
+    async def test_image_without_agent_falls_back_to_file_ipc(self, monkeypatch):
+        def no_agent(*args, **kwargs):
+            raise RuntimeError("exec failed")
+
+        sent = []
+        monkeypatch.setattr(k8s_file_sandbox, "stream", SimpleNamespace(stream=no_agent))
+        monkeypatch.setattr(k8s_file_sandbox, "_send_ipc_request", lambda sb, tool, args: sent.append(tool) or "ok")
+        sandbox = _sandbox()
+        await k8s_file_sandbox._open_initial_channel(sandbox)
+        assert await k8s_file_sandbox.run_command(sandbox, "ls") == "ok"
+        assert await k8s_file_sandbox.run_command(sandbox, "ls") == "ok"
+        assert sandbox.file_ipc_only and sent == ["execute", "execute"]
+
+    @pytest.mark.asyncio
+    async def test_failed_reopen_returns_error_without_falling_back(self, execs, monkeypatch):
+        sandbox = _sandbox()
+        await k8s_file_sandbox._open_initial_channel(sandbox)
+        assert await k8s_file_sandbox.run_code(sandbox, "print(1)") == "1\n"
+        sandbox.channel.close()
+
+        working_stream = k8s_file_sandbox.stream
+        attempts = []
+
+        def api_down(*args, **kwargs):
+            attempts.append(1)
+            raise RuntimeError("apiserver unavailable")
+
+        monkeypatch.setattr(k8s_file_sandbox, "stream", SimpleNamespace(stream=api_down))
+        monkeypatch.setattr(k8s_file_sandbox, "CHANNEL_REOPEN_BACKOFF", 0.01)
+        result = await k8s_file_sandbox.run_code(sandbox, "print(2)")
+        assert result.startswith("[error] sandbox IPC channel unavailable")
+        assert len(attempts) == k8s_file_sandbox.CHANNEL_REOPEN_ATTEMPTS
+        assert not sandbox.file_ipc_only
+
+        monkeypatch.setattr(k8s_file_sandbox, "stream", working_stream)
+        assert await k8s_file_sandbox.run_code(sandbox, "print(3)") == "3\n"
+        await k8s_file_sandbox.close(sandbox)
@@ -0,0 +1,142 @@
+"""Tests for the pooled MCP Streamable HTTP sessions used by post-approval tool runs."""
+
+import json
+
+import pytest
+from werkzeug import Response
+
+from agentura_sdk.mcp import session_pool
+from agentura_sdk.mcp.session_pool import McpSessionPool
+
+
+class FakeMcpServer:
+    """Streamable HTTP server that issues session ids and can forget them."""
+
+    def __init__(self):
+        self.sessions: set[str] = set()
+        self.initializes = 0
+        self.calls: list[str] = []
+
+    def __call__(self, request):
+        body = request.get_json()
+        if body["method"] == "initialize":
+            self.initializes += 1
+            session_id = f"sess-{self.initializes}"
+            self.sessions.add(session_id)
+            return Response(json.dumps({"jsonrpc": "2.0", "id": body["id"], "result": {}}),
+                            headers={"Mcp-Session-Id": session_id}, content_type="application/json")
+        if request.headers.get("Mcp-Session-Id") not in self.sessions:
+            return Response("session not found", status=404)
+        if body["method"] == "notifications/initialized":
+            return Response("", status=202)
+        self.calls.append(body["params"]["name"])
+        result = {"content": [{"type": "text", "text": f"ran {body['params']['arguments']['n']}"}]}
+        return Response(f"event: message\ndata: {json.dumps({'jsonrpc': '2.0', 'id': body['id'], 'result': result})}\n\n",
+                        content_type="text/event-stream")
+
+
+@pytest.fixture
+def mcp(httpserver):
+    server = FakeMcpServer()
+    httpserver.expect_request("/mcp", method="POST").respond_with_handler(server)
+    return server, httpserver.url_for("/mcp")
+
+
+class TestMcpSessionPool:
+    @pytest.mark.asyncio
+    async def test_one_handshake_for_many_calls(self, mcp):
+        server, url = mcp
+        pool = McpSessionPool()
+        for n in range(20):
+            result = await pool.call_tool(url, "kubectl_apply", {"n": n})
+            assert result["content"][0]["text"] == f"ran {n}"
+        assert server.initializes == 1
+        assert pool.handshakes == 1
+        assert len(server.calls) == 20
+
+    @pytest.mark.asyncio
+    async def test_expired_session_is_reinitialized(self, mcp):
+        server, url = mcp
+        pool = McpSessionPool()
+        await pool.call_tool(url, "kubectl_get", {"n": 1})
+        server.sessions.clear()
+
+        result = await pool.call_tool(url, "kubectl_get", {"n": 2})
+        assert result["content"][0]["text"] == "ran 2"
+        assert server.initializes == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_session_is_reinitialized(self, mcp, monkeypatch):
+        server, url = mcp
+        pool = McpSessionPool()
+        await pool.call_tool(url, "kubectl_get", {"n": 1})
+        monkeypatch.setattr(session_pool, "MCP_SESSION_IDLE_S", -1.0)
+
+        await pool.call_tool(url, "kubectl_get", {"n": 2})
+        assert server.initializes == 2
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_per_credential(self, mcp):
+        server, url = mcp
+        pool = McpSessionPool()
+        await pool.call_tool(url, "kubectl_get", {"n": 1}, {"Authorization": "Bearer a"})
+        await pool.call_tool(url, "kubectl_get", {"n": 2}, {"Authorization": "Bearer b"})
+        await pool.call_tool(url, "kubectl_get", {"n": 3}, {"Authorization": "Bearer a"})
+        assert server.initializes == 2
+
+
+class _FakeStore:
+    def __init__(self):
+        self.outputs: dict = {}
+
+    def get_execution_by_id(self, execution_id):
+        return {"output_summary": {"summary": "done"}}
+
+    def update_execution_output(self, execution_id, output, outcome=""):
+        self.outputs[execution_id] = (output, outcome)
+
+
+class TestPendingApprovalExecution:
+    @pytest.mark.asyncio
+    async def test_batch_of_approvals_shares_one_session(self, mcp):
+        from agentura_sdk.server.app import _execute_pending_tools
+
+        server, url = mcp
+        store = _FakeStore()
+        pending = [{"tool": "kubectl_apply", "arguments": {"n": n}, "server": url} for n in range(20)]
+        pending.insert(3, {"tool": "unbound", "arguments": {}})
+
+        await _execute_pending_tools("EXEC-1", "", pending, store)
+
+        output, outcome = store.outputs["EXEC-1"]
+        results = output["approval_tool_results"]
+        assert outcome == "approved_failed"
+        assert results[3]["success"] is False
+        assert [r["output"] for r in results if r["success"]] == [f"ran {n}" for n in range(20)]
+        assert server.initializes == 1
+
+    @pytest.mark.asyncio
+    async def test_calls_across_servers_run_in_approval_order(self, monkeypatch):
+        import asyncio
+
+        from agentura_sdk.server import app
+
+        calls: list[tuple[str, int]] = []
+
+        async def fake_call(server_url, tool_name, arguments):
+            calls.append((server_url, arguments["n"]))
+            await asyncio.sleep(0.02 if server_url == "http://slow" else 0)
+            calls.append((server_url, arguments["n"]))
+            return f"ran {arguments['n']}"
+
+        monkeypatch.setattr(app, "_call_mcp_tool_async", fake_call)
+        store = _FakeStore()
+        servers = ["http://slow", "http://fast", "http://fast", "http://slow"]
+        pending = [{"tool": "step", "arguments": {"n": n}, "server": url} for n, url in enumerate(servers)]
+
+        await app._execute_pending_tools("EXEC-2", "", pending, store)
+
+        assert calls == [(url, n) for n, url in enumerate(servers) for _ in range(2)]
+        output, outcome = store.outputs["EXEC-2"]
+        assert outcome == "executed"
+        assert [r["output"] for r in output["approval_tool_results"]] == [f"ran {n}" for n in range(4)]
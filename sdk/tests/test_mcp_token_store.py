@@ -0,0 +1,70 @@
+"""Tests for McpTokenStore caching — runs against PostgreSQL if DATABASE_URL is set, skips otherwise."""
+
+import os
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+HAS_PG = bool(os.environ.get("DATABASE_URL"))
+
+
+@pytest.mark.skipif(not HAS_PG, reason="DATABASE_URL not set")
+class TestMcpTokenStore:
+    def setup_method(self):
+        from agentura_sdk.store.mcp_token_store import McpTokenStore
+        self.store = McpTokenStore(os.environ["DATABASE_URL"])
+        self.user = f"user-{uuid4().hex[:8]}"
+
+    def _expire_in_db(self):
+        conn = self.store._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE mcp_user_tokens SET access_token = 'changed-behind-cache' WHERE user_identifier = %s",
+                    (self.user,),
+                )
+            conn.commit()
+        finally:
+            self.store._pool.putconn(conn)
+
+    def test_valid_token_served_from_cache(self):
+        self.store.save_token(self.user, "granola", "tok-1", expires_at=datetime.now(UTC) + timedelta(hours=1))
+        assert self.store.refresh_if_expired(self.user, "granola") == "tok-1"
+        self._expire_in_db()
+        assert self.store.refresh_if_expired(self.user, "granola") == "tok-1"
+        # Writes through the store invalidate the cached entry
+        self.store.save_token(self.user, "granola", "tok-2", expires_at=datetime.now(UTC) + timedelta(hours=1))
+        assert self.store.refresh_if_expired(self.user, "granola") == "tok-2"
+        self.store.delete_token(self.user, "granola")
+        assert self.store.refresh_if_expired(self.user, "granola") is None
+
+    def test_concurrent_refresh_is_single_flight(self, monkeypatch):
+        from agentura_sdk.oauth import providers
+
+        calls = []
+
+        def fake_refresh(provider, refresh_token, client_id, client_secret):
+            calls.append(provider)
+            time.sleep(0.1)
+            return {"access_token": "fresh", "expires_at": datetime.now(UTC) + timedelta(hours=1)}
+
+        monkeypatch.setattr(providers, "refresh_access_token", fake_refresh)
+        self.store.save_token(
+            self.user, "granola", "stale", refresh_token="r-1",
+            expires_at=datetime.now(UTC) - timedelta(minutes=5),
+        )
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.store.refresh_if_expired(self.user, "granola")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == ["fresh"] * 5
+        assert calls == ["granola"]
+        assert self.store.get_token(self.user, "granola")["refresh_token"] == "r-1"
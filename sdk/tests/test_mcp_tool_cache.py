@@ -0,0 +1,135 @@
+"""Tests for the MCP tool-definition cache (TTL + ETag revalidation)."""
+
+import json
+
+import pytest
+from werkzeug import Response
+
+from agentura_sdk.mcp import tool_cache
+
+_TOOLS = [{"name": "search", "description": "Search", "input_schema": {"type": "object"}}]
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    tool_cache.invalidate()
+    yield
+    tool_cache.invalidate()
+
+
+def _expire(server_url: str) -> None:
+    for (url, _), entry in tool_cache._cache.items():
+        if url == server_url:
+            entry.expires_at = 0.0
+
+
+class TestRestToolCache:
+    @pytest.mark.asyncio
+    async def test_fresh_entry_served_without_request(self, httpserver):
+        url = httpserver.url_for("/mcp").rstrip("/")
+        httpserver.expect_oneshot_request("/mcp/tools").respond_with_json(_TOOLS)
+
+        first = await tool_cache.resolve_tools_async(url)
+        second = await tool_cache.resolve_tools_async(url)
+        assert (first.protocol, first.tools) == ("rest", _TOOLS)
+        assert second is first
+        assert len(httpserver.log) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_etag(self, httpserver):
+        url = httpserver.url_for("/mcp").rstrip("/")
+        httpserver.expect_oneshot_request("/mcp/tools").respond_with_json(_TOOLS, headers={"ETag": '"v1"'})
+        httpserver.expect_oneshot_request(
+            "/mcp/tools", headers={"If-None-Match": '"v1"'},
+        ).respond_with_data("", status=304)
+
+        await tool_cache.resolve_tools_async(url)
+        _expire(url)
+        resolved = await tool_cache.resolve_tools_async(url)
+        assert resolved.tools == _TOOLS
+        assert resolved.expires_at > 0
+        httpserver.check_assertions()
+
+    @pytest.mark.asyncio
+    async def test_entries_are_per_auth_identity(self, httpserver):
+        url = httpserver.url_for("/mcp").rstrip("/")
+        httpserver.expect_request("/mcp/tools", headers={"Authorization": "Bearer a"}).respond_with_json(_TOOLS)
+        httpserver.expect_request("/mcp/tools", headers={"Authorization": "Bearer b"}).respond_with_json([])
+
+        alice = await tool_cache.resolve_tools_async(url, {"Authorization": "Bearer a"})
+        bob = await tool_cache.resolve_tools_async(url, {"Authorization": "Bearer b"})
+        assert (alice.tools, bob.tools) == (_TOOLS, [])
+        assert "Bearer a" not in json.dumps([list(k) for k in tool_cache._cache])
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_when_server_fails(self, httpserver):
+        url = httpserver.url_for("/mcp").rstrip("/")
+        httpserver.expect_oneshot_request("/mcp/tools").respond_with_json(_TOOLS)
+        httpserver.expect_request("/mcp/tools").respond_with_data("boom", status=500)
+
+        await tool_cache.resolve_tools_async(url)
+        _expire(url)
+        assert (await tool_cache.resolve_tools_async(url)).tools == _TOOLS
+
+    def test_sync_fetch_shares_cache(self, httpserver):
+        url = httpserver.url_for("/mcp").rstrip("/")
+        httpserver.expect_oneshot_request("/mcp/tools").respond_with_json({"tools": _TOOLS})
+
+        assert tool_cache.fetch_rest(url) == _TOOLS
+        assert tool_cache.fetch_rest(url) == _TOOLS
+
+
+class TestStreamableHttpToolCache:
+    @pytest.mark.asyncio
+    async def test_mcp_protocol_discovery(self, httpserver):
+        url = httpserver.url_for("/rpc")
+
+        def rpc(request):
+            body = request.get_json()
+            if body["method"] == "initialize":
+                return Response(json.dumps({"jsonrpc": "2.0", "id": 0, "result": {}}),
+                                headers={"Mcp-Session-Id": "sess-1"}, content_type="application/json")
+            assert request.headers.get("Mcp-Session-Id") == "sess-1"
+            result = {"tools": [{"name": "notion_search", "inputSchema": {"type": "object"}, "annotations": {}}]}
+            return Response(f"event: message\ndata: {json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': result})}\n\n",
+                            content_type="text/event-stream")
+
+        httpserver.expect_request("/rpc/tools").respond_with_data("", status=405)
+        httpserver.expect_request("/rpc", method="POST").respond_with_handler(rpc)
+
+        resolved = await tool_cache.resolve_tools_async(url)
+        assert resolved.protocol == "mcp"
+        assert resolved.tools == [{"name": "notion_search", "description": "", "input_schema": {"type": "object"}}]
+
+    @pytest.mark.asyncio
+    async def test_ptc_request_carries_resolved_schemas(self, httpserver):
+        from agentura_sdk.runner.ptc_executor import _resolve_tool_schemas
+
+        url = httpserver.url_for("/mcp").rstrip("/")
+        httpserver.expect_request("/mcp/tools").respond_with_json(_TOOLS)
+        servers = {"search": {"url": url}, "down": {"url": "http://127.0.0.1:9"}}
+
+        await _resolve_tool_schemas(servers)
+        assert servers["search"] == {"url": url, "tools": _TOOLS, "protocol": "rest"}
+        assert servers["down"] == {"url": "http://127.0.0.1:9"}
+
+
+class TestCacheBounds:
+    def test_long_expired_identities_dropped_on_insert(self, monkeypatch):
+        monkeypatch.setattr(tool_cache, "MCP_TOOLS_CACHE_TTL_S", 10.0)
+        tool_cache._store(("http://a", "token-1"), _TOOLS, "rest")
+        tool_cache._store(("http://a", "token-2"), _TOOLS, "rest")
+        tool_cache._cache[("http://a", "token-1")].expires_at -= 25.0  # stale for over a TTL
+        tool_cache._cache[("http://a", "token-2")].expires_at -= 15.0  # still revalidatable
+
+        tool_cache._store(("http://a", "token-3"), _TOOLS, "rest")
+        assert list(tool_cache._cache) == [("http://a", "token-2"), ("http://a", "token-3")]
+
+    def test_least_recently_used_entry_evicted_at_capacity(self, monkeypatch):
+        monkeypatch.setattr(tool_cache, "MCP_TOOLS_CACHE_MAX_ENTRIES", 2)
+        tool_cache._store(("http://a", ""), _TOOLS, "rest")
+        tool_cache._store(("http://b", ""), _TOOLS, "rest")
+        assert tool_cache.fetch_rest("http://a") == _TOOLS  # fresh hit, marks a as recently used
+
+        tool_cache._store(("http://c", ""), _TOOLS, "rest")
+        assert list(tool_cache._cache) == [("http://a", ""), ("http://c", "")]
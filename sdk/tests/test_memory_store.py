@@ -120,6 +120,288 @@ class TestJSONStore:
         assert len(all_execs) == 2
 
 
+class TestSkillStats:
+    def test_stats_track_logged_executions(self, json_store):
+        assert json_store.get_skill_stats() == {}
+        for outcome, latency in [("accepted", 100), ("accepted", 300), ("error", 200)]:
+            json_store.log_execution("hr/screener", {
+                "outcome": outcome, "latency_ms": latency, "cost_usd": 0.01,
+            })
+        stats = json_store.get_skill_stats("hr/screener")["hr/screener"]
+        assert stats["executions_total"] == 3
+        assert stats["accept_rate"] == 0.67
+        assert stats["health"] == "degraded"
+        assert stats["p50_latency_ms"] == 200.0
+        assert stats["total_cost_usd"] == 0.03
+
+    def test_incremental_matches_rebuild(self, json_store, tmp_path):
+        from agentura_sdk.memory.json_store import JSONStore
+
+        json_store.get_skill_stats()  # prime the in-memory aggregate
+        for i in range(5):
+            json_store.log_execution(f"hr/skill-{i % 2}", {
+                "execution_id": f"EXEC-{i}", "outcome": "accepted", "latency_ms": i * 10,
+            })
+        fresh = JSONStore(knowledge_dir=tmp_path / ".agentura")
+        assert json_store.get_skill_stats() == fresh.get_skill_stats()
+
+    def test_outside_writes_trigger_rebuild(self, json_store, tmp_path):
+        json_store.log_execution("hr/screener", {"outcome": "accepted"})
+        assert json_store.get_skill_stats()["hr/screener"]["executions_total"] == 1
+
+        # e.g. the CLI appending to episodic_memory.json directly
+        path = tmp_path / ".agentura" / "episodic_memory.json"
+        data = json.loads(path.read_text())
+        data["entries"].append({"skill": "hr/screener", "outcome": "error"})
+        path.write_text(json.dumps(data, indent=4))
+        stats = json_store.get_skill_stats()["hr/screener"]
+        assert stats["executions_total"] == 2
+        assert stats["health"] == "degraded"
+
+    def test_percentile_window(self):
+        from agentura_sdk.memory.skill_stats import STATS_WINDOW, SkillStats
+
+        stats = SkillStats(skill="dev/deployer")
+        for i in range(STATS_WINDOW + 50):
+            stats.record({"outcome": "accepted", "latency_ms": i})
+        assert len(stats.latency_samples) == STATS_WINDOW
+        assert stats.latency_samples[0] == 50
+        assert stats.to_dict()["executions_total"] == STATS_WINDOW + 50
+
+
+class TestExecutionQuery:
+    @pytest.fixture
+    def populated(self, json_store):
+        for i in range(7):
+            json_store.log_execution("hr/screener" if i % 2 else "dev/deployer", {
+                "execution_id": f"EXEC-{i:03d}",
+                "timestamp": f"2026-01-01T00:00:0{i}+00:00",
+                "outcome": "accepted" if i < 5 else "error",
+                "input_summary": {"i": i},
+                "triggered_by": "alice" if i < 3 else "bob",
+            })
+        return json_store
+
+    def test_pages_cover_all_rows_once(self, populated):
+        from agentura_sdk.memory.execution_query import encode_cursor
+
+        seen, cursor = [], None
+        while True:
+            page = populated.query_executions(limit=3, cursor=cursor)
+            seen.extend(e["execution_id"] for e in page)
+            if len(page) < 3:
+                break
+            cursor = encode_cursor(page[-1])
+        assert seen == [f"EXEC-{i:03d}" for i in range(6, -1, -1)]
+
+    def test_filters_combine(self, populated):
+        rows = populated.query_executions(domains={"hr"}, outcome="accepted", triggered_by="bob")
+        assert [e["execution_id"] for e in rows] == ["EXEC-003"]
+
+    def test_projection_drops_payloads(self, populated):
+        rows = populated.query_executions(limit=1, include_payload=False)
+        assert "input_summary" not in rows[0]
+        assert rows[0]["execution_id"] == "EXEC-006"
+
+    def test_bad_cursor_rejected(self, populated):
+        with pytest.raises(ValueError):
+            populated.query_executions(cursor="not-a-cursor")
+
+
+class TestPointLookups:
+    def test_execution_detail_lookups(self, json_store):
+        json_store.log_execution("hr/screener", {"execution_id": "EXEC-A"})
+        json_store.log_execution("hr/screener", {"execution_id": "EXEC-B"})
+        json_store.add_correction("hr/screener", {"execution_id": "EXEC-A", "user_correction": "fix"})
+        json_store.add_correction("hr/screener", {"execution_id": "EXEC-B", "user_correction": "other"})
+        json_store.add_reflexion("hr/screener", {"correction_id": "CORR-001", "rule": "r1"})
+        json_store.add_reflexion("hr/screener", {"correction_id": "CORR-002", "rule": "r2"})
+
+        assert json_store.get_execution_by_id("EXEC-A")["execution_id"] == "EXEC-A"
+        assert json_store.get_execution_by_id("EXEC-X") is None
+        corrections = json_store.get_corrections_for_execution("EXEC-A")
+        assert [c["correction_id"] for c in corrections] == ["CORR-001"]
+        reflexions = json_store.get_reflexions_for_corrections(["CORR-001"])
+        assert [r["rule"] for r in reflexions] == ["r1"]
+        assert json_store.get_reflexions_for_corrections([]) == []
+
+    def test_index_refreshes_after_write(self, json_store):
+        assert json_store.get_corrections_for_execution("EXEC-A") == []
+        json_store.add_correction("hr/screener", {"execution_id": "EXEC-A"})
+        assert len(json_store.get_corrections_for_execution("EXEC-A")) == 1
+
+
+class TestAnalytics:
+    @pytest.fixture
+    def populated(self, json_store):
+        rows = [
+            ("hr/screener", "2026-03-01T09:15:00+00:00", "accepted", 100.0, 0.01),
+            ("hr/screener", "2026-03-01T10:45:00+00:00", "corrected", 300.0, 0.03),
+            ("hr/screener", "2026-03-02T08:00:00+00:00", "accepted", 200.0, 0.02),
+            ("finance/audit", "2026-03-02T12:30:00+00:00", "error", 1000.0, 0.10),
+        ]
+        for i, (skill, ts, outcome, latency, cost) in enumerate(rows):
+            json_store.log_execution(skill, {
+                "execution_id": f"EXEC-{i}", "timestamp": ts, "outcome": outcome,
+                "latency_ms": latency, "cost_usd": cost,
+            })
+        json_store.add_correction("hr/screener", {"execution_id": "EXEC-1", "user_correction": "fix"})
+        return json_store
+
+    def test_totals_and_percentiles(self, populated):
+        a = populated.get_analytics()
+        assert a["total_executions"] == 4
+        assert a["outcomes"] == {"accepted": 2, "corrected": 1, "error": 1}
+        assert a["accept_rate"] == 0.5
+        assert a["executions_by_skill"] == {"hr/screener": 3, "finance/audit": 1}
+        assert a["cost_by_skill"]["hr/screener"] == 0.06
+        assert a["latency_by_skill"]["hr/screener"] == 200.0
+        assert a["p50_latency_ms"] == 250.0
+        assert a["p95_latency_ms"] == 895.0
+        assert a["p95_latency_by_skill"]["finance/audit"] == 1000.0
+        assert a["total_corrections"] == 1
+
+    def test_window_is_hour_aligned(self, populated):
+        a = populated.get_analytics(since="2026-03-01T10:59:00Z", until="2026-03-02T08:00:01Z")
+        # [10:00 on the 1st, 09:00 on the 2nd)
+        assert a["total_executions"] == 2
+        assert a["outcomes"] == {"corrected": 1, "accepted": 1}
+
+    def test_domain_scope(self, populated):
+        a = populated.get_analytics(domains={"finance"})
+        assert a["executions_by_skill"] == {"finance/audit": 1}
+        assert a["total_corrections"] == 0
+
+    def test_invalid_bound(self, populated):
+        with pytest.raises(ValueError):
+            populated.get_analytics(since="yesterday")
+
+
+class TestPlatformEvents:
+    def test_writes_append_events(self, json_store):
+        json_store.log_execution("hr/screener", {
+            "execution_id": "EXEC-A", "timestamp": "2026-03-01T09:00:00+00:00", "outcome": "corrected",
+        })
+        json_store.add_correction("hr/screener", {
+            "execution_id": "EXEC-A", "user_correction": "fix", "timestamp": "2026-03-01T10:00:00+00:00",
+        })
+        json_store.add_reflexion("finance/audit", {"rule": "r1", "created_at": "2026-03-01T11:00:00+00:00"})
+
+        events = json_store.query_events()
+        assert [e["event_type"] for e in events] == [
+            "reflexion_generated", "correction_submitted", "skill_executed",
+        ]
+        assert events[2]["severity"] == "warning"
+        assert [e["event_id"] for e in json_store.query_events(domains={"hr"}, event_type="skill_executed")] == [
+            "evt-exec-EXEC-A",
+        ]
+
+    def test_keyset_pages(self, json_store):
+        from agentura_sdk.memory.execution_query import encode_cursor
+
+        for i in range(5):
+            json_store.log_execution("hr/screener", {
+                "execution_id": f"EXEC-{i}", "timestamp": f"2026-03-01T09:00:0{min(i, 3)}+00:00",
+            })
+        first = json_store.query_events(limit=2)
+        rest = json_store.query_events(cursor=encode_cursor(first[-1], "event_id"))
+        assert [e["event_id"] for e in first + rest] == [f"evt-exec-EXEC-{i}" for i in range(4, -1, -1)]
+
+    def test_seeded_from_existing_records(self, json_store):
+        json_store._save("corrections.json", {"corrections": [
+            {"correction_id": "CORR-001", "skill": "hr/screener", "timestamp": "2026-01-01T00:00:00+00:00"},
+        ]})
+        json_store.record_event({"event_id": "evt-test-T1", "event_type": "test_generated", "domain": "hr"})
+        assert {e["event_id"] for e in json_store.query_events()} == {"evt-corr-CORR-001", "evt-test-T1"}
+
+    def test_reflexion_event_uses_stored_rule(self, json_store, tmp_path, monkeypatch):
+        import agentura_sdk.memory
+        from agentura_sdk.cli.correct import (
+            _generate_reflexion,
+            _record_feedback_events,
+        )
+
+        monkeypatch.setenv("AGENTURA_KNOWLEDGE_DIR", str(tmp_path / ".agentura"))
+        monkeypatch.setattr(agentura_sdk.memory, "get_memory_store", lambda: json_store)
+        rid = _generate_reflexion("hr/screener", "CORR-001", {"decision": "hire"}, "reject", {"role": "cto"})
+        stored = json.loads((tmp_path / ".agentura" / "reflexion_entries.json").read_text())["entries"][0]
+        stored["rule"] = "Reject candidates without references"
+        (tmp_path / ".agentura" / "reflexion_entries.json").write_text(json.dumps({"entries": [stored]}))
+
+        _record_feedback_events("hr/screener", "EXEC-A", "reject", "CORR-001", rid)
+        event = json_store.query_events(event_type="reflexion_generated")[0]
+        assert event["message"].endswith("Reject candidates without references")
+        assert event["metadata"]["applies_when"] == stored["applies_when"]
+        assert event["metadata"]["confidence"] == stored["confidence"]
+
+    def test_generated_tests_backfilled_with_live_ids(self, tmp_path):
+        from agentura_sdk.memory.events import (
+            generated_test_id,
+            scan_generated_test_events,
+        )
+        from agentura_sdk.testing.failure_case_generator import (
+            generate_failure_promptfoo_test,
+        )
+        from agentura_sdk.testing.test_generator import generate_promptfoo_test
+
+        skill_dir = tmp_path / "skills" / "hr" / "screener"
+        corrections = generate_promptfoo_test(skill_dir, {}, {}, description="Correction CORR-002: reject")
+        failures = generate_failure_promptfoo_test(skill_dir, {}, {}, execution_id="EXEC-9")
+        (skill_dir / "tests" / "generated" / "test_correction_1.py").write_text("")
+
+        events = scan_generated_test_events(tmp_path / "skills")
+        assert {e["event_id"] for e in events} == {
+            f"evt-test-{generated_test_id('hr/screener', skill_dir / 'tests/generated/test_correction_1.py')}",
+            f"evt-test-{generated_test_id('hr/screener', corrections, 'CORR-002')}",
+            f"evt-test-{generated_test_id('hr/screener', failures, 'EXEC-9')}",
+        }
+        assert all(e["domain"] == "hr" and e["timestamp"] for e in events)
+
+
+class TestTextSearch:
+    @pytest.fixture
+    def populated(self, json_store):
+        json_store.log_execution("hr/screener", {
+            "execution_id": "EXEC-A", "output_summary": {"decision": "route to compliance team"},
+        })
+        json_store.add_correction("hr/screener", {"execution_id": "EXEC-A", "user_correction": "compliance cases go to legal"})
+        json_store.add_reflexion("hr/screener", {"rule": "Route compliance cases to legal"})
+        json_store.add_reflexion("finance/audit", {"rule": "Flag compliance expenses over $500"})
+        return json_store
+
+    def test_ranked_by_kind_and_coverage(self, populated):
+        hits = populated.search_text("compliance legal")
+        assert [h["type"] for h in hits[:2]] == ["reflexion", "correction"]
+        assert hits[0]["score"] == 0.95
+        assert hits[0]["memory"] == "Rule: Route compliance cases to legal"
+
+    def test_scoped_by_domain_skill_and_kind(self, populated):
+        assert {h["skill"] for h in populated.search_text("compliance", domains={"finance"})} == {"finance/audit"}
+        hits = populated.search_text("compliance", skill="hr/screener", kinds=("reflexion",))
+        assert [h["type"] for h in hits] == ["reflexion"]
+        assert populated.search_text("an") == []
+
+
+class TestMemoryStats:
+    def test_counts_by_kind_and_domain(self, json_store):
+        json_store.log_execution("hr/screener", {"execution_id": "EXEC-A"})
+        json_store.log_execution("finance/audit", {"execution_id": "EXEC-B"})
+        json_store.add_correction("hr/screener", {"execution_id": "EXEC-A", "user_correction": "fix"})
+        json_store.add_reflexion("hr/screener", {"rule": "be careful"})
+
+        stats = json_store.stats()
+        assert (stats["executions"], stats["corrections"], stats["reflexions"], stats["total"]) == (2, 1, 1, 4)
+        assert stats["skills"] == ["finance/audit", "hr/screener"]
+        assert json_store.stats({"finance"}) == {
+            "executions": 1, "corrections": 0, "reflexions": 0, "total": 1, "skills": ["finance/audit"],
+        }
+
+    def test_counters_follow_writes(self, json_store):
+        assert json_store.stats()["total"] == 0
+        json_store.log_execution("hr/screener", {"execution_id": "EXEC-A"})
+        assert json_store.stats()["executions"] == 1
+
+
 class TestMemoryStoreFallback:
     def test_returns_json_store_without_api_key(self, mem0_fallback):
         from agentura_sdk.memory.json_store import JSONStore
@@ -154,3 +154,44 @@ class TestSkillLoaderReflexionIds:
             assert "REFL-001" in ids
         finally:
             os.chdir(old_dir)
+
+
+class TestMemRLOutcome:
+    def test_outcome_folds_injection_and_success(self, store: JSONStore):
+        _add_reflexion(store, "dev/deployer", "REFL-001")
+        store.log_execution("dev/deployer", {"execution_id": "EXEC-001"})
+        store.record_reflexion_outcome("EXEC-001", ["REFL-001"], helped=True)
+        entry = store.get_reflexions("dev/deployer")[0]
+        assert (entry["times_injected"], entry["times_helped"]) == (1, 1)
+        assert abs(entry["utility_score"] - 0.6) < 0.01
+
+
+class TestMemRLAggregator:
+    def test_deltas_accumulate_until_flush(self):
+        from agentura_sdk.memory.memrl import MemRLAggregator
+
+        applied: list[dict] = []
+        aggregator = MemRLAggregator(applied.append, flush_interval_s=60)
+        aggregator.add(["REFL-001", "REFL-002", "REFL-001"], injected=1, helped=1)
+        aggregator.add(["REFL-001"], injected=1)
+        assert applied == []
+        aggregator.close()
+        assert applied == [{"REFL-001": (2, 1), "REFL-002": (1, 1)}]
+
+    def test_failed_flush_is_retried(self):
+        from agentura_sdk.memory.memrl import MemRLAggregator
+
+        applied: list[dict] = []
+
+        def apply(deltas):
+            if not applied:
+                applied.append(None)
+                raise RuntimeError("db down")
+            applied.append(deltas)
+
+        aggregator = MemRLAggregator(apply, flush_interval_s=60)
+        aggregator.add(["REFL-001"], injected=1)
+        aggregator.flush()
+        aggregator.add(["REFL-001"], injected=1, helped=1)
+        aggregator.close()
+        assert applied == [None, {"REFL-001": (2, 1)}]
@@ -1,5 +1,7 @@
 """Tests for OpenRouter integration."""
 
+import pytest
+
 from agentura_sdk.runner.openrouter import resolve_model, MODEL_ALIASES, FALLBACK_CHAINS
 
 
@@ -24,3 +26,81 @@ class TestModelResolution:
             assert isinstance(alias, str)
             assert isinstance(full_id, str)
             assert "/" in full_id
+
+
+class TestPooledClients:
+    @pytest.fixture
+    def openrouter(self, httpserver, monkeypatch):
+        from agentura_sdk.runner import openrouter
+
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        monkeypatch.setattr(openrouter, "OPENROUTER_BASE", httpserver.url_for("/api/v1"))
+        monkeypatch.setattr(openrouter, "_client", None)
+        monkeypatch.setattr(openrouter, "_async_client", None)
+        return openrouter
+
+    def test_sync_calls_reuse_one_client(self, openrouter, httpserver):
+        httpserver.expect_request("/api/v1/chat/completions").respond_with_json(_COMPLETION)
+        first = openrouter.chat_completion("gpt-4o", "system", "hi", fallback=False)
+        client = openrouter._client
+        openrouter.chat_completion("gpt-4o", "system", "again", fallback=False)
+        assert first.content == "hello" and first.tokens_in == 3
+        assert openrouter._client is client and not client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_async_completion_and_tool_calls(self, openrouter, httpserver):
+        httpserver.expect_request("/api/v1/chat/completions", json={
+            "model": "openai/gpt-4o", "messages": [{"role": "user", "content": "hi"}],
+            "temperature": 0.0, "max_tokens": 4096,
+        }).respond_with_json(_COMPLETION)
+        resp = await openrouter.chat_completion_messages_async(
+            "gpt-4o", [{"role": "user", "content": "hi"}], fallback=False,
+        )
+        assert (resp.content, resp.model, resp.tokens_out) == ("hello", "openai/gpt-4o", 5)
+
+        httpserver.clear()
+        httpserver.expect_request("/api/v1/chat/completions").respond_with_json({
+            "model": "openai/gpt-4o",
+            "choices": [{"finish_reason": "tool_calls", "message": {"content": None, "tool_calls": [
+                {"id": "call-1", "function": {"name": "read_file", "arguments": '{"path": "/a"'}},
+            ]}}],
+        })
+        tool_resp = await openrouter.tool_chat_completion_async("gpt-4o", [], [])
+        assert [(tc.name, tc.arguments) for tc in tool_resp.tool_calls] == [("read_file", {"path": "/a"})]
+        await openrouter.aclose_clients()
+        assert openrouter._async_client is None
+
+    @pytest.mark.asyncio
+    async def test_async_fallback_chain(self, openrouter, httpserver):
+        httpserver.expect_request("/api/v1/chat/completions", json={
+            "model": "openai/gpt-4o", "messages": [], "temperature": 0.0, "max_tokens": 4096,
+        }).respond_with_data("boom", status=502)
+        httpserver.expect_request("/api/v1/chat/completions").respond_with_json(_COMPLETION)
+        resp = await openrouter.chat_completion_messages_async("gpt-4o", [])
+        assert resp.content == "hello"
+        await openrouter.aclose_clients()
+
+    def test_key_change_closes_old_sync_client(self, openrouter, monkeypatch):
+        old = openrouter._get_client()
+        monkeypatch.setenv("OPENROUTER_API_KEY", "rotated-key")
+        new = openrouter._get_client()
+        assert new is not old and old.is_closed
+        new.close()
+
+    @pytest.mark.asyncio
+    async def test_key_change_closes_old_async_client(self, openrouter, monkeypatch):
+        import asyncio
+
+        old = openrouter._get_async_client()
+        monkeypatch.setenv("OPENROUTER_API_KEY", "rotated-key")
+        new = openrouter._get_async_client()
+        await asyncio.sleep(0)
+        assert new is not old and old.is_closed
+        await openrouter.aclose_clients()
+
+
+_COMPLETION = {
+    "model": "openai/gpt-4o",
+    "choices": [{"message": {"content": "hello"}}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 5},
+}
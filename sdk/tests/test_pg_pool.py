@@ -0,0 +1,63 @@
+"""Tests for the shared Postgres pool registry — pool tests need DATABASE_URL, the rest run anywhere."""
+
+import os
+import threading
+
+import pytest
+
+HAS_PG = bool(os.environ.get("DATABASE_URL"))
+
+
+def test_migrate_once_runs_each_schema_once():
+    from agentura_sdk.memory.pg_pool import migrate_once
+
+    calls = []
+    for _ in range(3):
+        migrate_once("postgresql://test-migrate-once", "fleet", lambda: calls.append("fleet"))
+    migrate_once("postgresql://test-migrate-once", "tickets", lambda: calls.append("tickets"))
+    assert calls == ["fleet", "tickets"]
+
+
+def test_failed_migration_is_retried():
+    from agentura_sdk.memory.pg_pool import migrate_once
+
+    def broken():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        migrate_once("postgresql://test-migrate-retry", "fleet", broken)
+    calls = []
+    migrate_once("postgresql://test-migrate-retry", "fleet", lambda: calls.append(1))
+    assert calls == [1]
+
+
+@pytest.mark.skipif(not HAS_PG, reason="DATABASE_URL not set")
+class TestSharedPool:
+    def test_stores_share_one_pool(self):
+        from agentura_sdk.memory.agent_store import AgentStore
+        from agentura_sdk.memory.fleet_store import FleetStore
+        from agentura_sdk.memory.pg_pool import pool_metrics
+
+        dsn = os.environ["DATABASE_URL"]
+        assert FleetStore(dsn)._pool is FleetStore(dsn)._pool is AgentStore(dsn)._pool
+        FleetStore(dsn).list_sessions(limit=1)
+        metrics = next(iter(pool_metrics().values()))
+        assert metrics["acquired_total"] >= 1 and metrics["in_use"] == 0
+
+    def test_exhausted_pool_waits_then_times_out(self):
+        from agentura_sdk.memory.pg_pool import PoolTimeout, SharedPool
+
+        pool = SharedPool(os.environ["DATABASE_URL"], minconn=1, maxconn=1, timeout_s=0.2)
+        try:
+            conn = pool.getconn()
+            with pytest.raises(PoolTimeout):
+                pool.getconn()
+            threading.Timer(0.05, pool.putconn, (conn,)).start()
+            pool._timeout_s = 5
+            pool.putconn(pool.getconn())
+            metrics = pool.metrics()
+            assert metrics["timeouts_total"] == 1
+            assert metrics["waited_total"] == 1 and metrics["wait_ms_max"] > 0
+            assert metrics["peak_in_use"] == 1 and metrics["in_use"] == 0
+        finally:
+            pool.closeall()
@@ -53,6 +53,287 @@ class TestPgStore:
         hr_execs = self.store.get_executions("hr/triage")
         assert not any(e["execution_id"] == "EXEC-FIN-001" for e in hr_execs)
 
+    def test_skill_stats_maintained_on_write(self):
+        from uuid import uuid4
+
+        skill = f"ops/stats-{uuid4().hex[:8]}"
+        for outcome, latency in [("accepted", 100.0), ("error", 300.0), ("pending_approval", 200.0)]:
+            self.store.log_execution(skill, {
+                "execution_id": f"EXEC-{uuid4().hex}",
+                "outcome": outcome,
+                "latency_ms": latency,
+                "cost_usd": 0.02,
+            })
+        stats = self.store.get_skill_stats(skill)[skill]
+        assert stats["executions_total"] == 3
+        assert stats["accepted_total"] == 1
+        assert stats["error_total"] == 1
+        assert stats["p50_latency_ms"] == 200.0
+        assert stats["total_cost_usd"] == 0.06
+
+        pending = next(e for e in self.store.get_executions(skill) if e["outcome"] == "pending_approval")
+        self.store.update_execution_output(pending["execution_id"], {"ok": True}, outcome="accepted")
+        assert self.store.get_skill_stats(skill)[skill]["accepted_total"] == 2
+
+    def test_query_executions_keyset(self):
+        from uuid import uuid4
+
+        from agentura_sdk.memory.execution_query import encode_cursor
+
+        domain = f"kq{uuid4().hex[:8]}"
+        ids = []
+        for i in range(5):
+            eid = f"EXEC-KQ-{domain}-{i}"
+            ids.append(eid)
+            self.store.log_execution(f"{domain}/lister", {
+                "execution_id": eid,
+                # two rows share a timestamp to exercise the execution_id tie-break
+                "timestamp": f"2026-01-01T00:00:0{min(i, 3)}+00:00",
+                "outcome": "accepted" if i != 2 else "error",
+                "output_summary": {"big": "x" * 100},
+            })
+        first = self.store.query_executions(domains={domain}, limit=2, include_payload=False)
+        assert [e["execution_id"] for e in first] == [ids[4], ids[3]]
+        assert "output_summary" not in first[0]
+        rest = self.store.query_executions(domains={domain}, cursor=encode_cursor(first[-1]))
+        assert [e["execution_id"] for e in rest] == [ids[2], ids[1], ids[0]]
+        errors = self.store.query_executions(domains={domain}, outcome="error")
+        assert [e["execution_id"] for e in errors] == [ids[2]]
+
+    def test_analytics_rollups(self):
+        from uuid import uuid4
+
+        domain = f"an{uuid4().hex[:8]}"
+        rows = [
+            ("2026-02-01T09:15:00+00:00", "accepted", 100.0),
+            ("2026-02-02T03:00:00+00:00", "pending_approval", 300.0),
+            ("2026-02-03T23:59:00+00:00", "error", 200.0),
+            ("2026-02-04T00:30:00+00:00", "accepted", 400.0),
+        ]
+        for i, (ts, outcome, latency) in enumerate(rows):
+            self.store.log_execution(f"{domain}/rollup", {
+                "execution_id": f"EXEC-AN-{domain}-{i}", "timestamp": ts, "outcome": outcome,
+                "latency_ms": latency, "cost_usd": 0.01,
+            })
+
+        self.store.refresh_analytics_rollups()
+        full = self.store.get_analytics(domains={domain})
+        assert full["total_executions"] == 4
+        assert full["outcomes"] == {"accepted": 2, "pending_approval": 1, "error": 1}
+        # Estimated from the rollup latency histograms (exact: 250.0, 385.0)
+        assert full["p50_latency_ms"] == pytest.approx(250.0, rel=0.05)
+        assert full["p95_latency_ms"] == pytest.approx(385.0, rel=0.05)
+        assert self.store.refresh_analytics_rollups() == 0
+
+        # Partial first day (hourly) + whole days (daily) + partial last day (hourly)
+        window = self.store.get_analytics(
+            domains={domain}, since="2026-02-01T10:00:00Z", until="2026-02-04T00:10:00Z"
+        )
+        assert window["total_executions"] == 3
+        assert window["outcomes"] == {"pending_approval": 1, "error": 1, "accepted": 1}
+        assert window["avg_latency_ms"] == 300.0
+
+        # Outcome changes re-roll the affected hour
+        self.store.approve_execution_atomic(f"EXEC-AN-{domain}-1", "accepted")
+        self.store.refresh_analytics_rollups()
+        after = self.store.get_analytics(domains={domain})
+        assert after["outcomes"] == {"accepted": 3, "error": 1}
+        recent = self.store.query_executions(domains={domain}, since="2026-02-03T00:00:00Z")
+        assert [e["execution_id"] for e in recent] == [f"EXEC-AN-{domain}-3", f"EXEC-AN-{domain}-2"]
+
+    def test_analytics_rollup_queue_drained_in_batches(self):
+        from uuid import uuid4
+
+        domain = f"rb{uuid4().hex[:8]}"
+        for i, ts in enumerate(["2026-02-10T01:05:00+00:00", "2026-02-10T02:05:00+00:00",
+                                "2026-02-10T02:45:00+00:00", "2026-02-11T03:05:00+00:00"]):
+            self.store.log_execution(f"{domain}/batch", {
+                "execution_id": f"EXEC-RB-{domain}-{i}", "timestamp": ts, "outcome": "accepted",
+                "latency_ms": 100.0 * (i + 1),
+            })
+
+        assert self.store.refresh_analytics_rollups(batch_size=1) >= 3
+        a = self.store.get_analytics(domains={domain})
+        assert a["total_executions"] == 4
+        assert a["avg_latency_ms"] == 250.0
+        assert a["p95_latency_by_skill"][f"{domain}/batch"] == pytest.approx(385.0, rel=0.05)
+
+    def test_platform_events(self):
+        from uuid import uuid4
+
+        from agentura_sdk.memory.events import generated_test_event
+        from agentura_sdk.memory.execution_query import encode_cursor
+
+        domain = f"ev{uuid4().hex[:8]}"
+        for i in range(3):
+            self.store.log_execution(f"{domain}/worker", {
+                "execution_id": f"EXEC-EV-{domain}-{i}", "timestamp": f"2026-04-01T00:00:0{i}+00:00",
+                "outcome": "accepted", "cost_usd": 0.5, "latency_ms": 12.0,
+            })
+        self.store.add_correction(f"{domain}/worker", {
+            "correction_id": f"CORR-EV-{domain}", "execution_id": f"EXEC-EV-{domain}-0",
+            "user_correction": "wrong", "timestamp": "2026-04-01T00:01:00+00:00",
+        })
+        self.store.record_event(generated_test_event(f"{domain}/worker", f"TEST-{domain}", "deepeval", "d"))
+
+        events = self.store.query_events(domains={domain})
+        assert [e["event_type"] for e in events] == [
+            "test_generated", "correction_submitted", "skill_executed", "skill_executed", "skill_executed",
+        ]
+        assert events[2]["message"] == f"Skill {domain}/worker executed → accepted ($0.50, 12ms)"
+        assert events[2]["metadata"]["execution_id"] == f"EXEC-EV-{domain}-2"
+
+        first = self.store.query_events(domain=domain, event_type="skill_executed", limit=2)
+        rest = self.store.query_events(
+            domain=domain, event_type="skill_executed", cursor=encode_cursor(first[-1], "event_id")
+        )
+        assert [e["event_id"] for e in first + rest] == [f"evt-exec-EXEC-EV-{domain}-{i}" for i in (2, 1, 0)]
+
+    def test_search_text(self):
+        from uuid import uuid4
+
+        domain = f"fts{uuid4().hex[:8]}"
+        skill = f"{domain}/triage"
+        self.store.log_execution(skill, {
+            "execution_id": f"EXEC-FTS-{domain}", "output_summary": {"decision": "escalated to compliance"},
+        })
+        self.store.add_correction(skill, {
+            "correction_id": f"CORR-FTS-{domain}", "user_correction": "Compliance cases belong to legal",
+        })
+        self.store.add_reflexion(skill, {
+            "reflexion_id": f"REFL-FTS-{domain}", "rule": "Route compliance cases to legal",
+        })
+
+        hits = self.store.search_text("routing compliance to legal", domains={domain})
+        assert [h["type"] for h in hits] == ["reflexion", "correction", "execution"]
+        assert hits[0]["score"] == 0.95
+        assert "search_tsv" not in hits[0]
+        assert self.store.search_text("compliance", domains={"no-such-domain"}) == []
+        assert self.store.search_text("the of and", domains={domain}) == []
+        similar = self.store.search_similar(skill, "legal")
+        assert [h["reflexion_id"] for h in similar] == [f"REFL-FTS-{domain}"]
+
+    def test_search_vectors_backfilled_in_batches(self):
+        from uuid import uuid4
+
+        domain = f"bf{uuid4().hex[:8]}"
+        for i in range(3):
+            self.store.log_execution(f"{domain}/triage", {
+                "execution_id": f"EXEC-BF-{domain}-{i}", "input_summary": {"q": "reimbursement backlog"},
+            })
+        conn = self.store._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                # Rows from before the trigger existed have no vector
+                cur.execute("UPDATE executions SET search_tsv = NULL WHERE domain = %s", (domain,))
+            conn.commit()
+        finally:
+            self.store._pool.putconn(conn)
+        assert self.store.search_text("reimbursement", domains={domain}) == []
+
+        assert self.store.backfill_search_vectors(batch_size=2) >= 3
+        assert len(self.store.search_text("reimbursement", domains={domain})) == 3
+        assert self.store.backfill_search_vectors() == 0
+
+    def test_stats(self):
+        from uuid import uuid4
+
+        domain = f"stats{uuid4().hex[:8]}"
+        skill = f"{domain}/triage"
+        eid = self.store.log_execution(skill, {"execution_id": f"EXEC-S-{domain}"})
+        self.store.log_execution(skill, {"execution_id": f"EXEC-S2-{domain}"})
+        self.store.add_correction(skill, {"correction_id": f"CORR-S-{domain}", "execution_id": eid})
+        self.store.add_reflexion(skill, {"reflexion_id": f"REFL-S-{domain}", "rule": "count me"})
+
+        assert self.store.stats({domain}) == {
+            "executions": 2, "corrections": 1, "reflexions": 1, "total": 4, "skills": [skill],
+        }
+        overall = self.store.stats()
+        assert overall["executions"] >= 2 and skill in overall["skills"]
+
+    def test_log_executions_batch(self):
+        from uuid import uuid4
+
+        domain = f"batch{uuid4().hex[:8]}"
+        skill = f"{domain}/triage"
+        rid = self.store.add_reflexion(skill, {"reflexion_id": f"REFL-B-{domain}", "rule": "batch rule"})
+        entries = [
+            {"execution_id": f"EXEC-B{n}-{domain}", "skill": skill, "outcome": "accepted", "latency_ms": 10.0 * n}
+            for n in range(3)
+        ]
+        entries[0].update(reflexions_injected=[rid], reflexions_helped=True, pending_approvals=[{"tool": "x"}])
+
+        assert self.store.log_executions(entries) == [e["execution_id"] for e in entries]
+        assert self.store.log_executions(entries) == []  # replay is a no-op
+        assert self.store.stats({domain})["executions"] == 3
+        assert self.store.get_skill_stats(skill)[skill]["executions_total"] == 3
+        first = self.store.get_execution_by_id(entries[0]["execution_id"])
+        assert first["pending_approvals"] == [{"tool": "x"}]
+        assert first["reflexions_injected"] == [rid]
+        reflexion = next(r for r in self.store.get_reflexions(skill) if r["reflexion_id"] == rid)
+        assert (reflexion["times_injected"], reflexion["times_helped"]) == (1, 1)
+        events = self.store.query_events(domains={domain}, event_type="skill_executed")
+        assert len(events) == 3
+
+    def test_memrl_set_based_scoring(self):
+        from uuid import uuid4
+
+        tag = uuid4().hex[:8]
+        skill = f"memrl{tag}/triage"
+        rids = [self.store.add_reflexion(skill, {"reflexion_id": f"REFL-M{n}-{tag}", "rule": "r"}) for n in range(2)]
+        for n in range(3):
+            eid = self.store.log_execution(skill, {"execution_id": f"EXEC-M{n}-{tag}"})
+            self.store.record_reflexion_outcome(eid, rids, helped=n < 2)
+        self.store.record_reflexion_injection(f"EXEC-M2-{tag}", rids[:1])
+        self.store.record_execution_success(f"EXEC-M2-{tag}")
+
+        assert self.store.get_execution_by_id(f"EXEC-M2-{tag}")["reflexions_injected"] == rids[:1]
+        by_id = {r["reflexion_id"]: r for r in self.store.get_reflexions(skill)}
+        assert (by_id[rids[0]]["times_injected"], by_id[rids[0]]["times_helped"]) == (4, 3)
+        assert (by_id[rids[1]]["times_injected"], by_id[rids[1]]["times_helped"]) == (3, 2)
+        assert abs(by_id[rids[0]]["utility_score"] - 5 / 8) < 1e-6
+        assert abs(by_id[rids[1]]["utility_score"] - 4 / 6) < 1e-6
+
+    def test_memrl_aggregated_deltas(self):
+        from uuid import uuid4
+
+        from agentura_sdk.memory.memrl import MemRLAggregator
+
+        tag = uuid4().hex[:8]
+        skill = f"memrl{tag}/triage"
+        rid = self.store.add_reflexion(skill, {"reflexion_id": f"REFL-A-{tag}", "rule": "r"})
+        aggregator = MemRLAggregator(self.store.apply_memrl_deltas, flush_interval_s=60)
+        self.store._memrl = aggregator
+        try:
+            for n in range(4):
+                eid = self.store.log_execution(skill, {"execution_id": f"EXEC-A{n}-{tag}"})
+                self.store.record_reflexion_outcome(eid, [rid], helped=n % 2 == 0)
+            reflexion = self.store.get_reflexions(skill)[0]
+            assert (reflexion["times_injected"], reflexion["times_helped"]) == (0, 0)
+            assert aggregator.pending == 1
+        finally:
+            aggregator.close()
+        reflexion = self.store.get_reflexions(skill)[0]
+        assert (reflexion["times_injected"], reflexion["times_helped"]) == (4, 2)
+        assert abs(reflexion["utility_score"] - 4 / 8) < 1e-6
+
+    def test_execution_detail_lookups(self):
+        from uuid import uuid4
+
+        tag = uuid4().hex[:8]
+        eid = self.store.log_execution("hr/triage", {"execution_id": f"EXEC-D-{tag}"})
+        cid = self.store.add_correction("hr/triage", {
+            "correction_id": f"CORR-D-{tag}", "execution_id": eid, "user_correction": "fix",
+        })
+        self.store.add_reflexion("hr/triage", {
+            "reflexion_id": f"REFL-D-{tag}", "correction_id": cid, "rule": "do better",
+        })
+        corrections = self.store.get_corrections_for_execution(eid)
+        assert [c["correction_id"] for c in corrections] == [cid]
+        reflexions = self.store.get_reflexions_for_corrections([cid])
+        assert [r["reflexion_id"] for r in reflexions] == [f"REFL-D-{tag}"]
+        assert self.store.get_reflexions_for_corrections([]) == []
+
 
 class TestPgStoreImport:
     def test_import_succeeds(self):
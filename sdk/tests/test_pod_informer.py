@@ -0,0 +1,131 @@
+"""Tests for the shared pod informer against a fake Kubernetes list/watch API."""
+
+import asyncio
+import queue
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from agentura_sdk.sandbox.pod_informer import PodInformer, PodStartError
+
+
+def _pod(name, *, ready=False, ip="", waiting=None, phase="Pending", rv="2"):
+    conditions = [SimpleNamespace(type="Ready", status="True" if ready else "False")]
+    state = SimpleNamespace(waiting=SimpleNamespace(reason=waiting, message="back-off pulling image") if waiting else None)
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, resource_version=rv),
+        status=SimpleNamespace(
+            pod_ip=ip, phase=phase, reason=None, conditions=conditions,
+            container_statuses=[SimpleNamespace(state=state)],
+        ),
+    )
+
+
+class FakeWatch:
+    def __init__(self, events):
+        self._events = events
+        self._stopped = False
+
+    def stream(self, func, **kwargs):
+        while not self._stopped:
+            event = self._events.get()
+            if event is None:
+                return
+            yield event
+
+    def stop(self):
+        self._stopped = True
+        self._events.put(None)
+
+
+class FakeK8s:
+    """list_namespaced_pod + a watch fed from a queue; counts connections."""
+
+    def __init__(self, initial=()):
+        self.initial = list(initial)
+        self.events: queue.Queue = queue.Queue()
+        self.lists = 0
+        self.watches = 0
+        self.watch = None
+
+    def list_namespaced_pod(self, namespace, label_selector):
+        self.lists += 1
+        return SimpleNamespace(items=self.initial, metadata=SimpleNamespace(resource_version="1"))
+
+    def make_watch(self):
+        self.watches += 1
+        self.watch = FakeWatch(self.events)
+        return self.watch
+
+    def emit(self, event_type, pod):
+        self.events.put({"type": event_type, "object": pod})
+
+
+@pytest.fixture
+def k8s():
+    fake = FakeK8s()
+    informer = PodInformer(fake, "agentura", watch_factory=fake.make_watch)
+    yield fake, informer
+    informer.stop()
+
+
+class TestPodInformer:
+    @pytest.mark.asyncio
+    async def test_fifty_waiters_share_one_watch(self, k8s):
+        fake, informer = k8s
+        threads_before = threading.active_count()
+        waits = [asyncio.create_task(informer.wait_ready(f"pod-{i}", timeout=5)) for i in range(50)]
+        await asyncio.sleep(0.05)
+        assert threading.active_count() <= threads_before + 1
+
+        for i in range(50):
+            fake.emit("ADDED", _pod(f"pod-{i}"))
+            fake.emit("MODIFIED", _pod(f"pod-{i}", ready=True, ip=f"10.0.0.{i}"))
+        ips = await asyncio.gather(*waits)
+        assert ips == [f"10.0.0.{i}" for i in range(50)]
+        assert (fake.lists, fake.watches) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_image_pull_failure_fails_fast(self, k8s):
+        fake, informer = k8s
+        wait = asyncio.create_task(informer.wait_ready("bad-image", timeout=30))
+        await asyncio.sleep(0.05)
+        fake.emit("MODIFIED", _pod("bad-image", waiting="ImagePullBackOff"))
+        with pytest.raises(PodStartError, match="ImagePullBackOff"):
+            await asyncio.wait_for(wait, 2)
+
+    @pytest.mark.asyncio
+    async def test_ready_before_wait_resolves_from_cache(self):
+        fake = FakeK8s(initial=[_pod("warm", ready=True, ip="10.1.1.1")])
+        informer = PodInformer(fake, "agentura", watch_factory=fake.make_watch)
+        try:
+            informer.start()
+            await asyncio.sleep(0.05)
+            assert await informer.wait_ready("warm", timeout=1) == "10.1.1.1"
+        finally:
+            informer.stop()
+
+    @pytest.mark.asyncio
+    async def test_deleted_and_timeout(self, k8s):
+        fake, informer = k8s
+        wait = asyncio.create_task(informer.wait_ready("gone", timeout=5))
+        await asyncio.sleep(0.05)
+        fake.emit("DELETED", _pod("gone"))
+        with pytest.raises(PodStartError, match="deleted"):
+            await wait
+        with pytest.raises(TimeoutError):
+            await informer.wait_ready("never", timeout=0.1)
+        assert informer._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_watch_reconnects_from_last_resource_version(self, k8s):
+        fake, informer = k8s
+        informer.start()
+        await asyncio.sleep(0.05)
+        fake.events.put(None)  # server closes the stream (timeout_seconds)
+        await asyncio.sleep(0.05)
+        wait = asyncio.create_task(informer.wait_ready("late", timeout=5))
+        fake.emit("MODIFIED", _pod("late", ready=True, ip="10.2.2.2"))
+        assert await wait == "10.2.2.2"
+        assert (fake.lists, fake.watches) == (1, 2)
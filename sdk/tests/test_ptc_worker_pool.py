@@ -0,0 +1,138 @@
+"""Tests for the PTC worker warm pool against a fake Kubernetes pod API."""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from agentura_sdk.sandbox import ptc_worker
+from agentura_sdk.types import SandboxConfig
+
+
+class FakePodApi:
+    """In-memory stand-in for the blocking pod calls the pool makes."""
+
+    def __init__(self):
+        self.pods: dict[str, dict] = {}
+        self.created: list[str] = []
+        self.deleted: list[str] = []
+
+    def create(self, name, env_vars, labels):
+        self.created.append(name)
+        self.pods[name] = {
+            "name": name,
+            "labels": {"app": "ptc-worker", "managed-by": "agentura-executor", **labels},
+            "created_at": time.time(),
+            "env": env_vars,
+        }
+
+    async def wait_ready(self, name):
+        return f"10.0.0.{self.created.index(name) + 1}"
+
+    def delete(self, name):
+        self.deleted.append(name)
+        self.pods.pop(name, None)
+
+    def list(self):
+        return list(self.pods.values())
+
+
+async def _settle(pool):
+    while pool._tasks:
+        await asyncio.gather(*list(pool._tasks))
+
+
+@pytest_asyncio.fixture
+async def pool_env(monkeypatch):
+    async def healthy(sandbox):
+        return True
+
+    monkeypatch.setattr(ptc_worker, "WARM_POOL_SIZE", 2)
+    monkeypatch.setattr(ptc_worker, "_worker_healthy", healthy)
+    api = FakePodApi()
+    pool = ptc_worker.get_worker_pool(api)
+    yield api, pool
+    await ptc_worker.aclose_worker_pool()
+
+
+class TestPtcWarmPool:
+    @pytest.mark.asyncio
+    async def test_lease_is_warm_and_pool_refills(self, pool_env):
+        api, pool = pool_env
+        ptc_worker.prewarm({"ANTHROPIC_API_KEY": "k"})
+        await _settle(pool)
+        assert len(api.created) == 2
+
+        worker = await ptc_worker.create(SandboxConfig(), {"ANTHROPIC_API_KEY": "k"})
+        assert worker.pod_name in api.created
+        await _settle(pool)
+        assert len(api.created) == 3
+        assert api.pods[worker.pod_name]["env"] == {"ANTHROPIC_API_KEY": "k"}
+
+    @pytest.mark.asyncio
+    async def test_release_reuses_and_failure_recycles(self, pool_env, monkeypatch):
+        api, pool = pool_env
+        monkeypatch.setattr(pool, "target_size", 1)
+
+        first = await ptc_worker.create(SandboxConfig(), {})
+        await _settle(pool)
+        await ptc_worker.close(first)
+        again = await ptc_worker.create(SandboxConfig(), {})
+        assert again is first
+        assert len(api.created) == 2  # the cold one + one spare, no churn
+
+        await ptc_worker.close(again, reusable=False)
+        await _settle(pool)
+        assert api.deleted == [first.pod_name]
+        assert pool.idle_count(ptc_worker._register_class({})) == 1
+
+    @pytest.mark.asyncio
+    async def test_max_uses_and_max_age_recycle(self, pool_env, monkeypatch):
+        api, pool = pool_env
+        monkeypatch.setattr(pool, "target_size", 1)
+        monkeypatch.setattr(pool, "max_uses", 2)
+
+        worker = await ptc_worker.create(SandboxConfig(), {})
+        await _settle(pool)
+        spare = next(h for h in pool.handles() if h is not worker)
+        await ptc_worker.close(worker)
+        assert await ptc_worker.create(SandboxConfig(), {}) is worker
+        await ptc_worker.close(worker)  # second use — worn out
+        await _settle(pool)
+        assert api.deleted == [worker.pod_name]
+
+        monkeypatch.setattr(pool, "max_age_s", 0.0)
+        await pool.maintain()
+        await _settle(pool)
+        assert spare.pod_name in api.deleted
+        assert len(api.created) == 3  # refilled to target
+
+    @pytest.mark.asyncio
+    async def test_reaper_deletes_only_leaked_pods(self, pool_env, monkeypatch):
+        api, pool = pool_env
+        leased = await ptc_worker.create(SandboxConfig(), {})
+        await _settle(pool)
+        old = time.time() - ptc_worker.POD_READY_TIMEOUT - 120
+        api.pods["ptc-worker-leaked"] = {
+            "name": "ptc-worker-leaked", "created_at": old,
+            "labels": {"app": "ptc-worker", ptc_worker.OWNER_LABEL: ptc_worker.POOL_OWNER},
+        }
+        api.pods["ptc-worker-other"] = {
+            "name": "ptc-worker-other", "created_at": old,
+            "labels": {"app": "ptc-worker", ptc_worker.OWNER_LABEL: "other-executor"},
+        }
+        ancient = time.time() - 7 * 24 * 3600
+        api.pods["sandbox-ancient"] = {
+            "name": "sandbox-ancient", "created_at": ancient,
+            "labels": {"app": "sandbox-runtime", "managed-by": "agentura-executor"},
+        }
+        api.pods["ptc-worker-other-ancient"] = {
+            "name": "ptc-worker-other-ancient", "created_at": ancient,
+            "labels": {"app": "ptc-worker", "managed-by": "agentura-executor", ptc_worker.OWNER_LABEL: "other"},
+        }
+        api.pods[leased.pod_name]["created_at"] = old
+
+        await pool.maintain()
+        assert api.deleted == ["ptc-worker-leaked"]
+        assert leased.pod_name in api.pods
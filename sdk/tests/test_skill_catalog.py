@@ -0,0 +1,157 @@
+"""Tests for the in-memory skill catalog and its watcher-driven refresh."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agentura_sdk.server.skill_catalog import SkillCatalog
+
+SKILL_MD = """---
+name: {name}
+role: specialist
+domain: {domain}
+---
+
+# {name} skill
+
+## Task
+Do the thing.
+"""
+
+CONFIG_YAML = """domain:
+  name: {domain}
+  description: "{domain} domain"
+skills:
+  - name: {name}
+    role: specialist
+    triggers:
+      - type: cron
+        schedule: "0 9 * * *"
+mcp_tools:
+  - server: notion
+    tools: ["*"]
+"""
+
+
+def _write_skill(root: Path, domain: str, name: str, with_config: bool = True) -> Path:
+    skill_dir = root / domain / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(SKILL_MD.format(domain=domain, name=name))
+    if with_config:
+        (skill_dir / "agentura.config.yaml").write_text(CONFIG_YAML.format(domain=domain, name=name))
+    return skill_dir
+
+
+@pytest.fixture
+def skills_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "skills"
+    _write_skill(root, "hr", "triage")
+    _write_skill(root, "hr", "screener", with_config=False)
+    _write_skill(root, "dev", "deployer")
+    (root / "hr" / "DOMAIN.md").write_text("# HR Domain\n\nPeople ops.")
+    (root / "hr" / "GUARDRAILS.md").write_text("## GRD-001 No PII\n\n## GRD-002 Be kind\n")
+    (root / "hr" / "shared").mkdir()
+    return root
+
+
+class TestCatalogBuild:
+    def test_lists_all_skills_sorted(self, skills_dir: Path):
+        catalog = SkillCatalog(skills_dir)
+        names = [(s.domain, s.name) for s in catalog.skills()]
+        assert names == [("dev", "deployer"), ("hr", "screener"), ("hr", "triage")]
+
+    def test_domain_files_parsed(self, skills_dir: Path):
+        catalog = SkillCatalog(skills_dir)
+        hr = catalog.get_domain("hr")
+        assert hr is not None
+        assert hr.domain_md.startswith("# HR Domain")
+        assert hr.guardrails_count == 2
+        assert hr.config["domain"]["name"] == "hr"
+        assert "shared" not in hr.skills
+
+    def test_triggers_from_config(self, skills_dir: Path):
+        catalog = SkillCatalog(skills_dir)
+        triggers = catalog.triggers()
+        assert {(t["domain"], t["skill"]) for t in triggers} == {("dev", "deployer"), ("hr", "triage")}
+
+    def test_reads_do_not_touch_disk_after_build(self, skills_dir: Path, monkeypatch):
+        catalog = SkillCatalog(skills_dir)
+        catalog.build()
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("catalog read hit the filesystem")
+
+        monkeypatch.setattr(Path, "read_text", _fail)
+        assert len(catalog.skills()) == 3
+        assert catalog.triggers()
+
+
+class TestCatalogRefresh:
+    def test_refresh_picks_up_new_skill(self, skills_dir: Path):
+        catalog = SkillCatalog(skills_dir)
+        catalog.build()
+        new_dir = _write_skill(skills_dir, "dev", "reviewer")
+        catalog.refresh(new_dir / "SKILL.md")
+        assert catalog.get_skill("dev", "reviewer") is not None
+        assert catalog.get_skill("dev", "deployer") is not None
+
+    def test_refresh_drops_deleted_skill(self, skills_dir: Path):
+        catalog = SkillCatalog(skills_dir)
+        catalog.build()
+        skill_md = skills_dir / "hr" / "screener" / "SKILL.md"
+        skill_md.unlink()
+        catalog.refresh(skill_md)
+        assert catalog.get_skill("hr", "screener") is None
+
+    def test_refresh_updates_config(self, skills_dir: Path):
+        catalog = SkillCatalog(skills_dir)
+        catalog.build()
+        cfg = skills_dir / "dev" / "deployer" / "agentura.config.yaml"
+        cfg.write_text("domain:\n  name: dev\ntriggers:\n  - type: webhook\n")
+        catalog.refresh(cfg)
+        entry = catalog.get_skill("dev", "deployer")
+        assert entry.config["triggers"] == [{"type": "webhook"}]
+
+    def test_domain_file_refreshes_domain(self, skills_dir: Path):
+        catalog = SkillCatalog(skills_dir)
+        catalog.build()
+        grd = skills_dir / "hr" / "GUARDRAILS.md"
+        grd.write_text("## GRD-001 Only one\n")
+        catalog.refresh(grd)
+        assert catalog.get_domain("hr").guardrails_count == 1
+
+    def test_refresh_skill_in_new_domain_loads_domain(self, skills_dir: Path):
+        catalog = SkillCatalog(skills_dir)
+        catalog.build()
+        new_dir = _write_skill(skills_dir, "ops", "pager")
+        catalog.refresh(new_dir / "SKILL.md")
+        assert catalog.get_skill("ops", "pager") is not None
+        assert catalog.get_skill("hr", "screener") is not None
+
+    def test_paths_outside_skills_dir_ignored(self, skills_dir: Path, tmp_path: Path):
+        catalog = SkillCatalog(skills_dir)
+        catalog.build()
+        catalog.refresh(tmp_path / "elsewhere" / "SKILL.md")
+        assert len(catalog.skills()) == 3
+
+
+class TestWatcherDebounce:
+    def test_fire_each_reports_every_path(self):
+        from agentura_sdk.server.skill_watcher import _DebouncedHandler
+
+        seen: list[str] = []
+        handler = _DebouncedHandler(seen.append, debounce_s=60, watch_extensions={".md"}, fire_each=True)
+
+        class _Event:
+            is_directory = False
+
+            def __init__(self, path: str):
+                self.src_path = path
+
+        handler.on_any_event(_Event("/skills/hr/triage/SKILL.md"))
+        handler.on_any_event(_Event("/skills/dev/deployer/SKILL.md"))
+        handler._timer.cancel()
+        handler._fire()
+        assert seen == ["/skills/dev/deployer/SKILL.md", "/skills/hr/triage/SKILL.md"]
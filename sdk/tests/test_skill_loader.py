@@ -0,0 +1,105 @@
+"""Tests for the compiled skill bundle cache in skill_loader."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from agentura_sdk.runner import skill_loader
+from agentura_sdk.runner.skill_loader import (
+    PROMPT_SEPARATOR,
+    invalidate_skill_bundles,
+    load_skill_bundle,
+    load_skill_md,
+)
+
+SKILL_MD = """---
+name: planner
+role: specialist
+domain: pm
+---
+
+# Planner
+
+## Task
+Plan the sprint.
+"""
+
+
+@pytest.fixture
+def skill_md(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("AGENTURA_KNOWLEDGE_DIR", str(tmp_path / "knowledge"))
+    monkeypatch.chdir(tmp_path)
+    root = tmp_path / "skills"
+    skill_dir = root / "pm" / "planner"
+    skill_dir.mkdir(parents=True)
+    (root / "WORKSPACE.md").write_text("# Workspace")
+    (root / "pm" / "DOMAIN.md").write_text("# PM Domain")
+    configs = root / "pm" / "project-configs"
+    configs.mkdir()
+    (configs / "_workspace.md").write_text("workspace: 123")
+    (configs / "gold.md").write_text("list: gold")
+    path = skill_dir / "SKILL.md"
+    path.write_text(SKILL_MD)
+    invalidate_skill_bundles()
+    yield path
+    invalidate_skill_bundles()
+
+
+def _bump(path: Path, text: str) -> None:
+    """Rewrite a file and force a distinct mtime so the fingerprint changes."""
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestComposedPrompt:
+    def test_layer_order(self, skill_md: Path):
+        loaded = load_skill_md(skill_md, include_reflexions=False)
+        parts = loaded.composed_prompt.split(PROMPT_SEPARATOR)
+        assert parts[0] == "# Workspace"
+        assert parts[1] == "# PM Domain"
+        assert parts[2].startswith("## Project Configurations")
+        assert "workspace: 123" in parts[2]
+        assert parts[-1] == loaded.system_prompt
+
+    def test_reflexions_spliced_before_project_configs(self, skill_md: Path):
+        bundle = load_skill_bundle(skill_md)
+        composed = bundle.compose("## Learned Rules")
+        parts = composed.split(PROMPT_SEPARATOR)
+        assert parts[2] == "## Learned Rules"
+        assert parts[3].startswith("## Project Configurations")
+
+
+class TestBundleCache:
+    def test_bundle_reused_when_unchanged(self, skill_md: Path):
+        assert load_skill_bundle(skill_md) is load_skill_bundle(skill_md)
+
+    def test_skill_edit_recompiles(self, skill_md: Path):
+        first = load_skill_bundle(skill_md)
+        _bump(skill_md, SKILL_MD.replace("Plan the sprint.", "Plan the quarter."))
+        second = load_skill_bundle(skill_md)
+        assert second is not first
+        assert "Plan the quarter." in second.system_prompt
+
+    def test_new_project_config_recompiles(self, skill_md: Path):
+        load_skill_bundle(skill_md)
+        configs = skill_md.parent.parent / "project-configs"
+        (configs / "silver.md").write_text("list: silver")
+        st = configs.stat()
+        os.utime(configs, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert "list: silver" in load_skill_bundle(skill_md).prompt_tail
+
+    def test_watcher_invalidation_by_path(self, skill_md: Path):
+        load_skill_bundle(skill_md)
+        domain_md = skill_md.parent.parent / "DOMAIN.md"
+        assert invalidate_skill_bundles(domain_md) == 1
+        assert invalidate_skill_bundles(skill_md.parent.parent / "other" / "SKILL.md") == 0
+
+    def test_missing_file_raises_and_is_not_cached(self, tmp_path: Path):
+        missing = tmp_path / "nope" / "SKILL.md"
+        with pytest.raises(FileNotFoundError):
+            load_skill_bundle(missing)
+        assert str(missing.resolve()) not in skill_loader._bundle_cache
@@ -0,0 +1,89 @@
+"""Tests for the write-behind execution log queue."""
+
+import json
+
+import pytest
+
+from agentura_sdk.memory.write_behind import ExecutionLogQueue
+
+
+class FakeStore:
+    def __init__(self):
+        self.batches: list[list[dict]] = []
+        self.down = False
+
+    def log_executions(self, entries):
+        if self.down:
+            raise ConnectionError("database unreachable")
+        self.batches.append(list(entries))
+        return [e["execution_id"] for e in entries]
+
+    @property
+    def written(self):
+        return [e["execution_id"] for batch in self.batches for e in batch]
+
+
+@pytest.fixture
+def store():
+    return FakeStore()
+
+
+def _entry(n):
+    return {"execution_id": f"EXEC-{n}", "skill": "hr/screener"}
+
+
+class TestExecutionLogQueue:
+    def test_batches_writes(self, store, tmp_path):
+        q = ExecutionLogQueue(store, spill_path=tmp_path / "spill.jsonl", batch_size=50, flush_interval_s=0.05)
+        for n in range(120):
+            q.submit(_entry(n))
+        q.flush()
+        assert store.written == [f"EXEC-{n}" for n in range(120)]
+        assert len(store.batches) < 120
+        q.close()
+        assert q.metrics()["written_total"] == 120
+
+    def test_spills_when_store_down_and_replays(self, store, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        store.down = True
+        q = ExecutionLogQueue(store, spill_path=spill, flush_interval_s=0.05)
+        q.submit(_entry(1))
+        q.flush()
+        assert [json.loads(line)["execution_id"] for line in spill.read_text().splitlines()] == ["EXEC-1"]
+
+        store.down = False
+        q.submit(_entry(2))
+        q.flush()
+        assert sorted(store.written) == ["EXEC-1", "EXEC-2"]
+        assert not spill.exists()
+        q.close()
+
+    def test_full_buffer_spills_instead_of_blocking(self, store, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        q = ExecutionLogQueue(store, spill_path=spill, max_buffer=1, flush_interval_s=0.05)
+        q.close()  # writer stopped: the buffer can no longer drain
+        q.submit(_entry(1))
+        assert json.loads(spill.read_text())["execution_id"] == "EXEC-1"
+
+    def test_close_drains_buffer(self, store, tmp_path):
+        q = ExecutionLogQueue(store, spill_path=tmp_path / "spill.jsonl", flush_interval_s=5)
+        for n in range(3):
+            q.submit(_entry(n))
+        q.close()
+        assert store.written == ["EXEC-0", "EXEC-1", "EXEC-2"]
+
+    def test_pending_spill_replayed_on_start(self, store, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        spill.write_text(json.dumps(_entry(7)) + "\n")
+        q = ExecutionLogQueue(store, spill_path=spill, flush_interval_s=0.05)
+        q.close()
+        assert store.written == ["EXEC-7"]
+
+    def test_interrupted_replay_is_resumed(self, store, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        spill.with_suffix(".replay").write_text(json.dumps(_entry(8)) + "\n")
+        spill.write_text(json.dumps(_entry(9)) + "\n")
+        q = ExecutionLogQueue(store, spill_path=spill, flush_interval_s=0.05)
+        q.submit(_entry(10))
+        q.close()
+        assert sorted(store.written) == ["EXEC-10", "EXEC-8", "EXEC-9"]
@@ -52,7 +52,7 @@ export default function SkillDetailPage() {
 
   const { data: runs } = useQuery({
     queryKey: ["skill-runs", params.domain, params.skill],
-    queryFn: () => listExecutions(skillPath),
+    queryFn: () => listExecutions(skillPath, { limit: 100 }),
   });
 
   const { data: reflexions } = useQuery({
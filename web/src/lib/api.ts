@@ -35,6 +35,11 @@ import type {
 const BASE = process.env.NEXT_PUBLIC_API_URL || "";
 
 async function request<T>(path: string, init?: RequestInit, timeoutMs = 15000): Promise<T> {
+  const res = await send(path, init, timeoutMs);
+  return res.json() as Promise<T>;
+}
+
+async function send(path: string, init?: RequestInit, timeoutMs = 15000): Promise<Response> {
   const controller = new AbortController();
   const timeout = setTimeout(() => controller.abort(), timeoutMs);
   try {
@@ -47,7 +52,7 @@ async function request<T>(path: string, init?: RequestInit, timeoutMs = 15000):
       const body = await res.text().catch(() => "");
       throw new Error(`API ${res.status}: ${body}`);
     }
-    return res.json() as Promise<T>;
+    return res;
   } catch (err) {
     if (err instanceof DOMException && err.name === "AbortError") {
       throw new Error("API unreachable — is the backend running? (agentura-server)");
@@ -98,9 +103,40 @@ export function correctSkill(
   });
 }
 
-export function listExecutions(skill?: string): Promise<ExecutionEntry[]> {
-  const params = skill ? `?skill=${encodeURIComponent(skill)}` : "";
-  return request<ExecutionEntry[]>(`/api/v1/executions${params}`);
+export interface ExecutionsPage {
+  entries: ExecutionEntry[];
+  nextCursor: string | null;
+}
+
+export interface ListExecutionsOptions {
+  limit?: number;
+  cursor?: string;
+  outcome?: string;
+}
+
+// One page of executions, newest first. Pass nextCursor back as `cursor` for the next page.
+export async function listExecutionsPage(
+  skill?: string,
+  opts: ListExecutionsOptions = {},
+): Promise<ExecutionsPage> {
+  const params = new URLSearchParams();
+  if (skill) params.set("skill", skill);
+  if (opts.outcome) params.set("outcome", opts.outcome);
+  if (opts.limit) params.set("limit", String(opts.limit));
+  if (opts.cursor) params.set("cursor", opts.cursor);
+  const query = params.toString();
+  const res = await send(`/api/v1/executions${query ? `?${query}` : ""}`);
+  return {
+    entries: (await res.json()) as ExecutionEntry[],
+    nextCursor: res.headers.get("X-Next-Cursor"),
+  };
+}
+
+export async function listExecutions(
+  skill?: string,
+  opts: ListExecutionsOptions = {},
+): Promise<ExecutionEntry[]> {
+  return (await listExecutionsPage(skill, opts)).entries;
 }
 
 export function getExecution(executionId: string): Promise<ExecutionDetail> {
@@ -1,8 +1,10 @@
 import type { ChatMessage, ConversationScope } from "./chat-types";
 import type { PipelineResult } from "./api";
+import type { ExecutionEntry } from "./types";
 import {
   listSkills,
   listExecutions,
+  getExecution,
   listDomains,
   listReflexions,
   listEvents,
@@ -21,6 +23,16 @@ function generateId(): string {
   return `${Date.now()}-${Math.random().toString(36).slice(2, 9)}`;
 }
 
+// Full IDs resolve via GET /executions/{id}; a short prefix is matched against the latest page.
+async function findExecution(execId: string): Promise<ExecutionEntry | undefined> {
+  try {
+    return (await getExecution(execId)).execution;
+  } catch {
+    const recent = await listExecutions(undefined, { limit: 100 });
+    return recent.find((e) => String(e.execution_id).startsWith(execId));
+  }
+}
+
 const HELP_TEXT = `Available commands:
   <natural language>      Ask anything — auto-routes to the right skill
   get skills              List all deployed agents
@@ -182,8 +194,7 @@ async function handleGet(
   }
 
   if (resource === "executions") {
-    const data = await listExecutions();
-    const entries = data.slice(0, 15);
+    const entries = await listExecutions(undefined, { limit: 15 });
     if (!entries.length) return { ...base, content: "No executions recorded." };
     return {
       ...base,
@@ -253,8 +264,7 @@ async function handleGet(
   }
 
   if (resource === "approvals") {
-    const data = await listExecutions();
-    const pending = data.filter((e) => e.outcome === "pending_approval");
+    const pending = await listExecutions(undefined, { outcome: "pending_approval", limit: 100 });
     if (!pending.length) return { ...base, content: "No pending approvals." };
     return {
       ...base,
@@ -390,8 +400,7 @@ async function handleCorrect(
   const execId = match[1];
   const correctionText = match[2] || match[3];
 
-  const executions = await listExecutions();
-  const exec = executions.find((e) => String(e.execution_id).startsWith(execId));
+  const exec = await findExecution(execId);
   if (!exec) return { ...base, content: `Execution not found: ${execId}` };
 
   const skill = exec.skill;
@@ -785,8 +794,7 @@ async function handleApprove(
   if (!execId)
     return { ...base, content: `Usage: ${approved ? "approve" : "reject"} <execution-id>` };
 
-  const executions = await listExecutions();
-  const exec = executions.find((e) => String(e.execution_id).startsWith(execId));
+  const exec = await findExecution(execId);
   if (!exec) return { ...base, content: `Execution not found: ${execId}` };
 
   const result = await approveExecution(String(exec.execution_id), approved);